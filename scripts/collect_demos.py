@@ -0,0 +1,106 @@
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# Add argparse arguments
+parser = argparse.ArgumentParser(
+    description="Collect demonstrations for the block world tasks with the scripted expert."
+)
+parser.add_argument("--task", type=str, default=None, help="Name of the task.")
+parser.add_argument(
+    "--num_envs", type=int, default=1, help="Number of environments to spawn."
+)
+parser.add_argument(
+    "--num_demos", type=int, default=1000, help="Number of successful demonstrations to collect."
+)
+parser.add_argument(
+    "--max_episode_steps", type=int, default=1500, help="Episodes longer than this are discarded."
+)
+parser.add_argument(
+    "--obs_groups", type=str, nargs="+", default=["policy"], help="Observation groups to record."
+)
+parser.add_argument(
+    "--output_dir", type=str, default="./datasets/demos", help="Directory of the trajectory dataset."
+)
+parser.add_argument(
+    "--chunk_size", type=int, default=100000, help="Number of steps per dataset chunk."
+)
+parser.add_argument(
+    "--log_interval", type=int, default=100, help="Number of collected demos between progress messages."
+)
+parser.add_argument(
+    "--collision_budget", type=int, default=None, help="Maximum number of collision primitives per environment."
+)
+# Append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+# Parse the arguments
+args_cli = parser.parse_args()
+
+# Launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import gymnasium as gym
+import isaaclab_exassets  # noqa: F401
+import isaaclab_extasks  # noqa: F401
+from isaaclab_extasks.utils import (
+    EXPERT_CFGS,
+    PickPlaceExpert,
+    PickPlaceExpertCfg,
+    TrajectoryWriter,
+    collect_demonstrations,
+    task_sequence,
+)
+from isaaclab_tasks.utils import parse_env_cfg
+
+
+def expert_cfg(task: str) -> PickPlaceExpertCfg:
+    """Expert configuration of the robot named in the task id."""
+    names = [name for name in EXPERT_CFGS if f"-{name}-" in task]
+    if len(names) != 1:
+        raise ValueError(f"Task '{task}' names none or several of the robots: {list(EXPERT_CFGS)}.")
+    return EXPERT_CFGS[names[0]]
+
+
+def main():
+    """Main function."""
+    # Create environment configuration
+    env_cfg = parse_env_cfg(
+        task_name=args_cli.task, device=args_cli.device, num_envs=args_cli.num_envs
+    )
+    # episodes are ended by the expert or the success term
+    env_cfg.terminations.time_out = None
+    # fail on scenes that exceed the collision budget
+    if args_cli.collision_budget is not None:
+        env_cfg.collision_budget = args_cli.collision_budget
+        env_cfg.collision_budget_mode = "error"
+    env = gym.make(args_cli.task, cfg=env_cfg)
+
+    # Create the expert of the robot named in the task, e.g. Isaac-Block-Stack-Franka-v0
+    expert = PickPlaceExpert(env.unwrapped, expert_cfg(args_cli.task), task_sequence(env.unwrapped.cfg))
+
+    with TrajectoryWriter(args_cli.output_dir, chunk_size=args_cli.chunk_size) as writer:
+        num_demos, num_steps = collect_demonstrations(
+            env.unwrapped,
+            expert,
+            writer,
+            num_demos=args_cli.num_demos,
+            max_episode_steps=args_cli.max_episode_steps,
+            obs_groups=args_cli.obs_groups,
+            log_interval=args_cli.log_interval,
+            is_running=simulation_app.is_running,
+        )
+
+    print(f"[INFO]: Collected {num_demos} demos from {num_steps} steps.")
+
+    # Close the environment
+    env.close()
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # Close sim app
+    simulation_app.close()
@@ -0,0 +1,396 @@
+"""Completion backends for the LLM-driven scene construction.
+
+``SceneConstructor`` queries the OpenAI chat completion API for every scene, so each
+generation pays a remote round trip and identical prompts are never reused. The
+backends in this module are selected with the ``backend`` entry of
+``configs/scene_cfg.yaml``:
+
+* ``openai``: the remote model given by ``engine``.
+* ``local``: a deterministic stand-in that answers from rules, for machines without
+  network access and for reproducible tests of the pipeline. The shipped rules of
+  ``configs/local_completion_rules.yaml`` answer every prompt with the JSON example of
+  its output format, and recorded responses can be replayed as rules.
+
+With ``cache_dir`` set, the responses are stored by the hash of the model, the
+messages and the sampling parameters, and identical prompts are answered from the
+cache. The cache is off by default. The responses recorded in a cache are exported as
+exact-match rules of the local backend with:
+
+.. code-block:: bash
+
+    python construct_scene.py cache_dir=./llm_cache
+    python completion_backend.py ./llm_cache configs/recorded_rules.yaml
+    python construct_scene.py backend=local local_rules=configs/recorded_rules.yaml
+
+``SceneConstructor`` is not changed. :func:`serve_completions` serves a backend at a
+local endpoint of the chat completion API, and the OpenAI clients that the constructor
+creates are pointed to it by the documented ``OPENAI_BASE_URL`` environment variable.
+"""
+
+from __future__ import annotations
+
+import abc
+import argparse
+import contextlib
+import glob
+import hashlib
+import http.server
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+
+import yaml
+
+
+class CompletionBackend(abc.ABC):
+    """Base class of the completion backends."""
+
+    @abc.abstractmethod
+    def complete(self, messages: list[dict], model: str, **kwargs) -> str:
+        """Complete a chat.
+
+        Parameters
+        ----------
+        messages : list[dict]
+            Chat messages with the ``role`` and ``content`` entries.
+        model : str
+            Name of the model.
+        **kwargs
+            Sampling parameters, e.g. ``temperature``.
+
+        Returns
+        -------
+        str
+            Content of the assistant message.
+        """
+
+
+class OpenAIBackend(CompletionBackend):
+    """Remote completion with the OpenAI API."""
+
+    def __init__(self, api_key: str | None = None):
+        import openai
+
+        if hasattr(openai, "OpenAI"):
+            self._create = openai.OpenAI(api_key=api_key).chat.completions.create
+        else:
+            if api_key is not None:
+                openai.api_key = api_key
+            self._create = openai.ChatCompletion.create
+
+    def complete(self, messages: list[dict], model: str, **kwargs) -> str:
+        response = self._create(model=model, messages=messages, **kwargs)
+        if isinstance(response, dict):
+            return response["choices"][0]["message"]["content"]
+        return response.choices[0].message.content
+
+
+class LocalBackend(CompletionBackend):
+    """Deterministic stand-in that answers from rules.
+
+    The rules are read from a YAML file with a list of ``{"match": <regex>, "response":
+    <text>}`` entries, where the response may instead be given as a ``file`` relative to
+    the rule file. The first rule whose pattern matches the last user message is used.
+    In the response, ``{0}``, ``{1}``, ... are replaced by the groups of the match, if the
+    pattern has groups, and ``{example}`` by the last JSON example of the prompt, i.e. the
+    output format that the prompt asks for. Without a matching rule, the ``default``
+    response of the file is used, or an error is raised if the file has none. Rules are
+    exported from recorded responses by :func:`export_rules`.
+    """
+
+    def __init__(self, rules_path: str):
+        with open(rules_path) as f:
+            rules_cfg = yaml.safe_load(f) or {}
+        base_dir = os.path.dirname(os.path.abspath(rules_path))
+        self.rules = []
+        for rule in rules_cfg.get("rules") or []:
+            response = rule.get("response")
+            if response is None:
+                with open(os.path.join(base_dir, rule["file"])) as f:
+                    response = f.read()
+            self.rules.append((re.compile(rule["match"], re.DOTALL), response))
+        self.rules_path = rules_path
+        self.default = rules_cfg.get("default")
+
+    def complete(self, messages: list[dict], model: str, **kwargs) -> str:
+        prompt = next((m["content"] for m in reversed(messages) if m["role"] == "user"), "")
+        for pattern, response in self.rules:
+            match = pattern.search(prompt)
+            if match is not None:
+                # responses are often JSON, so only the numbered placeholders of the groups are replaced
+                if pattern.groups > 0:
+                    response = re.sub(r"\{(\d+)\}", lambda m: match.group(int(m.group(1)) + 1) or "", response)
+                return self._fill_example(response, prompt)
+        if self.default is None:
+            raise ValueError(f"No rule of '{self.rules_path}' matches the prompt and the rules have no default.")
+        return self._fill_example(self.default, prompt)
+
+    def _fill_example(self, response: str, prompt: str) -> str:
+        if "{example}" not in response:
+            return response
+        example = json_example(prompt)
+        if example is None:
+            raise ValueError(f"The response of '{self.rules_path}' uses the JSON example of a prompt that has none.")
+        return response.replace("{example}", example)
+
+
+def json_example(text: str) -> str | None:
+    """Get the last JSON example of a prompt.
+
+    Fenced code blocks are searched first, then the JSON objects and arrays of the text.
+
+    Parameters
+    ----------
+    text : str
+        The prompt.
+
+    Returns
+    -------
+    str | None
+        Source of the last JSON value, or None if the prompt has none.
+    """
+    blocks = [block.strip() for block in re.findall(r"```[^\n`]*\n(.*?)```", text, re.DOTALL)]
+    for block in reversed(blocks):
+        try:
+            json.loads(block)
+        except json.JSONDecodeError:
+            continue
+        return block
+    decoder, example, start = json.JSONDecoder(), None, 0
+    for match in re.finditer(r"[\[{]", text):
+        if match.start() < start:
+            # values nested in the last decoded value are part of it
+            continue
+        try:
+            _, end = decoder.raw_decode(text, match.start())
+        except json.JSONDecodeError:
+            continue
+        example, start = text[match.start() : end], end
+    return example
+
+
+class CachedBackend(CompletionBackend):
+    """Persistent prompt-hash cache in front of another backend."""
+
+    def __init__(self, backend: CompletionBackend, cache_dir: str):
+        self.backend = backend
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, messages: list[dict], model: str, **kwargs) -> str:
+        """Hash of the request."""
+        data = json.dumps({"model": model, "messages": messages, "kwargs": kwargs}, sort_keys=True, default=str)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def complete(self, messages: list[dict], model: str, **kwargs) -> str:
+        key = self.key(messages, model, **kwargs)
+        path = os.path.join(self.cache_dir, key[:2], f"{key}.json")
+        if os.path.isfile(path):
+            self.hits += 1
+            with open(path) as f:
+                return json.load(f)["response"]
+        self.misses += 1
+        response = self.backend.complete(messages, model, **kwargs)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # write atomically, so that concurrent scene builds never read a partial entry
+        with tempfile.NamedTemporaryFile("w", dir=os.path.dirname(path), delete=False) as f:
+            json.dump(
+                {"model": model, "messages": messages, "kwargs": kwargs, "response": response}, f, indent=2, default=str
+            )
+        os.replace(f.name, path)
+        return response
+
+
+class _CompletionHandler(http.server.BaseHTTPRequestHandler):
+    """Handler of the chat completion requests of the OpenAI clients."""
+
+    def do_POST(self):
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self.send_error(404)
+            return
+        request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        model, messages = request.pop("model"), request.pop("messages")
+        stream = request.pop("stream", False)
+        request.pop("stream_options", None)
+        if self.server.seed is not None:
+            request.setdefault("seed", self.server.seed)
+        try:
+            content = self.server.backend.complete(messages, model, **request)
+        except ValueError as e:
+            # client errors are not retried by the OpenAI clients
+            self._send_json(400, {"error": {"message": str(e), "type": "invalid_request_error"}})
+            return
+        except Exception as e:
+            self._send_json(500, {"error": {"message": str(e), "type": type(e).__name__}})
+            return
+        completion = {"id": f"chatcmpl-{uuid.uuid4().hex}", "created": int(time.time()), "model": model}
+        if not stream:
+            message = {"role": "assistant", "content": content}
+            usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+            choice = {"index": 0, "message": message, "finish_reason": "stop", "logprobs": None}
+            self._send_json(200, {**completion, "object": "chat.completion", "choices": [choice], "usage": usage})
+            return
+        # streamed completions are sent as a single chunk
+        choice = {"index": 0, "delta": {"role": "assistant", "content": content}, "finish_reason": "stop"}
+        chunk = json.dumps({**completion, "object": "chat.completion.chunk", "choices": [choice]})
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        self.wfile.write(f"data: {chunk}\n\ndata: [DONE]\n\n".encode("utf-8"))
+
+    def _send_json(self, status: int, body: dict):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@contextlib.contextmanager
+def serve_completions(backend: CompletionBackend, seed: int | None = None) -> Iterator[str]:
+    """Serve a backend at a local endpoint of the chat completion API of OpenAI.
+
+    The clients of the ``openai`` package, pinned in ``requirements.txt``, read their
+    endpoint from the ``OPENAI_BASE_URL`` environment variable when they are created.
+    Inside the context, the variable points to the local endpoint, so the clients that
+    ``SceneConstructor`` creates complete their chats with the backend. ``OPENAI_API_KEY``
+    is set to a placeholder if it is not set, since the local endpoint needs no key.
+
+    Parameters
+    ----------
+    backend : CompletionBackend
+        The completion backend. Backends that call the OpenAI API must be created before
+        the context is entered.
+    seed : int | None
+        Sampling seed passed with every request that sets none. It is part of the key of a
+        :class:`CachedBackend`, so scenes of different seeds are not answered from the
+        cache entries of each other. Defaults to None.
+
+    Yields
+    ------
+    str
+        Base URL of the local endpoint.
+    """
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _CompletionHandler)
+    server.daemon_threads = True
+    server.backend, server.seed = backend, seed
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    environ = {"OPENAI_BASE_URL": base_url, "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY", "local")}
+    previous = {key: os.environ.get(key) for key in environ}
+    os.environ.update(environ)
+    try:
+        yield base_url
+    finally:
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def make_backend(cfg) -> CompletionBackend:
+    """Create the completion backend of a scene configuration.
+
+    Parameters
+    ----------
+    cfg : DictConfig
+        Scene configuration with the ``backend``, ``api_key_file``, ``local_rules`` and
+        ``cache_dir`` entries.
+
+    Returns
+    -------
+    CompletionBackend
+        The backend, wrapped in a cache if ``cache_dir`` is set.
+    """
+    name = cfg.get("backend", "openai")
+    if name == "openai":
+        api_key = os.environ.get("OPENAI_API_KEY")
+        api_key_file = cfg.get("api_key_file")
+        if api_key is None and api_key_file and os.path.isfile(api_key_file):
+            with open(api_key_file) as f:
+                api_key = yaml.safe_load(f).get("api_key")
+        backend = OpenAIBackend(api_key)
+    elif name == "local":
+        backend = LocalBackend(cfg.local_rules)
+    else:
+        raise ValueError(f"Unknown completion backend '{name}'. Expected 'openai' or 'local'.")
+    if cfg.get("cache_dir"):
+        backend = CachedBackend(backend, cfg.cache_dir)
+    return backend
+
+
+def completion_context(cfg, seed: int | None = None) -> contextlib.AbstractContextManager:
+    """Context in which ``SceneConstructor`` completes its chats with the backend of a scene configuration.
+
+    The remote OpenAI API without cache and seed is used directly, as without a backend.
+
+    Parameters
+    ----------
+    cfg : DictConfig
+        Scene configuration with the entries read by :func:`make_backend`.
+    seed : int | None
+        Sampling seed of the requests, see :func:`serve_completions`. Defaults to None.
+
+    Returns
+    -------
+    contextlib.AbstractContextManager
+        The context of :func:`serve_completions` or a context that does nothing.
+    """
+    if cfg.get("backend", "openai") == "openai" and not cfg.get("cache_dir") and seed is None:
+        return contextlib.nullcontext()
+    return serve_completions(make_backend(cfg), seed)
+
+
+def export_rules(cache_dir: str, rules_path: str) -> int:
+    """Write the responses recorded in a cache as the rules of the local backend.
+
+    Each entry becomes a rule that matches its last user message exactly, so that the
+    local backend replays the recorded responses in the formats of the prompts. Other
+    prompts are answered with their JSON examples.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Directory of the cache of a :class:`CachedBackend`.
+    rules_path : str
+        Path of the YAML file of the rules.
+
+    Returns
+    -------
+    int
+        Number of exported rules.
+    """
+    rules = []
+    for path in sorted(glob.glob(os.path.join(cache_dir, "*", "*.json"))):
+        with open(path) as f:
+            entry = json.load(f)
+        prompt = next((m["content"] for m in reversed(entry["messages"]) if m["role"] == "user"), "")
+        # the pattern has no groups, so the response is returned as recorded
+        rules.append({"match": rf"\A{re.escape(prompt)}\Z", "response": entry["response"]})
+    with open(rules_path, "w") as f:
+        # the prompts that were not recorded are answered with the example of their output format
+        yaml.safe_dump({"rules": rules, "default": "{example}"}, f, sort_keys=False, allow_unicode=True)
+    return len(rules)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export the responses of a completion cache as local rules.")
+    parser.add_argument("cache_dir", type=str, help="Directory of the completion cache.")
+    parser.add_argument("rules_path", type=str, help="Path of the YAML file of the rules of the local backend.")
+    args = parser.parse_args()
+    print(f"[INFO]: Exported {export_rules(args.cache_dir, args.rules_path)} rules to {args.rules_path}.")
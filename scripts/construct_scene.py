@@ -1,12 +1,21 @@
 import hydra
+from hydra.utils import to_absolute_path
 from omegaconf import DictConfig
 from isaaclab_scenesynth.scene_constructor import SceneConstructor
 
+from completion_backend import completion_context
+
 
 @hydra.main(config_path="configs", config_name="scene_cfg", version_base=None)
-def main(cfg: DictConfig):    
-    scene_builder = SceneConstructor(cfg)
-    scene_builder.construct_scene()
+def main(cfg: DictConfig):
+    # paths of the backend are relative to the launch directory
+    for key in ("local_rules", "cache_dir"):
+        if cfg.get(key):
+            cfg[key] = to_absolute_path(cfg[key])
+    # the scene constructor completes its prompts with the configured backend
+    with completion_context(cfg):
+        scene_builder = SceneConstructor(cfg)
+        scene_builder.construct_scene()
 
 
 if __name__ == "__main__":
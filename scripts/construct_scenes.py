@@ -0,0 +1,154 @@
+"""Batch construction of scenes across a process pool.
+
+Each job builds one scene with ``SceneConstructor`` into its own directory
+``<output_dir>/scene_<hash>``, named by the hash of its prompt and seed. Jobs are
+defined by the lines of ``prompts_file`` or, without it, by the seeds ``seed_start,
+..., seed_start + num_scenes - 1``. The status of each job is appended to the ledger
+``<output_dir>/ledger.jsonl``, so an interrupted run resumes with the jobs that are not
+done, also if the prompts or the seed range changed in between:
+
+.. code-block:: bash
+
+    python construct_scenes.py num_scenes=5000 num_workers=16
+    python construct_scenes.py prompts_file=prompts.txt backend=local
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import random
+import time
+import traceback
+from functools import partial
+from multiprocessing import get_context
+
+import hydra
+import numpy as np
+from hydra.utils import to_absolute_path
+from omegaconf import DictConfig, OmegaConf, open_dict
+
+
+class JobLedger:
+    """Append-only log of the status of the jobs. The last record of a job wins."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.records = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # the last line may be truncated by a crash
+                        continue
+                    self.records[record["job"]] = record
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    def status(self, job: str) -> str | None:
+        record = self.records.get(job)
+        return None if record is None else record["status"]
+
+    def append(self, record: dict):
+        with open(self.path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.records[record["job"]] = record
+
+
+def job_name(prompt: str | None, seed: int) -> str:
+    """Name of the job of a prompt and seed, which is also the name of its scene directory."""
+    digest = hashlib.sha256(json.dumps([prompt, seed]).encode("utf-8")).hexdigest()
+    return f"scene_{digest[:16]}"
+
+
+def make_jobs(cfg: DictConfig) -> list[dict]:
+    """Create the jobs of the prompts or of the seed range."""
+    if cfg.prompts_file is not None:
+        with open(to_absolute_path(cfg.prompts_file)) as f:
+            prompts = [line.strip() for line in f if line.strip()]
+        seeds = [cfg.seed_start + i for i in range(len(prompts))]
+    else:
+        prompts, seeds = [None] * cfg.num_scenes, [cfg.seed_start + i for i in range(cfg.num_scenes)]
+    return [{"job": job_name(prompt, seed), "prompt": prompt, "seed": seed} for prompt, seed in zip(prompts, seeds)]
+
+
+def check_constructor(cfg: DictConfig):
+    """Check that the installed ``SceneConstructor`` takes the prompts of the jobs.
+
+    The seed of a job needs no support of the constructor: it seeds the random generators
+    of the worker and the completion requests. A prompt is passed as the ``prompt``
+    argument, which the constructor of ``isaaclab_scenesynth`` must accept.
+    """
+    if cfg.prompts_file is None:
+        return
+    from isaaclab_scenesynth.scene_constructor import SceneConstructor
+
+    parameters = inspect.signature(SceneConstructor).parameters.values()
+    if not any(p.name == "prompt" or p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters):
+        raise ValueError(
+            "The SceneConstructor of the installed isaaclab_scenesynth takes no 'prompt' argument, so the scenes of"
+            " prompts_file cannot be constructed. Use the seed range instead."
+        )
+
+
+def run_job(job: dict, cfg_dict: dict) -> dict:
+    """Construct the scene of a job in a worker process."""
+    from completion_backend import completion_context
+    from isaaclab_scenesynth.scene_constructor import SceneConstructor
+
+    cfg = OmegaConf.create(cfg_dict)
+    with open_dict(cfg):
+        cfg.output_dir = os.path.join(cfg.output_dir, job["job"])
+    os.makedirs(cfg.output_dir, exist_ok=True)
+    random.seed(job["seed"])
+    np.random.seed(job["seed"])
+
+    start = time.time()
+    try:
+        # the seed also keys the cached responses, so that the seeded scenes differ
+        kwargs = {} if job["prompt"] is None else {"prompt": job["prompt"]}
+        with completion_context(cfg, seed=job["seed"]):
+            SceneConstructor(cfg, **kwargs).construct_scene()
+    except Exception:
+        return {**job, "status": "failed", "error": traceback.format_exc(limit=5), "duration": time.time() - start}
+    outputs = [cfg.usd_filename, cfg.cfg_filename, cfg.metadata_filename, cfg.graph_filename]
+    missing = [name for name in outputs if not os.path.isfile(os.path.join(cfg.output_dir, name))]
+    status = "failed" if missing else "done"
+    record = {**job, "status": status, "duration": time.time() - start}
+    if missing:
+        record["error"] = f"missing outputs: {missing}"
+    return record
+
+
+@hydra.main(config_path="configs", config_name="batch_scene_cfg", version_base=None)
+def main(cfg: DictConfig):
+    # paths are relative to the launch directory
+    for key in ("output_dir", "prompt_dir", "local_rules", "cache_dir"):
+        if cfg.get(key):
+            cfg[key] = to_absolute_path(cfg[key])
+    check_constructor(cfg)
+    ledger = JobLedger(os.path.join(cfg.output_dir, cfg.ledger_filename))
+
+    jobs = make_jobs(cfg)
+    skipped = {"done"} if cfg.retry_failed else {"done", "failed"}
+    pending = [job for job in jobs if ledger.status(job["job"]) not in skipped]
+    print(f"[INFO]: {len(jobs)} scenes, {len(jobs) - len(pending)} are already in the ledger, {len(pending)} to build.")
+    if not pending:
+        return
+
+    cfg_dict = OmegaConf.to_container(cfg, resolve=True)
+    counts = {"done": 0, "failed": 0}
+    # fresh processes per scene, so that the USD stages of the previous scenes are released
+    with get_context("spawn").Pool(cfg.num_workers, maxtasksperchild=1) as pool:
+        for record in pool.imap_unordered(partial(run_job, cfg_dict=cfg_dict), pending):
+            ledger.append(record)
+            counts[record["status"]] += 1
+            print(f"[INFO]: {record['job']}: {record['status']} in {record['duration']:.1f} s.")
+    print(f"[INFO]: Built {counts['done']} scenes, {counts['failed']} failed. Ledger: {ledger.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import argparse
+
+from isaaclab.app import AppLauncher
+
+# Add argparse arguments
+parser = argparse.ArgumentParser(
+    description="Mirror the remote assets referenced by the extended tasks for offline runs."
+)
+parser.add_argument(
+    "--task", type=str, nargs="+", default=["Isaac-*"], help="Names or glob patterns of the tasks."
+)
+parser.add_argument(
+    "--mirror_dir", type=str, default=None, help="Directory of the asset mirror. Defaults to the data directory."
+)
+parser.add_argument(
+    "--num_workers", type=int, default=8, help="Number of concurrent downloads."
+)
+parser.add_argument(
+    "--force", action="store_true", default=False, help="Fetch the assets that are already mirrored."
+)
+# Append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+# Parse the arguments
+args_cli = parser.parse_args()
+args_cli.headless = True
+
+# Launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import fnmatch
+import os
+
+import gymnasium as gym
+import isaaclab_exassets  # noqa: F401
+import isaaclab_extasks  # noqa: F401
+from isaaclab_exassets.mirror import ASSET_MIRROR_DIR, AssetMirror, collect_remote_assets
+from isaaclab_tasks.utils import parse_env_cfg
+
+
+def main():
+    """Main function."""
+    # Tasks registered by the extended tasks
+    tasks = []
+    for name, spec in gym.registry.items():
+        entry_point = spec.kwargs.get("env_cfg_entry_point")
+        module = entry_point if isinstance(entry_point, str) else getattr(entry_point, "__module__", "")
+        if module.startswith("isaaclab_extasks") and any(fnmatch.fnmatch(name, pattern) for pattern in args_cli.task):
+            tasks.append(name)
+    tasks = sorted(tasks)
+    print(f"[INFO]: Collecting the remote assets of {len(tasks)} tasks.")
+
+    # Remote paths of the environment configurations
+    urls = set()
+    for task in tasks:
+        env_cfg = parse_env_cfg(task_name=task, device="cpu", num_envs=1)
+        # the assets added when the configuration is finalized, e.g. the sub-tasks of the multi-task envs
+        if hasattr(env_cfg, "finalize"):
+            env_cfg.finalize()
+        task_urls = collect_remote_assets(env_cfg)
+        print(f"[INFO]: {task}: {len(task_urls)} remote assets.")
+        urls.update(task_urls)
+
+    # Fetch the assets and the dependencies of their USD files
+    mirror = AssetMirror(args_cli.mirror_dir or ASSET_MIRROR_DIR)
+    failed = mirror.prefetch(sorted(urls), num_workers=args_cli.num_workers, force=args_cli.force)
+    for url, error in failed.items():
+        print(f"[WARN]: Failed to fetch {url}: {error}")
+    print(f"[INFO]: Mirrored {len(mirror.index)} assets to {os.path.abspath(mirror.mirror_dir)}.")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # Close sim app
+    simulation_app.close()
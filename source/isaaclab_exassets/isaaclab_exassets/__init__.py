@@ -22,11 +22,33 @@ ISAACLAB_EXTENDED_ASSETS_METADATA = toml.load(
 __version__ = ISAACLAB_EXTENDED_ASSETS_METADATA["package"]["version"]
 
 
+##
+# Quality tiers and complexity of the collision geometry.
+##
+
+from .collision import COLLISION_TIERS, collision_complexity, collision_variant_path
+
+
+##
+# Baked kitchens and fixture models of RoboCasa.
+##
+
+from .kitchen import KITCHEN_CACHE_DIR, config_hash, fixture_usd_path
+
+
+##
+# Resolution of remote assets.
+##
+
+from .mirror import ASSET_MIRROR_DIR, resolve_asset_path, resolve_cfg_assets
+
+
 ##
 # Configuration for different assets.
 ##
 
 from .franka import *
+from .grippers import *
 from .kinova import *
 from .kuka import *
 from .ufactory import *
@@ -0,0 +1,101 @@
+"""Collision geometry shared by the offline asset stages and the task configurations.
+
+* The quality tiers of the baked collision variants. The offline stage
+  ``utils/bake_collision.py`` writes one collision variant per tier next to each
+  part, and the task configurations select the variants of a tier.
+* The collision complexity of a USD prim tree. It is reported per asset by
+  ``utils/collision_report.py`` and per environment by the collision budget check of
+  the task environments.
+
+The module only needs ``pxr``, so that the offline stages can load it without Isaac Sim.
+"""
+
+import os
+
+from pxr import Usd, UsdGeom, UsdPhysics
+
+COLLISION_TIERS = {
+    # single convex hull per mesh
+    "hull": {"method": "hull"},
+    # CoACD parameters, from the cheapest to the most accurate contacts
+    "coarse": {"method": "coacd", "threshold": 0.2, "max_convex_hull": 8, "max_ch_vertex": 32, "resolution": 1000},
+    "medium": {"method": "coacd", "threshold": 0.08, "max_convex_hull": 24, "max_ch_vertex": 64, "resolution": 2000},
+    "fine": {"method": "coacd", "threshold": 0.03, "max_convex_hull": 64, "max_ch_vertex": 128, "resolution": 4000},
+}
+"""Parameters of the convex decomposition of the quality tiers, from the cheapest to the most accurate."""
+
+
+def collision_variant_path(usd_path: str, tier: str) -> str:
+    """Get the path of the collision variant of a part USD for a tier.
+
+    Parameters
+    ----------
+    usd_path : str
+        Path of the part USD.
+    tier : str
+        Quality tier, a key of :data:`COLLISION_TIERS`.
+
+    Returns
+    -------
+    str
+        Path of the collision variant. The file exists only if the tier was baked.
+    """
+    part_name = os.path.splitext(os.path.basename(usd_path))[0]
+    return os.path.join(os.path.dirname(usd_path), "collision", f"{part_name}_{tier}.usd")
+
+
+TRIANGLE_MESH_APPROXIMATIONS = ("none", "meshSimplification", "sdf")
+"""Collision approximations that keep the triangles of the mesh."""
+
+DEFAULT_MAX_CONVEX_HULLS = 32
+"""Default maximum number of hulls of the PhysX convex decomposition."""
+
+
+def collision_complexity(root: Usd.Prim) -> dict:
+    """Count the colliders, triangles, convex hulls and collision primitives of a prim tree.
+
+    Parameters
+    ----------
+    root : Usd.Prim
+        Root prim of the tree. Instance proxies are traversed.
+
+    Returns
+    -------
+    dict
+        Number of ``colliders``, ``triangles`` of the collision meshes, ``convex`` hulls
+        and collision ``primitives`` PhysX has to handle, i.e. one per analytic shape or
+        convex hull and one per triangle of triangle mesh colliders, and whether the tree
+        is ``instanceable``.
+    """
+    stats = {"colliders": 0, "triangles": 0, "convex": 0, "primitives": 0, "instanceable": False}
+    for prim in Usd.PrimRange(root, Usd.TraverseInstanceProxies()):
+        if prim.IsInstance():
+            stats["instanceable"] = True
+        if not prim.HasAPI(UsdPhysics.CollisionAPI):
+            continue
+        enabled = UsdPhysics.CollisionAPI(prim).GetCollisionEnabledAttr().Get()
+        if enabled is False:
+            continue
+        stats["colliders"] += 1
+        if not prim.IsA(UsdGeom.Mesh):
+            # analytic shape
+            stats["primitives"] += 1
+            continue
+        counts = UsdGeom.Mesh(prim).GetFaceVertexCountsAttr().Get() or []
+        triangles = sum(max(count - 2, 0) for count in counts)
+        stats["triangles"] += triangles
+        approximation = "none"
+        if prim.HasAPI(UsdPhysics.MeshCollisionAPI):
+            approximation = UsdPhysics.MeshCollisionAPI(prim).GetApproximationAttr().Get() or "none"
+        if approximation in TRIANGLE_MESH_APPROXIMATIONS:
+            stats["primitives"] += triangles
+        elif approximation == "convexDecomposition":
+            max_hulls = prim.GetAttribute("physxConvexDecompositionCollision:maxConvexHulls").Get()
+            num_hulls = max_hulls if max_hulls is not None else DEFAULT_MAX_CONVEX_HULLS
+            stats["convex"] += num_hulls
+            stats["primitives"] += num_hulls
+        else:
+            # convex hull and bounding shapes
+            stats["convex"] += int(approximation == "convexHull")
+            stats["primitives"] += 1
+    return stats
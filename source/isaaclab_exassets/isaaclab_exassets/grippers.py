@@ -0,0 +1,50 @@
+"""Joint positions of the open and closed grippers of the robots.
+
+The positions are keyed by the regular expressions of the gripper joints of the
+articulation configurations and are taken from the joint limits of the grippers.
+"""
+
+##
+# Configuration
+##
+
+FRANKA_HAND_OPEN = {"panda_finger_joint[1-2]": 0.04}
+"""Franka Hand opened to the upper limit of the finger joints (80 mm stroke)."""
+
+FRANKA_HAND_CLOSE = {"panda_finger_joint[1-2]": 0.0}
+"""Franka Hand closed to the lower limit of the finger joints."""
+
+
+ROBOTIQ_2F_85_OPEN = {"finger_joint": 0.0}
+"""Robotiq 2F-85 opened to the lower limit of the driver joint."""
+
+ROBOTIQ_2F_85_CLOSE = {"finger_joint": 0.8}
+"""Robotiq 2F-85 closed to the upper limit of the driver joint."""
+
+
+ROBOTIQ_2F_140_OPEN = {"finger_joint": 0.0}
+"""Robotiq 2F-140 opened to the lower limit of the driver joint."""
+
+ROBOTIQ_2F_140_CLOSE = {"finger_joint": 0.7}
+"""Robotiq 2F-140 closed to the upper limit of the driver joint."""
+
+
+SCHUNK_WSG_50_OPEN = {"drive_joint": 0.055}
+"""SCHUNK WSG 50 opened to half of its 110 mm stroke per finger."""
+
+SCHUNK_WSG_50_CLOSE = {"drive_joint": 0.0}
+"""SCHUNK WSG 50 closed to the lower limit of the drive joint."""
+
+
+XARM_GRIPPER_OPEN = {"drive_joint": 0.0}
+"""UFactory xArm gripper opened to the lower limit of the drive joint."""
+
+XARM_GRIPPER_CLOSE = {"drive_joint": 0.85}
+"""UFactory xArm gripper closed to the upper limit of the drive joint."""
+
+
+KINOVA_3F_OPEN = {".*_finger_[1-3]": 0.2, ".*_finger_tip_[1-3]": 0.2}
+"""Kinova three-finger gripper of the Jaco arms, opened."""
+
+KINOVA_3F_CLOSE = {".*_finger_[1-3]": 1.2, ".*_finger_tip_[1-3]": 1.2}
+"""Kinova three-finger gripper of the Jaco arms, closed."""
@@ -0,0 +1,59 @@
+"""RoboCasa kitchen files shared by the offline stages and the task configurations.
+
+* The cache of the baked kitchens. The offline stage ``utils/compile_kitchen.py`` bakes
+  a kitchen configuration (``env_config.json``) into ``<cache_dir>/kitchen_<hash>.usd``,
+  and the kitchen tasks find the baked file from the configuration by the same hash.
+* The converted USD files of the fixture models, which ``utils/load_robocasa_scene.py``,
+  ``utils/compile_kitchen.py`` and the scene compiler of the tasks spawn.
+
+The module only needs the standard library, so that the offline stages can load it without Isaac Sim.
+"""
+
+import hashlib
+import json
+import os
+
+_DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data"))
+
+KITCHEN_CACHE_DIR = os.path.join(_DATA_DIR, "Scenes/USD/Kitchen/cache")
+"""Default directory of the baked kitchens."""
+
+
+def config_hash(config: dict) -> str:
+    """Hash of the canonical JSON of a kitchen configuration.
+
+    Parameters
+    ----------
+    config : dict
+        Kitchen configuration with the ``others`` and ``fixture`` entries.
+
+    Returns
+    -------
+    str
+        Hexadecimal hash that names the baked kitchen.
+    """
+    data = json.dumps(config, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def fixture_usd_path(path: str, data_dir: str = _DATA_DIR) -> str:
+    """Path of the converted USD of a RoboCasa fixture model.
+
+    Parameters
+    ----------
+    path : str
+        Path of the MJCF model of the fixture in the kitchen configuration.
+    data_dir : str
+        Data directory that holds the converted models under ``Props/USD/objaverse``.
+
+    Returns
+    -------
+    str
+        Path of the converted USD. The file exists only if the model was converted.
+    """
+    if path.split("/")[-1] == "model.xml":
+        file_name = f"{path.split('/')[-2]}.usd"
+    else:
+        obj_name = path.split("/")[-1].split(".")[0]
+        file_name = f"{obj_name}/{obj_name}.usd"
+    return os.path.join(data_dir, "Props/USD/objaverse", os.path.dirname(path), file_name)
@@ -0,0 +1,376 @@
+"""Local mirror of the remote assets referenced by the task configurations.
+
+Assets on Nucleus servers or S3 buckets are fetched when the stage is created, which
+slows down the startup of every run and fails on nodes without network access. The
+mirror keeps a local copy of each remote file at
+
+    <mirror_dir>/<host>/<path>
+
+so that relative references between the USD files, textures and materials of an
+asset still resolve. The file contents are stored once under
+``<mirror_dir>/objects/<sha256><ext>`` and hard-linked into the tree, and the content
+hash of each URL is recorded in ``<mirror_dir>/index.json``. USD layers that author
+remote or server-absolute asset paths are mirrored as a copy whose paths point to the
+mirrored files instead.
+
+The environments replace the remote paths of their configuration by the mirrored
+files with :func:`resolve_cfg_assets` when they are constructed, so importing a task
+never touches the mirror. With the environment variable ``ISAACLAB_ASSET_OFFLINE=1``,
+a remote path that is not mirrored raises an error instead of blocking on the network.
+The mirror is filled by ``scripts/prefetch_assets.py``.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import posixpath
+import shutil
+import tempfile
+import threading
+import urllib.parse
+import urllib.request
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+
+from . import ISAACLAB_EXTENDED_ASSETS_DATA_DIR
+
+ASSET_MIRROR_DIR = os.environ.get("ISAACLAB_ASSET_MIRROR_DIR", os.path.join(ISAACLAB_EXTENDED_ASSETS_DATA_DIR, "Mirror"))
+"""Directory of the asset mirror. Can be overridden with ``ISAACLAB_ASSET_MIRROR_DIR``."""
+
+REMOTE_SCHEMES = ("http", "https", "omniverse", "s3")
+"""URL schemes of the remote assets."""
+
+USD_EXTENSIONS = (".usd", ".usda", ".usdc")
+"""Extensions of the USD files whose dependencies are mirrored."""
+
+
+def is_remote(path: str) -> bool:
+    """Check whether a path is the URL of a remote asset."""
+    return urllib.parse.urlparse(path).scheme in REMOTE_SCHEMES
+
+
+def mirror_path(url: str, mirror_dir: str = ASSET_MIRROR_DIR) -> str:
+    """Get the path of a remote asset in the mirror.
+
+    Parameters
+    ----------
+    url : str
+        URL of the remote asset.
+    mirror_dir : str
+        Directory of the asset mirror.
+
+    Returns
+    -------
+    str
+        Path of the mirrored file. The file exists only if the asset was fetched.
+    """
+    parsed = urllib.parse.urlparse(url)
+    return os.path.join(mirror_dir, parsed.netloc, urllib.parse.unquote(parsed.path).lstrip("/"))
+
+
+def resolve_asset_path(path: str, mirror_dir: str = ASSET_MIRROR_DIR) -> str:
+    """Resolve a remote asset to its mirrored file.
+
+    Parameters
+    ----------
+    path : str
+        Local path or URL of the asset.
+    mirror_dir : str
+        Directory of the asset mirror.
+
+    Returns
+    -------
+    str
+        The mirrored file if the asset is remote and was fetched, otherwise the input path.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the asset is remote, not mirrored and ``ISAACLAB_ASSET_OFFLINE`` is set.
+    """
+    if not is_remote(path):
+        return path
+    local_path = mirror_path(path, mirror_dir)
+    if os.path.isfile(local_path):
+        return local_path
+    if os.environ.get("ISAACLAB_ASSET_OFFLINE", "0") == "1":
+        raise FileNotFoundError(f"Remote asset '{path}' is not mirrored. Run scripts/prefetch_assets.py.")
+    return path
+
+
+def resolve_cfg_assets(cfg: object, mirror_dir: str = ASSET_MIRROR_DIR) -> list[str]:
+    """Replace the remote asset paths of a configuration by their mirrored files in place.
+
+    Configurations are walked recursively through their fields, dictionaries and lists.
+    This covers the default paths of Isaac Lab configurations, e.g. of the ground plane.
+
+    Parameters
+    ----------
+    cfg : object
+        The configuration, e.g. an environment configuration.
+    mirror_dir : str
+        Directory of the asset mirror.
+
+    Returns
+    -------
+    list[str]
+        Remote paths that are not mirrored.
+    """
+    missing = []
+
+    def resolve(value):
+        if isinstance(value, str):
+            if not is_remote(value):
+                return value
+            local_path = mirror_path(value, mirror_dir)
+            if os.path.isfile(local_path):
+                return local_path
+            missing.append(value)
+            return value
+        if isinstance(value, dict):
+            for key, item in value.items():
+                value[key] = resolve(item)
+        elif isinstance(value, list):
+            for i, item in enumerate(value):
+                value[i] = resolve(item)
+        elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+            for field in dataclasses.fields(value):
+                setattr(value, field.name, resolve(getattr(value, field.name)))
+        return value
+
+    resolve(cfg)
+    if missing and os.environ.get("ISAACLAB_ASSET_OFFLINE", "0") == "1":
+        raise FileNotFoundError(f"Remote assets are not mirrored: {sorted(set(missing))}. Run scripts/prefetch_assets.py.")
+    return sorted(set(missing))
+
+
+def collect_remote_assets(cfg: object) -> list[str]:
+    """Collect the remote asset paths of a configuration."""
+    urls = set()
+
+    def collect(value):
+        if isinstance(value, str):
+            if is_remote(value):
+                urls.add(value)
+        elif isinstance(value, dict):
+            for item in value.values():
+                collect(item)
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                collect(item)
+        elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+            for field in dataclasses.fields(value):
+                collect(getattr(value, field.name))
+
+    collect(cfg)
+    return sorted(urls)
+
+
+def read_remote(url: str) -> bytes:
+    """Read the contents of a remote asset."""
+    parsed = urllib.parse.urlparse(url)
+    if parsed.scheme == "omniverse":
+        import omni.client
+
+        result, _, content = omni.client.read_file(url)
+        if result != omni.client.Result.OK:
+            raise OSError(f"Failed to read '{url}': {result}")
+        return bytes(memoryview(content))
+    if parsed.scheme == "s3":
+        url = f"https://{parsed.netloc}.s3.amazonaws.com{parsed.path}"
+    with urllib.request.urlopen(url, timeout=60) as response:
+        return response.read()
+
+
+def dependency_url(url: str, path: str) -> str:
+    """URL of an asset path authored in the remote file of a URL."""
+    if is_remote(path):
+        return path
+    # urljoin does not resolve relative paths for schemes it does not know, e.g. omniverse
+    parsed = urllib.parse.urlparse(url)
+    if not path.startswith("/"):
+        path = posixpath.join(posixpath.dirname(parsed.path), path)
+    return urllib.parse.urlunparse(parsed._replace(path=posixpath.normpath(path), params="", query="", fragment=""))
+
+
+def usd_dependencies(url: str, usd_path: str) -> list[str]:
+    """URLs of the sublayers, references, payloads and asset attributes of the USD file of a URL."""
+    from pxr import UsdUtils
+
+    sublayers, references, payloads = UsdUtils.ExtractExternalReferences(usd_path)
+    urls = []
+    for path in list(sublayers) + list(references) + list(payloads):
+        if not path or "<UDIM>" in path:
+            continue
+        urls.append(dependency_url(url, path))
+    return urls
+
+
+def localize_usd(url: str, usd_path: str, local_path: str, mirror_dir: str = ASSET_MIRROR_DIR) -> bool:
+    """Write a copy of the USD file of a URL whose remote and server-absolute asset paths point into the mirror.
+
+    Parameters
+    ----------
+    url : str
+        URL of the USD file.
+    usd_path : str
+        Path of the fetched contents of the USD file.
+    local_path : str
+        Path of the mirrored file, to which the copy is written.
+    mirror_dir : str
+        Directory of the asset mirror.
+
+    Returns
+    -------
+    bool
+        Whether the copy was written, i.e. the layer authors remote or server-absolute asset paths.
+    """
+    from pxr import Sdf, UsdUtils
+
+    layer = Sdf.Layer.OpenAsAnonymous(usd_path)
+    localized = False
+
+    def localize(path: str) -> str:
+        nonlocal localized
+        if not path or "<UDIM>" in path or not (is_remote(path) or path.startswith("/")):
+            return path
+        localized = True
+        return os.path.relpath(mirror_path(dependency_url(url, path), mirror_dir), os.path.dirname(local_path))
+
+    UsdUtils.ModifyAssetPaths(layer, localize)
+    if not localized:
+        return False
+    # the format of the layer follows the extension of the temporary file
+    root, extension = os.path.splitext(local_path)
+    tmp_path = f"{root}.{os.getpid()}.{threading.get_ident()}.tmp{extension}"
+    layer.Export(tmp_path)
+    os.replace(tmp_path, local_path)
+    return True
+
+
+class AssetMirror:
+    """Content-addressed store of the mirrored remote assets."""
+
+    def __init__(self, mirror_dir: str = ASSET_MIRROR_DIR):
+        """Initialize the mirror.
+
+        Parameters
+        ----------
+        mirror_dir : str
+            Directory of the asset mirror.
+        """
+        self.mirror_dir = mirror_dir
+        self.index_path = os.path.join(mirror_dir, "index.json")
+        self.index = {}
+        if os.path.isfile(self.index_path):
+            with open(self.index_path) as f:
+                self.index = json.load(f)
+        self._lock = threading.Lock()
+
+    def fetch(self, url: str, force: bool = False) -> str:
+        """Fetch a remote asset into the mirror.
+
+        Parameters
+        ----------
+        url : str
+            URL of the remote asset.
+        force : bool
+            Whether to fetch an asset that is already mirrored.
+
+        Returns
+        -------
+        str
+            Path of the mirrored file.
+        """
+        local_path = mirror_path(url, self.mirror_dir)
+        if not force and url in self.index and os.path.isfile(local_path) and os.path.isfile(self.object_path(url)):
+            return local_path
+        content = read_remote(url)
+        digest = hashlib.sha256(content).hexdigest()
+        object_path = self._object_path(url, digest)
+        if not os.path.isfile(object_path):
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            # write atomically, so that interrupted fetches leave no partial objects
+            with tempfile.NamedTemporaryFile(dir=os.path.dirname(object_path), delete=False) as f:
+                f.write(content)
+            os.replace(f.name, object_path)
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        if os.path.lexists(local_path):
+            os.remove(local_path)
+        # layers with remote references are mirrored as a localized copy of the object
+        if not (local_path.endswith(USD_EXTENSIONS) and localize_usd(url, object_path, local_path, self.mirror_dir)):
+            try:
+                os.link(object_path, local_path)
+            except OSError:
+                shutil.copyfile(object_path, local_path)
+        with self._lock:
+            self.index[url] = digest
+        return local_path
+
+    def object_path(self, url: str) -> str:
+        """Get the path of the fetched contents of a mirrored URL.
+
+        Parameters
+        ----------
+        url : str
+            URL of the mirrored asset.
+
+        Returns
+        -------
+        str
+            Path of the content-addressed object, which is never localized.
+        """
+        return self._object_path(url, self.index[url])
+
+    def _object_path(self, url: str, digest: str) -> str:
+        # the extension is kept, since USD selects the file format by extension
+        extension = os.path.splitext(urllib.parse.urlparse(url).path)[1]
+        return os.path.join(self.mirror_dir, "objects", digest[:2], f"{digest}{extension}")
+
+    def prefetch(self, urls: Iterable[str], num_workers: int = 8, force: bool = False) -> dict[str, str]:
+        """Fetch remote assets and the dependencies of their USD files.
+
+        Parameters
+        ----------
+        urls : Iterable[str]
+            URLs of the remote assets.
+        num_workers : int
+            Number of concurrent downloads.
+        force : bool
+            Whether to fetch assets that are already mirrored.
+
+        Returns
+        -------
+        dict[str, str]
+            Error messages of the assets that could not be fetched, keyed by URL.
+        """
+        failed, visited = {}, set()
+        pending = [url for url in urls if is_remote(url)]
+        with ThreadPoolExecutor(num_workers) as executor:
+            while pending:
+                batch = [url for url in dict.fromkeys(pending) if url not in visited]
+                visited.update(batch)
+                pending = []
+                futures = {url: executor.submit(self.fetch, url, force) for url in batch}
+                for url, future in futures.items():
+                    try:
+                        local_path = future.result()
+                    except Exception as e:
+                        failed[url] = str(e)
+                        continue
+                    print(f"[INFO] Mirrored {url}")
+                    if local_path.endswith(USD_EXTENSIONS):
+                        # the dependencies are read from the fetched contents, not from the localized copy
+                        pending.extend(usd_dependencies(url, self.object_path(url)))
+                self.save()
+        return failed
+
+    def save(self):
+        """Save the content hashes of the mirrored URLs."""
+        os.makedirs(self.mirror_dir, exist_ok=True)
+        with self._lock:
+            with open(self.index_path, "w") as f:
+                json.dump(self.index, f, indent=2, sort_keys=True)
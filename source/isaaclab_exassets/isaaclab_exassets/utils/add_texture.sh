@@ -1,7 +1,7 @@
 #!/bin/bash
 
-# Store the paths of all object.xml files as a list in $input
-input=$(find ../../../../data/Props/USD/ -name "*.usd")
+# Store the paths of all converted props as a list in $input
+input=$(find ../../../../data/Props/USD/ -name "*.usd" -not -name "instanceable_meshes.usd" -not -path "*/collision/*")
 
-# Call convert_objaverse_fixture_mjcf.py once, passing all input and corresponding output files
-/isaac-sim/python.sh add_texture.py $input
\ No newline at end of file
+# Call postprocess_usd.py once, passing all input files
+python postprocess_usd.py add_texture $input --texture ${TEXTURE:?Set TEXTURE to the path of the diffuse texture}
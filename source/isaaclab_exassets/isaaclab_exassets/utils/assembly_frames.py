@@ -0,0 +1,190 @@
+"""Assembled poses of the parts of the assembly datasets, computed without Kit.
+
+The ``pivot`` operation of ``postprocess_usd.py`` moves the origin of every converted part
+to the center of its mesh extent, so the USD files no longer tell where a part sits in the
+assembly. This tool recovers the assembled poses from the mesh extents and writes them next
+to the parts, so that the tasks read a small JSON file instead of the meshes.
+
+Operations:
+
+* ``siemens``: the parts of the Siemens gearbox are exported in the frame of the assembled
+  gearbox, so the assembled pose of a part in the frame of the gearbox base is the offset
+  between the centers of their extents. The input is the gearbox base, the other parts are
+  the sibling directories. Writes ``Props/USD/siemens_gearbox/assembly_frames.json``.
+* ``fusion360``: the two bodies of a Fusion 360 Gallery joint set are exported in their own
+  frames and the joint set (``joint.json`` next to the meshes, ``body_one`` exported as
+  ``0.obj`` and ``body_two`` as ``1.obj``) aligns their joint frames. The input is the joint
+  set. Writes ``Props/USD/fusion360/<id>/joint_frame.json`` with the pose of ``model_0`` (the
+  object) in the frame of ``model_1`` (the fixture).
+
+The poses are those of the unscaled parts: positions are in the units of the meshes and
+quaternions are ``(w, x, y, z)``.
+"""
+
+import argparse
+import glob
+import json
+import os
+
+import numpy as np
+from pxr import Sdf
+
+# Conveniences to other module directories via relative paths
+ISAACLAB_EXTENDED_ASSETS_DATA_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "../../../../", "data")
+)
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Utility to compute the assembled poses of the converted parts.")
+parser.add_argument("operation", type=str, choices=["siemens", "fusion360"], help="Dataset of the inputs.")
+parser.add_argument("input", type=str, nargs="+", help="Gearbox base USD files or Fusion 360 joint set files.")
+
+
+"""
+Helpers.
+"""
+
+
+def mesh_center(usd_path: str) -> np.ndarray:
+    """Center of the mesh extent of a converted part, i.e. the origin of the part before the pivot.
+
+    The mesh is looked up in the part layer and, for parts whose meshes were moved to the
+    instanceable layer by ``instance_props.py``, in ``Props/instanceable_meshes.usd``.
+    """
+    model_name = os.path.basename(os.path.dirname(usd_path))
+    mesh_path = f"/{model_name}/geometry/mesh"
+    for layer_path in [usd_path, os.path.join(os.path.dirname(usd_path), "Props/instanceable_meshes.usd")]:
+        layer = Sdf.Layer.FindOrOpen(layer_path) if os.path.isfile(layer_path) else None
+        spec = layer.GetPrimAtPath(mesh_path) if layer is not None else None
+        if spec is not None and "extent" in spec.attributes:
+            extent = np.array(spec.attributes["extent"].default, dtype=np.float64)
+            return 0.5 * (extent[0] + extent[1])
+    raise ValueError(f"No extent of the mesh '{mesh_path}' in '{usd_path}'.")
+
+
+def quat_from_matrix(rot: np.ndarray) -> list[float]:
+    """Quaternion ``(w, x, y, z)`` of a rotation matrix, with a non-negative real part.
+
+    The quaternion is computed from the largest of its components, which stays accurate for
+    rotations by half a turn, e.g. those of flipped joints.
+    """
+    trace = np.trace(rot)
+    i = int(np.argmax([trace, rot[0, 0], rot[1, 1], rot[2, 2]]))
+    if i == 0:
+        r = np.sqrt(1.0 + trace)
+        quat = [r, (rot[2, 1] - rot[1, 2]) / r, (rot[0, 2] - rot[2, 0]) / r, (rot[1, 0] - rot[0, 1]) / r]
+    else:
+        j, k = i % 3, (i + 1) % 3
+        r = np.sqrt(1.0 + rot[i - 1, i - 1] - rot[j, j] - rot[k, k])
+        quat = [0.0] * 4
+        quat[0] = (rot[k, j] - rot[j, k]) / r
+        quat[i] = r
+        quat[j + 1] = (rot[j, i - 1] + rot[i - 1, j]) / r
+        quat[k + 1] = (rot[k, i - 1] + rot[i - 1, k]) / r
+    quat = 0.5 * np.array(quat)
+    quat = quat if quat[0] >= 0.0 else -quat
+    return (quat / np.linalg.norm(quat)).tolist()
+
+
+def joint_frame(transform: dict) -> np.ndarray:
+    """Homogeneous matrix of the joint frame of a body, from a Fusion 360 ``transform`` entry."""
+    frame = np.eye(4)
+    for i, key in enumerate(["x_axis", "y_axis", "z_axis", "origin"]):
+        frame[:3, i] = [transform[key][axis] for axis in "xyz"]
+    return frame
+
+
+def joint_transform(joint: dict) -> np.ndarray:
+    """Pose of body one in the frame of body two when the joint of a Fusion 360 joint set is assembled.
+
+    The joint frame of body one is flipped about its x-axis if the joint is flipped, moved along and
+    rotated about the joint axis by the offset and angle of the joint, and placed onto the joint
+    frame of body two.
+    """
+    frame_one = joint_frame(joint["geometry_or_origin_one"]["transform"])
+    frame_two = joint_frame(joint["geometry_or_origin_two"]["transform"])
+    angle = joint.get("angle", {}).get("value", 0.0)
+    offset = joint.get("offset", {}).get("value", 0.0)
+    motion = np.eye(4)
+    motion[:3, :3] = [[np.cos(angle), -np.sin(angle), 0.0], [np.sin(angle), np.cos(angle), 0.0], [0.0, 0.0, 1.0]]
+    motion[2, 3] = offset
+    if joint.get("is_flipped", False):
+        motion = motion @ np.diag([1.0, -1.0, -1.0, 1.0])
+    return frame_two @ motion @ np.linalg.inv(frame_one)
+
+
+def _translation(offset: np.ndarray) -> np.ndarray:
+    matrix = np.eye(4)
+    matrix[:3, 3] = offset
+    return matrix
+
+
+def _pose(matrix: np.ndarray) -> dict:
+    return {"pos": matrix[:3, 3].tolist(), "rot": quat_from_matrix(matrix[:3, :3])}
+
+
+"""
+Operations.
+"""
+
+
+def siemens(base_path: str) -> str:
+    """Write the assembled poses of the Siemens gearbox parts in the frame of the gearbox base."""
+    root = os.path.dirname(os.path.dirname(base_path))
+    parent_name = os.path.basename(os.path.dirname(base_path))
+    base_center = mesh_center(base_path)
+    frames = {}
+    for part_path in sorted(glob.glob(os.path.join(root, "*", "*.usd"))):
+        part_name = os.path.basename(os.path.dirname(part_path))
+        if part_name == parent_name or part_path.endswith("non_metric.usd"):
+            continue
+        # the part origins sit at their extent centers and the meshes share the frame of the assembly
+        frames[part_name] = _pose(_translation(mesh_center(part_path) - base_center))
+    output_path = os.path.join(root, "assembly_frames.json")
+    with open(output_path, "w") as f:
+        json.dump({"parent": parent_name, "frames": frames}, f, indent=2)
+    return f"[INFO] Wrote the assembled poses of {len(frames)} parts to {output_path}."
+
+
+def fusion360(joint_path: str) -> str:
+    """Write the assembled pose of the object of a Fusion 360 joint set in the frame of its fixture."""
+    with open(joint_path) as f:
+        joint_set = json.load(f)
+    if not joint_set.get("joints"):
+        return f"[WARN] Skipping {joint_path}: no joints."
+    joint_id = os.path.basename(os.path.dirname(joint_path))
+    usd_dir = os.path.join(ISAACLAB_EXTENDED_ASSETS_DATA_DIR, "Props/USD/fusion360", joint_id)
+    object_center = mesh_center(os.path.join(usd_dir, "model_0", "model_0.usd"))
+    fixture_center = mesh_center(os.path.join(usd_dir, "model_1", "model_1.usd"))
+    # all joints of a set assemble the bodies in the same way, the first one is used
+    pose = _translation(-fixture_center) @ joint_transform(joint_set["joints"][0]) @ _translation(object_center)
+    output_path = os.path.join(usd_dir, "joint_frame.json")
+    with open(output_path, "w") as f:
+        json.dump(_pose(pose), f, indent=2)
+    return f"[INFO] Wrote the joint frame of {joint_path} to {output_path}."
+
+
+def main():
+    # check valid file path
+    input_paths = [os.path.abspath(path) for path in args_cli.input if os.path.isfile(path)]
+    if len(input_paths) == 0:
+        raise ValueError("Input paths does not exist.")
+    operation = siemens if args_cli.operation == "siemens" else fusion360
+    num_errors = 0
+    for input_path in input_paths:
+        try:
+            msg = operation(input_path)
+        except (KeyError, ValueError) as e:
+            msg = f"[ERROR] {input_path}: {e}"
+        num_errors += int(not msg.startswith("[INFO]"))
+        print(msg)
+    print(f"[INFO] Assembled poses are done! {len(input_paths) - num_errors}/{len(input_paths)} files succeeded.")
+    if num_errors > 0:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    # parse the arguments
+    args_cli = parser.parse_args()
+    # run the main function
+    main()
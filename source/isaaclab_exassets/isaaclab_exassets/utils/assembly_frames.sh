@@ -0,0 +1,8 @@
+#!/bin/bash
+
+# Assembled poses of the Siemens gearbox parts in the frame of the gearbox base
+python assembly_frames.py siemens ../../../../data/Props/USD/siemens_gearbox/gearbox_base/gearbox_base.usd
+
+# Joint frames of the Fusion 360 joint sets
+input=$(find ../../../../data/Props/OBJ/fusion360/joint_assembly/ -name "joint.json")
+python assembly_frames.py fusion360 $input
@@ -0,0 +1,262 @@
+"""Offline convex decomposition of the collision meshes of converted parts.
+
+For every input USD, the collision meshes are decomposed into convex hulls at the
+requested quality tiers and a collision variant is written next to the part:
+
+    <part_dir>/collision/<part_name>_<tier>.usd
+
+The variant references the original USD, disables its collision meshes and adds one
+``convexHull`` collider per hull, so the simulator does not cook a decomposition at
+startup. Hulls are cached by the hash of the mesh data and the tier parameters, so
+re-running the stage only decomposes the meshes that changed.
+
+The script only needs ``pxr`` (``usd-core``) and ``numpy``. The ``coarse``, ``medium``
+and ``fine`` tiers use CoACD (``pip install coacd``), the ``hull`` tier uses a single
+convex hull computed with ``scipy``.
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import os
+from multiprocessing import Pool
+
+import numpy as np
+from pxr import Gf, Usd, UsdGeom, UsdPhysics
+
+# Conveniences to other module directories via relative paths
+ISAACLAB_EXTENDED_ASSETS_DATA_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "../../../../", "data")
+)
+
+# The quality tiers are shared with the task configurations. The module is loaded from its file, so that the
+# script does not import the asset configurations of the package, which need Isaac Sim.
+_collision_spec = importlib.util.spec_from_file_location(
+    "isaaclab_exassets_collision", os.path.join(os.path.dirname(__file__), "..", "collision.py")
+)
+_collision = importlib.util.module_from_spec(_collision_spec)
+_collision_spec.loader.exec_module(_collision)
+COLLISION_TIERS = _collision.COLLISION_TIERS
+collision_variant_path = _collision.collision_variant_path
+
+CACHE_VERSION = 1
+"""Version of the cache format. Bump to invalidate all cached hulls."""
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Utility to bake convex decompositions of the collision meshes of parts.")
+parser.add_argument("input", type=str, nargs="+", help="Paths to the input USD files.")
+parser.add_argument(
+    "--tiers",
+    type=str,
+    nargs="+",
+    default=["coarse", "medium", "fine"],
+    choices=list(COLLISION_TIERS.keys()),
+    help="Quality tiers to bake.",
+)
+parser.add_argument(
+    "--cache-dir",
+    type=str,
+    default=os.path.join(ISAACLAB_EXTENDED_ASSETS_DATA_DIR, "CollisionCache"),
+    help="Directory of the hull cache.",
+)
+parser.add_argument("--num-workers", type=int, default=os.cpu_count(), help="Number of decomposition processes.")
+parser.add_argument("--report", type=str, default=None, help="Path of the JSON report. Defaults to <cache-dir>/report.json.")
+parser.add_argument("--force", action="store_true", default=False, help="Ignore the cache and decompose every mesh.")
+
+
+def read_collision_meshes(stage: Usd.Stage) -> list[tuple[Usd.Prim, np.ndarray, np.ndarray]]:
+    """Collect the collision meshes of a stage as triangle soups in their local frame."""
+    meshes = []
+    for prim in Usd.PrimRange(stage.GetPseudoRoot(), Usd.TraverseInstanceProxies()):
+        if not prim.IsA(UsdGeom.Mesh) or not prim.HasAPI(UsdPhysics.CollisionAPI):
+            continue
+        mesh = UsdGeom.Mesh(prim)
+        points = np.asarray(mesh.GetPointsAttr().Get(), dtype=np.float64)
+        counts = np.asarray(mesh.GetFaceVertexCountsAttr().Get(), dtype=np.int64)
+        indices = np.asarray(mesh.GetFaceVertexIndicesAttr().Get(), dtype=np.int64)
+        if len(points) < 4 or len(counts) == 0:
+            continue
+        # fan triangulation of the polygons
+        triangles = []
+        start = 0
+        for count in counts:
+            face = indices[start : start + count]
+            triangles.extend((face[0], face[i], face[i + 1]) for i in range(1, count - 1))
+            start += count
+        meshes.append((prim, points, np.asarray(triangles, dtype=np.int64)))
+    return meshes
+
+
+def mesh_hash(points: np.ndarray, triangles: np.ndarray, tier: str) -> str:
+    """Hash of the mesh data and of the parameters of a tier."""
+    digest = hashlib.sha256()
+    digest.update(np.ascontiguousarray(points, dtype=np.float32).tobytes())
+    digest.update(np.ascontiguousarray(triangles, dtype=np.int32).tobytes())
+    digest.update(json.dumps({"version": CACHE_VERSION, **COLLISION_TIERS[tier]}, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def decompose(points: np.ndarray, triangles: np.ndarray, tier: str) -> list[tuple[np.ndarray, np.ndarray]]:
+    """Decompose a mesh into convex hulls with the parameters of a tier."""
+    params = dict(COLLISION_TIERS[tier])
+    method = params.pop("method")
+    if method == "hull":
+        from scipy.spatial import ConvexHull
+
+        hull = ConvexHull(points)
+        # compact the vertices of the hull
+        remap = -np.ones(len(points), dtype=np.int64)
+        remap[hull.vertices] = np.arange(len(hull.vertices))
+        return [(points[hull.vertices], remap[hull.simplices])]
+    import coacd
+
+    coacd.set_log_level("error")
+    parts = coacd.run_coacd(coacd.Mesh(points, triangles), seed=0, **params)
+    return [(np.asarray(vertices), np.asarray(faces)) for vertices, faces in parts]
+
+
+def bake_mesh(job: tuple[np.ndarray, np.ndarray, str, str, bool]) -> tuple[str, bool]:
+    """Decompose one mesh and store the hulls in the cache. Returns the cache file and whether it was a hit."""
+    points, triangles, tier, cache_file, force = job
+    if os.path.exists(cache_file) and not force:
+        return cache_file, True
+    hulls = decompose(points, triangles, tier)
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    # write to a file of this process and rename it, so that concurrent bakes never read a partial file
+    tmp_file = f"{cache_file[: -len('.npz')]}.{os.getpid()}.tmp.npz"
+    np.savez_compressed(
+        tmp_file,
+        vertices=np.concatenate([vertices for vertices, _ in hulls]).astype(np.float32),
+        faces=np.concatenate([faces for _, faces in hulls]).astype(np.int32),
+        vertex_counts=np.asarray([len(vertices) for vertices, _ in hulls], dtype=np.int32),
+        face_counts=np.asarray([len(faces) for _, faces in hulls], dtype=np.int32),
+    )
+    os.replace(tmp_file, cache_file)
+    return cache_file, False
+
+
+def load_hulls(cache_file: str) -> list[tuple[np.ndarray, np.ndarray]]:
+    """Load the hulls of a cache file."""
+    data = np.load(cache_file)
+    vertex_splits = np.cumsum(data["vertex_counts"])[:-1]
+    face_splits = np.cumsum(data["face_counts"])[:-1]
+    return list(zip(np.split(data["vertices"], vertex_splits), np.split(data["faces"], face_splits)))
+
+
+def write_collision_variant(usd_path: str, tier: str, meshes: list[tuple[Usd.Prim, list]]):
+    """Write the collision variant of a part that references the original USD."""
+    source = Usd.Stage.Open(usd_path)
+    default_prim = source.GetDefaultPrim()
+    output_path = collision_variant_path(usd_path, tier)
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+    stage = Usd.Stage.CreateNew(output_path)
+    UsdGeom.SetStageUpAxis(stage, UsdGeom.GetStageUpAxis(source))
+    UsdGeom.SetStageMetersPerUnit(stage, UsdGeom.GetStageMetersPerUnit(source))
+    root = stage.DefinePrim(default_prim.GetPath(), default_prim.GetTypeName())
+    root.GetReferences().AddReference(os.path.relpath(usd_path, os.path.dirname(output_path)))
+    stage.SetDefaultPrim(root)
+
+    for mesh_prim, hulls in meshes:
+        # prims inside instances cannot be overridden, so the instances are expanded
+        instance = mesh_prim
+        while instance.IsInstanceProxy():
+            instance = instance.GetParent()
+            if instance.IsInstance():
+                stage.OverridePrim(instance.GetPath()).SetInstanceable(False)
+        mesh_over = stage.OverridePrim(mesh_prim.GetPath())
+        UsdPhysics.CollisionAPI.Apply(mesh_over).CreateCollisionEnabledAttr(False)
+        # hulls are defined in the local frame of the mesh
+        hull_root = UsdGeom.Xform.Define(stage, mesh_prim.GetPath().GetParentPath().AppendChild(f"{mesh_prim.GetName()}_hulls"))
+        hull_root.AddTransformOp().Set(Gf.Matrix4d(UsdGeom.Xformable(mesh_prim).GetLocalTransformation()))
+        for i, (vertices, faces) in enumerate(hulls):
+            hull = UsdGeom.Mesh.Define(stage, hull_root.GetPath().AppendChild(f"hull_{i:03d}"))
+            hull.CreatePointsAttr([Gf.Vec3f(*vertex) for vertex in vertices.tolist()])
+            hull.CreateFaceVertexCountsAttr([3] * len(faces))
+            hull.CreateFaceVertexIndicesAttr(faces.flatten().tolist())
+            hull.CreatePurposeAttr(UsdGeom.Tokens.guide)
+            UsdPhysics.CollisionAPI.Apply(hull.GetPrim())
+            UsdPhysics.MeshCollisionAPI.Apply(hull.GetPrim()).CreateApproximationAttr(UsdPhysics.Tokens.convexHull)
+    stage.GetRootLayer().Save()
+    return output_path
+
+
+def main():
+    # check valid file path
+    usd_paths = [os.path.abspath(path) for path in args_cli.input]
+    print("USD paths:", usd_paths)
+
+    # collect the decomposition jobs of all parts and tiers
+    jobs = []
+    parts = []
+    for usd_path in usd_paths:
+        stage = Usd.Stage.Open(usd_path)
+        if stage is None or not stage.GetDefaultPrim():
+            print(f"[WARN] Skipping {usd_path}: invalid stage or no default prim.")
+            continue
+        meshes = read_collision_meshes(stage)
+        if len(meshes) == 0:
+            print(f"[WARN] Skipping {usd_path}: no collision mesh.")
+            continue
+        for tier in args_cli.tiers:
+            entries = []
+            for prim, points, triangles in meshes:
+                key = mesh_hash(points, triangles, tier)
+                cache_file = os.path.join(args_cli.cache_dir, key[:2], f"{key}.npz")
+                jobs.append((points, triangles, tier, cache_file, args_cli.force))
+                entries.append((prim.GetPath(), cache_file, len(triangles)))
+            parts.append((usd_path, tier, entries))
+
+    # decompose the meshes in parallel
+    with Pool(max(1, args_cli.num_workers)) as pool:
+        results = dict(pool.map(bake_mesh, jobs))
+
+    # write the collision variants and the report
+    report = []
+    for usd_path, tier, entries in parts:
+        stage = Usd.Stage.Open(usd_path)
+        meshes = []
+        num_hulls, num_vertices, num_triangles, cache_hits = 0, 0, 0, 0
+        for prim_path, cache_file, mesh_triangles in entries:
+            hulls = load_hulls(cache_file)
+            meshes.append((stage.GetPrimAtPath(prim_path), hulls))
+            num_hulls += len(hulls)
+            num_vertices += sum(len(vertices) for vertices, _ in hulls)
+            num_triangles += mesh_triangles
+            cache_hits += int(results[cache_file])
+        output_path = write_collision_variant(usd_path, tier, meshes)
+        report.append(
+            {
+                "usd_path": usd_path,
+                "tier": tier,
+                "output_path": output_path,
+                "num_meshes": len(entries),
+                "num_source_triangles": num_triangles,
+                "num_hulls": num_hulls,
+                "num_hull_vertices": num_vertices,
+                "cache_hits": cache_hits,
+            }
+        )
+
+    print(f"{'part':<40} {'tier':<8} {'tris':>8} {'hulls':>6} {'verts':>7} {'cached':>7}")
+    for entry in report:
+        part_name = os.path.splitext(os.path.basename(entry["usd_path"]))[0]
+        print(
+            f"{part_name:<40} {entry['tier']:<8} {entry['num_source_triangles']:>8} {entry['num_hulls']:>6}"
+            f" {entry['num_hull_vertices']:>7} {entry['cache_hits']:>3}/{entry['num_meshes']:<3}"
+        )
+
+    report_path = args_cli.report or os.path.join(args_cli.cache_dir, "report.json")
+    os.makedirs(os.path.dirname(report_path), exist_ok=True)
+    with open(report_path, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"[INFO] Report is saved to {report_path}")
+    print("[INFO] Baking is done!")
+
+
+if __name__ == "__main__":
+    # parse the arguments
+    args_cli = parser.parse_args()
+    # run the main function
+    main()
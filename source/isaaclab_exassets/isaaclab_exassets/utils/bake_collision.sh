@@ -0,0 +1,7 @@
+#!/bin/bash
+
+# Store the paths of all assembly part USD files as a list in $input
+input=$(find ../../../../data/Props/USD/industreal ../../../../data/Props/USD/siemens_gearbox ../../../../data/Props/USD/fusion360 -name "*.usd" -not -path "*/collision/*" -not -name "instanceable_meshes.usd")
+
+# Call bake_collision.py once, passing all input files
+/isaac-sim/python.sh bake_collision.py $input --tiers hull coarse medium fine
@@ -0,0 +1,110 @@
+"""Report of the collision complexity of the converted assets.
+
+Every USD file under the input directories is opened with ``pxr`` only (no Kit
+startup) and its colliders are summarized:
+
+* ``triangles``: number of triangles of the collision meshes,
+* ``convex``: number of convex hulls, including the hulls of convex decompositions,
+* ``primitives``: number of collision primitives PhysX has to handle, i.e. one per
+  analytic shape or convex hull and one per triangle of triangle mesh colliders,
+* ``instanceable``: whether the asset uses instanceable prims.
+
+The report is sorted by the number of primitives and saved as JSON, keyed by the
+path of the asset relative to the data directory. The counts are the same as those
+of the collision budget check of the task environments, which counts the colliders
+of the built scene.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+
+from pxr import Usd
+
+# Conveniences to other module directories via relative paths
+ISAACLAB_EXTENDED_ASSETS_DATA_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "../../../../", "data")
+)
+
+# The counting is shared with the collision budget check of the task environments. The module is loaded from its
+# file, so that the script does not import the asset configurations of the package, which need Isaac Sim.
+_collision_spec = importlib.util.spec_from_file_location(
+    "isaaclab_exassets_collision", os.path.join(os.path.dirname(__file__), "..", "collision.py")
+)
+_collision = importlib.util.module_from_spec(_collision_spec)
+_collision_spec.loader.exec_module(_collision)
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Utility to report the collision complexity of USD assets.")
+parser.add_argument(
+    "input",
+    type=str,
+    nargs="*",
+    default=[os.path.join(ISAACLAB_EXTENDED_ASSETS_DATA_DIR, "Props/USD")],
+    help="Directories or USD files to report. Defaults to the Props/USD directory.",
+)
+parser.add_argument(
+    "--output",
+    type=str,
+    default=os.path.join(ISAACLAB_EXTENDED_ASSETS_DATA_DIR, "Props/USD/collision_report.json"),
+    help="Path of the JSON report.",
+)
+parser.add_argument("--top", type=int, default=50, help="Number of assets printed in the table.")
+
+
+def collect_usd_paths(inputs: list[str]) -> list[str]:
+    """Collect the USD files of the input directories and files."""
+    usd_paths = []
+    for path in inputs:
+        if os.path.isfile(path):
+            usd_paths.append(os.path.abspath(path))
+            continue
+        for root, _, files in os.walk(path):
+            for file in files:
+                # meshes referenced by instanceable assets are counted with their asset
+                if file.endswith((".usd", ".usda", ".usdc")) and file != "instanceable_meshes.usd":
+                    usd_paths.append(os.path.abspath(os.path.join(root, file)))
+    return sorted(usd_paths)
+
+
+def collision_complexity(usd_path: str) -> dict:
+    """Count the colliders, triangles, convex hulls and collision primitives of an asset."""
+    stage = Usd.Stage.Open(usd_path, load=Usd.Stage.LoadAll)
+    return _collision.collision_complexity(stage.GetPseudoRoot())
+
+
+def main():
+    usd_paths = collect_usd_paths(args_cli.input)
+    print(f"[INFO] Reporting {len(usd_paths)} USD files.")
+
+    assets = {}
+    for usd_path in usd_paths:
+        try:
+            stats = collision_complexity(usd_path)
+        except Exception as e:
+            print(f"[WARN] Skipping {usd_path}: {e}")
+            continue
+        if stats["colliders"] == 0:
+            continue
+        assets[os.path.relpath(usd_path, ISAACLAB_EXTENDED_ASSETS_DATA_DIR)] = stats
+    assets = dict(sorted(assets.items(), key=lambda item: item[1]["primitives"], reverse=True))
+
+    print(f"{'asset':<80} {'colliders':>9} {'tris':>9} {'convex':>7} {'prims':>9} {'inst':>5}")
+    for name, stats in list(assets.items())[: args_cli.top]:
+        print(
+            f"{name[-80:]:<80} {stats['colliders']:>9} {stats['triangles']:>9} {stats['convex']:>7}"
+            f" {stats['primitives']:>9} {'yes' if stats['instanceable'] else 'no':>5}"
+        )
+
+    os.makedirs(os.path.dirname(os.path.abspath(args_cli.output)), exist_ok=True)
+    with open(args_cli.output, "w") as f:
+        json.dump({"data_dir": ISAACLAB_EXTENDED_ASSETS_DATA_DIR, "assets": assets}, f, indent=2)
+    print(f"[INFO] Report is saved to {args_cli.output}")
+
+
+if __name__ == "__main__":
+    # parse the arguments
+    args_cli = parser.parse_args()
+    # run the main function
+    main()
@@ -0,0 +1,4 @@
+#!/bin/bash
+
+# Report the collision complexity of all converted props and scenes
+/isaac-sim/python.sh collision_report.py ../../../../data/Props/USD ../../../../data/Scenes/USD
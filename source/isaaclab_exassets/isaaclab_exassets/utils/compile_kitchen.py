@@ -0,0 +1,238 @@
+"""Compilation of RoboCasa kitchen configurations into baked, instanced USD files.
+
+``load_robocasa_scene.py`` spawns one asset per fixture of an ``env_config.json``,
+so identical models, such as the outlets or the cabinet drawers of a layout, are
+loaded once per fixture. This tool groups the fixtures by their source model and
+authors the layout as one stage:
+
+* Every fixture is a plain reference to its model, so that its rigid bodies and
+  joints stay on the stage where PhysX parses them.
+* The mesh subtrees of the model, i.e. the parents of its visual and collision
+  meshes that hold no rigid body or joint, are instanceable, so fixtures of the same
+  model share one USD prototype per subtree. Models converted with
+  ``instance_props.py`` are instanced already and are left as they are.
+
+The stage is flattened into a single USD (the prototypes are kept by the flattening)
+and cached as ``<cache_dir>/kitchen_<hash>.usd``, where the hash is computed from the
+canonical JSON of the configuration. The layout is also saved unflattened as
+``kitchen_<hash>_layered.usd``, whose fixtures reference the models by relative path.
+Fixtures of the same model then share one prototype across all layered kitchens of
+a stage, which is used to spawn different kitchens per environment. The
+fingerprints of the fixture models are stored in the layer metadata and a baked
+kitchen is recompiled when a model changed.
+
+Fixtures are scaled to fit their ``size`` along the axes where both the size and
+the extent of the model are non-zero. The tool only needs ``pxr``, no Kit startup.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+from collections import defaultdict
+
+from pxr import Gf, Sdf, Usd, UsdGeom, UsdPhysics
+
+# Conveniences to other module directories via relative paths
+ISAACLAB_EXTENDED_ASSETS_DATA_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "../../../../", "data")
+)
+
+# the cache of the baked kitchens is shared with the kitchen tasks; the module is loaded
+# from its file, since the package __init__ needs Isaac Sim
+_kitchen_spec = importlib.util.spec_from_file_location(
+    "isaaclab_exassets_kitchen", os.path.join(os.path.dirname(__file__), "..", "kitchen.py")
+)
+_kitchen = importlib.util.module_from_spec(_kitchen_spec)
+_kitchen_spec.loader.exec_module(_kitchen)
+KITCHEN_CACHE_DIR = _kitchen.KITCHEN_CACHE_DIR
+config_hash = _kitchen.config_hash
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Utility to compile RoboCasa kitchen configurations into baked USD files.")
+parser.add_argument("input", type=str, nargs="+", help="Paths to the kitchen configuration files (env_config.json).")
+parser.add_argument("--cache-dir", type=str, default=KITCHEN_CACHE_DIR, help="Directory of the baked kitchens.")
+parser.add_argument("--force", action="store_true", default=False, help="Recompile up-to-date kitchens.")
+
+
+def fixture_usd_path(path: str) -> str:
+    """Path of the converted USD of a fixture model in the data directory."""
+    return _kitchen.fixture_usd_path(path, ISAACLAB_EXTENDED_ASSETS_DATA_DIR)
+
+
+def fingerprint(path: str) -> str:
+    """Size and modification time of a file."""
+    stat = os.stat(path)
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def model_extent(usd_path: str) -> Gf.Vec3d:
+    """Size of the bounding box of the default prim of a model."""
+    stage = Usd.Stage.Open(usd_path)
+    prim = stage.GetDefaultPrim() or stage.GetPseudoRoot()
+    bbox_cache = UsdGeom.BBoxCache(Usd.TimeCode.Default(), [UsdGeom.Tokens.default_, UsdGeom.Tokens.render])
+    bound = bbox_cache.ComputeWorldBound(prim).ComputeAlignedRange()
+    return Gf.Vec3d(0.0, 0.0, 0.0) if bound.IsEmpty() else bound.GetSize()
+
+
+def _has_physics(prim: Usd.Prim) -> bool:
+    """Check whether a prim tree holds a rigid body, an articulation root or a joint."""
+    for child in Usd.PrimRange(prim):
+        if child.HasAPI(UsdPhysics.RigidBodyAPI) or child.HasAPI(UsdPhysics.ArticulationRootAPI):
+            return True
+        if child.IsA(UsdPhysics.Joint):
+            return True
+    return False
+
+
+def mesh_subtrees(usd_path: str) -> dict[str, Sdf.Path]:
+    """Mesh subtrees of a model that can be instanced.
+
+    A subtree is the parent of visual or collision meshes below the default prim that
+    holds no rigid body, articulation root or joint, so that the physics of the model is
+    never moved into a prototype. Meshes that are instanced already are skipped.
+
+    Returns the paths of the subtrees in the model, keyed by their paths relative to the default prim.
+    """
+    stage = Usd.Stage.Open(usd_path)
+    root = stage.GetDefaultPrim() or stage.GetPseudoRoot()
+    subtrees = set()
+    # the range does not descend into instances
+    for prim in Usd.PrimRange(root):
+        if not prim.IsA(UsdGeom.Mesh):
+            continue
+        parent = prim.GetParent()
+        if parent == root or _has_physics(parent):
+            continue
+        subtrees.add(parent.GetPath())
+    # nested subtrees are covered by their outermost ancestor
+    subtrees = [path for path in subtrees if not any(path.HasPrefix(other) and path != other for other in subtrees)]
+    return {str(path.MakeRelativePath(root.GetPath())): path for path in sorted(subtrees)}
+
+
+def output_path(config: dict, cache_dir: str) -> str:
+    """Path of the baked kitchen of a configuration."""
+    return os.path.join(cache_dir, f"kitchen_{config_hash(config)}.usd")
+
+
+def layered_path(usd_path: str) -> str:
+    """Path of the unflattened layout of a baked kitchen."""
+    return f"{os.path.splitext(usd_path)[0]}_layered.usd"
+
+
+def is_up_to_date(usd_path: str, sources: dict[str, str]) -> bool:
+    """Check that a baked kitchen exists and was compiled from the current fixture models."""
+    if not os.path.isfile(usd_path) or not os.path.isfile(layered_path(usd_path)):
+        return False
+    layer = Sdf.Layer.FindOrOpen(usd_path)
+    return layer is not None and dict(layer.customLayerData.get("sources", {})) == sources
+
+
+def compile_kitchen(config: dict, usd_path: str) -> dict:
+    """Author the fixtures of a kitchen configuration and save the flattened stage.
+
+    Returns the statistics of the compilation.
+    """
+    # group the fixtures by source model
+    groups, missing = defaultdict(list), []
+    for fixture in config["fixture"]:
+        if fixture["path"] is None:
+            continue
+        model_path = fixture_usd_path(fixture["path"])
+        if not os.path.isfile(model_path):
+            missing.append(fixture["name"])
+            continue
+        groups[model_path].append(fixture)
+
+    # the layered kitchen references the models relative to its location
+    os.makedirs(os.path.dirname(usd_path), exist_ok=True)
+    layer = Sdf.Layer.FindOrOpen(layered_path(usd_path))
+    if layer is None:
+        layer = Sdf.Layer.CreateNew(layered_path(usd_path))
+    else:
+        layer.Clear()
+    stage = Usd.Stage.Open(layer)
+    UsdGeom.SetStageUpAxis(stage, UsdGeom.Tokens.z)
+    UsdGeom.SetStageMetersPerUnit(stage, 1.0)
+    root = UsdGeom.Xform.Define(stage, "/Kitchen")
+    stage.SetDefaultPrim(root.GetPrim())
+
+    for model_path, fixtures in groups.items():
+        extent = model_extent(model_path)
+        subtrees = mesh_subtrees(model_path)
+        for fixture in fixtures:
+            xform = UsdGeom.Xform.Define(stage, f"/Kitchen/{fixture['name']}")
+            prim = xform.GetPrim()
+            reference = os.path.relpath(model_path, os.path.dirname(usd_path))
+            prim.GetReferences().AddReference(reference)
+            # rigid bodies and joints cannot be parsed from an instance prototype, only the meshes are shared;
+            # an instance needs a composition arc of its own, so the subtree also references its source
+            for subtree in subtrees:
+                mesh_prim = stage.OverridePrim(prim.GetPath().AppendPath(subtree))
+                mesh_prim.GetReferences().AddReference(reference, subtrees[subtree])
+                mesh_prim.SetInstanceable(True)
+            # RoboCasa writes zero quaternions (w, x, y, z) for unrotated fixtures
+            rotation = fixture["rotation"]
+            orient = Gf.Quatd(1.0) if not any(rotation) else Gf.Quatd(rotation[0], *rotation[1:]).GetNormalized()
+            scale = [
+                size / extent[i] if size > 0.0 and extent[i] > 0.0 else 1.0 for i, size in enumerate(fixture["size"])
+            ]
+            xform.ClearXformOpOrder()
+            xform.AddTranslateOp().Set(Gf.Vec3d(*fixture["position"]))
+            xform.AddOrientOp(UsdGeom.XformOp.PrecisionDouble).Set(orient)
+            xform.AddScaleOp().Set(Gf.Vec3d(*scale))
+
+    layer.customLayerData = {
+        "config_hash": config_hash(config),
+        "sources": {
+            os.path.relpath(path, ISAACLAB_EXTENDED_ASSETS_DATA_DIR): fingerprint(path) for path in sorted(groups)
+        },
+    }
+    layer.Save()
+    # the flattening keeps one prototype per instanced model
+    stage.Flatten().Export(usd_path)
+    return {
+        "fixtures": sum(len(fixtures) for fixtures in groups.values()),
+        "models": len(groups),
+        "prototypes": len(stage.GetPrototypes()),
+        "missing": missing,
+    }
+
+
+def compile_config(config_path: str, cache_dir: str, force: bool = False) -> tuple[str, dict | None]:
+    """Compile a kitchen configuration file unless its baked kitchen is up to date.
+
+    Returns the path of the baked kitchen and the statistics, or None if it was skipped.
+    """
+    with open(config_path) as f:
+        config = json.load(f)
+    usd_path = output_path(config, cache_dir)
+    sources = {}
+    for fixture in config["fixture"]:
+        model_path = fixture_usd_path(fixture["path"]) if fixture["path"] is not None else None
+        if model_path is not None and os.path.isfile(model_path):
+            sources[os.path.relpath(model_path, ISAACLAB_EXTENDED_ASSETS_DATA_DIR)] = fingerprint(model_path)
+    if not force and is_up_to_date(usd_path, sources):
+        return usd_path, None
+    return usd_path, compile_kitchen(config, usd_path)
+
+
+def main():
+    for config_path in args_cli.input:
+        usd_path, stats = compile_config(config_path, args_cli.cache_dir, args_cli.force)
+        if stats is None:
+            print(f"[INFO] {config_path}: {usd_path} is up to date.")
+            continue
+        print(
+            f"[INFO] {config_path}: {stats['fixtures']} fixtures of {stats['models']} models"
+            f" ({stats['prototypes']} prototypes) are saved to {usd_path}"
+        )
+        if stats["missing"]:
+            print(f"[WARN] Fixtures without a converted model: {stats['missing']}")
+
+
+if __name__ == "__main__":
+    # parse the arguments
+    args_cli = parser.parse_args()
+    # run the main function
+    main()
@@ -0,0 +1,4 @@
+#!/bin/bash
+
+# Call compile_kitchen.py once, passing all kitchen configuration files
+python compile_kitchen.py ./env_config.json
@@ -0,0 +1,152 @@
+"""Batch normalization of the RoboCasa MJCF models before the USD conversion.
+
+The tool runs in plain Python (no Isaac Sim) and processes every ``model.xml`` under
+the input directories in a pool of worker processes. Files whose output is newer
+than the input are skipped. Structural anomalies are printed and written to a log
+file, so that broken models can be inspected after a batch.
+
+Model kinds:
+
+* ``objaverse``: keep only the ``object`` body of the top-level body and remove the
+  top-level sites. The output is ``object.xml`` next to the input.
+* ``fixture``: remove the sites of the top-level bodies and lift their ``object``
+  bodies to the world body. The output is ``model_fixed.xml`` next to the input.
+"""
+
+import argparse
+import json
+import os
+import sys
+import xml.etree.ElementTree as ET
+from functools import partial
+from multiprocessing import Pool
+
+OUTPUT_NAMES = {"objaverse": "object.xml", "fixture": "model_fixed.xml"}
+"""Name of the output file of each model kind."""
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Utility to normalize MJCF models before the USD conversion.")
+parser.add_argument("input", type=str, nargs="+", help="Root directories of the MJCF models or paths to model files.")
+parser.add_argument("--kind", type=str, required=True, choices=list(OUTPUT_NAMES.keys()), help="Kind of the models.")
+parser.add_argument("--pattern", type=str, default="model.xml", help="Name of the model files in the root directories.")
+parser.add_argument("--num-workers", type=int, default=os.cpu_count(), help="Number of worker processes.")
+parser.add_argument("--force", action="store_true", default=False, help="Process files with an up-to-date output.")
+parser.add_argument("--log", type=str, default="fix_mjcf_anomalies.jsonl", help="Path of the anomaly log.")
+
+
+def find_models(inputs: list[str], pattern: str) -> list[str]:
+    """Collect the model files of the input directories and files."""
+    model_paths = []
+    for path in inputs:
+        if os.path.isfile(path):
+            model_paths.append(os.path.abspath(path))
+            continue
+        for root, _, files in os.walk(path):
+            if pattern in files:
+                model_paths.append(os.path.abspath(os.path.join(root, pattern)))
+    return sorted(model_paths)
+
+
+def check_mesh_files(root: ET.Element, xml_path: str) -> list[str]:
+    """Report the mesh files referenced by the assets that do not exist."""
+    compiler = root.find("compiler")
+    meshdir = compiler.get("meshdir", "") if compiler is not None else ""
+    base_dir = os.path.join(os.path.dirname(xml_path), meshdir)
+    anomalies = []
+    for mesh in root.iter("mesh"):
+        file = mesh.get("file")
+        if file is not None and not os.path.isfile(os.path.join(base_dir, file)):
+            anomalies.append(f"missing mesh file '{file}'")
+    return anomalies
+
+
+def fix_objaverse(root: ET.Element) -> list[str]:
+    """Keep the ``object`` body of the first top-level body and remove the top-level sites."""
+    anomalies = []
+    worldbody = root.find("worldbody")
+    if worldbody is None:
+        raise ValueError("no worldbody")
+    bodies = worldbody.findall("body")
+    if len(bodies) == 0:
+        raise ValueError("no body in worldbody")
+    if len(bodies) > 1:
+        anomalies.append(f"{len(bodies)} top-level bodies, only the first is kept")
+    body_object = bodies[0].find('body[@name="object"]')
+    if body_object is None:
+        raise ValueError("body object does not exist.")
+    worldbody.remove(bodies[0])
+    worldbody.append(body_object)
+    for site in worldbody.findall("site"):
+        worldbody.remove(site)
+    return anomalies
+
+
+def fix_fixture(root: ET.Element) -> list[str]:
+    """Remove the sites of the top-level bodies and lift their ``object`` bodies to the world body."""
+    anomalies = []
+    worldbody = root.find("worldbody")
+    if worldbody is None:
+        raise ValueError("no worldbody")
+    bodies = worldbody.findall("body")
+    if len(bodies) == 0:
+        raise ValueError("no body in worldbody")
+    for body in bodies:
+        for site in body.findall("site"):
+            body.remove(site)
+        inner_body = body.find('body[@name="object"]')
+        if inner_body is not None:
+            worldbody.append(inner_body)
+            worldbody.remove(body)
+        else:
+            anomalies.append(f"body '{body.get('name')}' has no object body")
+    return anomalies
+
+
+def process(xml_path: str, kind: str, force: bool) -> tuple[str, str, list[str]]:
+    """Normalize one model. Returns the path, the status and the anomalies."""
+    output_path = os.path.join(os.path.dirname(xml_path), OUTPUT_NAMES[kind])
+    if not force and os.path.exists(output_path) and os.path.getmtime(output_path) >= os.path.getmtime(xml_path):
+        return xml_path, "skipped", []
+    try:
+        tree = ET.parse(xml_path)
+    except ET.ParseError as e:
+        return xml_path, "failed", [f"parse error: {e}"]
+    root = tree.getroot()
+    anomalies = check_mesh_files(root, xml_path)
+    try:
+        anomalies += fix_objaverse(root) if kind == "objaverse" else fix_fixture(root)
+    except ValueError as e:
+        return xml_path, "failed", anomalies + [str(e)]
+    # save fixed xml file
+    tree.write(output_path)
+    return xml_path, "fixed", anomalies
+
+
+def main() -> int:
+    """Fix the models and return the exit code, non-zero if no model was found or a model failed."""
+    xml_paths = find_models(args_cli.input, args_cli.pattern)
+    print(f"[INFO] Found {len(xml_paths)} models.")
+    if len(xml_paths) == 0:
+        print(f"[ERROR] No model matches '{args_cli.pattern}' under {args_cli.input}.")
+        return 1
+
+    worker = partial(process, kind=args_cli.kind, force=args_cli.force)
+    num_workers = max(1, min(args_cli.num_workers, len(xml_paths)))
+    chunksize = max(1, len(xml_paths) // (4 * num_workers))
+    counts = {"fixed": 0, "skipped": 0, "failed": 0}
+    with Pool(num_workers) as pool, open(args_cli.log, "w") as log:
+        for xml_path, status, anomalies in pool.imap_unordered(worker, xml_paths, chunksize=chunksize):
+            counts[status] += 1
+            if anomalies:
+                print(f"[WARN] {xml_path}: {'; '.join(anomalies)}")
+                log.write(json.dumps({"path": xml_path, "status": status, "anomalies": anomalies}) + "\n")
+    print(f"[INFO] Fixed: {counts['fixed']}, skipped: {counts['skipped']}, failed: {counts['failed']}.")
+    print(f"[INFO] Anomalies are saved to {args_cli.log}")
+    return 1 if counts["failed"] > 0 else 0
+
+
+if __name__ == "__main__":
+    # parse the arguments
+    args_cli = parser.parse_args()
+    # run the main function
+    sys.exit(main())
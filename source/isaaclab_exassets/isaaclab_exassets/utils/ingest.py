@@ -0,0 +1,387 @@
+"""Dependency-tracked ingestion of the asset datasets.
+
+Each pipeline is a chain of stages that wrap the conversion and post-processing
+scripts of this directory. A stage declares its input files with a glob pattern
+relative to the data directory and, for every input, the extra files it reads and
+the files it writes. Every input is a node of the DAG. A node is stale if it has not
+succeeded yet, if one of its outputs is missing, if the fingerprint (size and
+modification time) of the files it reads changed since its last success, or if the
+command of the stage changed. Stages are run in order, so the outputs of a stage are
+globbed as the inputs of the next one once it finished.
+
+Only the stale nodes of a stage are passed to its command. They are split into
+batches of at most ``--batch-size`` nodes that run in parallel, since the assets of a
+stage are independent. The nodes of a failed batch are rerun one by one, so that a
+single broken asset only fails its own node. The result of every node is appended to
+a status log as soon as its run finishes, so a crashed run resumes where it stopped.
+
+Example:
+
+    python ingest.py fusion360 siemens --jobs 4
+    python ingest.py objaverse --dry-run
+"""
+
+import argparse
+import fnmatch
+import glob
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+# Conveniences to other module directories via relative paths
+ISAACLAB_EXTENDED_ASSETS_DATA_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "../../../../", "data")
+)
+UTILS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+ISAACSIM_PYTHON = os.environ.get("ISAACSIM_PYTHON", "/isaac-sim/python.sh")
+"""Python interpreter of the stages that need Isaac Sim."""
+
+
+@dataclass
+class Stage:
+    """A step of an ingestion pipeline."""
+
+    name: str
+    """Name of the stage."""
+    inputs: str
+    """Glob pattern of the input files relative to the data directory. ``**`` matches sub-directories."""
+    outputs: list[str]
+    """Templates of the output files of an input. Outputs equal to the input mean an in-place edit."""
+    command: list[str]
+    """Script of the stage and its arguments. The ``{inputs}`` argument is replaced by the inputs of the stale nodes."""
+    extra_inputs: list[str] = field(default_factory=list)
+    """Templates of the other files read for an input."""
+    exclude: list[str] = field(default_factory=list)
+    """Patterns of the file names to ignore."""
+    kit: bool = False
+    """Whether the command runs with the Isaac Sim Python, which limits the number of parallel batches."""
+    max_jobs: int | None = None
+    """Maximum number of parallel batches. Defaults to None, i.e. the ``--jobs`` argument."""
+    batch_size: int | None = None
+    """Maximum number of nodes per batch. Defaults to None, i.e. the ``--batch-size`` argument."""
+
+    def expand(self, input_path: str, templates: list[str]) -> list[str]:
+        """Expand path templates for an input.
+
+        The fields are ``{data}`` (data directory), ``{dir}`` (directory of the input),
+        ``{stem}`` (file name without extension), ``{parent}``, ``{parent2}`` and
+        ``{parent3}`` (names of the first three parent directories).
+        """
+        parents = os.path.dirname(input_path).split(os.sep)
+        fields = {
+            "data": ISAACLAB_EXTENDED_ASSETS_DATA_DIR,
+            "dir": os.path.dirname(input_path),
+            "stem": os.path.splitext(os.path.basename(input_path))[0],
+            "parent": parents[-1],
+            "parent2": parents[-2],
+            "parent3": parents[-3],
+        }
+        return [os.path.normpath(template.format(**fields)) for template in templates]
+
+    @property
+    def signature(self) -> str:
+        """Hash of the definition of the stage, so that nodes rerun when the stage changes."""
+        definition = [self.inputs, self.outputs, self.command, self.extra_inputs, self.exclude]
+        return hashlib.sha1(json.dumps(definition).encode()).hexdigest()[:12]
+
+
+PIPELINES = {
+    "fusion360": [
+        Stage(
+            name="rename",
+            inputs="Props/OBJ/fusion360/joint_assembly/*/[01].obj",
+            outputs=["{dir}/model_{stem}.obj"],
+            command=["rename_fusion360_mesh.py", "{inputs}"],
+        ),
+        Stage(
+            name="convert",
+            inputs="Props/OBJ/fusion360/joint_assembly/*/model_*.obj",
+            outputs=["{data}/Props/USD/fusion360/{parent}/{stem}/{stem}.usd"],
+            command=["convert_fusion360_mesh.py", "{inputs}", "--headless", "--mass", "0.25", "--collision-approximation", "meshSimplification"],
+            kit=True,
+        ),
+        Stage(
+            name="pivot",
+            inputs="Props/USD/fusion360/*/model_?/model_?.usd",
+            outputs=["{dir}/{stem}.usd"],
+            command=["postprocess_usd.py", "pivot", "{inputs}", "--preset", "fusion360"],
+        ),
+        Stage(
+            name="joint_frame",
+            inputs="Props/OBJ/fusion360/joint_assembly/*/joint.json",
+            extra_inputs=[
+                "{data}/Props/USD/fusion360/{parent}/model_0/model_0.usd",
+                "{data}/Props/USD/fusion360/{parent}/model_1/model_1.usd",
+            ],
+            outputs=["{data}/Props/USD/fusion360/{parent}/joint_frame.json"],
+            command=["assembly_frames.py", "fusion360", "{inputs}"],
+        ),
+        Stage(
+            name="instance",
+            inputs="Props/USD/fusion360/*/model_?/model_?.usd",
+            outputs=["{dir}/Props/instanceable_meshes.usd"],
+            command=["instance_props.py", "{inputs}", "--convert"],
+        ),
+        Stage(
+            name="pivot_instanceable",
+            inputs="Props/USD/fusion360/*/model_0/model_0.usd",
+            extra_inputs=["{dir}/Props/instanceable_meshes.usd"],
+            outputs=["{dir}/Props/instanceable_meshes.usd"],
+            command=["postprocess_usd.py", "pivot", "{inputs}", "--preset", "fusion360_instanceable"],
+        ),
+    ],
+    "siemens": [
+        Stage(
+            name="convert",
+            inputs="Props/OBJ/siemens_gearbox/**/*.obj",
+            outputs=["{data}/Props/USD/{parent}/{stem}/{stem}.usd"],
+            command=["convert_siemens_mesh.py", "{inputs}", "--headless", "--mass", "0.25", "--collision-approximation", "meshSimplification"],
+            kit=True,
+        ),
+        Stage(
+            name="pivot",
+            inputs="Props/USD/siemens_gearbox/*/*.usd",
+            outputs=["{dir}/{stem}.usd"],
+            command=["postprocess_usd.py", "pivot", "{inputs}", "--preset", "siemens"],
+            exclude=["*non_metric.usd"],
+        ),
+        Stage(
+            name="assembly_frames",
+            inputs="Props/USD/siemens_gearbox/gearbox_base/gearbox_base.usd",
+            extra_inputs=[
+                "{data}/Props/USD/siemens_gearbox/gear_small/gear_small.usd",
+                "{data}/Props/USD/siemens_gearbox/gear_medium/gear_medium.usd",
+                "{data}/Props/USD/siemens_gearbox/gear_large/gear_large.usd",
+                "{data}/Props/USD/siemens_gearbox/shaft_left/shaft_left.usd",
+                "{data}/Props/USD/siemens_gearbox/shaft_right/shaft_right.usd",
+            ],
+            outputs=["{data}/Props/USD/siemens_gearbox/assembly_frames.json"],
+            command=["assembly_frames.py", "siemens", "{inputs}"],
+        ),
+        Stage(
+            name="instance",
+            inputs="Props/USD/siemens_gearbox/*/*.usd",
+            outputs=["{dir}/Props/instanceable_meshes.usd"],
+            command=["instance_props.py", "{inputs}", "--convert"],
+            exclude=["*non_metric.usd"],
+        ),
+    ],
+    "objaverse": [
+        Stage(
+            name="fix",
+            inputs="_robocasa/objects/objaverse/**/model.xml",
+            outputs=["{dir}/object.xml"],
+            command=["fix_mjcf_models.py", "{inputs}", "--kind", "objaverse", "--force"],
+        ),
+        Stage(
+            name="convert",
+            inputs="_robocasa/objects/objaverse/**/object.xml",
+            outputs=["{data}/Props/USD/{parent}/{parent}.usd"],
+            command=["convert_objaverse_object_mjcf.py", "{inputs}", "--headless", "--make-instanceable", "--import-sites"],
+            kit=True,
+        ),
+    ],
+    "fixtures": [
+        Stage(
+            name="fix",
+            inputs="Props/MJCF/fixtures/**/model.xml",
+            outputs=["{dir}/model_fixed.xml"],
+            command=["fix_mjcf_models.py", "{inputs}", "--kind", "fixture", "--force"],
+        ),
+        Stage(
+            name="convert",
+            inputs="Props/MJCF/fixtures/**/model_fixed.xml",
+            outputs=["{data}/Props/USD/fixtures/{parent3}/{parent2}/{parent}/{parent}.usd"],
+            command=["convert_fixture_mjcf.py", "{inputs}", "--headless", "--make-instanceable", "--fix-base", "--import-sites"],
+            kit=True,
+        ),
+        Stage(
+            name="recreate",
+            inputs="Props/USD/fixtures/**/*.usd",
+            outputs=["{dir}/{stem}.usd"],
+            command=["postprocess_usd.py", "recreate_fixture", "{inputs}"],
+            exclude=["instanceable_meshes.usd"],
+        ),
+    ],
+}
+"""Ingestion pipelines of the asset datasets."""
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Utility to ingest the asset datasets incrementally.")
+parser.add_argument("pipelines", type=str, nargs="*", default=list(PIPELINES.keys()), help="Pipelines to run.")
+parser.add_argument("--jobs", type=int, default=4, help="Number of parallel batches per stage.")
+parser.add_argument("--kit-jobs", type=int, default=1, help="Number of parallel batches of the Isaac Sim stages.")
+parser.add_argument("--batch-size", type=int, default=16, help="Maximum number of nodes per batch.")
+parser.add_argument("--force", action="store_true", default=False, help="Rerun all nodes.")
+parser.add_argument("--dry-run", action="store_true", default=False, help="Only print the stale nodes.")
+parser.add_argument(
+    "--status-log",
+    type=str,
+    default=os.path.join(ISAACLAB_EXTENDED_ASSETS_DATA_DIR, ".ingest", "status.jsonl"),
+    help="Path of the status log.",
+)
+
+
+def fingerprint(paths: list[str]) -> str:
+    """Fingerprint of the size and modification time of files."""
+    digest = hashlib.sha1()
+    for path in paths:
+        if os.path.exists(path):
+            stat = os.stat(path)
+            digest.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+        else:
+            digest.update(f"{path}:missing;".encode())
+    return digest.hexdigest()
+
+
+class StatusLog:
+    """Append-only log of the status of the nodes. The last record of a node wins."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.records = {}
+        # batches of a stage finish in parallel threads
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path) as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # the last line may be truncated by a crash
+                        continue
+                    self.records[(record["pipeline"], record["stage"], record["node"])] = record
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    def get(self, pipeline: str, stage: str, node: str) -> dict | None:
+        return self.records.get((pipeline, stage, node))
+
+    def append(self, records: list[dict]):
+        with self._lock, open(self.path, "a") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+                self.records[(record["pipeline"], record["stage"], record["node"])] = record
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def collect_nodes(stage: Stage) -> list[str]:
+    """Collect the input files of a stage."""
+    pattern = os.path.join(ISAACLAB_EXTENDED_ASSETS_DATA_DIR, stage.inputs)
+    paths = glob.glob(pattern, recursive=True)
+    return sorted(
+        path for path in paths if not any(fnmatch.fnmatch(os.path.basename(path), exclude) for exclude in stage.exclude)
+    )
+
+
+def _key(node: str) -> str:
+    """Key of a node in the status log."""
+    return os.path.relpath(node, ISAACLAB_EXTENDED_ASSETS_DATA_DIR)
+
+
+def is_stale(stage: Stage, node: str, record: dict | None) -> bool:
+    """Check whether a node has to run."""
+    if record is None or record["status"] != "done" or record["signature"] != stage.signature:
+        return True
+    if not all(os.path.exists(path) for path in stage.expand(node, stage.outputs)):
+        return True
+    return record["fingerprint"] != fingerprint([node] + stage.expand(node, stage.extra_inputs))
+
+
+def run_batch(stage: Stage, nodes: list[str]) -> tuple[bool, float]:
+    """Run the command of a stage on a batch of nodes. Returns the success and the duration."""
+    python = ISAACSIM_PYTHON if stage.kit else sys.executable
+    script = os.path.join(UTILS_DIR, stage.command[0])
+    arguments = [argument for token in stage.command[1:] for argument in (nodes if token == "{inputs}" else [token])]
+    start = time.time()
+    # logs written by the scripts are kept next to the status log
+    result = subprocess.run([python, script, *arguments], cwd=os.path.dirname(args_cli.status_log))
+    return result.returncode == 0, time.time() - start
+
+
+def run_stage(pipeline: str, stage: Stage, status: StatusLog) -> dict[str, int]:
+    """Run the stale nodes of a stage in parallel batches."""
+    nodes = collect_nodes(stage)
+    stale = [
+        node for node in nodes if args_cli.force or is_stale(stage, node, status.get(pipeline, stage.name, _key(node)))
+    ]
+    print(f"[INFO] {pipeline}/{stage.name}: {len(stale)} stale of {len(nodes)} nodes.")
+    if args_cli.dry_run or len(stale) == 0:
+        for node in stale:
+            print(f"    {os.path.relpath(node, ISAACLAB_EXTENDED_ASSETS_DATA_DIR)}")
+        return {"stale": len(stale), "failed": 0}
+
+    num_jobs = args_cli.kit_jobs if stage.kit else args_cli.jobs
+    if stage.max_jobs is not None:
+        num_jobs = min(num_jobs, stage.max_jobs)
+    batch_size = max(1, stage.batch_size or args_cli.batch_size)
+    batches = [stale[i : i + batch_size] for i in range(0, len(stale), batch_size)]
+    num_jobs = max(1, min(num_jobs, len(batches)))
+
+    def _record(nodes: list[str], success: bool, duration: float):
+        # fingerprints are taken after the run, so in-place edits do not invalidate the node
+        status.append(
+            [
+                {
+                    "pipeline": pipeline,
+                    "stage": stage.name,
+                    "node": _key(node),
+                    "status": "done" if success else "failed",
+                    "signature": stage.signature,
+                    "fingerprint": fingerprint([node] + stage.expand(node, stage.extra_inputs)),
+                    "duration": duration / len(nodes),
+                    "time": time.time(),
+                }
+                for node in nodes
+            ]
+        )
+
+    def _run(batch: list[str]) -> int:
+        success, duration = run_batch(stage, batch)
+        if success or len(batch) == 1:
+            _record(batch, success, duration)
+            return 0 if success else 1
+        # rerun the nodes of the failed batch one by one to find the failed nodes
+        num_failed = 0
+        for node in batch:
+            success, duration = run_batch(stage, [node])
+            _record([node], success, duration)
+            num_failed += int(not success)
+        return num_failed
+
+    with ThreadPoolExecutor(num_jobs) as executor:
+        num_failed = sum(executor.map(_run, batches))
+    if num_failed > 0:
+        print(f"[WARN] {pipeline}/{stage.name}: {num_failed} nodes failed.")
+    return {"stale": len(stale), "failed": num_failed}
+
+
+def main():
+    for name in args_cli.pipelines:
+        if name not in PIPELINES:
+            raise ValueError(f"Unknown pipeline '{name}'. Available: {list(PIPELINES.keys())}.")
+    status = StatusLog(args_cli.status_log)
+
+    summary = {}
+    for name in args_cli.pipelines:
+        for stage in PIPELINES[name]:
+            summary[f"{name}/{stage.name}"] = run_stage(name, stage, status)
+
+    print(f"{'stage':<40} {'stale':>7} {'failed':>7}")
+    for name, counts in summary.items():
+        print(f"{name:<40} {counts['stale']:>7} {counts['failed']:>7}")
+    print(f"[INFO] Status log is saved to {args_cli.status_log}")
+
+
+if __name__ == "__main__":
+    # parse the arguments
+    args_cli = parser.parse_args()
+    # run the main function
+    main()
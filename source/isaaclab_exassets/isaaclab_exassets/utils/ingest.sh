@@ -0,0 +1,4 @@
+#!/bin/bash
+
+# Run the stale stages of all ingestion pipelines, e.g. ./ingest.sh fusion360 --jobs 8
+python ingest.py "$@"
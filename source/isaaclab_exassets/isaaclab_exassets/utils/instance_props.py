@@ -0,0 +1,283 @@
+"""Audit and conversion of the prop USDs to instanceable assets.
+
+The mesh converters only write instanceable assets when ``--make-instanceable`` is
+given. Otherwise every environment clone composes its own copy of the visual and
+collision meshes. This tool finds the props whose meshes are not instanced and,
+with ``--convert``, moves their mesh groups into a ``Props/instanceable_meshes.usd``
+layer next to the asset. The groups in the asset are replaced by instanceable
+references to the layer, which is the layout written by the converters with
+``--make-instanceable``.
+
+A mesh group is the parent prim of the meshes, e.g. ``/<name>/geometry``. Meshes that
+are direct children of the default prim cannot be instanced without changing the
+prim paths of the asset and are reported instead. Targets outside the referenced
+prim do not resolve through a reference, so the materials the meshes of a group are
+bound to, e.g. ``/<name>/Looks/<material>``, are copied into ``<group>/Looks`` of the
+prototype layer and the bindings are retargeted to the copies.
+
+With ``--measure``, the composition of a stage with ``--clones`` references to the
+asset is timed and its memory is measured in a fresh process, before and after the
+conversion. The report also lists the mesh data each clone duplicates when the asset
+is not instanced.
+
+The tool only needs ``pxr``, no Kit startup.
+"""
+
+import argparse
+import json
+import os
+import time
+import multiprocessing
+
+import numpy as np
+from pxr import Sdf, Usd, UsdGeom
+
+# Conveniences to other module directories via relative paths
+ISAACLAB_EXTENDED_ASSETS_DATA_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "../../../../", "data")
+)
+
+INSTANCEABLE_LAYER = "Props/instanceable_meshes.usd"
+"""Path of the prototype layer relative to the asset."""
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Utility to audit and convert props to instanceable assets.")
+parser.add_argument(
+    "input",
+    type=str,
+    nargs="*",
+    default=[os.path.join(ISAACLAB_EXTENDED_ASSETS_DATA_DIR, "Props/USD")],
+    help="Directories or USD files to audit. Defaults to the Props/USD directory.",
+)
+parser.add_argument("--convert", action="store_true", default=False, help="Convert the non-instanceable assets.")
+parser.add_argument("--measure", action="store_true", default=False, help="Measure the stage memory of the clones.")
+parser.add_argument("--clones", type=int, default=1024, help="Number of clones of the memory measurement.")
+parser.add_argument("--report", type=str, default=None, help="Path of the JSON report.")
+
+
+def collect_usd_paths(inputs: list[str]) -> list[str]:
+    """Collect the asset USD files of the input directories and files."""
+    usd_paths = []
+    for path in inputs:
+        if os.path.isfile(path):
+            usd_paths.append(os.path.abspath(path))
+            continue
+        for root, _, files in os.walk(path):
+            # prototype layers and baked collision variants are not assets
+            if os.path.basename(root) in ("Props", "collision"):
+                continue
+            for file in files:
+                if file.endswith((".usd", ".usda", ".usdc")):
+                    usd_paths.append(os.path.abspath(os.path.join(root, file)))
+    return sorted(usd_paths)
+
+
+def mesh_bytes(mesh: UsdGeom.Mesh) -> int:
+    """Size of the array data of a mesh."""
+    size = 0
+    for attr in mesh.GetPrim().GetAttributes():
+        if attr.GetTypeName().isArray and attr.HasValue():
+            size += np.asarray(attr.Get()).nbytes
+    return size
+
+
+def audit(usd_path: str) -> dict:
+    """Find the meshes of an asset that are not instanced."""
+    stage = Usd.Stage.Open(usd_path)
+    default_prim = stage.GetDefaultPrim()
+    stats = {"meshes": 0, "instanced_meshes": 0, "mesh_bytes": 0, "groups": [], "blocked": []}
+    for prim in Usd.PrimRange(stage.GetPseudoRoot(), Usd.TraverseInstanceProxies()):
+        if not prim.IsA(UsdGeom.Mesh):
+            continue
+        stats["meshes"] += 1
+        stats["mesh_bytes"] += mesh_bytes(UsdGeom.Mesh(prim))
+        if prim.IsInstanceProxy():
+            stats["instanced_meshes"] += 1
+            continue
+        group = prim.GetParent()
+        if not default_prim or group.GetPath() == default_prim.GetPath() or group.IsPseudoRoot():
+            stats["blocked"].append(prim.GetPath().pathString)
+        elif group.GetPath().pathString not in stats["groups"]:
+            stats["groups"].append(group.GetPath().pathString)
+    stats["instanceable"] = stats["meshes"] > 0 and stats["instanced_meshes"] == stats["meshes"]
+    return stats
+
+
+def localize_materials(layer: Sdf.Layer, proto_layer: Sdf.Layer, group: Sdf.Path) -> dict[Sdf.Path, Sdf.Path]:
+    """Copy the materials bound outside a moved group into the group and retarget the bindings.
+
+    Parameters
+    ----------
+    layer : Sdf.Layer
+        Layer of the asset that defines the materials.
+    proto_layer : Sdf.Layer
+        Prototype layer that holds the moved group.
+    group : Sdf.Path
+        Path of the moved group in both layers.
+
+    Returns
+    -------
+    dict[Sdf.Path, Sdf.Path]
+        Paths of the copied materials in the prototype layer, keyed by their path in the asset.
+    """
+    bindings = []
+
+    def _collect(path: Sdf.Path):
+        if path.IsPropertyPath() and path.name.startswith("material:binding"):
+            bindings.append(path)
+
+    proto_layer.Traverse(group, _collect)
+    looks = group.AppendChild("Looks")
+    copies = {}
+    for binding_path in bindings:
+        rel_spec = proto_layer.GetRelationshipAtPath(binding_path)
+        if rel_spec is None:
+            continue
+        targets = rel_spec.targetPathList
+        for target in list(targets.GetAddedOrExplicitItems()):
+            if target.HasPrefix(group):
+                continue
+            if target not in copies:
+                if layer.GetPrimAtPath(target) is None:
+                    print(f"[WARN] {layer.identifier}: material {target} is not defined in the asset layer.")
+                    continue
+                if proto_layer.GetPrimAtPath(looks) is None:
+                    looks_spec = Sdf.CreatePrimInLayer(proto_layer, looks)
+                    looks_spec.specifier = Sdf.SpecifierDef
+                    looks_spec.typeName = "Scope"
+                copy_path = looks.AppendChild(target.name)
+                suffix = 1
+                while proto_layer.GetPrimAtPath(copy_path) is not None:
+                    copy_path = looks.AppendChild(f"{target.name}_{suffix}")
+                    suffix += 1
+                Sdf.CopySpec(layer, target, proto_layer, copy_path)
+                copies[target] = copy_path
+            targets.ReplaceItemEdits(target, copies[target])
+    return copies
+
+
+def convert(usd_path: str, groups: list[str]) -> str:
+    """Move mesh groups into the prototype layer and reference them as instances."""
+    layer = Sdf.Layer.FindOrOpen(usd_path)
+    proto_path = os.path.join(os.path.dirname(usd_path), INSTANCEABLE_LAYER)
+    os.makedirs(os.path.dirname(proto_path), exist_ok=True)
+    proto_layer = Sdf.Layer.FindOrOpen(proto_path) or Sdf.Layer.CreateNew(proto_path)
+    # keep the stage metrics of the asset
+    for key in ("upAxis", "metersPerUnit"):
+        if layer.pseudoRoot.HasInfo(key):
+            proto_layer.pseudoRoot.SetInfo(key, layer.pseudoRoot.GetInfo(key))
+
+    # nested groups are moved with their ancestor
+    groups = [group for group in groups if not any(group.startswith(other + "/") for other in groups)]
+    with Sdf.ChangeBlock():
+        for group in groups:
+            path = Sdf.Path(group)
+            spec = layer.GetPrimAtPath(path)
+            if spec is None:
+                continue
+            Sdf.CreatePrimInLayer(proto_layer, path.GetParentPath())
+            for ancestor in path.GetParentPath().GetPrefixes():
+                ancestor_spec = proto_layer.GetPrimAtPath(ancestor)
+                ancestor_spec.specifier = Sdf.SpecifierDef
+                ancestor_spec.typeName = layer.GetPrimAtPath(ancestor).typeName
+            Sdf.CopySpec(layer, path, proto_layer, path)
+            # keep the transform of the group on the instance and the meshes in the prototype
+            for name in list(spec.nameChildren.keys()):
+                del spec.nameChildren[name]
+            proto_spec = proto_layer.GetPrimAtPath(path)
+            for attr_name in [name for name in proto_spec.attributes.keys() if name.startswith("xformOp")]:
+                proto_spec.RemoveProperty(proto_spec.attributes[attr_name])
+            localize_materials(layer, proto_layer, path)
+            spec.referenceList.Prepend(Sdf.Reference(f"./{INSTANCEABLE_LAYER}", path))
+            spec.instanceable = True
+    if not proto_layer.defaultPrim and len(proto_layer.rootPrims) > 0:
+        proto_layer.defaultPrim = proto_layer.rootPrims[0].name
+    proto_layer.Save()
+    layer.Save()
+    return proto_path
+
+
+def measure_clones(usd_path: str, num_clones: int) -> dict:
+    """Compose a stage with references to an asset and measure its prims, time and memory."""
+
+    def rss() -> int:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+    start_rss = rss()
+    start = time.time()
+    stage = Usd.Stage.CreateInMemory()
+    with Sdf.ChangeBlock():
+        for i in range(num_clones):
+            spec = Sdf.CreatePrimInLayer(stage.GetRootLayer(), f"/World/envs/env_{i}/Object")
+            spec.referenceList.Prepend(Sdf.Reference(usd_path))
+            while spec is not None:
+                spec.specifier = Sdf.SpecifierDef
+                spec = spec.nameParent
+    # force the composition of all prims
+    num_prims = sum(1 for _ in stage.Traverse())
+    return {
+        "prims": num_prims,
+        "prototypes": len(stage.GetPrototypes()),
+        "compose_time": time.time() - start,
+        "rss_bytes": rss() - start_rss,
+    }
+
+
+def measure(usd_path: str, num_clones: int) -> dict:
+    """Measure the clones in a fresh process, so that the layer caches of other stages do not interfere."""
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        return pool.apply(measure_clones, (usd_path, num_clones))
+
+
+def main():
+    usd_paths = collect_usd_paths(args_cli.input)
+    print(f"[INFO] Auditing {len(usd_paths)} USD files.")
+
+    report = {}
+    for usd_path in usd_paths:
+        try:
+            stats = audit(usd_path)
+        except Exception as e:
+            print(f"[WARN] Skipping {usd_path}: {e}")
+            continue
+        if stats["meshes"] == 0:
+            continue
+        name = os.path.relpath(usd_path, ISAACLAB_EXTENDED_ASSETS_DATA_DIR)
+        entry = dict(stats)
+        if args_cli.measure:
+            entry["before"] = measure(usd_path, args_cli.clones)
+        if args_cli.convert and not stats["instanceable"] and stats["groups"]:
+            entry["prototype_layer"] = convert(usd_path, stats["groups"])
+            entry["instanceable"] = audit(usd_path)["instanceable"]
+            if args_cli.measure:
+                entry["after"] = measure(usd_path, args_cli.clones)
+        # mesh data composed once per clone without instancing
+        entry["duplicated_mesh_bytes"] = 0 if entry["instanceable"] else entry["mesh_bytes"] * (args_cli.clones - 1)
+        if stats["blocked"]:
+            print(f"[WARN] {name}: meshes directly under the default prim cannot be instanced: {stats['blocked']}")
+        report[name] = entry
+
+    print(f"{'asset':<70} {'meshes':>6} {'inst':>5} {'MB/clone':>9} {'prims before':>13} {'prims after':>12} {'MB before':>10} {'MB after':>9}")
+    for name, entry in sorted(report.items(), key=lambda item: item[1]["duplicated_mesh_bytes"], reverse=True):
+        before, after = entry.get("before", {}), entry.get("after", {})
+        print(
+            f"{name[-70:]:<70} {entry['meshes']:>6} {'yes' if entry['instanceable'] else 'no':>5}"
+            f" {entry['mesh_bytes'] / 1e6:>9.3f} {before.get('prims', '-'):>13} {after.get('prims', '-'):>12}"
+            f" {before.get('rss_bytes', 0) / 1e6:>10.1f} {after.get('rss_bytes', 0) / 1e6:>9.1f}"
+        )
+    num_dynamic = sum(1 for entry in report.values() if entry["duplicated_mesh_bytes"] > 0)
+    total = sum(entry["duplicated_mesh_bytes"] for entry in report.values())
+    print(f"[INFO] {num_dynamic} assets are not instanced. Mesh data duplicated at {args_cli.clones} clones: {total / 1e9:.2f} GB.")
+
+    if args_cli.report is not None:
+        with open(args_cli.report, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"[INFO] Report is saved to {args_cli.report}")
+
+
+if __name__ == "__main__":
+    # parse the arguments
+    args_cli = parser.parse_args()
+    # run the main function
+    main()
@@ -0,0 +1,4 @@
+#!/bin/bash
+
+# Audit all props, convert the non-instanceable ones and measure the stage memory at 1024 clones
+python instance_props.py ../../../../data/Props/USD --convert --measure --clones 1024 --report ../../../../data/Props/USD/instance_report.json
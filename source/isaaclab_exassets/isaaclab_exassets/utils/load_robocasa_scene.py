@@ -14,6 +14,7 @@ app_launcher = AppLauncher(args_cli)
 simulation_app = app_launcher.app
 
 """Rest everything follows."""
+import importlib.util
 import os
 import json
 import torch
@@ -27,6 +28,13 @@ ISAACLAB_EXTENDED_ASSETS_DATA_DIR = os.path.abspath(
     os.path.join(os.path.dirname(__file__), "../../../../", "data")
 )
 
+# the paths of the fixture models are shared with compile_kitchen.py and the scene compiler of the tasks
+_kitchen_spec = importlib.util.spec_from_file_location(
+    "isaaclab_exassets_kitchen", os.path.join(os.path.dirname(__file__), "..", "kitchen.py")
+)
+_kitchen = importlib.util.module_from_spec(_kitchen_spec)
+_kitchen_spec.loader.exec_module(_kitchen)
+
 
 class SceneBuilder:
     def __init__(self, config_path):
@@ -53,17 +61,7 @@ class SceneBuilder:
             if path is None:
                 continue
 
-            if f"{path.split('/')[-1]}" == "model.xml":
-                file_name = f"{path.split('/')[-2]}.usd"
-            else:
-                obj_name = path.split('/')[-1].split('.')[0]
-                file_name = f"{obj_name}/{obj_name}.usd"
-            usd_path = os.path.join(
-                ISAACLAB_EXTENDED_ASSETS_DATA_DIR,
-                "Props/USD/objaverse",
-                os.path.dirname(path),
-                file_name
-            )
+            usd_path = _kitchen.fixture_usd_path(path, ISAACLAB_EXTENDED_ASSETS_DATA_DIR)
             print("[INFO]: USD Path:", usd_path)
 
             # Fixed object
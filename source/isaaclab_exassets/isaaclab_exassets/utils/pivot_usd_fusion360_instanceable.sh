@@ -1,7 +1,7 @@
 #!/bin/bash
 
-# Store the paths of all object.xml files as a list in $input
+# Store the paths of all converted instanceable Fusion 360 parts as a list in $input
 input=$(find ../../../../data/Props/USD/fusion360/ -name "model_0.usd")
 
-# Call convert_mjcf.py once, passing all input and corresponding output files
-/isaac-sim/python.sh pivot_usd.py $input
\ No newline at end of file
+# Call postprocess_usd.py once, passing all input files
+python postprocess_usd.py pivot $input --preset fusion360_instanceable
@@ -1,7 +1,7 @@
 #!/bin/bash
 
-# Store the paths of all object.xml files as a list in $input
-input=$(find ../../../../data/Props/USD/siemens_gearbox/ -name "*.usd" ! -name "*non_metric.usd")
+# Store the paths of all converted Siemens gearbox parts as a list in $input
+input=$(find ../../../../data/Props/USD/siemens_gearbox/ -name "*.usd" ! -name "*non_metric.usd" -not -path "*/collision/*")
 
-# Call convert_mjcf.py once, passing all input and corresponding output files
-/isaac-sim/python.sh pivot_usd_siemens.py $input
\ No newline at end of file
+# Call postprocess_usd.py once, passing all input files
+python postprocess_usd.py pivot $input --preset siemens
@@ -0,0 +1,260 @@
+"""Batch post-processing of converted USD assets without Kit.
+
+The operations only edit layers with the ``pxr`` API, so the tool runs with any
+Python that provides ``pxr`` (``usd-core`` or the Isaac Sim Python) and never starts
+the simulation app. Files are processed in parallel by a pool of workers and the
+edits of each layer are batched in a single :class:`Sdf.ChangeBlock`.
+
+Operations:
+
+* ``pivot``: move the pivot of the meshes of a part to the center of their extent.
+  The presets reproduce the layouts written by the Siemens, Fusion 360 and IndustReal
+  converters.
+* ``recreate_fixture``: rebuild the ``/object`` hierarchy of the fixtures converted
+  from MJCF as a kinematic rigid body that references the instanceable meshes.
+* ``add_texture``: bind a ``UsdPreviewSurface`` material with a diffuse texture to
+  the mesh of a part.
+"""
+
+import argparse
+import os
+from functools import partial
+from multiprocessing import Pool
+
+from pxr import Gf, Sdf, Vt
+
+PIVOT_PRESETS = {
+    "siemens": {"layer": None, "meshes": ["/{model}/geometry/mesh"], "center": "/{model}/geometry/mesh"},
+    "fusion360": {"layer": None, "meshes": ["/{model}/geometry/mesh"], "center": "/{model}/geometry/mesh"},
+    "fusion360_instanceable": {
+        "layer": "Props/instanceable_meshes.usd",
+        "meshes": ["/{model}/geometry/mesh"],
+        "center": "/{model}/geometry/mesh",
+    },
+    "industreal": {
+        "layer": None,
+        "meshes": ["/{model}/{model}/collisions", "/{model}/{model}/visuals"],
+        "center": "/{model}/{model}/visuals",
+    },
+}
+"""Layer and prim paths of the meshes to pivot for each asset layout. ``{model}`` is
+replaced by the name of the directory of the USD file."""
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Utility to post-process converted USD files without Kit.")
+parser.add_argument("operation", type=str, choices=["pivot", "recreate_fixture", "add_texture"], help="Operation to apply.")
+parser.add_argument("input", type=str, nargs="+", help="Paths to the input USD files.")
+parser.add_argument("--preset", type=str, default="siemens", choices=list(PIVOT_PRESETS.keys()), help="Asset layout of the pivot operation.")
+parser.add_argument("--texture", type=str, default=None, help="Path of the diffuse texture of the add_texture operation.")
+parser.add_argument("--num-workers", type=int, default=os.cpu_count(), help="Number of worker processes.")
+parser.add_argument("--print_stage", action="store_true", help="Whether print out the edited layers.")
+
+
+"""
+Layer editing helpers.
+"""
+
+
+def _define_prim(layer: Sdf.Layer, path: str, type_name: str = "") -> Sdf.PrimSpec:
+    """Create or get a prim spec with a ``def`` specifier."""
+    spec = Sdf.CreatePrimInLayer(layer, Sdf.Path(path))
+    spec.specifier = Sdf.SpecifierDef
+    if type_name:
+        spec.typeName = type_name
+    return spec
+
+
+def _set_attr(
+    spec: Sdf.PrimSpec, name: str, type_name: Sdf.ValueTypeName, value, uniform: bool = False
+) -> Sdf.AttributeSpec:
+    """Create or get an attribute spec and set its default value."""
+    attr = spec.attributes.get(name)
+    if attr is None:
+        attr = Sdf.AttributeSpec(spec, name, type_name, Sdf.VariabilityUniform if uniform else Sdf.VariabilityVarying)
+    if value is not None:
+        attr.default = value
+    return attr
+
+
+def _apply_api(spec: Sdf.PrimSpec, *schemas: str):
+    """Prepend applied API schemas to a prim spec."""
+    op = spec.GetInfo("apiSchemas") if spec.HasInfo("apiSchemas") else Sdf.TokenListOp()
+    items = list(op.prependedItems)
+    items.extend(schema for schema in schemas if schema not in items)
+    op.prependedItems = items
+    spec.SetInfo("apiSchemas", op)
+
+
+def _mesh_extent(layer: Sdf.Layer, path: str):
+    """Extent of a mesh authored in a layer, or None."""
+    spec = layer.GetPrimAtPath(path)
+    if spec is None or "extent" not in spec.attributes:
+        return None
+    return spec.attributes["extent"].default
+
+
+"""
+Operations.
+"""
+
+
+def pivot(usd_path: str, preset: str) -> str:
+    """Translate the meshes of a part so that the pivot is at the center of their extent."""
+    cfg = PIVOT_PRESETS[preset]
+    model_name = os.path.basename(os.path.dirname(usd_path))
+    layer_path = os.path.join(os.path.dirname(usd_path), cfg["layer"]) if cfg["layer"] else usd_path
+    layer = Sdf.Layer.FindOrOpen(layer_path)
+    if layer is None:
+        return f"[WARN] Skipping {usd_path}: cannot open {layer_path}."
+    extent = _mesh_extent(layer, cfg["center"].format(model=model_name))
+    if extent is None:
+        return f"[WARN] Skipping {usd_path}: no extent at {cfg['center'].format(model=model_name)}."
+    center = Gf.Vec3d(*[-(extent[0][i] + extent[1][i]) / 2 for i in range(3)])
+
+    with Sdf.ChangeBlock():
+        for mesh_path in cfg["meshes"]:
+            spec = layer.GetPrimAtPath(mesh_path.format(model=model_name))
+            if spec is None:
+                continue
+            _set_attr(spec, "xformOp:translate", Sdf.ValueTypeNames.Double3, center)
+            order_attr = _set_attr(spec, "xformOpOrder", Sdf.ValueTypeNames.TokenArray, None, uniform=True)
+            order = list(order_attr.default or [])
+            if "xformOp:translate" not in order:
+                order_attr.default = Vt.TokenArray(order + ["xformOp:translate"])
+    layer.Save()
+    return f"[INFO] Pivoted {layer_path} to {tuple(center)}."
+
+
+def recreate_fixture(usd_path: str) -> str:
+    """Rebuild the hierarchy of a fixture as a kinematic rigid body with instanceable meshes."""
+    layer = Sdf.Layer.FindOrOpen(usd_path)
+    if layer is None or layer.GetPrimAtPath("/object/object") is None:
+        return f"[WARN] Skipping {usd_path}: no prim at /object/object."
+
+    with Sdf.ChangeBlock():
+        _define_prim(layer, "/object", "Xform")
+        layer.defaultPrim = "object"
+
+        spec = layer.GetPrimAtPath("/object/object")
+        _apply_api(spec, "PhysicsRigidBodyAPI", "PhysicsMassAPI")
+        _set_attr(spec, "physics:density", Sdf.ValueTypeNames.Float, 0.0)
+        _set_attr(spec, "xformOp:orient", Sdf.ValueTypeNames.Quatd, Gf.Quatd(1.0, 0.0, 0.0, 0.0))
+        _set_attr(spec, "xformOp:scale", Sdf.ValueTypeNames.Double3, Gf.Vec3d(1.0, 1.0, 1.0))
+        _set_attr(spec, "xformOp:translate", Sdf.ValueTypeNames.Double3, Gf.Vec3d(0.0, 0.0, 0.0))
+        _set_attr(spec, "xformOpOrder", Sdf.ValueTypeNames.TokenArray, Vt.TokenArray(["xformOp:transform"]), uniform=True)
+        _set_attr(spec, "physics:angularVelocity", Sdf.ValueTypeNames.Vector3f, Gf.Vec3f(0.0, 0.0, 0.0))
+        _set_attr(spec, "physics:kinematicEnabled", Sdf.ValueTypeNames.Bool, True)
+        _set_attr(spec, "physics:mass", Sdf.ValueTypeNames.Float, 10.0)
+        _set_attr(spec, "physics:rigidBodyEnabled", Sdf.ValueTypeNames.Bool, True)
+        _set_attr(spec, "physxRigidBody:maxLinearVelocity", Sdf.ValueTypeNames.Float, 1000.0)
+
+        for name in ("visuals", "collisions"):
+            child = _define_prim(layer, f"/object/object/{name}", "Xform")
+            child.referenceList.ClearEdits()
+            child.referenceList.Prepend(Sdf.Reference("./Props/instanceable_meshes.usd", Sdf.Path(f"/object_{name}")))
+            child.instanceable = True
+
+        if layer.GetPrimAtPath("/worldBody") is not None:
+            edit = Sdf.BatchNamespaceEdit()
+            edit.Add(Sdf.NamespaceEdit.Remove("/worldBody"))
+            layer.Apply(edit)
+    layer.Save()
+    return f"[INFO] Recreated {usd_path}."
+
+
+def add_texture(usd_path: str, texture: str) -> str:
+    """Bind a material with a diffuse texture to the mesh of a part in its instanceable meshes."""
+    model_name = os.path.basename(os.path.dirname(usd_path))
+    layer_path = os.path.join(os.path.dirname(usd_path), "Props/instanceable_meshes.usd")
+    layer = Sdf.Layer.FindOrOpen(layer_path)
+    mesh_path = f"/{model_name}/geometry/mesh"
+    if layer is None or layer.GetPrimAtPath(mesh_path) is None:
+        return f"[WARN] Skipping {usd_path}: no mesh at {mesh_path} in {layer_path}."
+    material_path = Sdf.Path(f"/{model_name}/Looks/textured_material")
+    texture_path = os.path.relpath(os.path.abspath(texture), os.path.dirname(layer_path))
+
+    with Sdf.ChangeBlock():
+        _define_prim(layer, material_path.GetParentPath().pathString, "Scope")
+        material = _define_prim(layer, material_path.pathString, "Material")
+        shader = _define_prim(layer, material_path.AppendChild("PBRShader").pathString, "Shader")
+        reader = _define_prim(layer, material_path.AppendChild("stReader").pathString, "Shader")
+        sampler = _define_prim(layer, material_path.AppendChild("diffuseTexture").pathString, "Shader")
+
+        # texture coordinates -> texture -> diffuse color
+        _set_attr(reader, "info:id", Sdf.ValueTypeNames.Token, "UsdPrimvarReader_float2", uniform=True)
+        _set_attr(reader, "inputs:varname", Sdf.ValueTypeNames.Token, "st")
+        _set_attr(reader, "outputs:result", Sdf.ValueTypeNames.Float2, None)
+        _set_attr(sampler, "info:id", Sdf.ValueTypeNames.Token, "UsdUVTexture", uniform=True)
+        _set_attr(sampler, "inputs:file", Sdf.ValueTypeNames.Asset, Sdf.AssetPath(texture_path))
+        _set_attr(sampler, "inputs:st", Sdf.ValueTypeNames.Float2, None).connectionPathList.Prepend(
+            reader.path.AppendProperty("outputs:result")
+        )
+        _set_attr(sampler, "outputs:rgb", Sdf.ValueTypeNames.Float3, None)
+        _set_attr(shader, "info:id", Sdf.ValueTypeNames.Token, "UsdPreviewSurface", uniform=True)
+        _set_attr(shader, "inputs:diffuseColor", Sdf.ValueTypeNames.Color3f, None).connectionPathList.Prepend(
+            sampler.path.AppendProperty("outputs:rgb")
+        )
+        _set_attr(shader, "outputs:surface", Sdf.ValueTypeNames.Token, None)
+        _set_attr(material, "outputs:surface", Sdf.ValueTypeNames.Token, None).connectionPathList.Prepend(
+            shader.path.AppendProperty("outputs:surface")
+        )
+
+        # bind the material to the mesh
+        mesh = layer.GetPrimAtPath(mesh_path)
+        _apply_api(mesh, "MaterialBindingAPI")
+        binding = mesh.relationships.get("material:binding")
+        if binding is None:
+            binding = Sdf.RelationshipSpec(mesh, "material:binding", custom=False)
+        binding.targetPathList.ClearEdits()
+        binding.targetPathList.Prepend(material_path)
+    layer.Save()
+    return f"[INFO] Added texture {texture_path} to {layer_path}."
+
+
+def process(usd_path: str, operation: str, preset: str, texture: str | None, print_stage: bool) -> str:
+    """Apply an operation to a single USD file."""
+    try:
+        if operation == "pivot":
+            msg = pivot(usd_path, preset)
+        elif operation == "recreate_fixture":
+            msg = recreate_fixture(usd_path)
+        else:
+            msg = add_texture(usd_path, texture)
+    except Exception as e:
+        return f"[ERROR] Failed to process {usd_path}: {e}"
+    if print_stage:
+        msg += "\n" + Sdf.Layer.FindOrOpen(usd_path).ExportToString()
+    return msg
+
+
+def main():
+    # check valid file path
+    usd_paths = [os.path.abspath(path) for path in args_cli.input if os.path.isfile(path)]
+    if len(usd_paths) == 0:
+        raise ValueError("USD paths does not exist.")
+    if args_cli.operation == "add_texture" and args_cli.texture is None:
+        raise ValueError("The add_texture operation requires --texture.")
+    print(f"[INFO] Processing {len(usd_paths)} USD files with '{args_cli.operation}'.")
+
+    worker = partial(
+        process,
+        operation=args_cli.operation,
+        preset=args_cli.preset,
+        texture=args_cli.texture,
+        print_stage=args_cli.print_stage,
+    )
+    num_workers = max(1, min(args_cli.num_workers, len(usd_paths)))
+    chunksize = max(1, len(usd_paths) // (4 * num_workers))
+    num_errors = 0
+    with Pool(num_workers) as pool:
+        for msg in pool.imap_unordered(worker, usd_paths, chunksize=chunksize):
+            num_errors += int(not msg.startswith("[INFO]"))
+            print(msg)
+    print(f"[INFO] Post-processing is done! {len(usd_paths) - num_errors}/{len(usd_paths)} files succeeded.")
+
+
+if __name__ == "__main__":
+    # parse the arguments
+    args_cli = parser.parse_args()
+    # run the main function
+    main()
@@ -0,0 +1,141 @@
+"""Batch compilation of all RoboCasa layout/style kitchens.
+
+RoboCasa defines 10 kitchen layouts and 12 styles. This tool compiles the
+configuration of every combination with ``compile_kitchen.py`` in a pool of worker
+processes and writes a manifest of the baked kitchens, which the kitchen tasks use to
+select a kitchen without building a scene at startup.
+
+The configurations are not generated here, since placing the fixtures of a layout
+needs RoboCasa itself. They are exported beforehand, in the ``env_config.json`` format
+read by ``load_robocasa_scene.py`` (see ``utils/env_config.json``), as
+``<config_dir>/layout_<layout>_style_<style>.json``:
+
+1. Create a RoboCasa kitchen environment with ``layout_ids=<layout>`` and
+   ``style_ids=<style>`` and reset it.
+2. Write every fixture of the model as ``{"name", "type", "position", "rotation",
+   "size", "path"}`` to the ``fixture`` list and the remaining geometry (walls and
+   floors) as ``{"name", "type", "position", "size"}`` to the ``others`` list.
+
+The tool fails with the list of the missing configurations unless ``--allow-missing``
+is given, in which case the available ones are compiled and the missing combinations
+are recorded in the manifest:
+
+.. code-block:: json
+
+    {"kitchens": [{"layout": 0, "style": 0, "hash": "...", "usd_path": "Scenes/USD/Kitchen/cache/kitchen_<hash>.usd",
+                   "layered_usd_path": "Scenes/USD/Kitchen/cache/kitchen_<hash>_layered.usd",
+                   "fixtures": 52, "models": 24, "prototypes": 20, "missing": []}, ...],
+     "missing_configs": [[9, 11], ...]}
+
+Paths are relative to the data directory. Up-to-date kitchens are not recompiled.
+"""
+
+import argparse
+import json
+import os
+from functools import partial
+from multiprocessing import Pool
+
+from compile_kitchen import ISAACLAB_EXTENDED_ASSETS_DATA_DIR, KITCHEN_CACHE_DIR, compile_config, config_hash, layered_path
+
+NUM_LAYOUTS = 10
+"""Number of RoboCasa kitchen layouts."""
+NUM_STYLES = 12
+"""Number of RoboCasa kitchen styles."""
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Utility to compile all RoboCasa layout/style kitchens.")
+parser.add_argument(
+    "--config-dir",
+    type=str,
+    default=os.path.join(ISAACLAB_EXTENDED_ASSETS_DATA_DIR, "Scenes/Kitchen/configs"),
+    help="Directory of the exported kitchen configurations.",
+)
+parser.add_argument("--layouts", type=int, nargs="+", default=list(range(NUM_LAYOUTS)), help="Layouts to compile.")
+parser.add_argument("--styles", type=int, nargs="+", default=list(range(NUM_STYLES)), help="Styles to compile.")
+parser.add_argument("--cache-dir", type=str, default=KITCHEN_CACHE_DIR, help="Directory of the baked kitchens.")
+parser.add_argument("--num-workers", type=int, default=os.cpu_count(), help="Number of worker processes.")
+parser.add_argument("--force", action="store_true", default=False, help="Recompile up-to-date kitchens.")
+parser.add_argument(
+    "--allow-missing", action="store_true", default=False, help="Compile the available configurations only."
+)
+
+
+def config_path(config_dir: str, layout: int, style: int) -> str:
+    """Path of the exported configuration of a layout/style combination."""
+    return os.path.join(config_dir, f"layout_{layout}_style_{style}.json")
+
+
+def compile_entry(layout_style: tuple[int, int], config_dir: str, cache_dir: str, force: bool) -> dict:
+    """Compile one layout/style kitchen and return its manifest entry."""
+    layout, style = layout_style
+    path = config_path(config_dir, layout, style)
+    usd_path, stats = compile_config(path, cache_dir, force)
+    with open(path) as f:
+        kitchen_hash = config_hash(json.load(f))
+    entry = {
+        "layout": layout,
+        "style": style,
+        "hash": kitchen_hash,
+        "usd_path": os.path.relpath(usd_path, ISAACLAB_EXTENDED_ASSETS_DATA_DIR),
+        "layered_usd_path": os.path.relpath(layered_path(usd_path), ISAACLAB_EXTENDED_ASSETS_DATA_DIR),
+        "compiled": stats is not None,
+    }
+    if stats is not None:
+        entry.update(stats)
+    return entry
+
+
+def main():
+    manifest_path = os.path.join(args_cli.cache_dir, "manifest.json")
+    # keep the statistics of the kitchens that are up to date
+    previous = {}
+    if os.path.isfile(manifest_path):
+        with open(manifest_path) as f:
+            previous = {entry["hash"]: entry for entry in json.load(f)["kitchens"]}
+
+    combinations, missing_configs = [], []
+    for layout in args_cli.layouts:
+        for style in args_cli.styles:
+            if os.path.isfile(config_path(args_cli.config_dir, layout, style)):
+                combinations.append((layout, style))
+            else:
+                missing_configs.append([layout, style])
+    if missing_configs and not args_cli.allow_missing:
+        missing_paths = "\n".join(
+            f"  {config_path(args_cli.config_dir, layout, style)}" for layout, style in missing_configs
+        )
+        raise ValueError(
+            f"{len(missing_configs)} kitchen configurations are missing, export them from RoboCasa as described in"
+            f" the documentation of this tool or pass --allow-missing:\n{missing_paths}"
+        )
+    print(f"[INFO] Compiling {len(combinations)} kitchens, {len(missing_configs)} configurations are missing.")
+
+    kitchens = []
+    if combinations:
+        worker = partial(compile_entry, config_dir=args_cli.config_dir, cache_dir=args_cli.cache_dir, force=args_cli.force)
+        num_workers = max(1, min(args_cli.num_workers, len(combinations)))
+        with Pool(num_workers) as pool:
+            for entry in pool.imap_unordered(worker, combinations):
+                if not entry.pop("compiled"):
+                    entry = {**previous.get(entry["hash"], {}), **entry}
+                print(f"[INFO] layout {entry['layout']}, style {entry['style']}: {entry['usd_path']}")
+                kitchens.append(entry)
+
+    os.makedirs(args_cli.cache_dir, exist_ok=True)
+    with open(manifest_path, "w") as f:
+        json.dump(
+            {"kitchens": sorted(kitchens, key=lambda entry: (entry["layout"], entry["style"])), "missing_configs": missing_configs},
+            f,
+            indent=2,
+        )
+    if missing_configs:
+        print(f"[WARN] Configurations are missing for the layout/style combinations: {missing_configs}")
+    print(f"[INFO] Manifest is saved to {manifest_path}")
+
+
+if __name__ == "__main__":
+    # parse the arguments
+    args_cli = parser.parse_args()
+    # run the main function
+    main()
@@ -0,0 +1,4 @@
+#!/bin/bash
+
+# Compile all layout/style kitchen configurations and write the manifest
+python precompile_kitchens.py --config-dir ../../../../data/Scenes/Kitchen/configs
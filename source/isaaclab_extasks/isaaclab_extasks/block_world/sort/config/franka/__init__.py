@@ -4,7 +4,7 @@ from . import agents, franka_env_cfg
 
 gym.register(
     id="Isaac-Block-Sort-Franka-v0",
-    entry_point="isaaclab.envs:ManagerBasedRLEnv",
+    entry_point="isaaclab_extasks.utils.envs:ExtendedManagerBasedRLEnv",
     kwargs={
         "env_cfg_entry_point": franka_env_cfg.FrankaSortEnvCfg,
         "rsl_rl_cfg_entry_point": f"{agents.__name__}.rsl_rl_ppo_cfg:SortPPORunnerCfg",
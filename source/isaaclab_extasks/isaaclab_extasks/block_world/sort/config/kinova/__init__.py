@@ -4,7 +4,7 @@ from . import agents, gen3n7_env_cfg, jaco7n_env_cfg, jaco7s_env_cfg
 
 gym.register(
     id="Isaac-Block-Sort-Gen3n7-v0",
-    entry_point="isaaclab.envs:ManagerBasedRLEnv",
+    entry_point="isaaclab_extasks.utils.envs:ExtendedManagerBasedRLEnv",
     kwargs={
         "env_cfg_entry_point": gen3n7_env_cfg.Gen3N7SortEnvCfg,
         "rsl_rl_cfg_entry_point": f"{agents.__name__}.rsl_rl_ppo_cfg:SortPPORunnerCfg",
@@ -14,7 +14,7 @@ gym.register(
 
 gym.register(
     id="Isaac-Block-Sort-Jaco7N-v0",
-    entry_point="isaaclab.envs:ManagerBasedRLEnv",
+    entry_point="isaaclab_extasks.utils.envs:ExtendedManagerBasedRLEnv",
     kwargs={
         "env_cfg_entry_point": jaco7n_env_cfg.Jaco7NSortEnvCfg,
         "rsl_rl_cfg_entry_point": f"{agents.__name__}.rsl_rl_ppo_cfg:SortPPORunnerCfg",
@@ -24,7 +24,7 @@ gym.register(
 
 gym.register(
     id="Isaac-Block-Sort-Jaco7S-v0",
-    entry_point="isaaclab.envs:ManagerBasedRLEnv",
+    entry_point="isaaclab_extasks.utils.envs:ExtendedManagerBasedRLEnv",
     kwargs={
         "env_cfg_entry_point": jaco7s_env_cfg.Jaco7SSortEnvCfg,
         "rsl_rl_cfg_entry_point": f"{agents.__name__}.rsl_rl_ppo_cfg:SortPPORunnerCfg",
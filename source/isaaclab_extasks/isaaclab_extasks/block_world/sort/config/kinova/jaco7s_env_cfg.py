@@ -154,6 +154,5 @@ class Jaco7SSortEnvCfg_PLAY(Jaco7SSortEnvCfg):
         super().__post_init__()
         # make a smaller scene for play
         self.scene.num_envs = 50
-        self.scene.env_spacing = 2.5
         # disable randomization for play
         self.observations.policy.enable_corruption = False
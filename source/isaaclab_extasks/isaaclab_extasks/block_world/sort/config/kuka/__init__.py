@@ -4,7 +4,7 @@ from . import agents, lbr_iiwa7_env_cfg
 
 gym.register(
     id="Isaac-Block-Sort-LBRIIWA7-v0",
-    entry_point="isaaclab.envs:ManagerBasedRLEnv",
+    entry_point="isaaclab_extasks.utils.envs:ExtendedManagerBasedRLEnv",
     kwargs={
         "env_cfg_entry_point": lbr_iiwa7_env_cfg.LBRIIWA7SortEnvCfg,
         "rsl_rl_cfg_entry_point": f"{agents.__name__}.rsl_rl_ppo_cfg:SortPPORunnerCfg",
@@ -1,8 +1,8 @@
 """This sub-module contains the functions that are specific to the assembly environment."""
 
 from isaaclab.envs.mdp import *  # noqa: F401, F403
+from isaaclab_extasks.mdp import *  # noqa: F401, F403
 
-from .events import *  # noqa: F401, F403
 from .observations import *  # noqa: F401, F403
 from .rewards import *  # noqa: F401, F403
 from .terminations import *  # noqa: F401, F403
@@ -7,7 +7,7 @@ from isaaclab.assets import (
     AssetBaseCfg,
     RigidObjectCfg,
 )
-from isaaclab.envs import ManagerBasedRLEnvCfg, mdp
+from isaaclab.envs import mdp
 from isaaclab.envs.common import ViewerCfg
 from isaaclab.managers import CurriculumTermCfg as CurrTerm
 from isaaclab.managers import EventTermCfg as EventTerm
@@ -27,6 +27,7 @@ from isaaclab.sim.spawners.from_files.from_files_cfg import (
 )
 from isaaclab.utils import configclass
 from isaaclab.utils.assets import ISAAC_NUCLEUS_DIR
+from isaaclab_extasks.utils.envs import ExtendedManagerBasedRLEnvCfg
 
 from . import mdp as extended_mdp
 
@@ -63,7 +64,7 @@ class SortSceneCfg(InteractiveSceneCfg):
             intensity=750.0,
             texture_format="latlong",
             texture_file="https://omniverse-content-staging.s3.us-west-2.amazonaws.com/DoNotDelete/PhysicsDemoAssets/106.5/FrankaNutBolt/ZetoCG.com_WarehouseInterior2b_4x8k.hdr",
-        ),  # TODO: Fix texture file path
+        ),
     )
 
     # rgb camera
@@ -242,7 +243,12 @@ class EventCfg:
                 "yaw": (-torch.pi, torch.pi),
             },
             "velocity_range": {},
-            "asset_names": ["blue_block", "green_block", "red_block", "yellow_block"],
+            "asset_cfgs": [
+                SceneEntityCfg("blue_block"),
+                SceneEntityCfg("green_block"),
+                SceneEntityCfg("red_block"),
+                SceneEntityCfg("yellow_block"),
+            ],
         },
     )
 
@@ -267,6 +273,14 @@ class TerminationsCfg:
 
     time_out = DoneTerm(func=mdp.time_out, time_out=True)
 
+    success = DoneTerm(
+        func=extended_mdp.regions_success,
+        params={
+            "asset_names": ["blue_block", "green_block", "red_block", "yellow_block"],
+            "region_names": ["base1", "base2", "base3", "base4"],
+        },
+    )
+
 
 @configclass
 class CurriculumCfg:
@@ -284,7 +298,7 @@ class CurriculumCfg:
 
 
 @configclass
-class SortEnvCfg(ManagerBasedRLEnvCfg):
+class SortEnvCfg(ExtendedManagerBasedRLEnvCfg):
     """Configuration for the sorting environment."""
 
     # scene settings
@@ -300,6 +314,8 @@ class SortEnvCfg(ManagerBasedRLEnvCfg):
     terminations: TerminationsCfg = TerminationsCfg()
     events: EventCfg = EventCfg()
     curriculum: CurriculumCfg = CurriculumCfg()
+    # spacing of the envs, "auto" to derive it from the bounds of the template env, None to keep the scene spacing
+    env_spacing: float | str | None = "auto"
 
     def __post_init__(self):
         """Post initialization."""
@@ -1,4 +1,3 @@
-import random
 from isaaclab.envs import mdp
 from isaaclab.assets import RigidObjectCfg
 from isaaclab.sensors import FrameTransformerCfg
@@ -96,9 +95,6 @@ class Jaco7SStackEnvCfg(StackEnvCfg):
             attr_name = "{}_block".format(k)
             self.scene.__setattr__(attr_name, v)
 
-        # Set target object (randomly)
-        self.scene.target_object = random.choice(list(block_cfgs.values()))
-
         # Listens to the required transforms
         marker_cfg = FRAME_MARKER_CFG.copy()
         marker_cfg.markers["frame"].scale = (0.1, 0.1, 0.1)
@@ -126,6 +122,5 @@ class Jaco7SStackEnvCfg_PLAY(Jaco7SStackEnvCfg):
         super().__post_init__()
         # make a smaller scene for play
         self.scene.num_envs = 50
-        self.scene.env_spacing = 2.5
         # disable randomization for play
         self.observations.policy.enable_corruption = False
@@ -1,4 +1,3 @@
-import random
 from isaaclab.envs import mdp
 from isaaclab.assets import RigidObjectCfg
 from isaaclab.sensors import FrameTransformerCfg
@@ -98,9 +97,6 @@ class LBRIIWA7StackEnvCfg(StackEnvCfg):
             attr_name = "{}_block".format(k)
             self.scene.__setattr__(attr_name, v)
 
-        # Set target object (randomly)
-        self.scene.target_object = random.choice(list(block_cfgs.values()))
-
         # Listens to the required transforms
         marker_cfg = FRAME_MARKER_CFG.copy()
         marker_cfg.markers["frame"].scale = (0.1, 0.1, 0.1)
@@ -128,6 +124,5 @@ class LBRIIWA7StackEnvCfg_PLAY(LBRIIWA7StackEnvCfg):
         super().__post_init__()
         # make a smaller scene for play
         self.scene.num_envs = 50
-        self.scene.env_spacing = 2.5
         # disable randomization for play
         self.observations.policy.enable_corruption = False
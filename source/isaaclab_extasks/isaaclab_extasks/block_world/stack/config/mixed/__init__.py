@@ -0,0 +1,13 @@
+import gymnasium as gym
+
+from . import agents, mixed_env_cfg
+
+gym.register(
+    id="Isaac-Block-Stack-Mixed-v0",
+    entry_point="isaaclab_extasks.utils.envs:ExtendedManagerBasedRLEnv",
+    kwargs={
+        "env_cfg_entry_point": mixed_env_cfg.MixedStackEnvCfg,
+        "rsl_rl_cfg_entry_point": f"{agents.__name__}.rsl_rl_ppo_cfg:StackPPORunnerCfg",
+    },
+    disable_env_checker=True,
+)
@@ -0,0 +1,68 @@
+from isaaclab.managers import ObservationTermCfg as ObsTerm
+from isaaclab.utils import configclass
+from isaaclab_extasks.block_world.stack.config.franka.franka_env_cfg import FrankaStackEnvCfg
+from isaaclab_extasks.utils.mixed_robots import (
+    MixedJointPositionActionCfg,
+    apply_mixed_robots,
+    embodiment_id,
+    mixed_joint_pos,
+    mixed_joint_vel,
+    mixed_joint_vel_l2,
+    mixed_object_ee_distance,
+    mixed_object_position_in_robot_root_frame,
+    mixed_reset_scene_to_default,
+)
+
+
+@configclass
+class MixedStackEnvCfg(FrankaStackEnvCfg):
+    # relative share of the envs of each robot, keyed by the names of EMBODIMENT_CFGS
+    embodiments: dict[str, float] = {
+        "Franka": 1.0,
+        "UR5e": 1.0,
+        "UR10e": 1.0,
+        "XArm7": 1.0,
+        "LBRIIWA7": 1.0,
+        "Gen3n7": 1.0,
+        "Jaco7N": 1.0,
+        "Jaco7S": 1.0,
+    }
+
+    def __post_init__(self):
+        # post init of parent (blocks, base and table of the Franka task)
+        super().__post_init__()
+
+        # Set one env group per robot
+        apply_mixed_robots(self, self.embodiments)
+
+        # Pad the actions to a common layout
+        self.actions.arm_action = MixedJointPositionActionCfg(joint_group="arm")
+        self.actions.gripper_action = MixedJointPositionActionCfg(joint_group="gripper")
+
+        # Pad the observations to a common layout and add the embodiment of each env
+        self.commands.object_pose = None
+        self.observations.policy.joint_pos = ObsTerm(func=mixed_joint_pos, params={"joint_group": "arm"})
+        self.observations.policy.joint_vel = ObsTerm(func=mixed_joint_vel, params={"joint_group": "arm"})
+        self.observations.policy.gripper_pos = ObsTerm(func=mixed_joint_pos, params={"joint_group": "gripper"})
+        self.observations.policy.object_position = ObsTerm(func=mixed_object_position_in_robot_root_frame)
+        self.observations.policy.target_object_position = None
+        self.observations.policy.embodiment = ObsTerm(func=embodiment_id)
+
+        # Replace the terms that read the robot data of all envs
+        self.rewards.reaching_object.func = mixed_object_ee_distance
+        self.rewards.object_goal_tracking = None
+        self.rewards.object_goal_tracking_fine_grained = None
+        self.rewards.joint_vel.func = mixed_joint_vel_l2
+        self.rewards.joint_vel.params = {}
+        self.events.reset_all.func = mixed_reset_scene_to_default
+
+
+@configclass
+class MixedStackEnvCfg_PLAY(MixedStackEnvCfg):
+    def __post_init__(self):
+        # post init of parent
+        super().__post_init__()
+        # make a smaller scene for play
+        self.scene.num_envs = 64
+        # disable randomization for play
+        self.observations.policy.enable_corruption = False
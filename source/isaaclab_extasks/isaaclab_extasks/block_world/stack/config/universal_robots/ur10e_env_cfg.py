@@ -1,4 +1,3 @@
-import random
 from isaaclab.envs import mdp
 from isaaclab.assets import RigidObjectCfg
 from isaaclab.sensors import FrameTransformerCfg
@@ -11,6 +10,7 @@ from isaaclab.utils.assets import ISAAC_NUCLEUS_DIR
 from isaaclab.markers.config import FRAME_MARKER_CFG  # isort: skip
 from isaaclab_exassets.universal_robots import UR10E_ROBOTIQ_2F_140_CFG  # isort: skip
 from isaaclab_extasks.block_world.stack.stack_env_cfg import StackEnvCfg
+from isaaclab_extasks.utils.ur_ik_actions import URAnalyticalIKActionCfg
 
 
 @configclass
@@ -105,9 +105,6 @@ class UR10eStackEnvCfg(StackEnvCfg):
             attr_name = "{}_block".format(k)
             self.scene.__setattr__(attr_name, v)
 
-        # Set target object (randomly)
-        self.scene.target_object = random.choice(list(block_cfgs.values()))
-
         # Listens to the required transforms
         marker_cfg = FRAME_MARKER_CFG.copy()
         marker_cfg.markers["frame"].scale = (0.1, 0.1, 0.1)
@@ -135,6 +132,41 @@ class UR10eStackEnvCfg_PLAY(UR10eStackEnvCfg):
         super().__post_init__()
         # make a smaller scene for play
         self.scene.num_envs = 50
-        self.scene.env_spacing = 2.5
+        # disable randomization for play
+        self.observations.policy.enable_corruption = False
+
+
+@configclass
+class UR10eStackIKRelEnvCfg(UR10eStackEnvCfg):
+    def __post_init__(self):
+        # post init of parent
+        super().__post_init__()
+
+        # Set the arm action to relative poses of the end effector solved by the analytical IK
+        self.actions.arm_action = URAnalyticalIKActionCfg(
+            asset_name="robot",
+            joint_names=[
+                "shoulder_pan_joint",
+                "shoulder_lift_joint",
+                "elbow_joint",
+                "wrist_1_joint",
+                "wrist_2_joint",
+                "wrist_3_joint",
+            ],
+            body_name="grasp_frame",
+            robot_type="UR10e",
+            body_offset=URAnalyticalIKActionCfg.OffsetCfg(pos=(0.0, 0.0, 0.1034)),
+            use_relative_mode=True,
+            scale=0.5,
+        )
+
+
+@configclass
+class UR10eStackIKRelEnvCfg_PLAY(UR10eStackIKRelEnvCfg):
+    def __post_init__(self):
+        # post init of parent
+        super().__post_init__()
+        # make a smaller scene for play
+        self.scene.num_envs = 50
         # disable randomization for play
         self.observations.policy.enable_corruption = False
@@ -6,6 +6,7 @@ import torch
 from isaaclab.assets import RigidObject
 from isaaclab.managers import SceneEntityCfg
 from isaaclab.utils.math import subtract_frame_transforms
+from isaaclab_extasks.mdp import SuccessTermBase
 
 if TYPE_CHECKING:
     from isaaclab.envs import ManagerBasedRLEnv
@@ -24,3 +25,59 @@ def object_position_in_robot_root_frame(
         robot.data.root_state_w[:, :3], robot.data.root_state_w[:, 3:7], object_pos_w
     )
     return object_pos_b
+
+
+def blocks_stacked(
+    env: ManagerBasedRLEnv,
+    asset_names: list[str],
+    block_height: float = 0.0468,
+    xy_threshold: float = 0.02,
+    height_threshold: float = 0.01,
+) -> torch.Tensor:
+    """Check whether the blocks are stacked in the given order.
+
+    Each block must lie above the previous one within ``xy_threshold`` in the horizontal
+    plane and within ``height_threshold`` of ``block_height`` along the vertical axis.
+    All pairs of blocks are evaluated in a single batched operation.
+
+    Parameters
+    ----------
+    env : ManagerBasedRLEnv
+        The environment.
+    asset_names : list[str]
+        Names of the blocks from the bottom to the top of the stack.
+    block_height : float
+        Height of a block (in m).
+    xy_threshold : float
+        Horizontal position tolerance between consecutive blocks (in m).
+    height_threshold : float
+        Vertical position tolerance between consecutive blocks (in m).
+
+    Returns
+    -------
+    torch.Tensor
+        Boolean mask of shape (num_envs,).
+    """
+    block_pos_w = torch.stack([env.scene[name].data.root_pos_w for name in asset_names], dim=1)
+    delta = block_pos_w[:, 1:] - block_pos_w[:, :-1]
+    is_above = torch.norm(delta[..., :2], dim=-1) < xy_threshold
+    is_on_top = torch.abs(delta[..., 2] - block_height) < height_threshold
+    return (is_above & is_on_top).all(dim=-1)
+
+
+class stack_success(SuccessTermBase):
+    """Terminate when the blocks have stayed stacked for a number of consecutive steps.
+
+    The fraction of resetting environments that succeeded is logged as ``Metrics/success_rate``.
+    """
+
+    def __call__(
+        self,
+        env: ManagerBasedRLEnv,
+        asset_names: list[str],
+        hold_steps: int = 5,
+        block_height: float = 0.0468,
+        xy_threshold: float = 0.02,
+        height_threshold: float = 0.01,
+    ) -> torch.Tensor:
+        return self.update(blocks_stacked(env, asset_names, block_height, xy_threshold, height_threshold), hold_steps)
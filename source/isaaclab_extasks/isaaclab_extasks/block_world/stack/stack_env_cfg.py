@@ -7,7 +7,7 @@ from isaaclab.assets import (
     AssetBaseCfg,
     RigidObjectCfg,
 )
-from isaaclab.envs import ManagerBasedRLEnvCfg, mdp
+from isaaclab.envs import mdp
 from isaaclab.envs.common import ViewerCfg
 from isaaclab.managers import CurriculumTermCfg as CurrTerm
 from isaaclab.managers import EventTermCfg as EventTerm
@@ -28,6 +28,8 @@ from isaaclab.sim.spawners.from_files.from_files_cfg import (
 from isaaclab.terrains import HfRandomUniformTerrainCfg, TerrainGeneratorCfg, TerrainImporterCfg
 from isaaclab.utils import configclass
 from isaaclab.utils.assets import ISAAC_NUCLEUS_DIR
+from isaaclab_extasks.utils.envs import ExtendedManagerBasedRLEnvCfg
+from isaaclab_extasks.utils.reset_rng import seeded_index
 
 from . import mdp as extended_mdp
 
@@ -66,7 +68,7 @@ class StackSceneCfg(InteractiveSceneCfg):
             intensity=750.0,
             texture_format="latlong",
             texture_file="https://omniverse-content-staging.s3.us-west-2.amazonaws.com/DoNotDelete/PhysicsDemoAssets/106.5/FrankaNutBolt/ZetoCG.com_WarehouseInterior2b_4x8k.hdr",
-        ),  # TODO: Fix texture file path
+        ),
     )
 
     # rgb camera
@@ -249,7 +251,12 @@ class EventCfg:
                 "yaw": (-torch.pi, torch.pi)
             },
             "velocity_range": {},
-            "asset_names": ["blue_block", "green_block", "red_block", "yellow_block"],
+            "asset_cfgs": [
+                SceneEntityCfg("blue_block"),
+                SceneEntityCfg("green_block"),
+                SceneEntityCfg("red_block"),
+                SceneEntityCfg("yellow_block"),
+            ],
         },
     )
 
@@ -299,6 +306,11 @@ class TerminationsCfg:
         params={"minimum_height": -0.05, "asset_cfg": SceneEntityCfg("target_object")},
     )
 
+    success = DoneTerm(
+        func=extended_mdp.stack_success,
+        params={"asset_names": ["blue_block", "green_block", "red_block", "yellow_block"]},
+    )
+
 
 @configclass
 class CurriculumCfg:
@@ -316,7 +328,7 @@ class CurriculumCfg:
 
 
 @configclass
-class StackEnvCfg(ManagerBasedRLEnvCfg):
+class StackEnvCfg(ExtendedManagerBasedRLEnvCfg):
     """Configuration for the sorting environment."""
 
     # scene settings
@@ -332,6 +344,8 @@ class StackEnvCfg(ManagerBasedRLEnvCfg):
     terminations: TerminationsCfg = TerminationsCfg()
     events: EventCfg = EventCfg()
     curriculum: CurriculumCfg = CurriculumCfg()
+    # spacing of the envs, "auto" to derive it from the bounds of the template env, None to keep the scene spacing
+    env_spacing: float | str | None = "auto"
 
     def __post_init__(self):
         """Post initialization."""
@@ -352,4 +366,29 @@ class StackEnvCfg(ManagerBasedRLEnvCfg):
         self.sim.physx.solver_type = 0
         # physics material settings
         self.sim.physics_material.static_friction = 1.0
-        self.sim.physics_material.dynamic_friction = 1.0
\ No newline at end of file
+        self.sim.physics_material.dynamic_friction = 1.0
+
+    def finalize(self):
+        """Choose the target block from the seed, which is set after the initialization, unless it is set."""
+        super().finalize()
+        if not isinstance(self.scene.target_object, RigidObjectCfg):
+            self.choose_target_object()
+
+    def choose_target_object(self):
+        """Set a target block chosen from the seed, so that runs with the same seed stack the same block."""
+        names = self.terminations.success.params["asset_names"]
+        self.set_target_object(names[seeded_index(self.seed, "target_object", len(names))])
+
+    def set_target_object(self, name: str):
+        """Set the block that is moved to the commanded pose and stacked on top of the others.
+
+        The other blocks keep their order at the bottom of the tower in the success term.
+
+        Parameters
+        ----------
+        name : str
+            Name of the block in the scene.
+        """
+        self.scene.target_object = getattr(self.scene, name)
+        asset_names = [asset_name for asset_name in self.terminations.success.params["asset_names"] if asset_name != name]
+        self.terminations.success.params["asset_names"] = asset_names + [name]
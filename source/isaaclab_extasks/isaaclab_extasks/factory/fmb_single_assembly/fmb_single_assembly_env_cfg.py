@@ -6,7 +6,7 @@ from isaaclab.assets import (
     AssetBaseCfg,
     RigidObjectCfg,
 )
-from isaaclab.envs import ManagerBasedRLEnvCfg, mdp
+from isaaclab.envs import mdp
 from isaaclab.envs.common import ViewerCfg
 from isaaclab.managers import CurriculumTermCfg as CurrTerm
 from isaaclab.managers import EventTermCfg as EventTerm
@@ -26,6 +26,7 @@ from isaaclab.sim.spawners.from_files.from_files_cfg import (
 )
 from isaaclab.utils import configclass
 from isaaclab.utils.assets import ISAAC_NUCLEUS_DIR
+from isaaclab_extasks.utils.envs import ExtendedManagerBasedRLEnvCfg
 
 from . import mdp as extended_mdp
 
@@ -41,6 +42,8 @@ class FMBSingleAssemblySceneCfg(InteractiveSceneCfg):
     ee_frame: FrameTransformerCfg = MISSING
     # target block: will be populated by agent env cfg
     target_object: RigidObjectCfg = MISSING
+    # fixture the target block is inserted into: will be populated by agent env cfg
+    fixture: RigidObjectCfg = MISSING
     # base: will be populated by agent env cfg
     base: RigidObjectCfg = MISSING
 
@@ -218,7 +221,12 @@ class EventCfg:
         params={
             "pose_range": {"x": (-0.2, 0.2), "y": (-0.25, 0.25), "z": (0.0, 0.0)},
             "velocity_range": {},
-            "asset_names": ["blue_block", "green_block", "red_block", "yellow_block"],
+            "asset_cfgs": [
+                SceneEntityCfg("blue_block"),
+                SceneEntityCfg("green_block"),
+                SceneEntityCfg("red_block"),
+                SceneEntityCfg("yellow_block"),
+            ],
         },
     )
 
@@ -247,6 +255,12 @@ class RewardsCfg:
         weight=5.0,
     )
 
+    object_inserted = RewTerm(
+        func=extended_mdp.parts_inserted_ratio,
+        params={"part_names": ["target_object"], "target_names": ["fixture"]},
+        weight=20.0,
+    )
+
     # action penalty
     action_rate = RewTerm(func=mdp.action_rate_l2, weight=-1e-4)
 
@@ -268,6 +282,11 @@ class TerminationsCfg:
         params={"minimum_height": -0.05, "asset_cfg": SceneEntityCfg("target_object")},
     )
 
+    success = DoneTerm(
+        func=extended_mdp.assembly_success,
+        params={"part_names": ["target_object"], "target_names": ["fixture"], "hold_steps": 10},
+    )
+
 
 @configclass
 class CurriculumCfg:
@@ -285,7 +304,7 @@ class CurriculumCfg:
 
 
 @configclass
-class FMBSingleAssemblyEnvCfg(ManagerBasedRLEnvCfg):
+class FMBSingleAssemblyEnvCfg(ExtendedManagerBasedRLEnvCfg):
     """Configuration for the FMB single assembly environment."""
 
     # scene settings
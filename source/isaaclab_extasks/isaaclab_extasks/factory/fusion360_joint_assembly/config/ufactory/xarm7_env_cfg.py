@@ -1,5 +1,4 @@
 import os
-import random
 from isaaclab.envs import mdp
 from isaaclab.assets import RigidObjectCfg
 from isaaclab.sensors import FrameTransformerCfg
@@ -47,10 +46,10 @@ class XArm7AssemblyEnvCfg(Fusion360JointAssemblyEnvCfg):
 
         # Find common IDs and corresponding paths
         common_ids = set(fixture_dict.keys()) & set(object_dict.keys())
-        common_paths = [(fixture_dict[id], object_dict[id]) for id in common_ids]
+        common_paths = [(fixture_dict[id], object_dict[id]) for id in sorted(common_ids)]
 
-        # Select parts path randomly
-        fixture_path, object_path = random.choice(common_paths)
+        # The parts are chosen from the seed at env build, which sets the USD paths of the object and fixture
+        self.parts = common_paths
 
         # Set target object
         self.scene.object = RigidObjectCfg(
@@ -59,7 +58,6 @@ class XArm7AssemblyEnvCfg(Fusion360JointAssemblyEnvCfg):
                 pos=[0.5, 0, 0.055], rot=[1, 0, 0, 0]
             ),
             spawn=UsdFileCfg(
-                usd_path=object_path,
                 scale=(1.0, 1.0, 1.0),
                 rigid_props=RigidBodyPropertiesCfg(
                     solver_position_iteration_count=192,
@@ -84,7 +82,6 @@ class XArm7AssemblyEnvCfg(Fusion360JointAssemblyEnvCfg):
                 pos=[0.5, 0.1, 0.055], rot=[1, 0, 0, 0]
             ),
             spawn=UsdFileCfg(
-                usd_path=fixture_path,
                 scale=(1.0, 1.0, 1.0),
                 rigid_props=RigidBodyPropertiesCfg(
                     solver_position_iteration_count=192,
@@ -155,6 +152,5 @@ class XArm7AssemblyEnvCfg_PLAY(XArm7AssemblyEnvCfg):
         super().__post_init__()
         # make a smaller scene for play
         self.scene.num_envs = 50
-        self.scene.env_spacing = 2.5
         # disable randomization for play
         self.observations.policy.enable_corruption = False
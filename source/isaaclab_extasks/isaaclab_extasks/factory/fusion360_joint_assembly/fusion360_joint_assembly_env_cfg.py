@@ -1,3 +1,5 @@
+import json
+import os
 from dataclasses import MISSING
 
 import isaaclab.sim as sim_utils
@@ -7,7 +9,7 @@ from isaaclab.assets import (
     DeformableObjectCfg,
     RigidObjectCfg,
 )
-from isaaclab.envs import ManagerBasedRLEnvCfg, mdp
+from isaaclab.envs import mdp
 from isaaclab.envs.common import ViewerCfg
 from isaaclab.managers import CurriculumTermCfg as CurrTerm
 from isaaclab.managers import EventTermCfg as EventTerm
@@ -27,6 +29,10 @@ from isaaclab.sim.spawners.from_files.from_files_cfg import (
 )
 from isaaclab.utils import configclass
 from isaaclab.utils.assets import ISAAC_NUCLEUS_DIR
+from isaaclab_extasks.utils.collision_tiers import apply_collision_tier
+from isaaclab_extasks.utils.envs import ExtendedManagerBasedRLEnvCfg
+from isaaclab_extasks.utils.reset_rng import seeded_index
+from isaaclab_extasks.utils.virtual_frames import VirtualFrameCfg
 
 from . import mdp as extended_mdp
 
@@ -219,12 +225,12 @@ class EventCfg:
     reset_all = EventTerm(func=mdp.reset_scene_to_default, mode="reset")
 
     reset_object_position = EventTerm(
-        func=mdp.reset_root_state_uniform,
+        func=extended_mdp.reset_root_state_uniform,
         mode="reset",
         params={
             "pose_range": {"x": (-0.1, 0.1), "y": (-0.25, 0.25), "z": (0.0, 0.0)},
             "velocity_range": {},
-            "asset_cfg": SceneEntityCfg("object", body_names="Object"),
+            "asset_cfgs": [SceneEntityCfg("object", body_names="Object")],
         },
     )
 
@@ -253,6 +259,12 @@ class RewardsCfg:
         weight=5.0,
     )
 
+    object_inserted = RewTerm(
+        func=extended_mdp.parts_inserted_ratio,
+        params={"part_names": ["object"], "target_names": ["target_object"]},
+        weight=20.0,
+    )
+
     # action penalty
     action_rate = RewTerm(func=mdp.action_rate_l2, weight=-1e-4)
 
@@ -274,6 +286,11 @@ class TerminationsCfg:
         params={"minimum_height": -0.05, "asset_cfg": SceneEntityCfg("object")},
     )
 
+    success = DoneTerm(
+        func=extended_mdp.assembly_success,
+        params={"part_names": ["object"], "target_names": ["target_object"], "hold_steps": 10},
+    )
+
 
 @configclass
 class CurriculumCfg:
@@ -291,7 +308,7 @@ class CurriculumCfg:
 
 
 @configclass
-class Fusion360JointAssemblyEnvCfg(ManagerBasedRLEnvCfg):
+class Fusion360JointAssemblyEnvCfg(ExtendedManagerBasedRLEnvCfg):
     """Configuration for the assembly environment."""
 
     # scene settings
@@ -307,6 +324,14 @@ class Fusion360JointAssemblyEnvCfg(ManagerBasedRLEnvCfg):
     terminations: TerminationsCfg = TerminationsCfg()
     events: EventCfg = EventCfg()
     curriculum: CurriculumCfg = CurriculumCfg()
+    # quality tier of the baked collision variants of the parts, None for the original collision meshes
+    collision_tier: str | None = None
+    # candidate (fixture, object) USD paths of the parts, one pair is chosen from the seed at env build
+    parts: list[tuple[str, str]] = []
+    # goal frame of the object on the fixture, placed at the joint frame of the chosen parts at env build
+    virtual_frames: dict[str, VirtualFrameCfg] = {"target_object": VirtualFrameCfg(parent_name="fixture")}
+    # spacing of the envs, "auto" to derive it from the bounds of the template env, None to keep the scene spacing
+    env_spacing: float | str | None = "auto"
 
     def __post_init__(self):
         """Post initialization."""
@@ -333,3 +358,46 @@ class Fusion360JointAssemblyEnvCfg(ManagerBasedRLEnvCfg):
         # physics material settings
         self.sim.physics_material.static_friction = 1.0
         self.sim.physics_material.dynamic_friction = 1.0
+
+    def finalize(self):
+        """Spawn the parts chosen from the seed and apply the passes that depend on the final configuration."""
+        super().finalize()
+        # only the parts whose joint frame was computed can be assembled
+        parts = [(fixture, obj) for fixture, obj in self.parts if os.path.isfile(joint_frame_path(obj))]
+        if not parts:
+            raise ValueError(
+                "No Fusion360 parts with a fixture, an object and a joint frame are available. The joint frames"
+                " are computed by the 'joint_frame' stage of 'isaaclab_exassets/utils/ingest.py fusion360'."
+            )
+        # random without a seed, reproducible with one
+        fixture_path, object_path = parts[seeded_index(self.seed, "parts", len(parts))]
+        self.scene.fixture.spawn = self.scene.fixture.spawn.replace(usd_path=fixture_path)
+        self.scene.object.spawn = self.scene.object.spawn.replace(usd_path=object_path)
+        self.set_target_frame(joint_frame_path(object_path))
+        # use the baked collision variants of the selected quality tier
+        apply_collision_tier(self, self.collision_tier)
+
+    def set_target_frame(self, path: str):
+        """Place the goal frame of the object at the assembled pose of the parts.
+
+        Parameters
+        ----------
+        path : str
+            Joint frame file of the parts, with the pose of the unscaled object in the frame of the fixture.
+        """
+        with open(path) as f:
+            frame = json.load(f)
+        scale = self.scene.fixture.spawn.scale or (1.0, 1.0, 1.0)
+        self.virtual_frames["target_object"] = VirtualFrameCfg(
+            parent_name="fixture",
+            pos=tuple(s * p for s, p in zip(scale, frame["pos"])),
+            rot=tuple(frame["rot"]),
+        )
+
+
+def joint_frame_path(object_path: str) -> str:
+    """Path of the joint frame of the parts of a Fusion360 joint set, from the USD path of the object.
+
+    The file is written next to the parts by ``isaaclab_exassets/utils/assembly_frames.py``.
+    """
+    return os.path.join(os.path.dirname(os.path.dirname(object_path)), "joint_frame.json")
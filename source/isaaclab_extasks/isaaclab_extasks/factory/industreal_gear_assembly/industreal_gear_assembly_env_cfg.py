@@ -8,7 +8,7 @@ from isaaclab.assets import (
     DeformableObjectCfg,
     RigidObjectCfg,
 )
-from isaaclab.envs import ManagerBasedRLEnvCfg, mdp
+from isaaclab.envs import mdp
 from isaaclab.envs.common import ViewerCfg
 from isaaclab.managers import CurriculumTermCfg as CurrTerm
 from isaaclab.managers import EventTermCfg as EventTerm
@@ -29,6 +29,10 @@ from isaaclab.sim.spawners.from_files.from_files_cfg import (
 from isaaclab.utils import configclass
 from isaaclab.utils.assets import ISAAC_NUCLEUS_DIR
 
+from isaaclab_extasks.utils.collision_tiers import apply_collision_tier
+from isaaclab_extasks.utils.envs import ExtendedManagerBasedRLEnvCfg
+from isaaclab_extasks.utils.virtual_frames import VirtualFrameCfg
+
 from . import mdp as extended_mdp
 
 
@@ -51,10 +55,6 @@ class IndustrealGearAssemblySceneCfg(InteractiveSceneCfg):
     gear_base: RigidObjectCfg | DeformableObjectCfg = MISSING
     # base: will be populated by agent env cfg
     base: RigidObjectCfg = MISSING
-    # target base: will be populated by agent env cfg
-    target_small: RigidObjectCfg = MISSING
-    target_medium: RigidObjectCfg = MISSING
-    target_large: RigidObjectCfg = MISSING
 
     # table
     table = AssetBaseCfg(
@@ -74,7 +74,7 @@ class IndustrealGearAssemblySceneCfg(InteractiveSceneCfg):
             intensity=750.0,
             texture_format="latlong",
             texture_file="https://omniverse-content-staging.s3.us-west-2.amazonaws.com/DoNotDelete/PhysicsDemoAssets/106.5/FrankaNutBolt/ZetoCG.com_WarehouseInterior2b_4x8k.hdr",
-        ),  # TODO: Fix texture file path
+        ),
     )
 
     # rgb camera
@@ -182,6 +182,15 @@ class ObservationsCfg:
 
         joint_pos = ObsTerm(func=mdp.joint_pos)
         joint_vel = ObsTerm(func=mdp.joint_vel)
+        target_small_position = ObsTerm(
+            func=extended_mdp.frame_position_in_robot_root_frame, params={"frame_name": "target_small"}
+        )
+        target_medium_position = ObsTerm(
+            func=extended_mdp.frame_position_in_robot_root_frame, params={"frame_name": "target_medium"}
+        )
+        target_large_position = ObsTerm(
+            func=extended_mdp.frame_position_in_robot_root_frame, params={"frame_name": "target_large"}
+        )
         actions = ObsTerm(func=mdp.last_action)
 
         def __post_init__(self):
@@ -253,28 +262,25 @@ class EventCfg:
                 "yaw": (-torch.pi, torch.pi)
             },
             "velocity_range": {},
-            "target_asset": "gear_base",
-            "asset_names": ["gear_small", "gear_medium", "gear_large"],
-        },
-    )
-    reset_target_position = EventTerm(
-        func=extended_mdp.reset_target_position,
-        mode="reset",
-        params={
-            "target_asset": "gear_base",
-            "offset_dict": {
-                "target_small": 0.051,
-                "target_medium": 0.0205,
-                "target_large": -0.0305,
-            },
+            "target_asset_cfg": SceneEntityCfg("gear_base"),
+            "asset_cfgs": [SceneEntityCfg("gear_small"), SceneEntityCfg("gear_medium"), SceneEntityCfg("gear_large")],
         },
     )
 
-
 @configclass
 class RewardsCfg:
     """Reward terms for the MDP."""
 
+    gears_inserted = RewTerm(
+        func=extended_mdp.parts_inserted_ratio,
+        weight=10.0,
+        params={
+            "part_names": ["gear_small", "gear_medium", "gear_large"],
+            "target_names": ["target_small", "target_medium", "target_large"],
+            "height_offsets": [0.005, 0.005, 0.005],
+        },
+    )
+
     # action penalty
     action_rate = RewTerm(func=mdp.action_rate_l2, weight=-1e-4)
 
@@ -291,6 +297,16 @@ class TerminationsCfg:
 
     time_out = DoneTerm(func=mdp.time_out, time_out=True)
 
+    success = DoneTerm(
+        func=extended_mdp.assembly_success,
+        params={
+            "part_names": ["gear_small", "gear_medium", "gear_large"],
+            "target_names": ["target_small", "target_medium", "target_large"],
+            "hold_steps": 10,
+            "height_offsets": [0.005, 0.005, 0.005],
+        },
+    )
+
 
 @configclass
 class CurriculumCfg:
@@ -308,7 +324,7 @@ class CurriculumCfg:
 
 
 @configclass
-class IndustrealGearAssemblyEnvCfg(ManagerBasedRLEnvCfg):
+class IndustrealGearAssemblyEnvCfg(ExtendedManagerBasedRLEnvCfg):
     """Configuration for the assembly environment."""
 
     # scene settings
@@ -324,6 +340,16 @@ class IndustrealGearAssemblyEnvCfg(ManagerBasedRLEnvCfg):
     terminations: TerminationsCfg = TerminationsCfg()
     events: EventCfg = EventCfg()
     curriculum: CurriculumCfg = CurriculumCfg()
+    # quality tier of the baked collision variants of the parts, None for the original collision meshes
+    collision_tier: str | None = None
+    # spacing of the envs, "auto" to derive it from the bounds of the template env, None to keep the scene spacing
+    env_spacing: float | str | None = "auto"
+    # goal frames of the gears on the gear base
+    virtual_frames: dict[str, VirtualFrameCfg] = {
+        "target_small": VirtualFrameCfg(parent_name="gear_base", pos=(0.051, 0.0, 0.0)),
+        "target_medium": VirtualFrameCfg(parent_name="gear_base", pos=(0.0205, 0.0, 0.0)),
+        "target_large": VirtualFrameCfg(parent_name="gear_base", pos=(-0.0305, 0.0, 0.0)),
+    }
 
     def __post_init__(self):
         """Post initialization."""
@@ -350,3 +376,9 @@ class IndustrealGearAssemblyEnvCfg(ManagerBasedRLEnvCfg):
         # physics material settings
         self.sim.physics_material.static_friction = 1.0
         self.sim.physics_material.dynamic_friction = 1.0
+
+    def finalize(self):
+        """Apply the passes that depend on the final configuration."""
+        super().finalize()
+        # use the baked collision variants of the selected quality tier
+        apply_collision_tier(self, self.collision_tier)
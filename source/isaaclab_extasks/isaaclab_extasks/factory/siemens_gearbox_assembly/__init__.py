@@ -7,3 +7,5 @@ from isaaclab_exassets import ISAACLAB_EXTENDED_ASSETS_DATA_DIR
 SIEMENS_ASSEMBLY_DIR = os.path.join(ISAACLAB_EXTENDED_ASSETS_DATA_DIR, "Props/USD/siemens_gearbox")
 # Siemens Assembly Parts USD Paths
 SIEMENS_OBJECT_PATH = glob.glob(os.path.join(ISAACLAB_EXTENDED_ASSETS_DATA_DIR, "Props/USD/siemens_gearbox/*/*.usd"))
+# Assembled poses of the parts in the frame of the gearbox base, written by isaaclab_exassets/utils/assembly_frames.py
+SIEMENS_ASSEMBLY_FRAMES_PATH = os.path.join(SIEMENS_ASSEMBLY_DIR, "assembly_frames.json")
@@ -1,3 +1,5 @@
+import json
+import os
 from dataclasses import MISSING
 
 import isaaclab.sim as sim_utils
@@ -7,7 +9,7 @@ from isaaclab.assets import (
     DeformableObjectCfg,
     RigidObjectCfg,
 )
-from isaaclab.envs import ManagerBasedRLEnvCfg, mdp
+from isaaclab.envs import mdp
 from isaaclab.envs.common import ViewerCfg
 from isaaclab.managers import CurriculumTermCfg as CurrTerm
 from isaaclab.managers import EventTermCfg as EventTerm
@@ -27,7 +29,11 @@ from isaaclab.sim.spawners.from_files.from_files_cfg import (
 )
 from isaaclab.utils import configclass
 from isaaclab.utils.assets import ISAAC_NUCLEUS_DIR
+from isaaclab_extasks.utils.collision_tiers import apply_collision_tier
+from isaaclab_extasks.utils.envs import ExtendedManagerBasedRLEnvCfg
+from isaaclab_extasks.utils.virtual_frames import VirtualFrameCfg
 
+from . import SIEMENS_ASSEMBLY_FRAMES_PATH
 from . import mdp as extended_mdp
 
 
@@ -225,7 +231,14 @@ class EventCfg:
         params={
             "pose_range": {"x": (-0.1, 0.3), "y": (-0.25, 0.25), "z": (0.0, 0.0)},
             "velocity_range": {},
-            "asset_names": ["gear_small", "gear_medium", "gear_large", "shaft_left", "shaft_right", "gearbox_base"],
+            "asset_cfgs": [
+                SceneEntityCfg("gear_small"),
+                SceneEntityCfg("gear_medium"),
+                SceneEntityCfg("gear_large"),
+                SceneEntityCfg("shaft_left"),
+                SceneEntityCfg("shaft_right"),
+                SceneEntityCfg("gearbox_base"),
+            ],
         },
     )
 
@@ -234,6 +247,15 @@ class EventCfg:
 class RewardsCfg:
     """Reward terms for the MDP."""
 
+    parts_inserted = RewTerm(
+        func=extended_mdp.parts_inserted_ratio,
+        weight=10.0,
+        params={
+            "part_names": ["shaft_left", "shaft_right", "gear_small", "gear_medium", "gear_large"],
+            "target_names": ["target_shaft_left", "target_shaft_right", "target_small", "target_medium", "target_large"],
+        },
+    )
+
     # action penalty
     action_rate = RewTerm(func=mdp.action_rate_l2, weight=-1e-4)
 
@@ -250,6 +272,15 @@ class TerminationsCfg:
 
     time_out = DoneTerm(func=mdp.time_out, time_out=True)
 
+    success = DoneTerm(
+        func=extended_mdp.assembly_success,
+        params={
+            "part_names": ["shaft_left", "shaft_right", "gear_small", "gear_medium", "gear_large"],
+            "target_names": ["target_shaft_left", "target_shaft_right", "target_small", "target_medium", "target_large"],
+            "hold_steps": 10,
+        },
+    )
+
 
 @configclass
 class CurriculumCfg:
@@ -267,7 +298,7 @@ class CurriculumCfg:
 
 
 @configclass
-class SiemensGearboxAssemblyEnvCfg(ManagerBasedRLEnvCfg):
+class SiemensGearboxAssemblyEnvCfg(ExtendedManagerBasedRLEnvCfg):
     """Configuration for the assembly environment."""
 
     # scene settings
@@ -283,6 +314,18 @@ class SiemensGearboxAssemblyEnvCfg(ManagerBasedRLEnvCfg):
     terminations: TerminationsCfg = TerminationsCfg()
     events: EventCfg = EventCfg()
     curriculum: CurriculumCfg = CurriculumCfg()
+    # quality tier of the baked collision variants of the parts, None for the original collision meshes
+    collision_tier: str | None = None
+    # spacing of the envs, "auto" to derive it from the bounds of the template env, None to keep the scene spacing
+    env_spacing: float | str | None = "auto"
+    # goal frames of the shafts and gears on the gearbox base, placed at the assembled poses of the parts at env build
+    virtual_frames: dict[str, VirtualFrameCfg] = {
+        "target_shaft_left": VirtualFrameCfg(parent_name="gearbox_base"),
+        "target_shaft_right": VirtualFrameCfg(parent_name="gearbox_base"),
+        "target_small": VirtualFrameCfg(parent_name="gearbox_base"),
+        "target_medium": VirtualFrameCfg(parent_name="gearbox_base"),
+        "target_large": VirtualFrameCfg(parent_name="gearbox_base"),
+    }
 
     def __post_init__(self):
         """Post initialization."""
@@ -309,3 +352,39 @@ class SiemensGearboxAssemblyEnvCfg(ManagerBasedRLEnvCfg):
         # physics material settings
         self.sim.physics_material.static_friction = 1.0
         self.sim.physics_material.dynamic_friction = 1.0
+
+    def finalize(self):
+        """Place the goal frames and apply the passes that depend on the final configuration."""
+        super().finalize()
+        self.set_target_frames(SIEMENS_ASSEMBLY_FRAMES_PATH)
+        # use the baked collision variants of the selected quality tier
+        apply_collision_tier(self, self.collision_tier)
+
+    def set_target_frames(self, path: str):
+        """Place the goal frames of the parts at their assembled poses on the gearbox base.
+
+        The parts of the success term are matched with the assembled poses by the name of the
+        directory of their USD file. The poses are those of the unscaled parts, so the positions
+        are scaled like the gearbox base.
+
+        Parameters
+        ----------
+        path : str
+            Assembled poses of the parts in the frame of the gearbox base.
+        """
+        if not os.path.isfile(path):
+            raise ValueError(
+                f"The assembled poses of the gearbox parts '{path}' do not exist. They are computed by the"
+                " 'assembly_frames' stage of 'isaaclab_exassets/utils/ingest.py siemens'."
+            )
+        with open(path) as f:
+            frames = json.load(f)["frames"]
+        params = self.terminations.success.params
+        for part_name, target_name in zip(params["part_names"], params["target_names"]):
+            frame_cfg = self.virtual_frames[target_name]
+            model_name = os.path.basename(os.path.dirname(getattr(self.scene, part_name).spawn.usd_path))
+            if model_name not in frames:
+                raise ValueError(f"No assembled pose of the part '{model_name}' in '{path}'.")
+            scale = getattr(self.scene, frame_cfg.parent_name).spawn.scale or (1.0, 1.0, 1.0)
+            frame_cfg.pos = tuple(s * p for s, p in zip(scale, frames[model_name]["pos"]))
+            frame_cfg.rot = tuple(frames[model_name]["rot"])
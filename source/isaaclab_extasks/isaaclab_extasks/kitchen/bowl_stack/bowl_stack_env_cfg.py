@@ -7,7 +7,7 @@ from isaaclab.assets import (
     DeformableObjectCfg,
     RigidObjectCfg,
 )
-from isaaclab.envs import ManagerBasedRLEnvCfg, mdp
+from isaaclab.envs import mdp
 from isaaclab.managers import CurriculumTermCfg as CurrTerm
 from isaaclab.managers import EventTermCfg as EventTerm
 from isaaclab.managers import ObservationGroupCfg as ObsGroup
@@ -26,6 +26,14 @@ from isaaclab.sim.spawners.from_files.from_files_cfg import (
 )
 from isaaclab.utils import configclass
 from isaaclab_exassets import ISAACLAB_EXTENDED_ASSETS_DATA_DIR
+from isaaclab_extasks.utils.envs import ExtendedManagerBasedRLEnvCfg
+from isaaclab_extasks.utils.kitchen import (
+    baked_kitchen_path,
+    kitchen_paths,
+    kitchen_variants_spawn_cfg,
+    select_kitchen,
+    select_kitchens,
+)
 
 from . import mdp as extended_mdp
 
@@ -45,14 +53,13 @@ class BowlStackSceneCfg(InteractiveSceneCfg):
     bowl: RigidObjectCfg | DeformableObjectCfg = MISSING
 
     # kitchen
-    kitchen_number: int = 1  # TODO: Fix this
     kitchen = AssetBaseCfg(
         prim_path="{ENV_REGEX_NS}/Kitchen",
         init_state=AssetBaseCfg.InitialStateCfg(
             pos=[1.0, 1.0, 0.0], rot=[1.0, 0.0, 0.0, 0.0]
         ),
         spawn=UsdFileCfg(
-            usd_path=f"{ISAACLAB_EXTENDED_ASSETS_DATA_DIR}/Scenes/USD/Kitchen/kitchen_{kitchen_number}.usd"
+            usd_path=f"{ISAACLAB_EXTENDED_ASSETS_DATA_DIR}/Scenes/USD/Kitchen/kitchen_1.usd"
         ),
     )
 
@@ -215,12 +222,12 @@ class EventCfg:
     reset_all = EventTerm(func=mdp.reset_scene_to_default, mode="reset")
 
     reset_object_position = EventTerm(
-        func=mdp.reset_root_state_uniform,
+        func=extended_mdp.reset_root_state_uniform,
         mode="reset",
         params={
             "pose_range": {"x": (-0.1, 0.1), "y": (-0.25, 0.25), "z": (0.0, 0.0)},
             "velocity_range": {},
-            "asset_cfg": SceneEntityCfg("object", body_names="Object"),
+            "asset_cfgs": [SceneEntityCfg("object", body_names="Object")],
         },
     )
 
@@ -287,7 +294,7 @@ class CurriculumCfg:
 
 
 @configclass
-class BowlStackEnvCfg(ManagerBasedRLEnvCfg):
+class BowlStackEnvCfg(ExtendedManagerBasedRLEnvCfg):
     """Configuration for the assembly environment."""
 
     # scene settings
@@ -301,6 +308,16 @@ class BowlStackEnvCfg(ManagerBasedRLEnvCfg):
     terminations: TerminationsCfg = TerminationsCfg()
     events: EventCfg = EventCfg()
     curriculum: CurriculumCfg = CurriculumCfg()
+    # RoboCasa kitchen configuration (env_config.json) of a baked kitchen, None for the default kitchen
+    kitchen_config: str | None = None
+    # layout (0-9) and style (0-11) of a precompiled kitchen, None for any layout or style
+    kitchen_layout: int | None = None
+    kitchen_style: int | None = None
+    # number of precompiled kitchens distributed across the envs in round-robin order, None for one kitchen in all envs
+    num_kitchens: int | None = None
+    # relative frequency of the kitchens distributed across the envs, keyed by "layout_<layout>_style_<style>",
+    # None to distribute num_kitchens kitchens
+    kitchen_weights: dict[str, float] | None = None
 
     def __post_init__(self):
         """Post initialization."""
@@ -327,3 +344,24 @@ class BowlStackEnvCfg(ManagerBasedRLEnvCfg):
         # physics material settings
         self.sim.physics_material.static_friction = 1.0
         self.sim.physics_material.dynamic_friction = 1.0
+
+    def finalize(self):
+        """Spawn the kitchen selected by the seed and the kitchen settings, which are set after the initialization."""
+        super().finalize()
+        # spawn the baked kitchen of the configuration or a precompiled kitchen of the manifest
+        if self.kitchen_config is not None:
+            usd_path = baked_kitchen_path(self.kitchen_config)
+            self.scene.kitchen.spawn = self.scene.kitchen.spawn.replace(usd_path=usd_path)
+        elif self.kitchen_weights is not None:
+            usd_paths = kitchen_paths(list(self.kitchen_weights))
+            self.scene.kitchen.spawn = kitchen_variants_spawn_cfg(usd_paths, self.kitchen_weights)
+            # the envs hold different assets
+            self.scene.replicate_physics = False
+        elif self.num_kitchens is not None:
+            usd_paths = select_kitchens(self.num_kitchens, self.kitchen_layout, self.kitchen_style, seed=self.seed)
+            self.scene.kitchen.spawn = kitchen_variants_spawn_cfg(usd_paths)
+            # the envs hold different assets
+            self.scene.replicate_physics = False
+        elif self.kitchen_layout is not None or self.kitchen_style is not None:
+            usd_path = select_kitchen(self.kitchen_layout, self.kitchen_style, seed=self.seed)
+            self.scene.kitchen.spawn = self.scene.kitchen.spawn.replace(usd_path=usd_path)
@@ -8,7 +8,7 @@ from isaaclab.assets import (
     DeformableObjectCfg,
     RigidObjectCfg,
 )
-from isaaclab.envs import ManagerBasedRLEnvCfg, mdp
+from isaaclab.envs import mdp
 from isaaclab.envs.common import ViewerCfg
 from isaaclab.managers import CurriculumTermCfg as CurrTerm
 from isaaclab.managers import EventTermCfg as EventTerm
@@ -37,6 +37,7 @@ from isaaclab.terrains import TerrainImporterCfg, TerrainGeneratorCfg, MeshPlane
 from isaaclab.utils import configclass
 from isaaclab.utils.assets import ISAAC_NUCLEUS_DIR
 from isaaclab_exassets import ISAACLAB_EXTENDED_ASSETS_DATA_DIR
+from isaaclab_extasks.utils.envs import ExtendedManagerBasedRLEnvCfg
 
 from . import mdp as extended_mdp
 
@@ -440,7 +441,13 @@ class EventCfg:
             },
             "velocity_range": {},
             "region_name": "region",
-            "asset_names": ["spam_can", "banana", "mustard_bottle", "sugar_box", "tomato_can"],
+            "asset_cfgs": [
+                SceneEntityCfg("spam_can"),
+                SceneEntityCfg("banana"),
+                SceneEntityCfg("mustard_bottle"),
+                SceneEntityCfg("sugar_box"),
+                SceneEntityCfg("tomato_can"),
+            ],
         },
     )
 
@@ -465,6 +472,15 @@ class TerminationsCfg:
 
     time_out = DoneTerm(func=mdp.time_out, time_out=True)
 
+    success = DoneTerm(
+        func=extended_mdp.regions_success,
+        params={
+            "asset_names": ["spam_can", "banana", "mustard_bottle", "sugar_box", "tomato_can"],
+            "region_names": ["region"],
+            "max_height": 0.2,
+        },
+    )
+
 
 @configclass
 class CurriculumCfg:
@@ -482,7 +498,7 @@ class CurriculumCfg:
 
 
 @configclass
-class YCBArrangeEnvCfg(ManagerBasedRLEnvCfg):
+class YCBArrangeEnvCfg(ExtendedManagerBasedRLEnvCfg):
     """Configuration for the ycb arrange environment."""
 
     # scene settings
@@ -498,6 +514,8 @@ class YCBArrangeEnvCfg(ManagerBasedRLEnvCfg):
     terminations: TerminationsCfg = TerminationsCfg()
     events: EventCfg = EventCfg()
     curriculum: CurriculumCfg = CurriculumCfg()
+    # spacing of the envs, "auto" to derive it from the bounds of the template env, None to keep the scene spacing
+    env_spacing: float | str | None = "auto"
 
     def __post_init__(self):
         """Post initialization."""
@@ -0,0 +1,9 @@
+"""This sub-module contains the functions that are shared by the extended task environments.
+
+The ``mdp`` modules of the tasks re-export them together with :mod:`isaaclab.envs.mdp`.
+"""
+
+from .events import *  # noqa: F401, F403
+from .observations import *  # noqa: F401, F403
+from .rewards import *  # noqa: F401, F403
+from .terminations import *  # noqa: F401, F403
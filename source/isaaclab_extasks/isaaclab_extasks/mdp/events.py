@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-import torch
 from typing import TYPE_CHECKING
 
 import isaaclab.utils.math as math_utils
+import torch
 from isaaclab.assets import Articulation, RigidObject
+from isaaclab.managers import SceneEntityCfg
+from isaaclab_extasks.utils.reset_rng import reset_uniform
 
 if TYPE_CHECKING:
     from isaaclab.envs import ManagerBasedEnv
@@ -15,11 +17,14 @@ def reset_root_state_uniform(
     env_ids: torch.Tensor,
     pose_range: dict[str, tuple[float, float]],
     velocity_range: dict[str, tuple[float, float]],
-    asset_names: list[str],
+    asset_cfgs: list[SceneEntityCfg],
 ):
-    """Reset the asset root state to a random position and velocity uniformly within the given ranges.
+    """Reset the root states of assets to random poses and velocities uniformly within the given ranges.
 
-    This function randomizes the root position and velocity of the asset.
+    The function is a multi-asset version of :func:`isaaclab.envs.mdp.reset_root_state_uniform`
+    that draws the offsets of each asset from the counter-based generator of
+    :mod:`isaaclab_extasks.utils.reset_rng`, so the n-th episode of an env starts from the same
+    state in every run with the same seed.
 
     * It samples the root position from the given ranges and adds them to the default root position, before setting
       them into the physics simulation.
@@ -30,8 +35,8 @@ def reset_root_state_uniform(
     dictionary are ``x``, ``y``, ``z``, ``roll``, ``pitch``, and ``yaw``. The values are tuples of the form
     ``(min, max)``. If the dictionary does not contain a key, the position or velocity is set to zero for that axis.
     """
-    # extract the used quantities (to enable type-hinting)
-    for name in asset_names:
+    for asset_cfg in asset_cfgs:
+        name = asset_cfg.name
         asset: RigidObject | Articulation = env.scene[name]
         # get default root state
         root_states = asset.data.default_root_state[env_ids].clone()
@@ -39,7 +44,7 @@ def reset_root_state_uniform(
         # poses
         range_list = [pose_range.get(key, (0.0, 0.0)) for key in ["x", "y", "z", "roll", "pitch", "yaw"]]
         ranges = torch.tensor(range_list, device=asset.device)
-        rand_samples = math_utils.sample_uniform(ranges[:, 0], ranges[:, 1], (len(env_ids), 6), device=asset.device)
+        rand_samples = reset_uniform(env, env_ids, ranges[:, 0], ranges[:, 1], f"root_state/{name}/pose")
 
         positions = root_states[:, 0:3] + env.scene.env_origins[env_ids] + rand_samples[:, 0:3]
         orientations_delta = math_utils.quat_from_euler_xyz(rand_samples[:, 3], rand_samples[:, 4], rand_samples[:, 5])
@@ -47,10 +52,10 @@ def reset_root_state_uniform(
         # velocities
         range_list = [velocity_range.get(key, (0.0, 0.0)) for key in ["x", "y", "z", "roll", "pitch", "yaw"]]
         ranges = torch.tensor(range_list, device=asset.device)
-        rand_samples = math_utils.sample_uniform(ranges[:, 0], ranges[:, 1], (len(env_ids), 6), device=asset.device)
+        rand_samples = reset_uniform(env, env_ids, ranges[:, 0], ranges[:, 1], f"root_state/{name}/velocity")
 
         velocities = root_states[:, 7:13] + rand_samples
 
         # set into the physics simulation
         asset.write_root_pose_to_sim(torch.cat([positions, orientations], dim=-1), env_ids=env_ids)
-        asset.write_root_velocity_to_sim(velocities, env_ids=env_ids)
\ No newline at end of file
+        asset.write_root_velocity_to_sim(velocities, env_ids=env_ids)
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import torch
+from isaaclab.assets import RigidObject
+from isaaclab.managers import SceneEntityCfg
+from isaaclab.utils.math import subtract_frame_transforms
+from isaaclab_extasks.utils.virtual_frames import frame_pose
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLEnv
+
+
+def frame_position_in_robot_root_frame(
+    env: ManagerBasedRLEnv,
+    frame_name: str,
+    robot_cfg: SceneEntityCfg = SceneEntityCfg("robot"),
+) -> torch.Tensor:
+    """The position of a virtual frame or of the root of a scene asset in the robot's root frame."""
+    robot: RigidObject = env.scene[robot_cfg.name]
+    frame_pos_w, _ = frame_pose(env, frame_name)
+    frame_pos_b, _ = subtract_frame_transforms(
+        robot.data.root_state_w[:, :3], robot.data.root_state_w[:, 3:7], frame_pos_w
+    )
+    return frame_pos_b
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import torch
+
+from .terminations import parts_inserted
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLEnv
+
+
+def parts_inserted_ratio(
+    env: ManagerBasedRLEnv,
+    part_names: list[str],
+    target_names: list[str],
+    xy_threshold: float = 0.0025,
+    height_threshold: float = 0.0075,
+    axis_threshold: float = 0.1,
+    height_offsets: list[float] | None = None,
+) -> torch.Tensor:
+    """Reward the agent for the fraction of parts inserted into their targets."""
+    inserted = parts_inserted(
+        env, part_names, target_names, xy_threshold, height_threshold, axis_threshold, height_offsets
+    )
+    return inserted.float().mean(dim=-1)
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+import torch
+from isaaclab.managers import ManagerTermBase, TerminationTermCfg
+from isaaclab.utils.math import subtract_frame_transforms
+from isaaclab_extasks.utils.virtual_frames import frame_pose
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLEnv
+
+
+class SuccessTermBase(ManagerTermBase):
+    """Base class of the terms that terminate when a success condition holds for a number of consecutive steps.
+
+    Derived classes evaluate their condition in ``__call__`` and pass it to :meth:`update`.
+    The fraction of resetting environments that succeeded is logged under ``Metrics/`` with
+    the name :attr:`metric_name`.
+    """
+
+    metric_name: str = "success_rate"
+    """Name of the logged success rate."""
+
+    default_hold_steps: int = 5
+    """Number of consecutive steps if the term parameters do not set ``hold_steps``."""
+
+    def __init__(self, cfg: TerminationTermCfg, env: ManagerBasedRLEnv):
+        super().__init__(cfg, env)
+        self.hold_counter = torch.zeros(env.num_envs, dtype=torch.long, device=env.device)
+
+    def reset(self, env_ids: Sequence[int] | None = None):
+        if env_ids is None:
+            env_ids = slice(None)
+        hold_steps = self.cfg.params.get("hold_steps", self.default_hold_steps)
+        success = self.hold_counter[env_ids] >= hold_steps
+        if "log" in self._env.extras and success.numel() > 0:
+            self._env.extras["log"][f"Metrics/{self.metric_name}"] = success.float().mean().item()
+        self.hold_counter[env_ids] = 0
+
+    def update(self, condition: torch.Tensor, hold_steps: int) -> torch.Tensor:
+        """Count the consecutive steps in which the condition holds.
+
+        Parameters
+        ----------
+        condition : torch.Tensor
+            Boolean mask of the environments that satisfy the condition. Shape is (num_envs,).
+        hold_steps : int
+            Number of consecutive steps the condition must hold.
+
+        Returns
+        -------
+        torch.Tensor
+            Boolean mask of the environments that succeeded. Shape is (num_envs,).
+        """
+        self.hold_counter = torch.where(condition, self.hold_counter + 1, torch.zeros_like(self.hold_counter))
+        return self.hold_counter >= hold_steps
+
+
+def parts_inserted(
+    env: ManagerBasedRLEnv,
+    part_names: list[str],
+    target_names: list[str],
+    xy_threshold: float = 0.0025,
+    height_threshold: float = 0.0075,
+    axis_threshold: float = 0.1,
+    height_offsets: list[float] | None = None,
+) -> torch.Tensor:
+    """Check which parts are inserted into their targets.
+
+    A part is inserted when its origin, expressed in the frame of its target, lies
+    within ``xy_threshold`` of the target axis and within ``height_threshold`` of the
+    inserted height, and its z-axis is tilted by less than ``axis_threshold`` from the
+    target z-axis. All parts are evaluated in a single batched operation.
+
+    Parameters
+    ----------
+    env : ManagerBasedRLEnv
+        The environment.
+    part_names : list[str]
+        Names of the parts to be inserted.
+    target_names : list[str]
+        Names of the virtual frames or assets that define the inserted pose of each part.
+    xy_threshold : float
+        Radial position tolerance (in m).
+    height_threshold : float
+        Axial position tolerance around the inserted height (in m).
+    axis_threshold : float
+        Tolerance of the angle between the part and target z-axes (in rad).
+    height_offsets : list[float] | None
+        Height of each inserted part above its target frame (in m). Defaults to zeros.
+
+    Returns
+    -------
+    torch.Tensor
+        Boolean mask of shape (num_envs, num_parts).
+    """
+    part_pos_w = torch.stack([env.scene[name].data.root_pos_w for name in part_names], dim=1)
+    part_quat_w = torch.stack([env.scene[name].data.root_quat_w for name in part_names], dim=1)
+    target_poses = [frame_pose(env, name) for name in target_names]
+    target_pos_w = torch.stack([pos for pos, _ in target_poses], dim=1)
+    target_quat_w = torch.stack([quat for _, quat in target_poses], dim=1)
+    # relative pose of the parts in the target frames: (num_envs * num_parts, ...)
+    num_parts = len(part_names)
+    rel_pos, rel_quat = subtract_frame_transforms(
+        target_pos_w.reshape(-1, 3),
+        target_quat_w.reshape(-1, 4),
+        part_pos_w.reshape(-1, 3),
+        part_quat_w.reshape(-1, 4),
+    )
+    rel_pos = rel_pos.view(-1, num_parts, 3)
+    if height_offsets is not None:
+        rel_pos[..., 2] -= torch.tensor(height_offsets, device=env.device)
+    # cosine of the tilt angle is the z-component of the rotated z-axis: 1 - 2 (x^2 + y^2)
+    rel_quat = rel_quat.view(-1, num_parts, 4)
+    cos_tilt = 1.0 - 2.0 * (rel_quat[..., 1] ** 2 + rel_quat[..., 2] ** 2)
+
+    is_centered = torch.norm(rel_pos[..., :2], dim=-1) < xy_threshold
+    is_seated = torch.abs(rel_pos[..., 2]) < height_threshold
+    is_aligned = cos_tilt > math.cos(axis_threshold)
+    return is_centered & is_seated & is_aligned
+
+
+def objects_in_regions(
+    env: ManagerBasedRLEnv,
+    asset_names: list[str],
+    region_names: list[str],
+    max_height: float = 0.1,
+) -> torch.Tensor:
+    """Check which objects lie inside the footprint of their regions.
+
+    The footprint of a region is the rectangle spanned by the x and y extents of its
+    cuboid, in the frame of the region. An object is inside when its origin projects
+    into the footprint and lies at most ``max_height`` above the region. All objects
+    are evaluated in a single batched operation.
+
+    Parameters
+    ----------
+    env : ManagerBasedRLEnv
+        The environment.
+    asset_names : list[str]
+        Names of the objects.
+    region_names : list[str]
+        Names of the cuboid regions, either one per object or a single shared region.
+    max_height : float
+        Maximum height of the object origins above the regions (in m).
+
+    Returns
+    -------
+    torch.Tensor
+        Boolean mask of shape (num_envs, num_objects).
+    """
+    if len(region_names) == 1:
+        region_names = region_names * len(asset_names)
+    num_objects = len(asset_names)
+    object_pos_w = torch.stack([env.scene[name].data.root_pos_w for name in asset_names], dim=1)
+    # regions may be static colliders, so their poses are resolved through the scene configuration
+    region_poses = [frame_pose(env, name) for name in region_names]
+    region_pos_w = torch.stack([pos for pos, _ in region_poses], dim=1)
+    region_quat_w = torch.stack([quat for _, quat in region_poses], dim=1)
+    half_extents = torch.tensor(
+        [getattr(env.scene.cfg, name).spawn.size for name in region_names], device=env.device
+    ) / 2.0
+    # object positions in the region frames: (num_envs, num_objects, 3)
+    object_pos_r, _ = subtract_frame_transforms(
+        region_pos_w.reshape(-1, 3), region_quat_w.reshape(-1, 4), object_pos_w.reshape(-1, 3)
+    )
+    object_pos_r = object_pos_r.view(-1, num_objects, 3)
+    is_inside = (torch.abs(object_pos_r[..., :2]) <= half_extents[:, :2]).all(dim=-1)
+    is_above = (object_pos_r[..., 2] >= 0.0) & (object_pos_r[..., 2] <= half_extents[:, 2] + max_height)
+    return is_inside & is_above
+
+
+class regions_success(SuccessTermBase):
+    """Terminate when all objects have stayed inside their regions for a number of consecutive steps.
+
+    The fraction of resetting environments that succeeded is logged as ``Metrics/success_rate``.
+    """
+
+    def __call__(
+        self,
+        env: ManagerBasedRLEnv,
+        asset_names: list[str],
+        region_names: list[str],
+        hold_steps: int = 5,
+        max_height: float = 0.1,
+    ) -> torch.Tensor:
+        return self.update(objects_in_regions(env, asset_names, region_names, max_height).all(dim=-1), hold_steps)
+
+
+class assembly_success(SuccessTermBase):
+    """Terminate when all parts have stayed inserted for a number of consecutive steps.
+
+    The fraction of resetting environments that succeeded is logged as
+    ``Metrics/assembly_success_rate``.
+    """
+
+    metric_name = "assembly_success_rate"
+    default_hold_steps = 10
+
+    def __call__(
+        self,
+        env: ManagerBasedRLEnv,
+        part_names: list[str],
+        target_names: list[str],
+        hold_steps: int = 10,
+        xy_threshold: float = 0.0025,
+        height_threshold: float = 0.0075,
+        axis_threshold: float = 0.1,
+        height_offsets: list[float] | None = None,
+    ) -> torch.Tensor:
+        inserted = parts_inserted(
+            env, part_names, target_names, xy_threshold, height_threshold, axis_threshold, height_offsets
+        )
+        return self.update(inserted.all(dim=-1), hold_steps)
@@ -0,0 +1,13 @@
+import gymnasium as gym
+
+from . import agents, franka_env_cfg
+
+gym.register(
+    id="Isaac-Multi-Task-Franka-v0",
+    entry_point="isaaclab_extasks.utils.envs:ExtendedManagerBasedRLEnv",
+    kwargs={
+        "env_cfg_entry_point": franka_env_cfg.MultiTaskFrankaEnvCfg,
+        "rsl_rl_cfg_entry_point": f"{agents.__name__}.rsl_rl_ppo_cfg:MultiTaskPPORunnerCfg",
+    },
+    disable_env_checker=True,
+)
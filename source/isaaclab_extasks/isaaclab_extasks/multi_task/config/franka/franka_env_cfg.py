@@ -0,0 +1,60 @@
+from isaaclab.utils import configclass
+from isaaclab_extasks.block_world.sort.config.franka.franka_env_cfg import FrankaSortEnvCfg
+from isaaclab_extasks.block_world.stack.config.franka.franka_env_cfg import FrankaStackEnvCfg
+from isaaclab_extasks.kitchen.bowl_stack.config.franka.franka_env_cfg import FrankaBowlStackEnvCfg
+from isaaclab_extasks.utils.multi_task import apply_multi_task
+
+
+@configclass
+class MultiTaskFrankaEnvCfg(FrankaStackEnvCfg):
+    # relative share of the envs of each task, the stack task sets the actions and the simulation
+    tasks: dict[str, float] = {"stack": 1.0, "sort": 1.0, "bowl_stack": 1.0}
+    # kitchen settings of the bowl stack task, see BowlStackEnvCfg
+    kitchen_config: str | None = None
+    kitchen_layout: int | None = None
+    kitchen_style: int | None = None
+    num_kitchens: int | None = None
+    kitchen_weights: dict[str, float] | None = None
+
+    def finalize(self):
+        """Merge the finalized tasks, after the target block of the stack task is chosen from the seed."""
+        self.choose_target_object()
+
+        # Set one env group per task
+        task_cfg_types = {"sort": FrankaSortEnvCfg, "bowl_stack": FrankaBowlStackEnvCfg}
+        task_cfgs = {name: self if name == "stack" else task_cfg_types[name]() for name in self.tasks}
+        for task_cfg in task_cfgs.values():
+            if task_cfg is self:
+                continue
+            # the tasks share the seed and the layout of the envs
+            task_cfg.seed = self.seed
+            task_cfg.scene.num_envs = self.scene.num_envs
+            task_cfg.scene.env_spacing = self.scene.env_spacing
+            task_cfg.env_spacing = self.env_spacing
+            # the passes over the whole scene run once, when the merged configuration is finalized
+            task_cfg.static_helpers = False
+            task_cfg.staggered_resets = False
+            if isinstance(task_cfg, FrankaBowlStackEnvCfg):
+                # the kitchen is selected on the merged configuration
+                for name in ("kitchen_config", "kitchen_layout", "kitchen_style", "num_kitchens", "kitchen_weights"):
+                    setattr(task_cfg, name, getattr(self, name))
+            task_cfg.finalize()
+        # the kitchen envs share the light and the cameras of the block world
+        if "bowl_stack" in task_cfgs:
+            for name in ("light", "rgb_camera", "depth_camera", "semantic_camera"):
+                setattr(task_cfgs["bowl_stack"].scene, name, getattr(self.scene, name))
+        apply_multi_task(self, task_cfgs, self.tasks)
+
+        # finalize the merged configuration
+        super().finalize()
+
+
+@configclass
+class MultiTaskFrankaEnvCfg_PLAY(MultiTaskFrankaEnvCfg):
+    def __post_init__(self):
+        # post init of parent
+        super().__post_init__()
+        # make a smaller scene for play
+        self.scene.num_envs = 48
+        # disable randomization for play
+        self.observations.policy.enable_corruption = False
@@ -0,0 +1,74 @@
+"""Sub-package with utilities shared across the extended task environments.
+
+This package is excluded from the automatic gym registration in :mod:`isaaclab_extasks`.
+
+The utilities are imported lazily on first access, so that importing a single module,
+e.g. :mod:`isaaclab_extasks.utils.virtual_frames` from the MDP terms, does not import
+the heavier modules of the other utilities.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "collision_budget": ["check_collision_budget", "scene_collision_primitives"],
+    "collision_tiers": ["apply_collision_tier"],
+    "envs": ["ExtendedManagerBasedRLEnv", "ExtendedManagerBasedRLEnvCfg"],
+    "env_spacing": ["ROBOT_REACH", "apply_env_spacing", "grid_extent", "template_env_bounds"],
+    "kitchen": [
+        "KITCHEN_CACHE_DIR",
+        "baked_kitchen_path",
+        "kitchen_name",
+        "kitchen_paths",
+        "kitchen_variants_spawn_cfg",
+        "load_kitchen_manifest",
+        "select_kitchen",
+        "select_kitchens",
+    ],
+    "mixed_robots": [
+        "EMBODIMENT_CFGS",
+        "EmbodimentArticulation",
+        "EmbodimentArticulationCfg",
+        "MixedJointPositionAction",
+        "MixedJointPositionActionCfg",
+        "apply_mixed_robots",
+        "assign_env_groups",
+        "embodiment_assets",
+    ],
+    "multi_task": ["EnvGroupSpawnerCfg", "apply_multi_task", "task_id", "task_masks"],
+    "reset_rng": ["ResetRNG", "philox", "reset_randint", "reset_rng", "reset_uniform", "seeded_index"],
+    "reset_scheduler": ["StaggeredTimeOut", "apply_staggered_resets"],
+    "scene_compiler": ["CompiledScene", "compile_scene", "placement_events"],
+    "scripted_expert": [
+        "EXPERT_CFGS",
+        "PickPlaceExpert",
+        "PickPlaceExpertCfg",
+        "collect_demonstrations",
+        "flatten_obs",
+        "gripper_joint_positions",
+        "sort_sequence",
+        "stack_sequence",
+        "task_sequence",
+    ],
+    "static_colliders": ["asset_root_pose", "convert_kinematic_helpers", "report_static_colliders"],
+    "trajectory_dataset": ["TrajectoryDataset", "TrajectoryLoader", "TrajectoryWriter"],
+    "ur_ik_actions": ["URAnalyticalIKAction", "URAnalyticalIKActionCfg"],
+    "ur_kinematics": ["UR_DH_PARAMS", "select_nearest_branch", "ur_forward_kinematics", "ur_inverse_kinematics"],
+    "virtual_frames": ["VirtualFrameCfg", "frame_pose", "virtual_frame_pose"],
+}
+"""Names exported by the package, keyed by the module that defines them."""
+
+_MODULE_OF = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = sorted(_MODULE_OF)
+
+
+def __getattr__(name: str):
+    if name not in _MODULE_OF:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_MODULE_OF[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
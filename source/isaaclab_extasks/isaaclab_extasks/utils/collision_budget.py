@@ -0,0 +1,86 @@
+"""Collision complexity budget of the scenes.
+
+Converted assets may carry collision meshes with many thousands of triangles, which
+silently reduce the simulation throughput once they are placed in a scene. The check
+in this module sums the collision primitives of the first environment of a built
+scene and warns or fails when they exceed a budget. The colliders are counted on the
+stage, so robots and assets on Nucleus are counted like the local assets, with the
+same rules as the report of ``isaaclab_exassets/utils/collision_report.py``.
+
+Environments built from :class:`~isaaclab_extasks.utils.envs.ExtendedManagerBasedRLEnvCfg`
+run the check when ``collision_budget`` is set.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import omni.log
+from isaaclab_exassets import collision_complexity
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedEnv
+
+
+def scene_collision_primitives(env: ManagerBasedEnv) -> dict[str, int]:
+    """Count the collision primitives of the prims of the first environment.
+
+    Prims outside the environments, such as the ground plane, are ignored.
+
+    Parameters
+    ----------
+    env : ManagerBasedEnv
+        The environment. Its scene must be built.
+
+    Returns
+    -------
+    dict[str, int]
+        Number of collision primitives per child prim of the first environment, keyed by
+        the name of the prim.
+    """
+    env_prim = env.scene.stage.GetPrimAtPath(env.scene.env_prim_paths[0])
+    primitives = {}
+    for prim in env_prim.GetChildren():
+        num_primitives = collision_complexity(prim)["primitives"]
+        if num_primitives > 0:
+            primitives[prim.GetName()] = num_primitives
+    return primitives
+
+
+def check_collision_budget(env: ManagerBasedEnv, max_primitives: int, on_exceed: str = "warn") -> int:
+    """Check that the collision primitives per environment are within a budget.
+
+    Parameters
+    ----------
+    env : ManagerBasedEnv
+        The environment. Its scene must be built.
+    max_primitives : int
+        Maximum number of collision primitives per environment.
+    on_exceed : str
+        Either ``"warn"`` to log a warning or ``"error"`` to raise an exception
+        when the budget is exceeded. Defaults to ``"warn"``.
+
+    Returns
+    -------
+    int
+        Number of collision primitives per environment.
+
+    Raises
+    ------
+    ValueError
+        If ``on_exceed`` is ``"error"`` and the budget is exceeded.
+    """
+    if on_exceed not in ("warn", "error"):
+        raise ValueError(f"Invalid value for 'on_exceed': {on_exceed}. Expected 'warn' or 'error'.")
+    primitives = scene_collision_primitives(env)
+    total = sum(primitives.values())
+    if total > max_primitives:
+        heaviest = sorted(primitives.items(), key=lambda item: item[1], reverse=True)[:5]
+        msg = (
+            f"Scene has {total} collision primitives per env, exceeding the budget of {max_primitives}."
+            f" Heaviest prims: {heaviest}."
+        )
+        if on_exceed == "error":
+            raise ValueError(msg)
+        omni.log.warn(msg)
+    return total
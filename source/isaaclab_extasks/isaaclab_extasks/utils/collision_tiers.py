@@ -0,0 +1,73 @@
+"""Selection of the baked collision variants of the assembly parts.
+
+The offline stage ``isaaclab_exassets/utils/bake_collision.py`` decomposes the
+collision meshes of each part into convex hulls and writes one collision variant
+per quality tier to ``<part_dir>/collision/<part_name>_<tier>.usd``. The variant
+references the original part, so visuals, mass and rigid body properties are
+unchanged. The pass in this module swaps the USD files of the scene entities for
+the variants of a tier, which lets each experiment trade contact accuracy for
+simulation throughput.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+import omni.log
+from isaaclab.assets import RigidObjectCfg
+from isaaclab.sim.spawners.from_files.from_files_cfg import UsdFileCfg
+from isaaclab_exassets import COLLISION_TIERS, collision_variant_path
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedEnvCfg
+
+
+def apply_collision_tier(
+    env_cfg: ManagerBasedEnvCfg,
+    tier: str | None,
+    names: Sequence[str] | None = None,
+    verbose: bool = True,
+) -> list[str]:
+    """Spawn the scene entities with the collision variants of a quality tier.
+
+    Entities spawned from a USD file whose variant was not baked keep the original
+    collision meshes.
+
+    Parameters
+    ----------
+    env_cfg : ManagerBasedEnvCfg
+        The environment configuration. Its scene is modified in place.
+    tier : str | None
+        Quality tier, a key of :data:`COLLISION_TIERS`. If None, the scene is not modified.
+    names : Sequence[str] | None
+        Names of the scene entities to consider. Defaults to None, i.e. all rigid objects.
+    verbose : bool
+        Whether to warn about the entities without a baked variant.
+
+    Returns
+    -------
+    list[str]
+        Names of the scene entities that use a collision variant.
+    """
+    if tier is None:
+        return []
+    if tier not in COLLISION_TIERS:
+        raise ValueError(f"Unknown collision tier '{tier}'. Available: {list(COLLISION_TIERS)}.")
+    applied, missing = [], []
+    for name, asset_cfg in env_cfg.scene.__dict__.items():
+        if (names is None and not isinstance(asset_cfg, RigidObjectCfg)) or (names is not None and name not in names):
+            continue
+        spawn = getattr(asset_cfg, "spawn", None)
+        if not isinstance(spawn, UsdFileCfg) or "://" in spawn.usd_path:
+            continue
+        variant_path = collision_variant_path(spawn.usd_path, tier)
+        if os.path.isfile(variant_path):
+            asset_cfg.spawn = spawn.replace(usd_path=variant_path)
+            applied.append(name)
+        else:
+            missing.append(name)
+    if verbose and missing:
+        omni.log.warn(f"No baked '{tier}' collision variant for {missing}. Keeping the original collision meshes.")
+    return applied
@@ -0,0 +1,237 @@
+"""Environment spacing derived from the bounds of the template environment.
+
+The task configurations place their environments 2.5 m apart, which is far more
+than a tabletop scene needs. The world extent that the GPU broadphase covers grows
+with the square of the spacing, so a tighter grid makes large runs cheaper. The
+pass in this module computes the axis-aligned bounds of the template environment
+from its configuration, i.e. the reach of the robots and the bounds of the spawned
+entities widened by their reset ranges, and sets the smallest spacing at which the
+environments do not overlap.
+
+The spacing depends on the final number of envs and scene, so
+:class:`~isaaclab_extasks.utils.envs.ExtendedManagerBasedRLEnv` applies the pass to the
+``env_spacing`` of its configuration after :meth:`finalize`, i.e. after the command-line
+overrides of the training scripts.
+
+Bounds of USD assets are read from the local files. If the bounds of an entity are
+unknown, e.g. of a remote asset that is not mirrored, the configured spacing is kept
+and a warning names the entities.
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+import os
+from typing import TYPE_CHECKING
+
+import numpy as np
+import omni.log
+from isaaclab.assets import ArticulationCfg, AssetBaseCfg
+from isaaclab.sim.spawners.from_files.from_files_cfg import UsdFileCfg
+from isaaclab.sim.spawners.shapes import CapsuleCfg, ConeCfg, CuboidCfg, CylinderCfg, SphereCfg
+from isaaclab.sim.spawners.wrappers import MultiUsdFileCfg
+from isaaclab_exassets import resolve_asset_path
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedEnvCfg
+
+ROBOT_REACH = {
+    "franka_panda": 1.0,
+    "gen3": 1.05,
+    "jaco": 1.05,
+    "iiwa": 0.95,
+    "xarm7": 0.9,
+    "ur5e": 1.05,
+    "ur10e": 1.5,
+}
+"""Reach of the robots including their grippers in meters, keyed by a part of the USD file name."""
+
+
+@functools.lru_cache(maxsize=256)
+def usd_bounds(usd_path: str) -> tuple[tuple[float, ...], tuple[float, ...]] | None:
+    """Bounds of the default prim of a local USD file in its own frame, or None if unknown."""
+    try:
+        usd_path = resolve_asset_path(usd_path)
+    except FileNotFoundError:
+        # remote asset that is not mirrored in offline mode, reported when the environment is constructed
+        return None
+    if not os.path.isfile(usd_path):
+        return None
+    from pxr import Usd, UsdGeom
+
+    stage = Usd.Stage.Open(usd_path)
+    prim = stage.GetDefaultPrim() or stage.GetPseudoRoot()
+    bbox_cache = UsdGeom.BBoxCache(Usd.TimeCode.Default(), [UsdGeom.Tokens.default_, UsdGeom.Tokens.render])
+    bound = bbox_cache.ComputeWorldBound(prim).ComputeAlignedRange()
+    if bound.IsEmpty():
+        return None
+    return tuple(bound.GetMin()), tuple(bound.GetMax())
+
+
+def _spawn_bounds(spawn) -> tuple[np.ndarray, np.ndarray] | None:
+    """Bounds of a spawner in the frame of the spawned prim."""
+    if hasattr(spawn, "group_names"):
+        # spawner of a prim in the envs of some tasks, see multi_task.EnvGroupSpawnerCfg
+        spawn = spawn.spawn
+    if isinstance(spawn, CuboidCfg):
+        half = np.asarray(spawn.size) / 2.0
+        return -half, half
+    if isinstance(spawn, SphereCfg):
+        return -np.full(3, spawn.radius), np.full(3, spawn.radius)
+    if isinstance(spawn, (CylinderCfg, CapsuleCfg, ConeCfg)):
+        # bounding cube of any axis
+        half = max(spawn.radius, spawn.height / 2.0 + (spawn.radius if isinstance(spawn, CapsuleCfg) else 0.0))
+        return -np.full(3, half), np.full(3, half)
+    if isinstance(spawn, (UsdFileCfg, MultiUsdFileCfg)):
+        usd_paths = spawn.usd_path if isinstance(spawn.usd_path, (list, tuple)) else [spawn.usd_path]
+        bounds = [usd_bounds(path) for path in usd_paths]
+        if any(bound is None for bound in bounds):
+            return None
+        scale = np.asarray(spawn.scale) if spawn.scale is not None else np.ones(3)
+        lower = np.min([np.asarray(bound[0]) for bound in bounds], axis=0) * scale
+        upper = np.max([np.asarray(bound[1]) for bound in bounds], axis=0) * scale
+        return np.minimum(lower, upper), np.maximum(lower, upper)
+    return None
+
+
+def _transform_bounds(lower: np.ndarray, upper: np.ndarray, pos, rot) -> tuple[np.ndarray, np.ndarray]:
+    """Axis-aligned bounds of a box moved by a position and a (w, x, y, z) quaternion."""
+    w, x, y, z = rot
+    rotation = np.array([
+        [1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y)],
+        [2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x)],
+        [2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y)],
+    ])
+    corners = np.stack(np.meshgrid(*zip(lower, upper), indexing="ij"), axis=-1).reshape(-1, 3)
+    corners = corners @ rotation.T + np.asarray(pos)
+    return corners.min(axis=0), corners.max(axis=0)
+
+
+def _reset_ranges(env_cfg: ManagerBasedEnvCfg) -> dict[str, dict[str, tuple[float, float]]]:
+    """Position ranges of the reset events by asset name."""
+    ranges = {}
+    for term in env_cfg.events.__dict__.values():
+        params = getattr(term, "params", None) or {}
+        if "pose_range" not in params:
+            continue
+        names = [asset_cfg.name for asset_cfg in params.get("asset_cfgs", [])]
+        for key in ("asset_cfg", "target_asset_cfg"):
+            if key in params:
+                names.append(params[key].name)
+        for name in names:
+            ranges.setdefault(name, {})
+            for axis in ("x", "y"):
+                low, high = params["pose_range"].get(axis, (0.0, 0.0))
+                old_low, old_high = ranges[name].get(axis, (0.0, 0.0))
+                ranges[name][axis] = (min(low, old_low), max(high, old_high))
+    return ranges
+
+
+def template_env_bounds(env_cfg: ManagerBasedEnvCfg) -> tuple[np.ndarray, np.ndarray, list[str]]:
+    """Compute the bounds of the entities of the template environment.
+
+    Parameters
+    ----------
+    env_cfg : ManagerBasedEnvCfg
+        The environment configuration.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, list[str]]
+        Lower and upper corners of the bounds relative to the environment origin, and
+        the names of the entities whose bounds are unknown.
+    """
+    reset_ranges = _reset_ranges(env_cfg)
+    lower, upper, unknown = np.full(3, np.inf), np.full(3, -np.inf), []
+    for name, asset_cfg in env_cfg.scene.__dict__.items():
+        if not isinstance(asset_cfg, AssetBaseCfg) or asset_cfg.spawn is None:
+            continue
+        if "{ENV_REGEX_NS}" not in asset_cfg.prim_path:
+            continue
+        pos, rot = asset_cfg.init_state.pos, asset_cfg.init_state.rot
+        if isinstance(asset_cfg, ArticulationCfg) and isinstance(asset_cfg.spawn, UsdFileCfg):
+            file_name = os.path.basename(asset_cfg.spawn.usd_path).lower()
+            reach = next((value for key, value in ROBOT_REACH.items() if key in file_name), None)
+            if reach is not None:
+                entity_lower, entity_upper = np.asarray(pos) - reach, np.asarray(pos) + reach
+            else:
+                bounds = _spawn_bounds(asset_cfg.spawn)
+                if bounds is None:
+                    unknown.append(name)
+                    continue
+                entity_lower, entity_upper = _transform_bounds(*bounds, pos, rot)
+        else:
+            bounds = _spawn_bounds(asset_cfg.spawn)
+            if bounds is None:
+                unknown.append(name)
+                continue
+            entity_lower, entity_upper = _transform_bounds(*bounds, pos, rot)
+        # widen by the reset offsets
+        for i, axis in enumerate(("x", "y")):
+            low, high = reset_ranges.get(name, {}).get(axis, (0.0, 0.0))
+            entity_lower[i] += low
+            entity_upper[i] += high
+        lower, upper = np.minimum(lower, entity_lower), np.maximum(upper, entity_upper)
+    return lower, upper, unknown
+
+
+def grid_extent(
+    num_envs: int, env_spacing: float, lower: np.ndarray, upper: np.ndarray
+) -> tuple[int, int, float, float]:
+    """Rows, columns and world extent in x and y of the environment grid of Isaac Lab."""
+    num_rows = math.ceil(num_envs / int(math.sqrt(num_envs)))
+    num_cols = math.ceil(num_envs / num_rows)
+    extent_x = (num_rows - 1) * env_spacing + float(upper[0] - lower[0])
+    extent_y = (num_cols - 1) * env_spacing + float(upper[1] - lower[1])
+    return num_rows, num_cols, extent_x, extent_y
+
+
+def apply_env_spacing(
+    env_cfg: ManagerBasedEnvCfg, env_spacing: float | str | None, margin: float = 0.1, verbose: bool = True
+) -> float:
+    """Set the spacing of the environments from the bounds of the template environment.
+
+    Parameters
+    ----------
+    env_cfg : ManagerBasedEnvCfg
+        The environment configuration. Its scene is modified in place.
+    env_spacing : float | str | None
+        ``"auto"`` to compute the spacing, a value in meters to override it, or None
+        to keep the spacing of the scene.
+    margin : float
+        Clearance between the bounds of neighboring environments in meters. Defaults to 0.1.
+    verbose : bool
+        Whether to print the spacing and the extent of the broadphase.
+
+    Returns
+    -------
+    float
+        The spacing of the environments.
+    """
+    if env_spacing is None:
+        return env_cfg.scene.env_spacing
+    if isinstance(env_spacing, str) and env_spacing != "auto":
+        raise ValueError(f"Invalid env spacing '{env_spacing}'. Expected 'auto', a value in meters or None.")
+    lower, upper, unknown = template_env_bounds(env_cfg)
+    configured = env_cfg.scene.env_spacing
+    if env_spacing != "auto":
+        env_cfg.scene.env_spacing = float(env_spacing)
+    elif unknown or not np.all(np.isfinite(lower)):
+        omni.log.warn(
+            f"Bounds of {unknown} are unknown, e.g. remote assets that are not mirrored. Keeping the configured env"
+            f" spacing of {configured} m. Run scripts/prefetch_assets.py or set env_spacing to a value in meters."
+        )
+        return configured
+    else:
+        env_cfg.scene.env_spacing = round(float(max(upper[0] - lower[0], upper[1] - lower[1])) + margin, 3)
+    if verbose and np.all(np.isfinite(lower)):
+        num_envs = env_cfg.scene.num_envs
+        num_rows, num_cols, extent_x, extent_y = grid_extent(num_envs, env_cfg.scene.env_spacing, lower, upper)
+        _, _, old_x, old_y = grid_extent(num_envs, configured, lower, upper)
+        print(
+            f"[INFO]: Env spacing {env_cfg.scene.env_spacing:.2f} m (configured {configured:.2f} m),"
+            f" grid {num_rows} x {num_cols}, broadphase extent {extent_x:.1f} x {extent_y:.1f} m"
+            f" ({extent_x * extent_y / (old_x * old_y):.0%} of the configured area)."
+        )
+    return env_cfg.scene.env_spacing
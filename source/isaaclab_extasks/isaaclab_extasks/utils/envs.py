@@ -0,0 +1,79 @@
+"""Environment whose configuration is finalized right before the scene is built.
+
+The seed, the number of envs and the command-line overrides of the training scripts
+are set on the environment configuration after its ``__post_init__``. The passes that
+depend on them, such as the conversion of the kinematic helpers into static colliders
+and the staggered time-outs, therefore run in :meth:`ExtendedManagerBasedRLEnvCfg.finalize`,
+which :class:`ExtendedManagerBasedRLEnv` calls before it builds the scene. The results of the
+passes are reported from the built scene, which is also checked against the collision
+budget of the configuration. The spacing of the envs is derived last, from the bounds
+of the finalized scene, see :mod:`.env_spacing`.
+
+The remote asset paths of the configuration are replaced by their mirrored files at
+the same point, so importing or parsing a task configuration never fails on an asset
+that is not mirrored, see :mod:`isaaclab_exassets.mirror`.
+"""
+
+from __future__ import annotations
+
+from isaaclab.envs import ManagerBasedRLEnv, ManagerBasedRLEnvCfg
+from isaaclab.utils import configclass
+from isaaclab_exassets import resolve_cfg_assets
+
+from .collision_budget import check_collision_budget
+from .env_spacing import apply_env_spacing
+from .reset_scheduler import apply_staggered_resets
+from .static_colliders import convert_kinematic_helpers, report_static_colliders
+
+
+@configclass
+class ExtendedManagerBasedRLEnvCfg(ManagerBasedRLEnvCfg):
+    """Configuration of :class:`ExtendedManagerBasedRLEnv`."""
+
+    # whether to convert the never-moved kinematic helpers of the scene into static colliders
+    static_helpers: bool = True
+    # names of the scene entities converted into static colliders, set by :meth:`finalize`
+    static_colliders: list[str] = []
+    # maximum number of collision primitives per env, None to skip the check
+    collision_budget: int | None = None
+    # whether to "warn" or raise an "error" when the scene exceeds the collision budget
+    collision_budget_mode: str = "warn"
+    # spacing of the envs, "auto" to derive it from the bounds of the template env, None to keep the scene spacing
+    env_spacing: float | str | None = None
+    # whether to randomize the first episode lengths and cap the time-outs per step to flatten the reset spikes
+    staggered_resets: bool = False
+
+    def finalize(self):
+        """Apply the passes that depend on the final configuration.
+
+        The method is called once by :class:`ExtendedManagerBasedRLEnv` before the scene is
+        built. Derived configurations extend it and call the method of the parent first.
+        """
+        if self.static_helpers:
+            self.static_colliders = convert_kinematic_helpers(self)
+        if self.staggered_resets:
+            apply_staggered_resets(self)
+
+
+class ExtendedManagerBasedRLEnv(ManagerBasedRLEnv):
+    """RL environment that finalizes its configuration and loads the mirrored assets before the scene is built.
+
+    Parameters
+    ----------
+    cfg : ManagerBasedRLEnvCfg
+        The environment configuration. :meth:`ExtendedManagerBasedRLEnvCfg.finalize` is
+        called and the env spacing is applied on configurations that derive from
+        :class:`ExtendedManagerBasedRLEnvCfg`.
+    render_mode : str | None
+        The render mode of the environment.
+    """
+
+    def __init__(self, cfg: ManagerBasedRLEnvCfg, render_mode: str | None = None, **kwargs):
+        if isinstance(cfg, ExtendedManagerBasedRLEnvCfg):
+            cfg.finalize()
+            apply_env_spacing(cfg, cfg.env_spacing)
+        resolve_cfg_assets(cfg)
+        super().__init__(cfg, render_mode, **kwargs)
+        report_static_colliders(self)
+        if getattr(cfg, "collision_budget", None) is not None:
+            check_collision_budget(self, cfg.collision_budget, on_exceed=cfg.collision_budget_mode)
@@ -0,0 +1,254 @@
+"""Selection of the baked RoboCasa kitchens.
+
+The offline stage ``isaaclab_exassets/utils/compile_kitchen.py`` compiles a kitchen
+configuration (``env_config.json``) into a single flattened USD whose fixtures of
+the same model share the instance prototypes of their meshes. The baked file is cached by the hash
+of the configuration, so the kitchen tasks only need the configuration to find it
+and no scene is built at startup. ``precompile_kitchens.py`` compiles all RoboCasa
+layout/style combinations and writes a manifest, from which a kitchen is selected by
+layout and style.
+
+Several kitchens can be distributed across the environments. They are spawned from
+their layered USDs, whose fixtures reference the models directly, so fixtures of the
+same model share the prototypes of their meshes in all kitchens and the stage memory grows
+with the number of distinct models rather than with the number of kitchens.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import random
+from collections.abc import Sequence
+
+import isaaclab.sim as sim_utils
+from isaaclab_exassets import ISAACLAB_EXTENDED_ASSETS_DATA_DIR, KITCHEN_CACHE_DIR, config_hash
+
+DEFAULT_KITCHEN_MANIFEST_PATH = os.path.join(KITCHEN_CACHE_DIR, "manifest.json")
+"""Default path of the manifest of the precompiled kitchens."""
+
+
+def baked_kitchen_path(config_path: str, cache_dir: str = KITCHEN_CACHE_DIR) -> str:
+    """Get the path of the baked kitchen of a configuration file.
+
+    Parameters
+    ----------
+    config_path : str
+        Path of the kitchen configuration file.
+    cache_dir : str
+        Directory of the baked kitchens.
+
+    Returns
+    -------
+    str
+        Path of the baked kitchen USD.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the kitchen was not compiled.
+    """
+    with open(config_path) as f:
+        config = json.load(f)
+    usd_path = os.path.join(cache_dir, f"kitchen_{config_hash(config)}.usd")
+    if not os.path.isfile(usd_path):
+        raise FileNotFoundError(
+            f"Kitchen '{config_path}' is not compiled. Run isaaclab_exassets/utils/compile_kitchen.py {config_path}."
+        )
+    return usd_path
+
+
+@functools.lru_cache(maxsize=4)
+def load_kitchen_manifest(manifest_path: str = DEFAULT_KITCHEN_MANIFEST_PATH) -> list[dict]:
+    """Load the entries of the manifest of the precompiled kitchens.
+
+    Parameters
+    ----------
+    manifest_path : str
+        Path of the JSON manifest.
+
+    Returns
+    -------
+    list[dict]
+        Entries with the ``layout``, ``style`` and ``usd_path`` of each kitchen, sorted
+        by layout and style.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the manifest does not exist.
+    """
+    if not os.path.isfile(manifest_path):
+        raise FileNotFoundError(
+            f"Kitchen manifest '{manifest_path}' does not exist. Run isaaclab_exassets/utils/precompile_kitchens.py."
+        )
+    with open(manifest_path) as f:
+        return json.load(f)["kitchens"]
+
+
+def select_kitchen(
+    layout: int | None = None,
+    style: int | None = None,
+    seed: int | None = None,
+    manifest_path: str = DEFAULT_KITCHEN_MANIFEST_PATH,
+) -> str:
+    """Select a precompiled kitchen by layout and style.
+
+    Parameters
+    ----------
+    layout : int | None
+        Kitchen layout (0-9). Defaults to None, i.e. any layout.
+    style : int | None
+        Kitchen style (0-11). Defaults to None, i.e. any style.
+    seed : int | None
+        Seed of the random choice among the matching kitchens. Defaults to None, i.e. a new choice in each run.
+    manifest_path : str
+        Path of the manifest of the precompiled kitchens.
+
+    Returns
+    -------
+    str
+        Path of the baked kitchen USD.
+
+    Raises
+    ------
+    ValueError
+        If no precompiled kitchen matches the layout and style.
+    """
+    candidates = [
+        entry
+        for entry in load_kitchen_manifest(manifest_path)
+        if (layout is None or entry["layout"] == layout) and (style is None or entry["style"] == style)
+    ]
+    if len(candidates) == 0:
+        raise ValueError(f"No precompiled kitchen with layout {layout} and style {style} in '{manifest_path}'.")
+    entry = random.Random(seed).choice(candidates)
+    return os.path.join(ISAACLAB_EXTENDED_ASSETS_DATA_DIR, entry["usd_path"])
+
+
+def kitchen_name(entry: dict) -> str:
+    """Name ``layout_<layout>_style_<style>`` of a precompiled kitchen of the manifest."""
+    return f"layout_{entry['layout']}_style_{entry['style']}"
+
+
+def select_kitchens(
+    num_kitchens: int,
+    layout: int | None = None,
+    style: int | None = None,
+    seed: int | None = None,
+    manifest_path: str = DEFAULT_KITCHEN_MANIFEST_PATH,
+) -> dict[str, str]:
+    """Select distinct precompiled kitchens to distribute across the environments.
+
+    Parameters
+    ----------
+    num_kitchens : int
+        Number of kitchens.
+    layout : int | None
+        Kitchen layout (0-9). Defaults to None, i.e. any layout.
+    style : int | None
+        Kitchen style (0-11). Defaults to None, i.e. any style.
+    seed : int | None
+        Seed of the random choice among the matching kitchens. Defaults to None, i.e. a new choice in each run.
+    manifest_path : str
+        Path of the manifest of the precompiled kitchens.
+
+    Returns
+    -------
+    dict[str, str]
+        Paths of the layered kitchen USDs keyed by the names of the kitchens, sorted by layout and style.
+
+    Raises
+    ------
+    ValueError
+        If the number of kitchens is not positive or fewer precompiled kitchens match the layout and style.
+    """
+    if num_kitchens < 1:
+        raise ValueError(f"Expected a positive number of kitchens, got {num_kitchens}.")
+    candidates = [
+        entry
+        for entry in load_kitchen_manifest(manifest_path)
+        if (layout is None or entry["layout"] == layout) and (style is None or entry["style"] == style)
+    ]
+    if len(candidates) < num_kitchens:
+        raise ValueError(
+            f"Requested {num_kitchens} kitchens, but only {len(candidates)} precompiled kitchens with layout"
+            f" {layout} and style {style} are in '{manifest_path}'."
+        )
+    entries = random.Random(seed).sample(candidates, num_kitchens)
+    entries = sorted(entries, key=lambda entry: (entry["layout"], entry["style"]))
+    return {
+        kitchen_name(entry): os.path.join(ISAACLAB_EXTENDED_ASSETS_DATA_DIR, entry["layered_usd_path"])
+        for entry in entries
+    }
+
+
+def kitchen_paths(names: Sequence[str], manifest_path: str = DEFAULT_KITCHEN_MANIFEST_PATH) -> dict[str, str]:
+    """Get the precompiled kitchens of the given names.
+
+    Parameters
+    ----------
+    names : Sequence[str]
+        Names of the kitchens, ``layout_<layout>_style_<style>``.
+    manifest_path : str
+        Path of the manifest of the precompiled kitchens.
+
+    Returns
+    -------
+    dict[str, str]
+        Paths of the layered kitchen USDs keyed by the names of the kitchens.
+
+    Raises
+    ------
+    ValueError
+        If a kitchen is not in the manifest.
+    """
+    entries = {kitchen_name(entry): entry for entry in load_kitchen_manifest(manifest_path)}
+    unknown = [name for name in names if name not in entries]
+    if unknown:
+        raise ValueError(f"Kitchens {unknown} are not in '{manifest_path}'. Available kitchens: {sorted(entries)}.")
+    return {name: os.path.join(ISAACLAB_EXTENDED_ASSETS_DATA_DIR, entries[name]["layered_usd_path"]) for name in names}
+
+
+def kitchen_variants_spawn_cfg(
+    usd_paths: dict[str, str], weights: dict[str, float] | None = None, resolution: int = 100
+) -> sim_utils.MultiUsdFileCfg:
+    """Spawner configuration that distributes kitchens across the environments.
+
+    Without weights, the kitchens are assigned to the environments in round-robin
+    order. With weights, each environment draws a kitchen with the given probability.
+    The scene must be created with ``replicate_physics=False``.
+
+    Parameters
+    ----------
+    usd_paths : dict[str, str]
+        Paths of the kitchen USDs keyed by the names of the kitchens.
+    weights : dict[str, float] | None
+        Relative frequency of each kitchen, keyed by the names of the kitchens. Defaults to None, i.e. round-robin.
+    resolution : int
+        Number of slots over which the weights are quantized. Defaults to 100.
+
+    Returns
+    -------
+    sim_utils.MultiUsdFileCfg
+        The spawner configuration.
+
+    Raises
+    ------
+    ValueError
+        If the weights do not name the same kitchens as the paths, are negative or are all zero.
+    """
+    if weights is None:
+        return sim_utils.MultiUsdFileCfg(usd_path=list(usd_paths.values()), random_choice=False)
+    if set(weights) != set(usd_paths):
+        raise ValueError(f"Expected the weights of the kitchens {sorted(usd_paths)}, got {sorted(weights)}.")
+    if any(weight < 0.0 for weight in weights.values()):
+        raise ValueError(f"Kitchen weights must not be negative, got {weights}.")
+    total = sum(weights.values())
+    if total <= 0.0:
+        raise ValueError(f"At least one kitchen weight must be positive, got {weights}.")
+    # the spawner draws uniformly from its paths, so a path is repeated by its weight
+    counts = {name: max(1, round(weight / total * resolution)) if weight > 0 else 0 for name, weight in weights.items()}
+    paths = [path for name, path in usd_paths.items() for _ in range(counts[name])]
+    return sim_utils.MultiUsdFileCfg(usd_path=paths, random_choice=True)
@@ -0,0 +1,474 @@
+"""Scenes with several robot embodiments in one simulation.
+
+Every task is registered once per robot, so training a cross-embodiment policy
+needs one process per robot. In a mixed-robot scene, the envs are split into
+contiguous groups and each group gets one robot of :data:`EMBODIMENT_CFGS`:
+
+* The robot of a group is an :class:`EmbodimentArticulation` at
+  ``{ENV_REGEX_NS}/Robot_<name>``. It is spawned only in the envs of its group, so its
+  view holds one instance per env of the group. The env ids passed to
+  :meth:`EmbodimentArticulation.reset` are mapped to these instances.
+* :class:`MixedJointPositionAction` pads the arm or gripper joints of all robots to a
+  common action layout. Each group uses the leading columns for its joints.
+* The observation, reward and event terms of this module pad the per-robot
+  quantities in the same way. :func:`embodiment_id` gives the one-hot embodiment of
+  every env.
+
+Since the envs differ, physics replication is disabled for mixed-robot scenes. Terms
+that read the data of a robot for all envs, e.g. ``mdp.joint_pos`` or
+``mdp.reset_scene_to_default``, must be replaced by the terms of this module.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import MISSING, fields
+from typing import TYPE_CHECKING
+
+import isaaclab.sim as sim_utils
+import isaaclab.utils.math as math_utils
+import torch
+from isaaclab.assets import Articulation, ArticulationCfg, RigidObject
+from isaaclab.managers import SceneEntityCfg
+from isaaclab.managers.action_manager import ActionTerm, ActionTermCfg
+from isaaclab.utils import configclass
+from isaaclab_exassets.franka import FRANKA_PANDA_CFG
+from isaaclab_exassets.kinova import KINOVA_GEN3_N7_CFG, KINOVA_JACO_7N_CFG, KINOVA_JACO_7S_CFG
+from isaaclab_exassets.kuka import LBR_IIWA7_SCHUNK_WSG_50_CFG
+from isaaclab_exassets.ufactory import XARM7_CFG
+from isaaclab_exassets.universal_robots import UR5E_ROBOTIQ_2F_85_CFG, UR10E_ROBOTIQ_2F_140_CFG
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedEnv, ManagerBasedRLEnv
+
+
+class EmbodimentArticulation(Articulation):
+    """Robot of one env group of a mixed-robot scene."""
+
+    cfg: EmbodimentArticulationCfg
+    """Configuration instance for the articulation."""
+
+    def __init__(self, cfg: EmbodimentArticulationCfg):
+        # the envs are assigned when the scene is created, after the number of envs is final
+        env_ns = cfg.prim_path.split("/env_.*", 1)[0]
+        num_envs = len(sim_utils.find_matching_prim_paths(f"{env_ns}/env_.*"))
+        self._group_env_ids = assign_env_groups(num_envs, cfg.embodiment_weights)[cfg.embodiment_name]
+        # spawn the robot only in the envs of its group
+        if cfg.spawn is not None:
+            env_regex = "|".join(str(env_id) for env_id in self._group_env_ids)
+            cfg.spawn.func(
+                cfg.prim_path.replace("env_.*", f"env_({env_regex})", 1),
+                cfg.spawn,
+                translation=cfg.init_state.pos,
+                orientation=cfg.init_state.rot,
+            )
+        super().__init__(cfg.replace(spawn=None))
+        self.cfg.spawn = cfg.spawn
+
+    """
+    Properties.
+    """
+
+    @property
+    def env_ids(self) -> torch.Tensor:
+        """Ids of the envs of the instances. Shape is (num_instances,)."""
+        return self._env_ids
+
+    @property
+    def embodiment_id(self) -> int:
+        """Index of the embodiment in the one-hot observation."""
+        return list(self.cfg.embodiment_weights).index(self.cfg.embodiment_name)
+
+    @property
+    def arm_joint_ids(self) -> list[int]:
+        """Indices of the arm joints."""
+        return self._arm_joint_ids
+
+    @property
+    def gripper_joint_ids(self) -> list[int]:
+        """Indices of the gripper joints."""
+        return self._gripper_joint_ids
+
+    @property
+    def ee_body_idx(self) -> int:
+        """Index of the end-effector body."""
+        return self._ee_body_idx
+
+    """
+    Operations.
+    """
+
+    def local_env_ids(self, env_ids: Sequence[int] | torch.Tensor | None) -> tuple[torch.Tensor, torch.Tensor]:
+        """Select the envs of the group.
+
+        Parameters
+        ----------
+        env_ids : Sequence[int] | torch.Tensor | None
+            Ids of the envs. None for all envs.
+
+        Returns
+        -------
+        tuple[torch.Tensor, torch.Tensor]
+            Indices of the instances and ids of the envs of the group among the given envs.
+        """
+        if env_ids is None or isinstance(env_ids, slice):
+            return self._ALL_INDICES, self._env_ids
+        env_ids = torch.as_tensor(env_ids, device=self.device, dtype=torch.long)
+        env_ids = env_ids[env_ids < len(self._instance_ids)]
+        instance_ids = self._instance_ids[env_ids]
+        mask = instance_ids >= 0
+        return instance_ids[mask], env_ids[mask]
+
+    def reset(self, env_ids: Sequence[int] | None = None):
+        if env_ids is None:
+            super().reset(None)
+            return
+        instance_ids, _ = self.local_env_ids(env_ids)
+        if len(instance_ids) > 0:
+            super().reset(instance_ids)
+
+    def joint_ids(self, joint_group: str) -> list[int]:
+        """Indices of the ``"arm"`` or ``"gripper"`` joints."""
+        if joint_group == "arm":
+            return self._arm_joint_ids
+        if joint_group == "gripper":
+            return self._gripper_joint_ids
+        raise ValueError(f"Unknown joint group '{joint_group}'. Expected 'arm' or 'gripper'.")
+
+    """
+    Implementation specific.
+    """
+
+    def _initialize_impl(self):
+        super()._initialize_impl()
+        env_ids = self._group_env_ids
+        if self.num_instances != len(env_ids):
+            raise RuntimeError(
+                f"Expected {len(env_ids)} instances of '{self.cfg.prim_path}' for its env group,"
+                f" found {self.num_instances}."
+            )
+        self._env_ids = torch.tensor(env_ids, device=self.device, dtype=torch.long)
+        # env id -> instance index, -1 for the envs of the other groups
+        self._instance_ids = torch.full((env_ids[-1] + 1,), -1, device=self.device, dtype=torch.long)
+        self._instance_ids[self._env_ids] = torch.arange(len(env_ids), device=self.device)
+        self._arm_joint_ids, _ = self.find_joints(self.cfg.arm_joint_names, preserve_order=True)
+        self._gripper_joint_ids, _ = self.find_joints(self.cfg.gripper_joint_names, preserve_order=True)
+        body_ids, body_names = self.find_bodies(self.cfg.ee_body_name)
+        if len(body_ids) != 1:
+            raise ValueError(
+                f"Expected one match for the body name: {self.cfg.ee_body_name}. Found {len(body_ids)}: {body_names}."
+            )
+        self._ee_body_idx = body_ids[0]
+
+
+@configclass
+class EmbodimentArticulationCfg(ArticulationCfg):
+    """Configuration of the robot of one env group of a mixed-robot scene."""
+
+    class_type: type = EmbodimentArticulation
+
+    embodiment_name: str = MISSING
+    """Name of the embodiment in :attr:`embodiment_weights`. Set by :func:`apply_mixed_robots`."""
+
+    embodiment_weights: dict[str, float] = MISSING
+    """Relative share of the envs of all embodiments of the scene. The envs of the groups are
+    assigned with :func:`assign_env_groups`. Set by :func:`apply_mixed_robots`."""
+
+    arm_joint_names: list[str] = MISSING
+    """Names or regex expressions of the arm joints, in the order of the action layout."""
+
+    gripper_joint_names: list[str] = MISSING
+    """Names or regex expressions of the gripper joints, in the order of the action layout."""
+
+    ee_body_name: str = MISSING
+    """Name or regex expression of the end-effector body."""
+
+
+def embodiment_cfg(
+    robot_cfg: ArticulationCfg, arm_joint_names: list[str], gripper_joint_names: list[str], ee_body_name: str
+) -> EmbodimentArticulationCfg:
+    """Make the embodiment configuration of a robot configuration."""
+    values = {field.name: getattr(robot_cfg, field.name) for field in fields(robot_cfg) if field.name != "class_type"}
+    return EmbodimentArticulationCfg(
+        **values, arm_joint_names=arm_joint_names, gripper_joint_names=gripper_joint_names, ee_body_name=ee_body_name
+    )
+
+
+EMBODIMENT_CFGS = {
+    "Franka": embodiment_cfg(FRANKA_PANDA_CFG, ["panda_joint.*"], ["panda_finger_joint.*"], "grasp_frame"),
+    "UR5e": embodiment_cfg(
+        UR5E_ROBOTIQ_2F_85_CFG,
+        ["shoulder_pan_joint", "shoulder_lift_joint", "elbow_joint", "wrist_1_joint", "wrist_2_joint", "wrist_3_joint"],
+        ["finger_joint"],
+        "grasp_frame",
+    ),
+    "UR10e": embodiment_cfg(
+        UR10E_ROBOTIQ_2F_140_CFG,
+        ["shoulder_pan_joint", "shoulder_lift_joint", "elbow_joint", "wrist_1_joint", "wrist_2_joint", "wrist_3_joint"],
+        ["finger_joint"],
+        "grasp_frame",
+    ),
+    "XArm7": embodiment_cfg(XARM7_CFG, ["joint.*"], ["drive_joint"], "grasp_frame"),
+    "LBRIIWA7": embodiment_cfg(LBR_IIWA7_SCHUNK_WSG_50_CFG, ["iiwa7_joint_.*"], ["drive_joint"], "grasp_frame"),
+    "Gen3n7": embodiment_cfg(KINOVA_GEN3_N7_CFG, ["joint_.*"], ["finger_joint"], "grasp_frame"),
+    "Jaco7N": embodiment_cfg(
+        KINOVA_JACO_7N_CFG, [".*_joint_[1-7]"], [".*_finger_[1-3]", ".*_finger_tip_[1-3]"], ".*_end_effector"
+    ),
+    "Jaco7S": embodiment_cfg(
+        KINOVA_JACO_7S_CFG, [".*_joint_[1-7]"], [".*_finger_[1-3]", ".*_finger_tip_[1-3]"], ".*_end_effector"
+    ),
+}
+"""Embodiment configurations keyed by the robot name used in the gym task ids."""
+
+
+def assign_env_groups(num_envs: int, weights: dict[str, float]) -> dict[str, list[int]]:
+    """Split the envs into contiguous groups with sizes proportional to the weights.
+
+    Parameters
+    ----------
+    num_envs : int
+        Number of envs.
+    weights : dict[str, float]
+        Relative share of the envs of each group.
+
+    Returns
+    -------
+    dict[str, list[int]]
+        Ids of the envs of each group.
+    """
+    total = sum(weights.values())
+    shares = {name: num_envs * weight / total for name, weight in weights.items()}
+    counts = {name: math.floor(share) for name, share in shares.items()}
+    # distribute the remaining envs by the largest remainders
+    remaining = num_envs - sum(counts.values())
+    for name in sorted(shares, key=lambda name: counts[name] - shares[name])[:remaining]:
+        counts[name] += 1
+    empty = [name for name, count in counts.items() if count == 0]
+    if empty:
+        raise ValueError(f"No envs are left for the groups {empty}. Increase the number of envs.")
+    env_ids, start = {}, 0
+    for name, count in counts.items():
+        env_ids[name] = list(range(start, start + count))
+        start += count
+    return env_ids
+
+
+def apply_mixed_robots(env_cfg, weights: dict[str, float]):
+    """Replace the robot of an environment configuration by an env group per embodiment.
+
+    The robot and the entities below its prim, e.g. the end-effector frame, are removed
+    from the scene. Each embodiment is added as ``robot_<name>`` with the lowercase name.
+
+    Parameters
+    ----------
+    env_cfg : ManagerBasedEnvCfg
+        The environment configuration. Its scene is modified in place.
+    weights : dict[str, float]
+        Relative share of the envs of each embodiment, keyed by the names of :data:`EMBODIMENT_CFGS`.
+    """
+    unknown = [name for name in weights if name not in EMBODIMENT_CFGS]
+    if unknown:
+        raise ValueError(f"Unknown embodiments {unknown}. Available: {list(EMBODIMENT_CFGS.keys())}.")
+    scene = env_cfg.scene
+    for name, asset_cfg in list(scene.__dict__.items()):
+        prim_path = getattr(asset_cfg, "prim_path", None)
+        if name == "robot" or (isinstance(prim_path, str) and prim_path.startswith("{ENV_REGEX_NS}/Robot/")):
+            setattr(scene, name, None)
+    for name in weights:
+        robot_cfg = EMBODIMENT_CFGS[name].replace(
+            prim_path=f"{{ENV_REGEX_NS}}/Robot_{name}", embodiment_name=name, embodiment_weights=dict(weights)
+        )
+        setattr(scene, f"robot_{name.lower()}", robot_cfg)
+    # the envs are not copies of each other
+    scene.replicate_physics = False
+
+
+def embodiment_assets(env: ManagerBasedEnv) -> list[EmbodimentArticulation]:
+    """Robots of the env groups of a mixed-robot scene, ordered by embodiment id."""
+    assets = [asset for asset in env.scene.articulations.values() if isinstance(asset, EmbodimentArticulation)]
+    return sorted(assets, key=lambda asset: asset.embodiment_id)
+
+
+def _pad(env: ManagerBasedEnv, values: dict[EmbodimentArticulation, torch.Tensor]) -> torch.Tensor:
+    """Gather per-robot values into a zero-padded tensor of all envs."""
+    width = max(value.shape[1] for value in values.values())
+    padded = torch.zeros(env.num_envs, width, device=env.device)
+    for asset, value in values.items():
+        padded[asset.env_ids, : value.shape[1]] = value
+    return padded
+
+
+"""
+Actions.
+"""
+
+
+class MixedJointPositionAction(ActionTerm):
+    """Joint position action of the arm or gripper joints of all embodiments.
+
+    The action dimension is the largest number of joints of the group over the
+    embodiments. The envs of each embodiment use the leading columns of the action for
+    their joints and ignore the rest.
+    """
+
+    cfg: MixedJointPositionActionCfg
+    """The configuration of the action term."""
+
+    def __init__(self, cfg: MixedJointPositionActionCfg, env: ManagerBasedEnv):
+        self._assets = embodiment_assets(env)
+        if not self._assets:
+            raise RuntimeError("The scene has no embodiment articulations. Call apply_mixed_robots on the env cfg.")
+        # the base class binds one asset, the term drives the robots of all groups
+        asset_name = next(name for name, asset in env.scene.articulations.items() if asset is self._assets[0])
+        super().__init__(cfg.replace(asset_name=asset_name), env)
+
+        self._joint_ids = [asset.joint_ids(self.cfg.joint_group) for asset in self._assets]
+        self._action_dim = max(len(joint_ids) for joint_ids in self._joint_ids)
+        self._raw_actions = torch.zeros(self.num_envs, self.action_dim, device=self.device)
+        self._processed_actions = torch.zeros_like(self._raw_actions)
+
+    """
+    Properties.
+    """
+
+    @property
+    def action_dim(self) -> int:
+        return self._action_dim
+
+    @property
+    def raw_actions(self) -> torch.Tensor:
+        return self._raw_actions
+
+    @property
+    def processed_actions(self) -> torch.Tensor:
+        return self._processed_actions
+
+    """
+    Operations.
+    """
+
+    def process_actions(self, actions: torch.Tensor):
+        self._raw_actions[:] = actions
+        self._processed_actions[:] = self._raw_actions * self.cfg.scale
+
+    def apply_actions(self):
+        for asset, joint_ids in zip(self._assets, self._joint_ids):
+            targets = self._processed_actions[asset.env_ids, : len(joint_ids)]
+            if self.cfg.use_default_offset:
+                targets = targets + asset.data.default_joint_pos[:, joint_ids]
+            asset.set_joint_position_target(targets, joint_ids=joint_ids)
+
+    def reset(self, env_ids: Sequence[int] | None = None) -> None:
+        if env_ids is None:
+            env_ids = slice(None)
+        self._raw_actions[env_ids] = 0.0
+
+
+@configclass
+class MixedJointPositionActionCfg(ActionTermCfg):
+    """Configuration for the joint position action of all embodiments."""
+
+    class_type: type[ActionTerm] = MixedJointPositionAction
+
+    asset_name: str = ""
+    """Unused. The term drives the robots of all env groups."""
+
+    joint_group: str = "arm"
+    """Joints of the action, ``"arm"`` or ``"gripper"``. Defaults to ``"arm"``."""
+
+    scale: float = 1.0
+    """Scale factor of the actions. Defaults to 1.0."""
+
+    use_default_offset: bool = False
+    """Whether the actions are offsets of the default joint positions. Defaults to False."""
+
+
+"""
+Observations.
+"""
+
+
+def embodiment_id(env: ManagerBasedEnv) -> torch.Tensor:
+    """One-hot embodiment of the envs. Shape is (num_envs, num_embodiments)."""
+    assets = embodiment_assets(env)
+    one_hot = torch.zeros(env.num_envs, len(assets), device=env.device)
+    for asset in assets:
+        one_hot[asset.env_ids, asset.embodiment_id] = 1.0
+    return one_hot
+
+
+def mixed_joint_pos(env: ManagerBasedEnv, joint_group: str = "arm") -> torch.Tensor:
+    """Zero-padded joint positions of the arm or gripper joints of the robots."""
+    return _pad(env, {asset: asset.data.joint_pos[:, asset.joint_ids(joint_group)] for asset in embodiment_assets(env)})
+
+
+def mixed_joint_vel(env: ManagerBasedEnv, joint_group: str = "arm") -> torch.Tensor:
+    """Zero-padded joint velocities of the arm or gripper joints of the robots."""
+    return _pad(env, {asset: asset.data.joint_vel[:, asset.joint_ids(joint_group)] for asset in embodiment_assets(env)})
+
+
+def mixed_ee_pos_w(env: ManagerBasedEnv) -> torch.Tensor:
+    """Position of the end-effector body of the robots in the world frame."""
+    return _pad(env, {asset: asset.data.body_pos_w[:, asset.ee_body_idx] for asset in embodiment_assets(env)})
+
+
+def mixed_object_position_in_robot_root_frame(
+    env: ManagerBasedEnv, object_cfg: SceneEntityCfg = SceneEntityCfg("target_object")
+) -> torch.Tensor:
+    """The position of the object in the root frame of the robot of each env."""
+    object: RigidObject = env.scene[object_cfg.name]
+    values = {}
+    for asset in embodiment_assets(env):
+        values[asset], _ = math_utils.subtract_frame_transforms(
+            asset.data.root_pos_w, asset.data.root_quat_w, object.data.root_pos_w[asset.env_ids]
+        )
+    return _pad(env, values)
+
+
+"""
+Rewards.
+"""
+
+
+def mixed_object_ee_distance(
+    env: ManagerBasedRLEnv, std: float, object_cfg: SceneEntityCfg = SceneEntityCfg("target_object")
+) -> torch.Tensor:
+    """Reward the agent for reaching the object with the end-effector body using tanh-kernel."""
+    object: RigidObject = env.scene[object_cfg.name]
+    distance = torch.norm(object.data.root_pos_w - mixed_ee_pos_w(env), dim=1)
+    return 1 - torch.tanh(distance / std)
+
+
+def mixed_joint_vel_l2(env: ManagerBasedRLEnv) -> torch.Tensor:
+    """Penalize the joint velocities of the robots with the L2 squared kernel."""
+    values = {asset: asset.data.joint_vel for asset in embodiment_assets(env)}
+    return torch.sum(torch.square(_pad(env, values)), dim=1)
+
+
+"""
+Events.
+"""
+
+
+def mixed_reset_scene_to_default(env: ManagerBasedEnv, env_ids: torch.Tensor):
+    """Reset the rigid objects and the robots of the env groups to their default states."""
+    for rigid_object in env.scene.rigid_objects.values():
+        default_root_state = rigid_object.data.default_root_state[env_ids].clone()
+        default_root_state[:, 0:3] += env.scene.env_origins[env_ids]
+        rigid_object.write_root_pose_to_sim(default_root_state[:, :7], env_ids=env_ids)
+        rigid_object.write_root_velocity_to_sim(default_root_state[:, 7:], env_ids=env_ids)
+    for asset in env.scene.articulations.values():
+        if isinstance(asset, EmbodimentArticulation):
+            instance_ids, group_env_ids = asset.local_env_ids(env_ids)
+        else:
+            instance_ids, group_env_ids = env_ids, env_ids
+        if len(instance_ids) == 0:
+            continue
+        default_root_state = asset.data.default_root_state[instance_ids].clone()
+        default_root_state[:, 0:3] += env.scene.env_origins[group_env_ids]
+        asset.write_root_pose_to_sim(default_root_state[:, :7], env_ids=instance_ids)
+        asset.write_root_velocity_to_sim(default_root_state[:, 7:], env_ids=instance_ids)
+        default_joint_pos = asset.data.default_joint_pos[instance_ids].clone()
+        default_joint_vel = asset.data.default_joint_vel[instance_ids].clone()
+        asset.write_joint_state_to_sim(default_joint_pos, default_joint_vel, env_ids=instance_ids)
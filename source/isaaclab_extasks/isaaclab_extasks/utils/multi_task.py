@@ -0,0 +1,383 @@
+"""Environments that host several tasks in one simulation.
+
+Tasks that share the robot and the table, e.g. stacking and sorting the blocks,
+are registered separately. Running them side by side for multi-task learning
+needs one process each, and none of them fills the GPU. :func:`apply_multi_task`
+merges the configurations of several tasks into one environment. The envs are
+split into contiguous groups with :func:`assign_env_groups`, one group per task:
+
+* The scene is the union of the task scenes. Entities that only some tasks use are
+  handled by their type. Static props such as the kitchen are spawned only in the
+  envs of those tasks with :class:`EnvGroupSpawnerCfg`. Rigid objects and
+  articulations are spawned in all envs, since their views must cover every env.
+  In the envs of the other tasks, their default pose is on a parking shelf out of
+  the reach of the robot, so the reset to the default state moves them out of the
+  way. If two tasks place the same object differently, each group gets the default
+  pose of its own task. Entities of the same prim, e.g. an alias of one of the blocks,
+  share the default poses of the prim. Entities of the same name must otherwise be configured the
+  same way by all tasks. Since the envs hold different prims, the physics of the
+  scene is not replicated.
+* The observation, reward, termination and event terms are merged by name. A term
+  that all tasks configure the same way is kept as is. Any other term is applied
+  only to the envs of the tasks that use it. Observations are zeroed, rewards
+  and terminations are masked, and events receive only the env ids of those
+  groups. Conflicting terms of the same name are suffixed with the task name.
+* The ``task_id`` observation gives the one-hot task of every env.
+
+The actions, commands, curriculum and the simulation settings are those of the
+first task, because all tasks drive the same robot.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+from collections.abc import Callable
+from dataclasses import MISSING
+from typing import TYPE_CHECKING
+
+import isaaclab.sim as sim_utils
+import torch
+from isaaclab.assets import ArticulationCfg, AssetBaseCfg, RigidObjectCfg
+from isaaclab.managers import (
+    EventTermCfg,
+    ObservationGroupCfg,
+    ObservationTermCfg,
+    RewardTermCfg,
+    TerminationTermCfg,
+)
+from isaaclab.sensors import SensorBaseCfg
+from isaaclab.sim.spawners.spawner_cfg import SpawnerCfg
+from isaaclab.utils import configclass
+
+from .mixed_robots import assign_env_groups
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedEnv, ManagerBasedRLEnvCfg
+
+
+def task_masks(env: ManagerBasedEnv, weights: dict[str, float]) -> torch.Tensor:
+    """Masks of the envs of each task. Shape is (num_tasks, num_envs).
+
+    The masks are computed on the first call and kept on the environment.
+    """
+    masks = getattr(env, "_task_masks", None)
+    if masks is None:
+        masks = torch.zeros(len(weights), env.num_envs, dtype=torch.bool, device=env.device)
+        for i, env_ids in enumerate(assign_env_groups(env.num_envs, weights).values()):
+            masks[i, env_ids] = True
+        env._task_masks = masks
+    return masks
+
+
+def _group_mask(env: ManagerBasedEnv, weights: dict[str, float], tasks: tuple[str, ...]) -> torch.Tensor:
+    """Mask of the envs of some tasks. Shape is (num_envs,)."""
+    masks = task_masks(env, weights)
+    return masks[[list(weights).index(task) for task in tasks]].any(dim=0)
+
+
+def _group_env_ids(env: ManagerBasedEnv, env_ids, weights: dict[str, float], tasks: tuple[str, ...]) -> torch.Tensor:
+    """Ids of the envs of some tasks among the given envs."""
+    mask = _group_mask(env, weights, tasks)
+    if env_ids is None or isinstance(env_ids, slice):
+        return mask.nonzero().flatten()
+    env_ids = torch.as_tensor(env_ids, device=env.device, dtype=torch.long)
+    return env_ids[mask[env_ids]]
+
+
+"""
+Spawning.
+"""
+
+
+def spawn_in_env_group(prim_path: str, cfg: EnvGroupSpawnerCfg, translation=None, orientation=None):
+    """Spawn a prim only in the envs of some tasks."""
+    env_ns = prim_path.split("/env_.*", 1)[0]
+    num_envs = len(sim_utils.find_matching_prim_paths(f"{env_ns}/env_.*"))
+    groups = assign_env_groups(num_envs, cfg.group_weights)
+    env_ids = sorted(env_id for task in cfg.group_names for env_id in groups[task])
+    env_regex = "|".join(str(env_id) for env_id in env_ids)
+    prim_path = prim_path.replace("env_.*", f"env_({env_regex})", 1)
+    return cfg.spawn.func(prim_path, cfg.spawn, translation=translation, orientation=orientation)
+
+
+@configclass
+class EnvGroupSpawnerCfg(SpawnerCfg):
+    """Configuration of a spawner that spawns a prim only in the envs of some tasks."""
+
+    func: Callable = spawn_in_env_group
+
+    spawn: SpawnerCfg = MISSING
+    """The wrapped spawner."""
+
+    group_names: list[str] = MISSING
+    """Tasks of the envs in which the prim is spawned."""
+
+    group_weights: dict[str, float] = MISSING
+    """Relative share of the envs of all tasks."""
+
+
+"""
+Term dispatch.
+"""
+
+
+def _masked_term(func: Callable | type, kind: str, weights: dict[str, float], tasks: tuple[str, ...]):
+    """Wrap a term function or class so that it applies only to the envs of some tasks.
+
+    The wrapper keeps the signature of the term, so that the managers check and
+    resolve its parameters as for the term itself.
+    """
+    if inspect.isclass(func):
+        call = func.__call__
+
+        @functools.wraps(call)
+        def __call__(self, env, *args, **kwargs):
+            if kind == "event":
+                env_ids = _group_env_ids(env, args[0], weights, tasks)
+                return call(self, env, env_ids, *args[1:], **kwargs) if len(env_ids) > 0 else None
+            return _mask_output(call(self, env, *args, **kwargs), _group_mask(env, weights, tasks), kind)
+
+        return type(func.__name__, (func,), {"__call__": __call__})
+
+    @functools.wraps(func)
+    def wrapper(env, *args, **kwargs):
+        if kind == "event":
+            env_ids = _group_env_ids(env, args[0], weights, tasks)
+            return func(env, env_ids, *args[1:], **kwargs) if len(env_ids) > 0 else None
+        return _mask_output(func(env, *args, **kwargs), _group_mask(env, weights, tasks), kind)
+
+    return wrapper
+
+
+def _mask_output(value: torch.Tensor, mask: torch.Tensor, kind: str) -> torch.Tensor:
+    if kind == "termination":
+        return value & mask
+    return value * mask.view(-1, *([1] * (value.dim() - 1))).to(value.dtype)
+
+
+def _merge_terms(terms: dict[str, dict[str, object]], kind: str, weights: dict[str, float]) -> dict[str, object]:
+    """Merge the terms of the tasks by name.
+
+    Parameters
+    ----------
+    terms : dict[str, dict[str, object]]
+        Terms of each task, keyed by term name.
+    kind : str
+        ``"observation"``, ``"reward"``, ``"termination"`` or ``"event"``.
+    weights : dict[str, float]
+        Relative share of the envs of all tasks.
+
+    Returns
+    -------
+    dict[str, object]
+        The merged terms.
+    """
+    merged = {}
+    names = list(dict.fromkeys(name for task_terms in terms.values() for name in task_terms))
+    for name in names:
+        # group the tasks by the configuration of the term
+        variants: list[tuple[object, list[str]]] = []
+        for task, task_terms in terms.items():
+            term_cfg = task_terms.get(name)
+            if term_cfg is None:
+                continue
+            for variant_cfg, variant_tasks in variants:
+                if variant_cfg == term_cfg:
+                    variant_tasks.append(task)
+                    break
+            else:
+                variants.append((term_cfg, [task]))
+        for term_cfg, variant_tasks in variants:
+            term_name = name if len(variants) == 1 else f"{name}_{variant_tasks[0]}"
+            if len(variant_tasks) < len(weights):
+                term_cfg = term_cfg.replace(func=_masked_term(term_cfg.func, kind, weights, tuple(variant_tasks)))
+            merged[term_name] = term_cfg
+    return merged
+
+
+def _same_entity(asset_cfg: object, other_cfg: object) -> bool:
+    """Whether two tasks configure a scene entity the same way, up to the root pose of a movable object."""
+    if isinstance(asset_cfg, (RigidObjectCfg, ArticulationCfg)) and type(other_cfg) is type(asset_cfg):
+        init_state = other_cfg.init_state.replace(pos=asset_cfg.init_state.pos, rot=asset_cfg.init_state.rot)
+        other_cfg = other_cfg.replace(init_state=init_state)
+    return asset_cfg == other_cfg
+
+
+def _terms(cfg: object, term_type: type) -> dict[str, object]:
+    if cfg is None:
+        return {}
+    return {name: value for name, value in cfg.__dict__.items() if isinstance(value, term_type)}
+
+
+def _set_terms(cfg: object, term_type: type, terms: dict[str, object]):
+    # the managers skip the terms that are None
+    for name in _terms(cfg, term_type):
+        setattr(cfg, name, None)
+    for name, term_cfg in terms.items():
+        setattr(cfg, name, term_cfg)
+
+
+"""
+Events and observations.
+"""
+
+
+def set_task_default_states(env: ManagerBasedEnv, env_ids: torch.Tensor | None, default_poses: dict, weights: dict):
+    """Set the default root poses of the objects in the envs of each task.
+
+    Parameters
+    ----------
+    env : ManagerBasedEnv
+        The environment.
+    env_ids : torch.Tensor | None
+        Unused. The poses are set for all envs.
+    default_poses : dict
+        Default pose (position and quaternion in the env frame) of the objects, keyed by
+        task name and asset name.
+    weights : dict
+        Relative share of the envs of all tasks.
+    """
+    masks = task_masks(env, weights)
+    for i, task in enumerate(weights):
+        group_env_ids = masks[i].nonzero().flatten()
+        for asset_name, pose in default_poses.get(task, {}).items():
+            asset = env.scene[asset_name]
+            pose = torch.tensor(pose, device=env.device, dtype=torch.float)
+            asset.data.default_root_state[group_env_ids, :7] = pose
+            asset.data.default_root_state[group_env_ids, 7:] = 0.0
+
+
+def task_id(env: ManagerBasedEnv, weights: dict) -> torch.Tensor:
+    """One-hot task of the envs. Shape is (num_envs, num_tasks)."""
+    return task_masks(env, weights).T.float()
+
+
+"""
+Composition.
+"""
+
+
+def apply_multi_task(
+    env_cfg: ManagerBasedRLEnvCfg,
+    task_cfgs: dict[str, ManagerBasedRLEnvCfg],
+    weights: dict[str, float] | None = None,
+    parking_pos: tuple[float, float, float] = (-1.2, 0.0, -0.3),
+    parking_spacing: float = 0.3,
+):
+    """Merge the configurations of several tasks into one environment configuration.
+
+    Parameters
+    ----------
+    env_cfg : ManagerBasedRLEnvCfg
+        Configuration of the first task. It is modified in place.
+    task_cfgs : dict[str, ManagerBasedRLEnvCfg]
+        Configurations of all tasks, keyed by task name. May contain ``env_cfg`` itself.
+    weights : dict[str, float] | None
+        Relative share of the envs of each task. Defaults to None, i.e. equal shares.
+    parking_pos : tuple[float, float, float]
+        Position of the parking shelf of the unused objects in the env frame, in meters.
+        Defaults to (-1.2, 0.0, -0.3), i.e. behind the robot, below the table top and out
+        of the reach of a robot at the env origin (1 m for the Franka, see
+        :data:`.env_spacing.ROBOT_REACH`).
+    parking_spacing : float
+        Distance between the parked objects along the y-axis, in meters. Defaults to 0.3.
+
+    Raises
+    ------
+    ValueError
+        If the weights do not match the tasks, or if two tasks configure a scene entity
+        of the same name differently beyond the root pose of a rigid object or articulation.
+    """
+    # snapshot the tasks, since env_cfg may be one of them
+    task_cfgs = {name: cfg.copy() for name, cfg in task_cfgs.items()}
+    weights = dict(weights) if weights is not None else {name: 1.0 for name in task_cfgs}
+    if list(weights) != list(task_cfgs):
+        raise ValueError(f"Expected weights for the tasks {list(task_cfgs)}, got {list(weights)}.")
+
+    # scene
+    entities: dict[str, dict[str, object]] = {}
+    for task, cfg in task_cfgs.items():
+        for name, asset_cfg in cfg.scene.__dict__.items():
+            if isinstance(asset_cfg, (AssetBaseCfg, SensorBaseCfg)):
+                entities.setdefault(name, {})[task] = asset_cfg
+    # entities of the same prim, e.g. the target block of the stack task and the block itself, share their poses
+    prim_entities: dict[str, dict[str, object]] = {}
+    for task_entities in entities.values():
+        for task, asset_cfg in task_entities.items():
+            if isinstance(asset_cfg, (RigidObjectCfg, ArticulationCfg)):
+                prim_entities.setdefault(asset_cfg.prim_path, {}).setdefault(task, asset_cfg)
+    default_poses: dict[str, dict[str, tuple]] = {task: {} for task in task_cfgs}
+    # prim paths of the parked objects, in the order of their places on the shelf
+    parked: list[str] = []
+    for name, task_entities in entities.items():
+        asset_cfg = next(iter(task_entities.values())).copy()
+        conflicts = [task for task, task_cfg in task_entities.items() if not _same_entity(asset_cfg, task_cfg)]
+        if conflicts:
+            raise ValueError(
+                f"Tasks {list(task_entities)} configure the scene entity '{name}' differently ({conflicts} differ"
+                f" from {list(task_entities)[0]}). Give the entity the same configuration in all tasks or rename it."
+            )
+        setattr(env_cfg.scene, name, asset_cfg)
+        is_local = isinstance(asset_cfg.prim_path, str) and asset_cfg.prim_path.startswith("{ENV_REGEX_NS}")
+        if not is_local or isinstance(asset_cfg, SensorBaseCfg):
+            continue
+        if isinstance(asset_cfg, (RigidObjectCfg, ArticulationCfg)):
+            task_prims = prim_entities[asset_cfg.prim_path]
+            for task in task_cfgs:
+                if task not in task_prims:
+                    # park the object in the envs of the tasks that do not use its prim
+                    if asset_cfg.prim_path not in parked:
+                        parked.append(asset_cfg.prim_path)
+                    offset = parked.index(asset_cfg.prim_path) * parking_spacing
+                    pos = (parking_pos[0], parking_pos[1] + offset, parking_pos[2] + 0.1)
+                    default_poses[task][name] = pos + (1.0, 0.0, 0.0, 0.0)
+                elif task_prims[task].init_state != asset_cfg.init_state:
+                    init_state = task_prims[task].init_state
+                    default_poses[task][name] = tuple(init_state.pos) + tuple(init_state.rot)
+        elif len(task_entities) < len(task_cfgs) and asset_cfg.spawn is not None:
+            asset_cfg.spawn = EnvGroupSpawnerCfg(
+                spawn=asset_cfg.spawn, group_names=list(task_entities), group_weights=weights
+            )
+    if parked:
+        env_cfg.scene.parking_shelf = AssetBaseCfg(
+            prim_path="{ENV_REGEX_NS}/ParkingShelf",
+            init_state=AssetBaseCfg.InitialStateCfg(
+                pos=(parking_pos[0], parking_pos[1] + (len(parked) - 1) * parking_spacing / 2, parking_pos[2])
+            ),
+            spawn=sim_utils.CuboidCfg(
+                size=(parking_spacing, len(parked) * parking_spacing, 0.02),
+                collision_props=sim_utils.CollisionPropertiesCfg(),
+            ),
+        )
+    for name, asset_cfg in env_cfg.scene.__dict__.items():
+        if isinstance(asset_cfg, (AssetBaseCfg, SensorBaseCfg)) and name not in entities and name != "parking_shelf":
+            setattr(env_cfg.scene, name, None)
+    # the envs are not copies of each other
+    env_cfg.scene.replicate_physics = False
+
+    # observations
+    for group_name, group_cfg in env_cfg.observations.__dict__.items():
+        if not isinstance(group_cfg, ObservationGroupCfg):
+            continue
+        terms = {
+            task: _terms(getattr(cfg.observations, group_name, None), ObservationTermCfg)
+            for task, cfg in task_cfgs.items()
+        }
+        _set_terms(group_cfg, ObservationTermCfg, _merge_terms(terms, "observation", weights))
+    env_cfg.observations.policy.task_id = ObservationTermCfg(func=task_id, params={"weights": weights})
+
+    # rewards, terminations and events
+    for attr, kind, term_type in (
+        ("rewards", "reward", RewardTermCfg),
+        ("terminations", "termination", TerminationTermCfg),
+        ("events", "event", EventTermCfg),
+    ):
+        terms = {task: _terms(getattr(cfg, attr), term_type) for task, cfg in task_cfgs.items()}
+        _set_terms(getattr(env_cfg, attr), term_type, _merge_terms(terms, kind, weights))
+    if any(default_poses.values()):
+        env_cfg.events.task_default_states = EventTermCfg(
+            func=set_task_default_states,
+            mode="startup",
+            params={"default_poses": default_poses, "weights": weights},
+        )
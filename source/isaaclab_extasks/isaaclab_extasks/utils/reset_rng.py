@@ -0,0 +1,236 @@
+"""Counter-based random numbers for the reset events.
+
+The reset events draw from the global generator of torch, so the poses of an env
+depend on which other envs reset in the same step and in which order. This module
+draws the random numbers of the resets from the Philox-4x32-10 counter-based
+generator instead. A draw is a pure function of
+
+* the seed of the environment configuration,
+* the env id,
+* the index of the episode of the env,
+* the name of the stream, e.g. the asset and the quantity that is sampled,
+* the index of the value within the draw,
+
+so that the n-th episode of an env starts from the same state in every run with
+the same seed, regardless of the order of the resets and of the other events. All
+values of a draw are computed in one batch on the device of the environment.
+
+The index of the episode of an env is advanced by the first draw for the env in a
+step of the environment, so all reset events of an env in one step belong to the
+same episode. A :class:`~isaaclab.envs.ManagerBasedEnv` has no step counter, so
+there a new episode of an env starts when a stream is drawn again for the env.
+
+Without a seed, the key of the generator and the choices of :func:`seeded_index` are
+random, so each run differs as with the global generator.
+"""
+
+from __future__ import annotations
+
+import functools
+import random
+import weakref
+import zlib
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+import torch
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedEnv
+
+_MASK_32 = 0xFFFFFFFF
+_PHILOX_M = (0xD2511F53, 0xCD9E8D57)
+_PHILOX_W = (0x9E3779B9, 0xBB67AE85)
+
+
+def _mulhilo(a: torch.Tensor, b: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
+    """High and low 32 bits of the products of 32-bit values, with b split in 16-bit limbs to stay within int64."""
+    p0, p1 = a * (b & 0xFFFF), a * (b >> 16)
+    low = p0 + ((p1 & 0xFFFF) << 16)
+    return (p1 >> 16) + (low >> 32), low & _MASK_32
+
+
+@functools.lru_cache(maxsize=32)
+def _philox_schedule(key: tuple[int, int], rounds: int, device: str) -> tuple[torch.Tensor, torch.Tensor]:
+    """Multipliers of the words (c2, c0) and keys of the rounds of Philox-4x32. Shapes are (2,) and (rounds, 2)."""
+    multipliers = torch.tensor([_PHILOX_M[1], _PHILOX_M[0]], dtype=torch.long, device=device)
+    round_keys = [
+        [(key[0] + i * _PHILOX_W[0]) & _MASK_32, (key[1] + i * _PHILOX_W[1]) & _MASK_32] for i in range(rounds)
+    ]
+    return multipliers, torch.tensor(round_keys, dtype=torch.long, device=device)
+
+
+def philox(counter: torch.Tensor, key: tuple[int, int], rounds: int = 10) -> torch.Tensor:
+    """Philox-4x32 bijection of counters.
+
+    The two multiplications of a round are computed in one batch and the key schedule is
+    cached per key and device, so a round takes a fixed, small number of kernels.
+
+    Parameters
+    ----------
+    counter : torch.Tensor
+        Counters of 4 unsigned 32-bit words stored as int64. Shape is (..., 4).
+    key : tuple[int, int]
+        Key of 2 unsigned 32-bit words.
+    rounds : int
+        Number of rounds. Defaults to 10.
+
+    Returns
+    -------
+    torch.Tensor
+        Random unsigned 32-bit words stored as int64. Shape is (..., 4).
+    """
+    multipliers, round_keys = _philox_schedule(key, rounds, str(counter.device))
+    # the words as the pairs (c0, c1) and (c2, c3)
+    words = counter.reshape(*counter.shape[:-1], 2, 2)
+    for round_key in round_keys:
+        hi, lo = _mulhilo(words[..., 0].flip(-1), multipliers)
+        # (c0, c1, c2, c3) <- (hi(M1 * c2) ^ c1 ^ k0, lo(M1 * c2), hi(M0 * c0) ^ c3 ^ k1, lo(M0 * c0))
+        words = torch.stack([hi ^ words[..., 1] ^ round_key, lo], dim=-1)
+    return words.flatten(-2)
+
+
+def stream_id(stream: str) -> int:
+    """32-bit id of the name of a stream."""
+    return zlib.crc32(stream.encode())
+
+
+def seeded_index(seed: int | None, stream: str, num: int) -> int:
+    """Index in [0, num) drawn from a seed, for random choices in the configurations.
+
+    The choice is made when the environment is built, from the seed of its configuration.
+    A seed of None gives a new choice in each run.
+    """
+    if seed is None:
+        return random.randrange(num)
+    counter = torch.tensor([[0, 0, 0, stream_id(stream)]], dtype=torch.long)
+    word = philox(counter, (seed & _MASK_32, (seed >> 32) & _MASK_32))[0, 0]
+    return int(word) % num
+
+
+class ResetRNG:
+    """Counter-based generator keyed by the seed, the env id and the episode index of the env.
+
+    Parameters
+    ----------
+    seed : int | None
+        Seed of the environment. None for a random key.
+    num_envs : int
+        Number of envs.
+    device : str
+        Device of the random numbers.
+    """
+
+    def __init__(self, seed: int | None, num_envs: int, device: str):
+        if seed is None:
+            seed = random.getrandbits(64)
+        self._key = (seed & _MASK_32, (seed >> 32) & _MASK_32)
+        self._device = device
+        self._episode_index = torch.full((num_envs,), -1, dtype=torch.long, device=device)
+        self._last_step = torch.full((num_envs,), -1, dtype=torch.long, device=device)
+        self._all_env_ids = torch.arange(num_envs, dtype=torch.long, device=device)
+        # episode index of the last draw of each stream, for environments without a step counter
+        self._stream_episodes: dict[str, torch.Tensor] = {}
+
+    @property
+    def episode_index(self) -> torch.Tensor:
+        """Index of the current episode of each env. Shape is (num_envs,)."""
+        return self._episode_index
+
+    def env_ids(self, env_ids: Sequence[int] | torch.Tensor | None) -> torch.Tensor:
+        """Env ids as a tensor, all envs for None."""
+        if env_ids is None or isinstance(env_ids, slice):
+            return self._all_env_ids
+        return torch.as_tensor(env_ids, dtype=torch.long, device=self._device)
+
+    def advance(self, env_ids: torch.Tensor, step: int | None, stream: str):
+        """Start a new episode of the envs whose last draw was in an earlier step.
+
+        Without a step, a new episode starts for the envs for which the stream was
+        already drawn in their current episode.
+        """
+        if step is not None:
+            new_episode = self._last_step[env_ids] != step
+            self._last_step[env_ids] = step
+            self._episode_index[env_ids] += new_episode.long()
+            return
+        stream_episodes = self._stream_episodes.setdefault(stream, torch.full_like(self._episode_index, -1))
+        episode_index = self._episode_index[env_ids]
+        new_episode = (stream_episodes[env_ids] == episode_index) | (episode_index < 0)
+        self._episode_index[env_ids] += new_episode.long()
+        stream_episodes[env_ids] = self._episode_index[env_ids]
+
+    def random_words(self, env_ids: torch.Tensor, num: int, stream: str) -> torch.Tensor:
+        """Random unsigned 32-bit words. Shape is (len(env_ids), num)."""
+        num_blocks = (num + 3) // 4
+        counter = torch.empty(len(env_ids), num_blocks, 4, dtype=torch.long, device=self._device)
+        counter[..., 0] = torch.arange(num_blocks, dtype=torch.long, device=self._device)
+        counter[..., 1] = env_ids.unsqueeze(-1)
+        counter[..., 2] = (self._episode_index[env_ids] & _MASK_32).unsqueeze(-1)
+        counter[..., 3] = stream_id(stream)
+        return philox(counter, self._key).flatten(1)[:, :num]
+
+    def uniform(self, env_ids: torch.Tensor, lower: torch.Tensor, upper: torch.Tensor, stream: str) -> torch.Tensor:
+        """Uniform samples in [lower, upper). Shape is (len(env_ids), *lower.shape)."""
+        lower = torch.as_tensor(lower, dtype=torch.float, device=self._device)
+        upper = torch.as_tensor(upper, dtype=torch.float, device=self._device)
+        words = self.random_words(env_ids, lower.numel(), stream)
+        # 24 bits are exact in float32
+        unit = (words >> 8).float() * (1.0 / (1 << 24))
+        return lower + unit.view(len(env_ids), *lower.shape) * (upper - lower)
+
+    def randint(self, env_ids: torch.Tensor, high: int, num: int, stream: str) -> torch.Tensor:
+        """Integers in [0, high). Shape is (len(env_ids), num)."""
+        return self.random_words(env_ids, num, stream) % high
+
+
+_RESET_RNGS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+"""Generators of the environments."""
+
+
+def reset_rng(
+    env: ManagerBasedEnv, env_ids: Sequence[int] | torch.Tensor | None, stream: str
+) -> tuple[ResetRNG, torch.Tensor]:
+    """Generator of an environment with the episodes of the envs advanced to the current step.
+
+    Parameters
+    ----------
+    env : ManagerBasedEnv
+        The environment. Its configuration holds the seed.
+    env_ids : Sequence[int] | torch.Tensor | None
+        Ids of the envs that are reset, None for all envs.
+    stream : str
+        Name of the stream that is drawn, which starts the next episode of the envs on
+        an environment without a step counter.
+
+    Returns
+    -------
+    tuple[ResetRNG, torch.Tensor]
+        The generator and the env ids as a tensor.
+    """
+    if env not in _RESET_RNGS:
+        _RESET_RNGS[env] = ResetRNG(env.cfg.seed, env.num_envs, env.device)
+    rng = _RESET_RNGS[env]
+    env_ids = rng.env_ids(env_ids)
+    rng.advance(env_ids, getattr(env, "common_step_counter", None), stream)
+    return rng, env_ids
+
+
+def reset_uniform(
+    env: ManagerBasedEnv,
+    env_ids: Sequence[int] | torch.Tensor | None,
+    lower: torch.Tensor,
+    upper: torch.Tensor,
+    stream: str,
+) -> torch.Tensor:
+    """Uniform samples of the reset of some envs. Shape is (len(env_ids), *lower.shape)."""
+    rng, env_ids = reset_rng(env, env_ids, stream)
+    return rng.uniform(env_ids, lower, upper, stream)
+
+
+def reset_randint(
+    env: ManagerBasedEnv, env_ids: Sequence[int] | torch.Tensor | None, high: int, num: int, stream: str
+) -> torch.Tensor:
+    """Integers in [0, high) of the reset of some envs. Shape is (len(env_ids), num)."""
+    rng, env_ids = reset_rng(env, env_ids, stream)
+    return rng.randint(env_ids, high, num, stream)
@@ -0,0 +1,168 @@
+"""Staggered time-outs that flatten the reset spikes of synchronized envs.
+
+All envs start together, so their episodes time out in the same step, and every
+``episode_length_s`` the whole batch resets at once. In the assembly tasks a reset
+runs several event terms that write poses to the simulation, so that step takes
+far longer than the others and a synchronous learner waits for it.
+
+:class:`StaggeredTimeOut` replaces the ``time_out`` termination term. The first
+episode of each env ends after a random share of the episode length, which spreads
+the time-outs over the steps. The number of time-outs per step is capped, and the
+envs above the cap run on and time out in one of the next steps, the longest
+overdue first. Terminations other than the time-out are never deferred.
+
+A deferred episode is longer than ``episode_length_s``. The deferral is bounded by
+``max_deferral`` steps, a tenth of the episode length by default: an env that is
+overdue by that many steps times out even if the cap is exceeded. The policy sees
+the extra steps as ordinary steps of the episode, and the time-out is reported as a
+truncation as usual.
+
+The pass is enabled by the ``staggered_resets`` field of
+:class:`~isaaclab_extasks.utils.envs.ExtendedManagerBasedRLEnvCfg` and applied when the
+environment is constructed.
+
+The deferral of the time-outs in steps is logged as percentiles under ``Reset/``
+in the episode log.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+import torch
+from isaaclab.managers import ManagerTermBase, TerminationTermCfg
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLEnv, ManagerBasedRLEnvCfg
+
+
+class StaggeredTimeOut(ManagerTermBase):
+    """Time-out term with random first episode lengths and a cap on the time-outs per step.
+
+    Parameters of the term
+    ----------------------
+    max_resets_per_step : int | None
+        Maximum number of time-outs per step. Defaults to None, i.e. twice the number of
+        time-outs per step of envs that are spread evenly over the episode.
+    initial_length_range : tuple[float, float]
+        Range of the length of the first episode of each env as a share of the episode
+        length. Defaults to (0.0, 1.0).
+    max_deferral : int | None
+        Maximum number of steps by which a time-out is deferred. Defaults to None, i.e. a
+        tenth of the episode length.
+    history_size : int
+        Number of recent time-outs of which the percentiles of the deferral are logged.
+        Defaults to 4096.
+    """
+
+    def __init__(self, cfg: TerminationTermCfg, env: ManagerBasedRLEnv):
+        super().__init__(cfg, env)
+        low, high = cfg.params.get("initial_length_range", (0.0, 1.0))
+        self._max_resets_per_step = cfg.params.get("max_resets_per_step")
+        if self._max_resets_per_step is None:
+            self._max_resets_per_step = max(1, math.ceil(2 * env.num_envs / env.max_episode_length))
+        self._max_deferral = cfg.params.get("max_deferral")
+        if self._max_deferral is None:
+            self._max_deferral = max(1, env.max_episode_length // 10)
+        # episode length at which each env times out
+        lengths = torch.empty(env.num_envs, device=env.device).uniform_(low, high) * env.max_episode_length
+        self._limits = lengths.long().clamp(min=1)
+        # deferral of the recent time-outs in steps
+        history_size = cfg.params.get("history_size", 4096)
+        self._deferrals = torch.zeros(history_size, device=env.device, dtype=torch.long)
+        self._num_deferrals = 0
+        self._max_resets = 0
+
+    @property
+    def max_resets_per_step(self) -> int:
+        """Maximum number of time-outs per step."""
+        return self._max_resets_per_step
+
+    @property
+    def max_deferral(self) -> int:
+        """Maximum number of steps by which a time-out is deferred."""
+        return self._max_deferral
+
+    def reset(self, env_ids=None):
+        if env_ids is None:
+            env_ids = slice(None)
+        # the first episodes keep their random length
+        if self._env.common_step_counter > 0:
+            self._limits[env_ids] = self._env.max_episode_length
+        if self._num_deferrals > 0 and "log" in self._env.extras:
+            self._env.extras["log"].update(self.latency_percentiles())
+
+    def __call__(
+        self,
+        env: ManagerBasedRLEnv,
+        max_resets_per_step: int | None = None,
+        initial_length_range: tuple[float, float] = (0.0, 1.0),
+        max_deferral: int | None = None,
+        history_size: int = 4096,
+    ) -> torch.Tensor:
+        overdue = env.episode_length_buf - self._limits
+        time_outs = overdue >= 0
+        num_time_outs = int(time_outs.sum())
+        # the envs deferred for the maximum number of steps time out in any case
+        max_resets = max(self._max_resets_per_step, int((overdue >= self._max_deferral).sum()))
+        if num_time_outs > max_resets:
+            # defer the envs above the cap, the longest overdue first
+            scores = torch.where(time_outs, overdue, -1).float()
+            scores -= torch.arange(env.num_envs, device=env.device) / env.num_envs
+            time_outs = torch.zeros_like(time_outs)
+            time_outs[torch.topk(scores, max_resets).indices] = True
+        self._record(overdue[time_outs])
+        self._max_resets = max(self._max_resets, min(num_time_outs, max_resets))
+        return time_outs
+
+    def _record(self, deferrals: torch.Tensor):
+        """Add the deferrals of the time-outs of a step to the history."""
+        deferrals = deferrals[-len(self._deferrals) :]
+        ids = (self._num_deferrals + torch.arange(len(deferrals), device=deferrals.device)) % len(self._deferrals)
+        self._deferrals[ids] = deferrals
+        self._num_deferrals += len(deferrals)
+
+    def latency_percentiles(self) -> dict[str, float]:
+        """Percentiles of the deferral of the recent time-outs in steps."""
+        deferrals = self._deferrals[: min(self._num_deferrals, len(self._deferrals))].float()
+        quantiles = torch.quantile(deferrals, torch.tensor([0.5, 0.9, 0.99], device=deferrals.device)).tolist()
+        return {
+            "Reset/deferral_p50": quantiles[0],
+            "Reset/deferral_p90": quantiles[1],
+            "Reset/deferral_p99": quantiles[2],
+            "Reset/max_time_outs_per_step": float(self._max_resets),
+        }
+
+
+def apply_staggered_resets(
+    env_cfg: ManagerBasedRLEnvCfg,
+    max_resets_per_step: int | None = None,
+    initial_length_range: tuple[float, float] = (0.0, 1.0),
+    max_deferral: int | None = None,
+):
+    """Replace the ``time_out`` termination term with :class:`StaggeredTimeOut`.
+
+    Parameters
+    ----------
+    env_cfg : ManagerBasedRLEnvCfg
+        The environment configuration. Its terminations are modified in place.
+    max_resets_per_step : int | None
+        Maximum number of time-outs per step. Defaults to None, i.e. twice the number of
+        time-outs per step of envs that are spread evenly over the episode.
+    initial_length_range : tuple[float, float]
+        Range of the length of the first episode of each env as a share of the episode
+        length. Defaults to (0.0, 1.0).
+    max_deferral : int | None
+        Maximum number of steps by which a time-out is deferred. Defaults to None, i.e. a
+        tenth of the episode length.
+    """
+    time_out = getattr(env_cfg.terminations, "time_out", None)
+    if time_out is None:
+        raise ValueError("The environment has no 'time_out' termination term to stagger.")
+    time_out.func = StaggeredTimeOut
+    time_out.params = {
+        "max_resets_per_step": max_resets_per_step,
+        "initial_length_range": initial_length_range,
+        "max_deferral": max_deferral,
+    }
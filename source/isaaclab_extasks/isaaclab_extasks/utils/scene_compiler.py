@@ -0,0 +1,378 @@
+"""Compilation of scene descriptions into interactive scene configurations.
+
+The scene synthesis pipeline (``scripts/construct_scene.py``) and RoboCasa describe
+scenes as JSON files, which the environments cannot consume directly. The compiler
+in this module turns them into :class:`InteractiveSceneCfg` subclasses with one
+entity per object, so that a synthesized scene can be trained on without a
+hand-written configuration. Two formats are read:
+
+* RoboCasa ``env_config.json`` with the ``fixture`` and ``others`` lists. Fixtures
+  become static :class:`AssetBaseCfg` entities spawned from their converted USD under
+  ``Props/USD/objaverse`` and scaled to their ``size``. The room boxes of ``others``
+  become static cuboids (``size`` holds half extents).
+* Synthesized ``scene_configuration.json`` with an ``objects`` list. Each object has
+  a ``name``, a ``usd_path`` (absolute, remote or relative to the data directory of
+  :mod:`isaaclab_exassets`), a ``position``, and optionally a ``rotation`` (w, x, y, z),
+  a ``scale``, a ``size`` and a ``type``. Objects of type ``rigid`` become
+  :class:`RigidObjectCfg` entities, all others static :class:`AssetBaseCfg` entities.
+  The ``on`` relations of an optional ``scene_graph.json`` (``edges`` with ``source``,
+  ``target`` and ``relation``) bound the placement ranges of the rigid objects to the
+  top of their support.
+
+Objects are named by their sanitized names. Names that collide with each other, with
+the entities added by the compiler or with the fields of :class:`InteractiveSceneCfg`
+get a numbered suffix, and two objects of the same name are an error.
+
+The compiler first describes a scene as plain JSON, i.e. the entities with their
+spawned files, poses and fitted scales and the placement ranges, and then builds the
+configuration class from the description. Descriptions are cached in ``cache_dir`` by
+the hash of the scene files and are rebuilt when a spawned model changed, so loading
+a scene again in a new process does not open the models to fit their scales. Compiled
+scenes are also memoized in the process, so loading the same scene again returns the
+same configuration class.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import hashlib
+import json
+import math
+import os
+import re
+import tempfile
+
+import isaaclab.sim as sim_utils
+from isaaclab.assets import ArticulationCfg, AssetBaseCfg, RigidObjectCfg
+from isaaclab.managers import EventTermCfg, SceneEntityCfg
+from isaaclab.scene import InteractiveSceneCfg
+from isaaclab.sim.spawners.from_files.from_files_cfg import GroundPlaneCfg, UsdFileCfg
+from isaaclab.utils import configclass
+from isaaclab_exassets import ISAACLAB_EXTENDED_ASSETS_DATA_DIR, fixture_usd_path, resolve_asset_path
+from isaaclab_extasks.mdp.events import reset_root_state_uniform
+
+SCENE_CACHE_DIR = os.path.join(ISAACLAB_EXTENDED_ASSETS_DATA_DIR, "Scenes/compiled")
+"""Default directory of the cached scene descriptions."""
+
+_DESCRIPTION_VERSION = 1
+"""Version of the format of the scene descriptions, part of their cache key."""
+
+_COMPILER_ENTITIES = ("plane", "light", "robot")
+"""Names of the entities added by the compiler."""
+
+
+@dataclasses.dataclass
+class CompiledScene:
+    """Result of the compilation of a scene description."""
+
+    scene_cfg_class: type[InteractiveSceneCfg]
+    """Scene configuration class with one entity per object."""
+
+    placement_ranges: dict[str, dict[str, tuple[float, float]]]
+    """Offsets of the reset poses of the rigid objects, in the ``pose_range`` format of
+    :func:`isaaclab_extasks.mdp.reset_root_state_uniform`."""
+
+    source_hash: str
+    """Hash of the compiled files."""
+
+
+_COMPILED_SCENES: dict[str, CompiledScene] = {}
+"""Compiled scenes by the hash of their files."""
+
+
+def _file_hash(*paths: str | None) -> str:
+    digest = hashlib.sha256()
+    for path in paths:
+        if path is not None:
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _fingerprint(path: str) -> str | None:
+    """Size and modification time of a file, or None if it does not exist."""
+    if not os.path.isfile(path):
+        return None
+    stat = os.stat(path)
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _entity_name(name: str) -> str:
+    """Turn an object name into a valid attribute and prim name."""
+    name = re.sub(r"\W", "_", name)
+    return f"obj_{name}" if name[0].isdigit() else name
+
+
+def _entity_names(names: list[str]) -> dict[str, str]:
+    """Unique entity names of objects, keyed by the object names.
+
+    Raises
+    ------
+    ValueError
+        If two objects have the same name.
+    """
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Objects {duplicates} are defined more than once.")
+    taken = set(_COMPILER_ENTITIES) | {field.name for field in dataclasses.fields(InteractiveSceneCfg)}
+    entity_names = {}
+    for name in names:
+        entity_name = base_name = _entity_name(name)
+        suffix = 1
+        while entity_name in taken:
+            entity_name = f"{base_name}_{suffix}"
+            suffix += 1
+        taken.add(entity_name)
+        entity_names[name] = entity_name
+    return entity_names
+
+
+def _orientation(rotation: list[float] | None) -> tuple[float, float, float, float]:
+    # RoboCasa writes zero quaternions for unrotated fixtures
+    if rotation is None or not any(rotation):
+        return (1.0, 0.0, 0.0, 0.0)
+    norm = math.sqrt(sum(value * value for value in rotation))
+    return tuple(value / norm for value in rotation)
+
+
+@functools.lru_cache(maxsize=256)
+def _usd_extent(usd_path: str) -> tuple[float, float, float]:
+    """Size of the bounding box of the default prim of a USD file."""
+    from pxr import Usd, UsdGeom
+
+    stage = Usd.Stage.Open(usd_path)
+    prim = stage.GetDefaultPrim() or stage.GetPseudoRoot()
+    bbox_cache = UsdGeom.BBoxCache(Usd.TimeCode.Default(), [UsdGeom.Tokens.default_, UsdGeom.Tokens.render])
+    bound = bbox_cache.ComputeWorldBound(prim).ComputeAlignedRange()
+    return (0.0, 0.0, 0.0) if bound.IsEmpty() else tuple(bound.GetSize())
+
+
+def _fit_scale(usd_path: str, size: list[float] | None) -> tuple[float, float, float] | None:
+    """Scale of a model that fits its bounding box to a size, along the non-zero axes."""
+    if size is None or not any(size) or not os.path.isfile(usd_path):
+        return None
+    extent = _usd_extent(usd_path)
+    return tuple(s / e if s > 0.0 and e > 0.0 else 1.0 for s, e in zip(size, extent))
+
+
+def _describe_robocasa(config: dict) -> dict:
+    fixtures = [fixture for fixture in config["fixture"] if fixture["path"] is not None]
+    others = config.get("others", [])
+    names = _entity_names([entry["name"] for entry in fixtures + others])
+    entities, sources = [], {}
+    for fixture in fixtures:
+        usd_path = fixture_usd_path(fixture["path"], ISAACLAB_EXTENDED_ASSETS_DATA_DIR)
+        sources[usd_path] = _fingerprint(usd_path)
+        entities.append({
+            "name": names[fixture["name"]],
+            "kind": "static",
+            "usd_path": usd_path,
+            "scale": _fit_scale(usd_path, fixture.get("size")),
+            "pos": fixture["position"],
+            "rot": _orientation(fixture.get("rotation")),
+        })
+    for other in others:
+        entities.append({
+            "name": names[other["name"]],
+            "kind": "cuboid",
+            "size": [2.0 * value for value in other["size"]],
+            "pos": other["position"],
+        })
+    return {"entities": entities, "placement_ranges": {}, "sources": sources}
+
+
+def _describe_synthesized(config: dict, graph: dict | None, margin: float) -> dict:
+    objects = {obj["name"]: obj for obj in config["objects"]}
+    names = _entity_names([obj["name"] for obj in config["objects"]])
+    entities, placement_ranges, sources = [], {}, {}
+    for obj_name, obj in objects.items():
+        name = names[obj_name]
+        usd_path = obj["usd_path"]
+        if not os.path.isabs(usd_path) and "://" not in usd_path:
+            usd_path = os.path.join(ISAACLAB_EXTENDED_ASSETS_DATA_DIR, usd_path)
+        # the scale is fitted to the mirrored file, while the entity keeps the path that the environment resolves
+        local_path = resolve_asset_path(usd_path)
+        sources[local_path] = _fingerprint(local_path)
+        scale = obj["scale"] if obj.get("scale") is not None else _fit_scale(local_path, obj.get("size"))
+        rigid = obj.get("type") == "rigid"
+        entities.append({
+            "name": name,
+            "kind": "rigid" if rigid else "static",
+            "usd_path": usd_path,
+            "scale": scale,
+            "pos": obj["position"],
+            "rot": _orientation(obj.get("rotation")),
+        })
+        if rigid:
+            placement_ranges[name] = {"x": (-margin, margin), "y": (-margin, margin), "yaw": (-math.pi, math.pi)}
+
+    # bound the rigid objects to the top of their support
+    for edge in (graph or {}).get("edges", []):
+        if edge.get("relation") != "on" or edge["source"] not in names:
+            continue
+        name = names[edge["source"]]
+        support = objects.get(edge["target"])
+        if name not in placement_ranges or support is None or support.get("size") is None:
+            continue
+        obj_pos, support_pos = objects[edge["source"]]["position"], support["position"]
+        ranges = placement_ranges[name]
+        for i, axis in enumerate(("x", "y")):
+            half = max(support["size"][i] / 2.0 - margin, 0.0)
+            ranges[axis] = (support_pos[i] - obj_pos[i] - half, support_pos[i] - obj_pos[i] + half)
+    return {"entities": entities, "placement_ranges": placement_ranges, "sources": sources}
+
+
+def _build_entity(entity: dict) -> AssetBaseCfg:
+    """Entity configuration of an entry of a scene description."""
+    prim_path = f"{{ENV_REGEX_NS}}/Scene/{entity['name']}"
+    scale = tuple(entity["scale"]) if entity.get("scale") is not None else None
+    if entity["kind"] == "cuboid":
+        return AssetBaseCfg(
+            prim_path=prim_path,
+            init_state=AssetBaseCfg.InitialStateCfg(pos=tuple(entity["pos"])),
+            spawn=sim_utils.CuboidCfg(size=tuple(entity["size"]), collision_props=sim_utils.CollisionPropertiesCfg()),
+        )
+    init_state = dict(pos=tuple(entity["pos"]), rot=tuple(entity["rot"]))
+    if entity["kind"] == "rigid":
+        return RigidObjectCfg(
+            prim_path=prim_path,
+            init_state=RigidObjectCfg.InitialStateCfg(**init_state),
+            spawn=UsdFileCfg(
+                usd_path=entity["usd_path"],
+                scale=scale,
+                rigid_props=sim_utils.RigidBodyPropertiesCfg(),
+                mass_props=sim_utils.MassPropertiesCfg(density=500.0),
+                collision_props=sim_utils.CollisionPropertiesCfg(),
+            ),
+        )
+    return AssetBaseCfg(
+        prim_path=prim_path,
+        init_state=AssetBaseCfg.InitialStateCfg(**init_state),
+        spawn=UsdFileCfg(usd_path=entity["usd_path"], scale=scale),
+    )
+
+
+def _load_description(path: str) -> dict | None:
+    """Cached scene description, or None if it does not exist or a spawned model changed."""
+    if not os.path.isfile(path):
+        return None
+    with open(path) as f:
+        description = json.load(f)
+    if any(_fingerprint(source) != fingerprint for source, fingerprint in description["sources"].items()):
+        return None
+    return description
+
+
+def _save_description(path: str, description: dict):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # write atomically, so that concurrent compilations never read a partial description
+    with tempfile.NamedTemporaryFile("w", dir=os.path.dirname(path), suffix=".json", delete=False) as f:
+        json.dump(description, f, indent=2)
+    os.replace(f.name, path)
+
+
+def compile_scene(
+    scene_path: str,
+    graph_path: str | None = None,
+    robot_cfg: ArticulationCfg | None = None,
+    placement_margin: float = 0.05,
+    cache_dir: str | None = SCENE_CACHE_DIR,
+) -> CompiledScene:
+    """Compile a scene description into a scene configuration class.
+
+    Parameters
+    ----------
+    scene_path : str
+        Path of the RoboCasa ``env_config.json`` or of the synthesized
+        ``scene_configuration.json``.
+    graph_path : str | None
+        Path of the synthesized ``scene_graph.json``. Defaults to None.
+    robot_cfg : ArticulationCfg | None
+        Robot of the scene, spawned at ``{ENV_REGEX_NS}/Robot``. Defaults to None, i.e.
+        the robot is set by the environment configuration.
+    placement_margin : float
+        Distance to the edge of the support of the reset positions and half width of
+        the placement range of unsupported objects, in meters. Defaults to 0.05.
+    cache_dir : str | None
+        Directory of the cached scene descriptions, None to describe the scene again.
+
+    Returns
+    -------
+    CompiledScene
+        The scene configuration class and the placement ranges of the rigid objects.
+
+    Raises
+    ------
+    ValueError
+        If the format of the scene is unknown or two objects have the same name.
+    """
+    source_hash = _file_hash(scene_path, graph_path)
+    key = hashlib.sha256(f"{source_hash}:{placement_margin}:{robot_cfg}".encode()).hexdigest()
+    if key in _COMPILED_SCENES:
+        return _COMPILED_SCENES[key]
+
+    description_key = hashlib.sha256(f"{source_hash}:{placement_margin}:{_DESCRIPTION_VERSION}".encode()).hexdigest()
+    description_path = os.path.join(cache_dir, f"scene_{description_key[:16]}.json") if cache_dir else None
+    description = _load_description(description_path) if description_path else None
+    if description is None:
+        with open(scene_path) as f:
+            config = json.load(f)
+        graph = None
+        if graph_path is not None:
+            with open(graph_path) as f:
+                graph = json.load(f)
+        if "fixture" in config:
+            description = _describe_robocasa(config)
+        elif "objects" in config:
+            description = _describe_synthesized(config, graph, placement_margin)
+        else:
+            raise ValueError(f"Unknown scene format of '{scene_path}'. Expected a 'fixture' or an 'objects' list.")
+        if description_path:
+            _save_description(description_path, description)
+
+    entities = {entity["name"]: _build_entity(entity) for entity in description["entities"]}
+    placement_ranges = {
+        name: {axis: tuple(value) for axis, value in ranges.items()}
+        for name, ranges in description["placement_ranges"].items()
+    }
+    entities["plane"] = AssetBaseCfg(prim_path="/World/GroundPlane", spawn=GroundPlaneCfg())
+    entities["light"] = AssetBaseCfg(
+        prim_path="/World/light", spawn=sim_utils.DomeLightCfg(color=(0.75, 0.75, 0.75), intensity=3000.0)
+    )
+    if robot_cfg is not None:
+        entities["robot"] = robot_cfg.replace(prim_path="{ENV_REGEX_NS}/Robot")
+
+    class_name = f"CompiledSceneCfg_{source_hash[:8]}"
+    attributes = {"__module__": __name__, "__doc__": f"Scene compiled from {os.path.basename(scene_path)}."}
+    attributes["__annotations__"] = {name: type(cfg) for name, cfg in entities.items()}
+    attributes.update(entities)
+    scene_cfg_class = configclass(type(class_name, (InteractiveSceneCfg,), attributes))
+
+    compiled = CompiledScene(scene_cfg_class, placement_ranges, source_hash)
+    _COMPILED_SCENES[key] = compiled
+    return compiled
+
+
+def placement_events(compiled: CompiledScene) -> dict[str, EventTermCfg]:
+    """Reset events that place the rigid objects of a compiled scene within their ranges.
+
+    Parameters
+    ----------
+    compiled : CompiledScene
+        The compiled scene.
+
+    Returns
+    -------
+    dict[str, EventTermCfg]
+        One ``reset_<name>`` event term per rigid object.
+    """
+    return {
+        f"reset_{name}": EventTermCfg(
+            func=reset_root_state_uniform,
+            mode="reset",
+            params={"pose_range": pose_range, "velocity_range": {}, "asset_cfgs": [SceneEntityCfg(name)]},
+        )
+        for name, pose_range in compiled.placement_ranges.items()
+    }
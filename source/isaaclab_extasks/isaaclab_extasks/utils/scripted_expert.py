@@ -0,0 +1,578 @@
+"""Batched scripted expert for the block world pick-and-place tasks.
+
+The expert runs a vectorized state machine over all environments at once. For every
+environment it reads the end-effector frame and the block poses from the scene,
+produces a Cartesian waypoint (approach, grasp, lift, place, release) and converts it
+to arm joint targets with a batched differential IK step. The resulting actions can
+be fed directly to the joint-position action terms used by the block world tasks.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Sequence
+from dataclasses import MISSING
+from typing import TYPE_CHECKING
+
+import isaaclab.utils.math as math_utils
+import isaaclab.utils.string as string_utils
+import torch
+from isaaclab.controllers import DifferentialIKController, DifferentialIKControllerCfg
+from isaaclab.utils import configclass
+from isaaclab_exassets.grippers import (
+    FRANKA_HAND_CLOSE,
+    FRANKA_HAND_OPEN,
+    KINOVA_3F_CLOSE,
+    KINOVA_3F_OPEN,
+    ROBOTIQ_2F_85_CLOSE,
+    ROBOTIQ_2F_85_OPEN,
+    ROBOTIQ_2F_140_CLOSE,
+    ROBOTIQ_2F_140_OPEN,
+    SCHUNK_WSG_50_CLOSE,
+    SCHUNK_WSG_50_OPEN,
+    XARM_GRIPPER_CLOSE,
+    XARM_GRIPPER_OPEN,
+)
+
+from .virtual_frames import frame_pose
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLEnv, ManagerBasedRLEnvCfg
+
+    from .trajectory_dataset import TrajectoryWriter
+
+
+class ExpertState:
+    """States of the pick-and-place state machine."""
+
+    APPROACH_ABOVE_OBJECT = 0
+    APPROACH_OBJECT = 1
+    GRASP = 2
+    LIFT = 3
+    APPROACH_ABOVE_GOAL = 4
+    PLACE = 5
+    RELEASE = 6
+    RETREAT = 7
+    DONE = 8
+
+
+@configclass
+class PickPlaceExpertCfg:
+    """Configuration of the scripted pick-and-place expert."""
+
+    gripper_open: dict[str, float] = MISSING
+    """Joint positions of the open gripper keyed by regular expressions of the gripper joint names."""
+
+    gripper_close: dict[str, float] = MISSING
+    """Joint positions of the closed gripper keyed by regular expressions of the gripper joint names."""
+
+    robot_name: str = "robot"
+    """Name of the robot in the scene."""
+
+    ee_frame_name: str = "ee_frame"
+    """Name of the frame transformer tracking the end-effector in the scene."""
+
+    arm_action_name: str = "arm_action"
+    """Name of the arm action term. Its joints are driven by the IK step."""
+
+    gripper_action_name: str = "gripper_action"
+    """Name of the gripper action term."""
+
+    approach_height: float = 0.1
+    """Height above the object and goal used for the approach and retreat waypoints."""
+
+    lift_height: float = 0.15
+    """Height above the grasp pose to lift the object to."""
+
+    grasp_height: float = 0.0
+    """Offset along the world z-axis between the object origin and the grasp point."""
+
+    position_threshold: float = 0.01
+    """Distance to the waypoint (in m) at which the state machine advances."""
+
+    grasp_steps: int = 15
+    """Number of steps to wait for the gripper to close."""
+
+    release_steps: int = 10
+    """Number of steps to wait for the gripper to open."""
+
+    ik_method: str = "dls"
+    """Method used by the differential IK controller."""
+
+    ik_params: dict[str, float] | None = None
+    """Parameters of the differential IK method. Defaults to the controller defaults."""
+
+
+EXPERT_CFGS = {
+    "Franka": PickPlaceExpertCfg(gripper_open=FRANKA_HAND_OPEN, gripper_close=FRANKA_HAND_CLOSE),
+    "UR5e": PickPlaceExpertCfg(gripper_open=ROBOTIQ_2F_85_OPEN, gripper_close=ROBOTIQ_2F_85_CLOSE),
+    "UR10e": PickPlaceExpertCfg(gripper_open=ROBOTIQ_2F_140_OPEN, gripper_close=ROBOTIQ_2F_140_CLOSE),
+    "XArm7": PickPlaceExpertCfg(gripper_open=XARM_GRIPPER_OPEN, gripper_close=XARM_GRIPPER_CLOSE),
+    "LBRIIWA7": PickPlaceExpertCfg(gripper_open=SCHUNK_WSG_50_OPEN, gripper_close=SCHUNK_WSG_50_CLOSE),
+    "Gen3n7": PickPlaceExpertCfg(gripper_open=ROBOTIQ_2F_85_OPEN, gripper_close=ROBOTIQ_2F_85_CLOSE),
+    "Jaco7N": PickPlaceExpertCfg(gripper_open=KINOVA_3F_OPEN, gripper_close=KINOVA_3F_CLOSE),
+    "Jaco7S": PickPlaceExpertCfg(gripper_open=KINOVA_3F_OPEN, gripper_close=KINOVA_3F_CLOSE),
+}
+"""Expert configurations keyed by the robot name used in the gym task ids.
+
+The gripper positions are those of the grippers mounted on the robots in :mod:`isaaclab_exassets`.
+"""
+
+
+BLOCK_HEIGHT = 0.0468
+"""Height of the blocks in ``Props/Blocks`` (in m)."""
+
+
+def stack_sequence(asset_names: Sequence[str]) -> list[tuple[str, str, tuple[float, float, float]]]:
+    """Pick-and-place sequence that stacks the blocks on top of the first one.
+
+    Parameters
+    ----------
+    asset_names : Sequence[str]
+        Names of the blocks from the bottom to the top of the tower.
+
+    Returns
+    -------
+    list[tuple[str, str, tuple[float, float, float]]]
+        Tuples of (object name, reference asset name, offset from the reference asset).
+    """
+    return [(top, bottom, (0.0, 0.0, BLOCK_HEIGHT)) for bottom, top in zip(asset_names[:-1], asset_names[1:])]
+
+
+def sort_sequence(
+    asset_names: Sequence[str], region_names: Sequence[str]
+) -> list[tuple[str, str, tuple[float, float, float]]]:
+    """Pick-and-place sequence that puts each block onto its region.
+
+    Parameters
+    ----------
+    asset_names : Sequence[str]
+        Names of the blocks.
+    region_names : Sequence[str]
+        Names of the regions. The i-th block is placed onto the i-th region.
+
+    Returns
+    -------
+    list[tuple[str, str, tuple[float, float, float]]]
+        Tuples of (object name, reference asset name, offset from the reference asset).
+    """
+    if len(asset_names) != len(region_names):
+        raise ValueError(f"Got {len(asset_names)} blocks for {len(region_names)} regions.")
+    return [(name, region, (0.0, 0.0, 0.005 + 0.5 * BLOCK_HEIGHT)) for name, region in zip(asset_names, region_names)]
+
+
+def task_sequence(env_cfg: ManagerBasedRLEnvCfg) -> list[tuple[str, str, tuple[float, float, float]]]:
+    """Pick-and-place sequence that satisfies the ``success`` termination term of a block world task.
+
+    The blocks and regions are read from the parameters of the term, so the sequence follows
+    the stacking order and the block-to-region assignment of the configuration.
+
+    Parameters
+    ----------
+    env_cfg : ManagerBasedRLEnvCfg
+        Configuration of a stack or sort environment.
+
+    Returns
+    -------
+    list[tuple[str, str, tuple[float, float, float]]]
+        Tuples of (object name, reference asset name, offset from the reference asset).
+    """
+    success = getattr(env_cfg.terminations, "success", None)
+    if success is None:
+        raise ValueError("The environment has no 'success' termination term to derive the sequence from.")
+    if "region_names" in success.params:
+        return sort_sequence(success.params["asset_names"], success.params["region_names"])
+    return stack_sequence(success.params["asset_names"])
+
+
+def gripper_joint_positions(positions: dict[str, float], joint_names: Sequence[str], device: str) -> torch.Tensor:
+    """Resolve the joint positions of a gripper in the order of the joints of its action term.
+
+    Parameters
+    ----------
+    positions : dict[str, float]
+        Joint positions keyed by regular expressions of the joint names.
+    joint_names : Sequence[str]
+        Names of the joints of the gripper action term.
+    device : str
+        Device of the returned tensor.
+
+    Returns
+    -------
+    torch.Tensor
+        Joint positions. Shape is (len(joint_names),).
+    """
+    ids, _, values = string_utils.resolve_matching_names_values(positions, joint_names)
+    if len(ids) != len(joint_names):
+        missing = sorted(set(joint_names) - {joint_names[i] for i in ids})
+        raise ValueError(f"No gripper position is given for the joints {missing}.")
+    joint_pos = torch.zeros(len(joint_names), device=device)
+    joint_pos[ids] = torch.tensor(values, device=device)
+    return joint_pos
+
+
+class PickPlaceExpert:
+    """Vectorized state machine that performs a sequence of pick-and-place motions.
+
+    All quantities are kept as tensors of shape ``(num_envs, ...)`` and every state
+    transition is computed with masked tensor operations, so the cost of a step does
+    not depend on the number of environments.
+    """
+
+    def __init__(
+        self,
+        env: ManagerBasedRLEnv,
+        cfg: PickPlaceExpertCfg,
+        sequence: Sequence[tuple[str, str, tuple[float, float, float]]],
+    ):
+        """Initialize the expert.
+
+        Parameters
+        ----------
+        env : ManagerBasedRLEnv
+            The (unwrapped) environment.
+        cfg : PickPlaceExpertCfg
+            The configuration of the expert.
+        sequence : Sequence[tuple[str, str, tuple[float, float, float]]]
+            Pick-and-place steps as tuples of (object name, reference asset name,
+            offset of the place pose from the reference asset in the world frame).
+        """
+        self.env = env
+        self.cfg = cfg
+        self.num_envs = env.num_envs
+        self.device = env.device
+
+        self.robot = env.scene[cfg.robot_name]
+        self.ee_frame = env.scene[cfg.ee_frame_name]
+        self.objects = [env.scene[name] for name, _, _ in sequence]
+        self.reference_names = [name for _, name, _ in sequence]
+        self.place_offsets = torch.tensor(
+            [offset for _, _, offset in sequence], dtype=torch.float, device=self.device
+        )
+        self.num_steps = len(sequence)
+
+        # resolve the joints driven by the action terms
+        arm_term = env.action_manager.get_term(cfg.arm_action_name)
+        gripper_term = env.action_manager.get_term(cfg.gripper_action_name)
+        self.arm_joint_ids, _ = self.robot.find_joints(
+            arm_term.cfg.joint_names, preserve_order=arm_term.cfg.preserve_order
+        )
+        _, gripper_joint_names = self.robot.find_joints(
+            gripper_term.cfg.joint_names, preserve_order=gripper_term.cfg.preserve_order
+        )
+        self.gripper_open = gripper_joint_positions(cfg.gripper_open, gripper_joint_names, self.device)
+        self.gripper_close = gripper_joint_positions(cfg.gripper_close, gripper_joint_names, self.device)
+
+        # resolve the body the end-effector frame is attached to
+        ee_body_name = env.cfg.commands.object_pose.body_name
+        self.ee_body_idx = self.robot.find_bodies(ee_body_name)[0][0]
+        # the root body is not part of the jacobians of fixed-base articulations
+        self.ee_jacobi_idx = (
+            self.ee_body_idx - 1 if self.robot.is_fixed_base else self.ee_body_idx
+        )
+        self.jacobi_joint_ids = (
+            self.arm_joint_ids
+            if self.robot.is_fixed_base
+            else [i + 6 for i in self.arm_joint_ids]
+        )
+
+        ik_cfg = DifferentialIKControllerCfg(
+            command_type="pose",
+            use_relative_mode=False,
+            ik_method=cfg.ik_method,
+            ik_params=cfg.ik_params,
+        )
+        self.ik_controller = DifferentialIKController(ik_cfg, self.num_envs, self.device)
+
+        # state machine buffers
+        self.state = torch.full(
+            (self.num_envs,), ExpertState.APPROACH_ABOVE_OBJECT, dtype=torch.long, device=self.device
+        )
+        self.step_index = torch.zeros(self.num_envs, dtype=torch.long, device=self.device)
+        self.wait_counter = torch.zeros(self.num_envs, dtype=torch.long, device=self.device)
+        self.ref_quat_w = torch.zeros(self.num_envs, 4, device=self.device)
+        self.ref_quat_w[:, 0] = 1.0
+        self.held_quat_w = self.ref_quat_w.clone()
+        self.needs_ref = torch.ones(self.num_envs, dtype=torch.bool, device=self.device)
+        self.des_pos_w = torch.zeros(self.num_envs, 3, device=self.device)
+        self.des_quat_w = self.ref_quat_w.clone()
+
+    @property
+    def done(self) -> torch.Tensor:
+        """Boolean mask of the environments that finished the whole sequence."""
+        return self.state == ExpertState.DONE
+
+    def reset(self, env_ids: Sequence[int] | torch.Tensor | None = None):
+        """Reset the state machine of the given environments.
+
+        The reference grasp orientation is captured on the next call to
+        :meth:`compute`, after the environments have been reset by the simulator.
+
+        Parameters
+        ----------
+        env_ids : Sequence[int] | torch.Tensor | None
+            Environment indices to reset. Defaults to all environments.
+        """
+        if env_ids is None:
+            env_ids = slice(None)
+        self.state[env_ids] = ExpertState.APPROACH_ABOVE_OBJECT
+        self.step_index[env_ids] = 0
+        self.wait_counter[env_ids] = 0
+        self.needs_ref[env_ids] = True
+
+    def compute(self) -> torch.Tensor:
+        """Advance the state machine and compute the actions for all environments.
+
+        Returns
+        -------
+        torch.Tensor
+            Actions of shape ``(num_envs, num_arm_joints + num_gripper_joints)``.
+        """
+        ee_pos_w = self.ee_frame.data.target_pos_w[:, 0]
+        ee_quat_w = self.ee_frame.data.target_quat_w[:, 0]
+
+        # capture the reference orientation after a reset
+        self.ref_quat_w = torch.where(self.needs_ref.unsqueeze(-1), ee_quat_w, self.ref_quat_w)
+        self.needs_ref[:] = False
+
+        # gather the object and place poses of the active pick-and-place step
+        step_index = self.step_index.clamp(max=self.num_steps - 1)
+        env_ids = torch.arange(self.num_envs, device=self.device)
+        obj_pos_w = torch.stack([obj.data.root_pos_w for obj in self.objects], dim=1)[env_ids, step_index]
+        obj_quat_w = torch.stack([obj.data.root_quat_w for obj in self.objects], dim=1)[env_ids, step_index]
+        goal_pos_w = torch.stack([frame_pose(self.env, name)[0] for name in self.reference_names], dim=1)
+        goal_pos_w = goal_pos_w[env_ids, step_index]
+        goal_pos_w = goal_pos_w + self.place_offsets[step_index]
+
+        # align the gripper with the object yaw, wrapped to the symmetry of the block
+        _, _, obj_yaw = math_utils.euler_xyz_from_quat(obj_quat_w)
+        _, _, ref_yaw = math_utils.euler_xyz_from_quat(self.ref_quat_w)
+        delta_yaw = torch.remainder(obj_yaw - ref_yaw + math.pi / 4, math.pi / 2) - math.pi / 4
+        zeros = torch.zeros_like(delta_yaw)
+        grasp_quat_w = math_utils.quat_mul(
+            math_utils.quat_from_euler_xyz(zeros, zeros, delta_yaw), self.ref_quat_w
+        )
+
+        # waypoints of each state
+        up = torch.tensor([0.0, 0.0, 1.0], device=self.device)
+        grasp_pos_w = obj_pos_w + self.cfg.grasp_height * up
+        place_pos_w = goal_pos_w + self.cfg.grasp_height * up
+        waypoints = torch.stack(
+            [
+                grasp_pos_w + self.cfg.approach_height * up,  # APPROACH_ABOVE_OBJECT
+                grasp_pos_w,  # APPROACH_OBJECT
+                grasp_pos_w,  # GRASP
+                grasp_pos_w + self.cfg.lift_height * up,  # LIFT
+                place_pos_w + self.cfg.approach_height * up,  # APPROACH_ABOVE_GOAL
+                place_pos_w,  # PLACE
+                place_pos_w,  # RELEASE
+                place_pos_w + self.cfg.approach_height * up,  # RETREAT
+                self.des_pos_w,  # DONE
+            ],
+            dim=1,
+        )
+        # keep the waypoint fixed while the gripper is closing or opening
+        holding = (self.state == ExpertState.GRASP) | (self.state == ExpertState.RELEASE)
+        des_pos_w = torch.where(holding.unsqueeze(-1), self.des_pos_w, waypoints[env_ids, self.state])
+        reached = torch.norm(ee_pos_w - des_pos_w, dim=-1) < self.cfg.position_threshold
+
+        # state transitions
+        state = self.state
+        next_state = state.clone()
+        moving = (
+            (state == ExpertState.APPROACH_ABOVE_OBJECT)
+            | (state == ExpertState.APPROACH_OBJECT)
+            | (state == ExpertState.LIFT)
+            | (state == ExpertState.APPROACH_ABOVE_GOAL)
+            | (state == ExpertState.PLACE)
+        )
+        next_state = torch.where(moving & reached, state + 1, next_state)
+        self.wait_counter = torch.where(holding, self.wait_counter + 1, torch.zeros_like(self.wait_counter))
+        grasped = (state == ExpertState.GRASP) & (self.wait_counter >= self.cfg.grasp_steps)
+        released = (state == ExpertState.RELEASE) & (self.wait_counter >= self.cfg.release_steps)
+        next_state = torch.where(grasped | released, state + 1, next_state)
+        # after retreating, continue with the next pick-and-place step or finish
+        retreated = (state == ExpertState.RETREAT) & reached
+        self.step_index = torch.where(retreated, self.step_index + 1, self.step_index)
+        finished = self.step_index >= self.num_steps
+        next_state = torch.where(
+            retreated,
+            torch.where(
+                finished,
+                torch.full_like(state, ExpertState.DONE),
+                torch.full_like(state, ExpertState.APPROACH_ABOVE_OBJECT),
+            ),
+            next_state,
+        )
+
+        # keep the grasp orientation fixed while an object is held
+        self.held_quat_w = torch.where(
+            (state <= ExpertState.APPROACH_OBJECT).unsqueeze(-1), grasp_quat_w, self.held_quat_w
+        )
+        des_quat_w = torch.where(
+            (state <= ExpertState.APPROACH_OBJECT).unsqueeze(-1), grasp_quat_w, self.held_quat_w
+        )
+
+        self.state = next_state
+        self.des_pos_w = des_pos_w
+        self.des_quat_w = des_quat_w
+
+        # gripper command
+        closed = (state >= ExpertState.GRASP) & (state <= ExpertState.PLACE)
+        gripper = torch.where(closed.unsqueeze(-1), self.gripper_close, self.gripper_open)
+
+        return torch.cat([self._compute_arm_targets(des_pos_w, des_quat_w), gripper], dim=-1)
+
+    def _compute_arm_targets(self, des_pos_w: torch.Tensor, des_quat_w: torch.Tensor) -> torch.Tensor:
+        """Compute the arm joint targets with a differential IK step.
+
+        The desired pose is expressed for the end-effector frame tracked by the frame
+        transformer. The jacobian of the body it is attached to is shifted to that frame.
+
+        Parameters
+        ----------
+        des_pos_w : torch.Tensor
+            Desired end-effector positions in the world frame. Shape is (num_envs, 3).
+        des_quat_w : torch.Tensor
+            Desired end-effector orientations (w, x, y, z) in the world frame. Shape is (num_envs, 4).
+
+        Returns
+        -------
+        torch.Tensor
+            Arm joint position targets. Shape is (num_envs, num_arm_joints).
+        """
+        root_pos_w = self.robot.data.root_pos_w
+        root_quat_w = self.robot.data.root_quat_w
+        ee_pos_w = self.ee_frame.data.target_pos_w[:, 0]
+        ee_quat_w = self.ee_frame.data.target_quat_w[:, 0]
+        body_pos_w = self.robot.data.body_pos_w[:, self.ee_body_idx]
+
+        # express the poses in the root frame of the robot
+        des_pos_b, des_quat_b = math_utils.subtract_frame_transforms(
+            root_pos_w, root_quat_w, des_pos_w, des_quat_w
+        )
+        ee_pos_b, ee_quat_b = math_utils.subtract_frame_transforms(
+            root_pos_w, root_quat_w, ee_pos_w, ee_quat_w
+        )
+
+        # jacobian of the end-effector body in the root frame
+        jacobian = self.robot.root_physx_view.get_jacobians()[:, self.ee_jacobi_idx, :, self.jacobi_joint_ids]
+        base_rot_matrix = math_utils.matrix_from_quat(math_utils.quat_inv(root_quat_w))
+        jacobian[:, :3, :] = torch.bmm(base_rot_matrix, jacobian[:, :3, :])
+        jacobian[:, 3:, :] = torch.bmm(base_rot_matrix, jacobian[:, 3:, :])
+        # shift the linear part to the tracked end-effector frame: v_ee = v_body + w x r
+        offset_b = math_utils.quat_apply(math_utils.quat_inv(root_quat_w), ee_pos_w - body_pos_w)
+        jacobian[:, :3, :] -= torch.bmm(math_utils.skew_symmetric_matrix(offset_b), jacobian[:, 3:, :])
+
+        joint_pos = self.robot.data.joint_pos[:, self.arm_joint_ids]
+        self.ik_controller.set_command(torch.cat([des_pos_b, des_quat_b], dim=-1))
+        return self.ik_controller.compute(ee_pos_b, ee_quat_b, jacobian, joint_pos)
+
+
+def flatten_obs(obs: dict, groups: Sequence[str]) -> dict[str, torch.Tensor]:
+    """Select the recorded observation groups and flatten them into ``obs.<group>[.<term>]`` entries."""
+    flat = {}
+    for group in groups:
+        value = obs[group]
+        if isinstance(value, dict):
+            for name, term in value.items():
+                flat[f"obs.{group}.{name}"] = term
+        else:
+            flat[f"obs.{group}"] = value
+    return flat
+
+
+def collect_demonstrations(
+    env: ManagerBasedRLEnv,
+    expert: PickPlaceExpert,
+    writer: TrajectoryWriter,
+    num_demos: int,
+    max_episode_steps: int = 1500,
+    obs_groups: Sequence[str] = ("policy",),
+    log_interval: int | None = None,
+    is_running: Callable[[], bool] | None = None,
+) -> tuple[int, int]:
+    """Run the expert in all environments and record the episodes it finishes.
+
+    An episode is written to ``writer`` once the expert is done or the ``success`` termination term of
+    the environment ends it. The success term holds for a few steps only, so it usually resets the
+    environment while the expert still releases the last block. Episodes that terminate otherwise or
+    exceed ``max_episode_steps`` are discarded.
+
+    Parameters
+    ----------
+    env : ManagerBasedRLEnv
+        The (unwrapped) environment.
+    expert : PickPlaceExpert
+        The expert acting in the environment.
+    writer : TrajectoryWriter
+        Writer of the demonstrations.
+    num_demos : int
+        Number of demonstrations to collect.
+    max_episode_steps : int
+        Number of steps after which an episode is discarded.
+    obs_groups : Sequence[str]
+        Observation groups to record.
+    log_interval : int | None
+        Number of demonstrations between progress messages. None to not print any.
+    is_running : Callable[[], bool] | None
+        Returns False to stop early, e.g. when the simulation app is closed.
+
+    Returns
+    -------
+    tuple[int, int]
+        The number of collected demonstrations and of simulated environment steps.
+    """
+    obs, _ = env.reset()
+    expert.reset()
+
+    # buffers of the running episodes: (max_episode_steps, num_envs, ...)
+    buffers = None
+    episode_length = torch.zeros(env.num_envs, dtype=torch.long, device=env.device)
+    env_ids = torch.arange(env.num_envs, device=env.device)
+
+    demos = 0
+    steps = 0
+    while demos < num_demos and (is_running is None or is_running()):
+        with torch.inference_mode():
+            actions = expert.compute()
+            step_data = flatten_obs(obs, obs_groups)
+            step_data["actions"] = actions
+            if buffers is None:
+                buffers = {
+                    key: torch.zeros((max_episode_steps, *value.shape), dtype=value.dtype, device=env.device)
+                    for key, value in step_data.items()
+                }
+            index = episode_length.clamp(max=max_episode_steps - 1)
+            for key, value in step_data.items():
+                buffers[key][index, env_ids] = value
+            episode_length += 1
+
+            obs, _, terminated, truncated, _ = env.step(actions)
+            steps += env.num_envs
+
+            # write out the finished episodes
+            done = expert.done
+            if "success" in env.termination_manager.active_terms:
+                done = done | env.termination_manager.get_term("success")
+            for i in done.nonzero(as_tuple=False).squeeze(-1).tolist():
+                if demos == num_demos:
+                    break
+                length = int(episode_length[i])
+                writer.add_episode({key: buf[:length, i].cpu().numpy() for key, buf in buffers.items()})
+                demos += 1
+                if log_interval is not None and demos % log_interval == 0:
+                    print(f"[INFO]: Collected {demos} demos from {steps} steps.")
+
+            # reset the finished and failed episodes
+            auto_reset = terminated | truncated
+            finished = done | auto_reset | (episode_length >= max_episode_steps)
+            reset_ids = finished.nonzero(as_tuple=False).squeeze(-1)
+            if len(reset_ids) > 0:
+                # environments that were terminated are already reset inside of step()
+                manual_ids = reset_ids[~auto_reset[reset_ids]]
+                if len(manual_ids) > 0:
+                    obs, _ = env.reset(env_ids=manual_ids)
+                expert.reset(reset_ids)
+                episode_length[reset_ids] = 0
+    return demos, steps
@@ -0,0 +1,162 @@
+"""Conversion of kinematic helper geometry into static colliders.
+
+Many task configurations spawn helper geometry, such as the ``base`` plate under the
+objects or the ``region`` marker, as kinematic rigid bodies that are never moved. Each
+of them adds one body per environment to the broadphase and to the solver. The pass
+in this module replaces such helpers with static colliders of the same shape, which
+PhysX handles without any solver work.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Any
+
+import torch
+from isaaclab.assets import AssetBaseCfg, RigidObjectCfg
+from isaaclab.managers import EventTermCfg, SceneEntityCfg
+from isaaclab.sim.schemas.schemas_cfg import CollisionPropertiesCfg
+from isaaclab.sim.spawners.shapes import ShapeCfg
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedEnv, ManagerBasedEnvCfg
+
+
+def _referenced_names(value: Any) -> Iterable[str]:
+    """Yield the names of the scene entities of (nested) event term parameters."""
+    if isinstance(value, SceneEntityCfg):
+        yield value.name
+    elif isinstance(value, dict):
+        for sub_value in value.values():
+            yield from _referenced_names(sub_value)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _referenced_names(item)
+
+
+def moved_asset_names(env_cfg: ManagerBasedEnvCfg) -> set[str]:
+    """Collect the names of the assets that may be moved by event terms.
+
+    An asset is considered moved if a :class:`SceneEntityCfg` of it is passed to an
+    event term, either directly or in a list, tuple or dict of the parameters. Event
+    terms that only read the configuration of an asset take its name as a string.
+
+    Parameters
+    ----------
+    env_cfg : ManagerBasedEnvCfg
+        The environment configuration.
+
+    Returns
+    -------
+    set[str]
+        Names of the assets referenced by event terms.
+    """
+    names = set()
+    events = getattr(env_cfg, "events", None)
+    if events is None:
+        return names
+    for term_cfg in events.__dict__.values():
+        if isinstance(term_cfg, EventTermCfg):
+            names.update(_referenced_names(term_cfg.params))
+    return names
+
+
+def convert_kinematic_helpers(env_cfg: ManagerBasedEnvCfg, exclude: Sequence[str] = ()) -> list[str]:
+    """Replace never-moved kinematic shape bodies in the scene with static colliders.
+
+    A scene entity is converted if it is a :class:`RigidObjectCfg` spawned from a
+    primitive shape with ``kinematic_enabled=True`` and no event term gets a
+    :class:`SceneEntityCfg` of it. The converted entity keeps its prim path, pose,
+    shape, visibility and materials, and gets collision properties if it had none.
+
+    Note
+    ----
+    Converted entities are no longer rigid objects of the scene. Terms that need
+    their pose should use :func:`asset_root_pose`, which falls back to the configured
+    initial pose.
+
+    Parameters
+    ----------
+    env_cfg : ManagerBasedEnvCfg
+        The environment configuration. Its scene is modified in place.
+    exclude : Sequence[str]
+        Names of scene entities to keep as rigid bodies.
+
+    Returns
+    -------
+    list[str]
+        Names of the converted scene entities.
+    """
+    moved = moved_asset_names(env_cfg)
+    converted = []
+    for name, asset_cfg in list(env_cfg.scene.__dict__.items()):
+        if not isinstance(asset_cfg, RigidObjectCfg) or name in exclude or name in moved:
+            continue
+        spawn = asset_cfg.spawn
+        if not isinstance(spawn, ShapeCfg) or spawn.rigid_props is None or not spawn.rigid_props.kinematic_enabled:
+            continue
+        static_spawn = spawn.replace(
+            rigid_props=None,
+            mass_props=None,
+            collision_props=spawn.collision_props if spawn.collision_props is not None else CollisionPropertiesCfg(),
+        )
+        setattr(
+            env_cfg.scene,
+            name,
+            AssetBaseCfg(
+                prim_path=asset_cfg.prim_path,
+                init_state=AssetBaseCfg.InitialStateCfg(pos=asset_cfg.init_state.pos, rot=asset_cfg.init_state.rot),
+                spawn=static_spawn,
+                collision_group=asset_cfg.collision_group,
+            ),
+        )
+        converted.append(name)
+    return converted
+
+
+def report_static_colliders(env: ManagerBasedEnv):
+    """Print the static colliders of a built scene and the number of rigid bodies they saved.
+
+    Parameters
+    ----------
+    env : ManagerBasedEnv
+        The environment. The names of the converted entities are read from the
+        ``static_colliders`` attribute of its configuration.
+    """
+    converted = [
+        name
+        for name in getattr(env.cfg, "static_colliders", [])
+        if name in env.scene.keys() and name not in env.scene.rigid_objects
+    ]
+    if converted:
+        print(
+            f"[INFO]: Converted {len(converted)} kinematic helpers to static colliders: {converted}."
+            f" Rigid bodies removed from the solver: {len(converted) * env.num_envs}."
+        )
+
+
+def asset_root_pose(env: ManagerBasedEnv, name: str) -> tuple[torch.Tensor, torch.Tensor]:
+    """Get the world root pose of a scene entity, including static colliders.
+
+    Rigid objects and articulations are read from the simulation. Other entities are
+    static, so their pose is the configured initial pose in every environment.
+
+    Parameters
+    ----------
+    env : ManagerBasedEnv
+        The environment.
+    name : str
+        Name of the scene entity.
+
+    Returns
+    -------
+    tuple[torch.Tensor, torch.Tensor]
+        Positions of shape (num_envs, 3) and quaternions (w, x, y, z) of shape (num_envs, 4) in the world frame.
+    """
+    if name in env.scene.rigid_objects or name in env.scene.articulations:
+        asset = env.scene[name]
+        return asset.data.root_pos_w, asset.data.root_quat_w
+    asset_cfg = getattr(env.scene.cfg, name)
+    pos = torch.tensor(asset_cfg.init_state.pos, dtype=torch.float, device=env.device)
+    rot = torch.tensor(asset_cfg.init_state.rot, dtype=torch.float, device=env.device)
+    return env.scene.env_origins + pos, rot.expand(env.num_envs, 4)
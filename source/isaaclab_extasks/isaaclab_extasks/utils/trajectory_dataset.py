@@ -0,0 +1,409 @@
+"""Chunked trajectory storage with a memory-mapped reader for offline training.
+
+Episodes are stored in fixed-size chunk directories. Every chunk holds one ``.npy`` file per data key
+(all episodes of the chunk concatenated along the time axis) and an ``episodes.npy`` file with the
+``(start, length)`` of each episode inside the chunk:
+
+.. code-block:: text
+
+    <root>/
+    ├── meta.json
+    ├── chunk_00000/
+    │   ├── episodes.npy
+    │   ├── actions.npy
+    │   ├── obs.joint_pos.npy
+    │   └── obs.rgb_image.npy
+    └── chunk_00001/
+        └── ...
+
+Nested keys (e.g. ``obs/rgb_image``) are flattened with a ``.`` separator. Since the files are plain
+``.npy`` arrays, the reader opens them with ``numpy.load(..., mmap_mode="r")`` and only the pages that
+belong to a sampled window are ever read from disk.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import threading
+from collections.abc import Iterator, Mapping
+
+import numpy as np
+import torch
+
+META_FILE_NAME = "meta.json"
+"""Name of the dataset metadata file."""
+
+EPISODES_FILE_NAME = "episodes.npy"
+"""Name of the per-chunk episode table (``(start, length)`` rows)."""
+
+
+def _flatten_episode(episode: Mapping, prefix: str = "") -> dict[str, np.ndarray]:
+    """Flatten a nested episode dictionary into ``{"a.b": array}`` entries."""
+    flat = {}
+    for key, value in episode.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, Mapping):
+            flat.update(_flatten_episode(value, prefix=f"{name}."))
+        elif isinstance(value, torch.Tensor):
+            flat[name] = value.detach().cpu().numpy()
+        else:
+            flat[name] = np.asarray(value)
+    return flat
+
+
+class TrajectoryWriter:
+    """Writes episodes into the chunked trajectory format.
+
+    Episodes are buffered in memory until the buffered number of steps reaches ``chunk_size``, after
+    which the buffer is written to a new chunk directory. Episodes are never split across chunks, so
+    a chunk may be larger than ``chunk_size`` when a single episode is longer than it.
+    """
+
+    def __init__(self, root: str, chunk_size: int = 10000):
+        """Initialize the writer.
+
+        Parameters
+        ----------
+        root : str
+            Directory of the dataset. It is created if it does not exist.
+        chunk_size : int
+            Number of steps after which the buffered episodes are flushed to a chunk.
+        """
+        self.root = os.path.abspath(root)
+        self.chunk_size = chunk_size
+        os.makedirs(self.root, exist_ok=True)
+
+        self._meta = self._load_meta()
+        self._buffer: list[dict[str, np.ndarray]] = []
+        self._buffered_steps = 0
+
+    def __enter__(self) -> TrajectoryWriter:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def add_episode(self, episode: Mapping):
+        """Add an episode to the dataset.
+
+        Parameters
+        ----------
+        episode : Mapping
+            (Nested) dictionary of arrays or tensors. All leaves must share the same leading time dimension.
+        """
+        flat = _flatten_episode(episode)
+        lengths = {value.shape[0] for value in flat.values()}
+        if len(lengths) != 1:
+            raise ValueError(f"All episode entries must have the same length. Received: {sorted(lengths)}.")
+        # check that the keys and layouts match the existing dataset
+        keys = {name: {"dtype": value.dtype.str, "shape": list(value.shape[1:])} for name, value in flat.items()}
+        if self._meta["keys"] and keys != self._meta["keys"]:
+            raise ValueError("Episode keys, dtypes or shapes do not match the existing dataset.")
+        self._meta["keys"] = keys
+
+        self._buffer.append(flat)
+        self._buffered_steps += lengths.pop()
+        if self._buffered_steps >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered episodes to a new chunk."""
+        if not self._buffer:
+            return
+        chunk_name = f"chunk_{len(self._meta['chunks']):05d}"
+        chunk_dir = os.path.join(self.root, chunk_name)
+        os.makedirs(chunk_dir, exist_ok=True)
+
+        lengths = np.array([next(iter(ep.values())).shape[0] for ep in self._buffer], dtype=np.int64)
+        starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+        np.save(os.path.join(chunk_dir, EPISODES_FILE_NAME), np.stack([starts, lengths], axis=-1))
+        for name in self._meta["keys"]:
+            np.save(os.path.join(chunk_dir, f"{name}.npy"), np.concatenate([ep[name] for ep in self._buffer]))
+
+        # update the metadata last so that a crash never references a partial chunk
+        self._meta["chunks"].append({"name": chunk_name, "num_steps": int(lengths.sum())})
+        self._save_meta()
+        self._buffer.clear()
+        self._buffered_steps = 0
+
+    def close(self):
+        """Flush the remaining episodes."""
+        self.flush()
+
+    def _load_meta(self) -> dict:
+        meta_path = os.path.join(self.root, META_FILE_NAME)
+        if os.path.isfile(meta_path):
+            with open(meta_path) as f:
+                return json.load(f)
+        return {"keys": {}, "chunks": []}
+
+    def _save_meta(self):
+        meta_path = os.path.join(self.root, META_FILE_NAME)
+        with open(meta_path + ".tmp", "w") as f:
+            json.dump(self._meta, f, indent=2)
+        os.replace(meta_path + ".tmp", meta_path)
+
+
+class TrajectoryDataset:
+    """Random-access reader over the chunked trajectory format.
+
+    All chunk files are memory-mapped on construction and a global episode index is built from the
+    per-chunk episode tables. Windows of ``seq_len`` consecutive steps are sampled uniformly over all
+    valid window start positions, i.e. longer episodes contribute proportionally more windows.
+    """
+
+    def __init__(self, root: str, keys: list[str] | None = None):
+        """Initialize the dataset.
+
+        Parameters
+        ----------
+        root : str
+            Directory of the dataset.
+        keys : list[str] | None
+            Flattened keys to load (e.g. ``["actions", "obs.rgb_image"]``). Defaults to all keys.
+        """
+        self.root = os.path.abspath(root)
+        with open(os.path.join(self.root, META_FILE_NAME)) as f:
+            self.meta = json.load(f)
+        if keys is None:
+            keys = list(self.meta["keys"])
+        missing = set(keys) - set(self.meta["keys"])
+        if missing:
+            raise KeyError(f"Keys not found in dataset '{self.root}': {sorted(missing)}.")
+        self.keys = keys
+
+        # memory-map every chunk file
+        self._arrays: list[dict[str, np.ndarray]] = []
+        episode_tables = []
+        for chunk_id, chunk in enumerate(self.meta["chunks"]):
+            chunk_dir = os.path.join(self.root, chunk["name"])
+            self._arrays.append(
+                {name: np.load(os.path.join(chunk_dir, f"{name}.npy"), mmap_mode="r") for name in self.keys}
+            )
+            table = np.load(os.path.join(chunk_dir, EPISODES_FILE_NAME))
+            episode_tables.append(np.concatenate([np.full((len(table), 1), chunk_id), table], axis=-1))
+        # episode index: (chunk_id, start, length)
+        self.episode_index = (
+            np.concatenate(episode_tables).astype(np.int64) if episode_tables else np.zeros((0, 3), dtype=np.int64)
+        )
+
+    @property
+    def num_episodes(self) -> int:
+        """Number of episodes in the dataset."""
+        return len(self.episode_index)
+
+    @property
+    def num_steps(self) -> int:
+        """Number of steps in the dataset."""
+        return int(self.episode_index[:, 2].sum())
+
+    def get_episode(self, index: int) -> dict[str, np.ndarray]:
+        """Memory-mapped views of all steps of an episode."""
+        chunk_id, start, length = self.episode_index[index]
+        return {name: array[start : start + length] for name, array in self._arrays[chunk_id].items()}
+
+    def window_starts(self, seq_len: int) -> tuple[np.ndarray, np.ndarray]:
+        """Episodes that fit a window of ``seq_len`` steps and their number of valid window starts."""
+        num_windows = self.episode_index[:, 2] - seq_len + 1
+        valid = np.nonzero(num_windows > 0)[0]
+        if len(valid) == 0:
+            raise ValueError(f"No episode in '{self.root}' is long enough for windows of length {seq_len}.")
+        return valid, num_windows[valid]
+
+    def sample_windows(
+        self, batch_size: int, seq_len: int, rng: np.random.Generator | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Sample ``batch_size`` windows uniformly over all valid start positions.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The chunk ids and the start steps (inside the chunk) of the sampled windows.
+        """
+        rng = np.random.default_rng() if rng is None else rng
+        episodes, num_windows = self.window_starts(seq_len)
+        # sample a flat window id and map it back to (episode, offset)
+        cum_windows = np.cumsum(num_windows)
+        flat_ids = rng.integers(0, cum_windows[-1], size=batch_size)
+        slots = np.searchsorted(cum_windows, flat_ids, side="right")
+        offsets = flat_ids - (cum_windows[slots] - num_windows[slots])
+        rows = self.episode_index[episodes[slots]]
+        return rows[:, 0], rows[:, 1] + offsets
+
+    def allocate_batch(self, batch_size: int, seq_len: int, pin_memory: bool = True) -> dict[str, torch.Tensor]:
+        """Allocate (pinned) host tensors for a batch of windows."""
+        pin_memory = pin_memory and torch.cuda.is_available()
+        batch = {}
+        for name in self.keys:
+            spec = self.meta["keys"][name]
+            dtype = torch.from_numpy(np.empty(0, dtype=np.dtype(spec["dtype"]))).dtype
+            batch[name] = torch.empty((batch_size, seq_len, *spec["shape"]), dtype=dtype, pin_memory=pin_memory)
+        return batch
+
+    def read_windows(self, chunk_ids: np.ndarray, starts: np.ndarray, out: dict[str, torch.Tensor]):
+        """Copy the given windows from the memory-mapped chunks into ``out`` without intermediate copies."""
+        seq_len = next(iter(out.values())).shape[1]
+        for name, tensor in out.items():
+            out_np = tensor.numpy()
+            for i, (chunk_id, start) in enumerate(zip(chunk_ids, starts)):
+                out_np[i] = self._arrays[chunk_id][name][start : start + seq_len]
+
+    def sample(
+        self,
+        batch_size: int,
+        seq_len: int,
+        rng: np.random.Generator | None = None,
+        pin_memory: bool = True,
+        out: dict[str, torch.Tensor] | None = None,
+    ) -> dict[str, torch.Tensor]:
+        """Sample a batch of windows of shape ``(batch_size, seq_len, ...)`` per key.
+
+        The windows are read into ``out`` if given, e.g. a batch from :meth:`allocate_batch` that is
+        reused across calls, and into newly allocated tensors otherwise.
+        """
+        chunk_ids, starts = self.sample_windows(batch_size, seq_len, rng)
+        batch = self.allocate_batch(batch_size, seq_len, pin_memory) if out is None else out
+        self.read_windows(chunk_ids, starts, batch)
+        return batch
+
+
+class TrajectoryLoader:
+    """Infinite iterator over random window batches, prefetched by background threads.
+
+    Reading from the memory-mapped chunks is dominated by page faults and memory copies which release
+    the GIL, so a few threads are enough to keep the training loop from waiting on disk. When a CUDA
+    device is given, the pinned batches are transferred with ``non_blocking=True``.
+
+    The (pinned) host batches are allocated once and reused: a batch goes back to the workers once its
+    transfer to ``device`` has completed or, without a device, on the next call of :meth:`__next__`. A host
+    batch is therefore only valid until the next batch is requested and must be cloned to be kept.
+    """
+
+    def __init__(
+        self,
+        dataset: TrajectoryDataset,
+        batch_size: int,
+        seq_len: int,
+        num_workers: int = 4,
+        prefetch: int = 8,
+        pin_memory: bool = True,
+        device: str | torch.device | None = None,
+        seed: int | None = None,
+    ):
+        """Initialize the loader and start the worker threads.
+
+        Parameters
+        ----------
+        dataset : TrajectoryDataset
+            The dataset to sample from.
+        batch_size : int
+            Number of windows per batch.
+        seq_len : int
+            Number of consecutive steps per window.
+        num_workers : int
+            Number of prefetch threads.
+        prefetch : int
+            Maximum number of batches that are kept ready.
+        pin_memory : bool
+            Whether to return batches in page-locked memory (only if CUDA is available).
+        device : str | torch.device | None
+            If given, batches are moved to this device before they are returned.
+        seed : int | None
+            Seed of the per-worker random generators.
+        """
+        self.dataset = dataset
+        self.batch_size = batch_size
+        self.seq_len = seq_len
+        self.pin_memory = pin_memory
+        self.device = device
+        # fail early instead of inside the workers
+        dataset.window_starts(seq_len)
+
+        self._queue: queue.Queue = queue.Queue(maxsize=prefetch)
+        self._stop_event = threading.Event()
+        # staging batches: one per worker, the prefetched ones and the one held by the caller
+        self._free: queue.Queue = queue.Queue()
+        for _ in range(num_workers + prefetch + 1):
+            self._free.put((dataset.allocate_batch(batch_size, seq_len, pin_memory), None))
+        self._held: dict[str, torch.Tensor] | None = None
+        seeds = np.random.SeedSequence(seed).spawn(num_workers)
+        self._workers = [
+            threading.Thread(target=self._worker, args=(np.random.default_rng(s),), daemon=True) for s in seeds
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def __iter__(self) -> Iterator[dict[str, torch.Tensor]]:
+        return self
+
+    def __next__(self) -> dict[str, torch.Tensor]:
+        # the caller is done with the previous host batch
+        if self._held is not None:
+            self._free.put((self._held, None))
+            self._held = None
+        batch = self._queue.get()
+        if isinstance(batch, Exception):
+            raise batch
+        if self.device is None:
+            self._held = batch
+            return batch
+        device_batch = {name: tensor.to(self.device, non_blocking=True) for name, tensor in batch.items()}
+        # the host batch is reused once the asynchronous copy has completed
+        copied = None
+        if torch.device(self.device).type == "cuda":
+            copied = torch.cuda.Event()
+            copied.record()
+        self._free.put((batch, copied))
+        return device_batch
+
+    def close(self):
+        """Stop the worker threads."""
+        self._stop_event.set()
+        # unblock workers waiting on a full queue
+        while any(worker.is_alive() for worker in self._workers):
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            for worker in self._workers:
+                worker.join(timeout=0.01)
+
+    def _worker(self, rng: np.random.Generator):
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    batch, copied = self._free.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if copied is not None:
+                    copied.synchronize()
+                self.dataset.sample(self.batch_size, self.seq_len, rng, out=batch)
+                while not self._stop_event.is_set():
+                    try:
+                        self._queue.put(batch, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+        except Exception as e:
+            self._queue.put(e)
+
+
+def convert_hdf5_dataset(hdf5_path: str, root: str, chunk_size: int = 10000):
+    """Convert an HDF5 file written by the Isaac Lab recorder manager into the chunked format.
+
+    Every ``data/<demo>`` group of the file becomes one episode; nested groups become nested keys. The
+    ``initial_state`` group is skipped since it does not share the time axis of the other entries.
+    """
+    import h5py
+
+    def _read_group(group) -> dict:
+        return {k: _read_group(v) if isinstance(v, h5py.Group) else v[()] for k, v in group.items()}
+
+    with h5py.File(hdf5_path, "r") as f, TrajectoryWriter(root, chunk_size=chunk_size) as writer:
+        demos = sorted(f["data"].keys(), key=lambda name: int(name.split("_")[-1]))
+        for demo in demos:
+            episode = _read_group(f["data"][demo])
+            episode.pop("initial_state", None)
+            writer.add_episode(episode)
@@ -0,0 +1,284 @@
+"""Task-space action term for Universal Robots arms based on the analytical IK."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import MISSING
+from typing import TYPE_CHECKING
+
+import isaaclab.utils.math as math_utils
+import torch
+from isaaclab.managers.action_manager import ActionTerm, ActionTermCfg
+from isaaclab.utils import configclass
+
+from .ur_kinematics import (
+    UR_DH_PARAMS,
+    select_nearest_branch,
+    ur_forward_kinematics,
+    ur_inverse_kinematics,
+)
+
+if TYPE_CHECKING:
+    from isaaclab.assets import Articulation
+    from isaaclab.envs import ManagerBasedEnv
+
+
+class URAnalyticalIKAction(ActionTerm):
+    """Inverse kinematics action term for Universal Robots arms.
+
+    The action is the pose of the end-effector in the root frame of the robot, either
+    absolute (position and quaternion) or relative to the current pose (position and
+    axis-angle deltas). All eight closed-form IK branches are computed for every
+    environment and the valid branch closest to the current joint positions is applied
+    as joint position targets. If no branch is valid, the previous targets are kept.
+
+    The pose of the controlled body relative to the DH flange is calibrated per environment
+    from the simulation on the first call, unless it is provided in the configuration.
+    """
+
+    cfg: URAnalyticalIKActionCfg
+    """The configuration of the action term."""
+    _asset: Articulation
+    """The articulation asset on which the action term is applied."""
+
+    def __init__(self, cfg: URAnalyticalIKActionCfg, env: ManagerBasedEnv):
+        super().__init__(cfg, env)
+
+        self._joint_ids, self._joint_names = self._asset.find_joints(
+            self.cfg.joint_names, preserve_order=True
+        )
+        if len(self._joint_ids) != 6:
+            raise ValueError(
+                f"Expected 6 arm joints for '{self.cfg.joint_names}', found: {self._joint_names}."
+            )
+        body_ids, body_names = self._asset.find_bodies(self.cfg.body_name)
+        if len(body_ids) != 1:
+            raise ValueError(
+                f"Expected one match for the body name: {self.cfg.body_name}. Found {len(body_ids)}: {body_names}."
+            )
+        self._body_idx = body_ids[0]
+        if self.cfg.robot_type not in UR_DH_PARAMS:
+            raise ValueError(
+                f"Unknown robot type '{self.cfg.robot_type}'. Available: {list(UR_DH_PARAMS.keys())}."
+            )
+        self._dh_params = UR_DH_PARAMS[self.cfg.robot_type]
+
+        # constant frame offsets
+        self._base_offset_pos, self._base_offset_rot = self._offset_tensors(self.cfg.base_offset)
+        if self.cfg.body_offset is not None:
+            self._body_offset_pos, self._body_offset_rot = self._offset_tensors(self.cfg.body_offset)
+        else:
+            self._body_offset_pos, self._body_offset_rot = None, None
+        if self.cfg.flange_offset is not None:
+            self._flange_offset_pos, self._flange_offset_rot = self._offset_tensors(self.cfg.flange_offset)
+        else:
+            self._flange_offset_pos, self._flange_offset_rot = None, None
+
+        if self.cfg.joint_weights is not None:
+            self._joint_weights = torch.tensor(self.cfg.joint_weights, device=self.device)
+        else:
+            self._joint_weights = None
+
+        # action buffers
+        self._raw_actions = torch.zeros(self.num_envs, self.action_dim, device=self.device)
+        self._processed_actions = torch.zeros_like(self.raw_actions)
+        self._scale = torch.zeros((self.num_envs, self.action_dim), device=self.device)
+        self._scale[:] = torch.tensor(self.cfg.scale, device=self.device)
+        self._joint_pos_target = self._asset.data.joint_pos[:, self._joint_ids].clone()
+        self._ik_success = torch.ones(self.num_envs, dtype=torch.bool, device=self.device)
+
+    """
+    Properties.
+    """
+
+    @property
+    def action_dim(self) -> int:
+        return 6 if self.cfg.use_relative_mode else 7
+
+    @property
+    def raw_actions(self) -> torch.Tensor:
+        return self._raw_actions
+
+    @property
+    def processed_actions(self) -> torch.Tensor:
+        return self._processed_actions
+
+    @property
+    def ik_success(self) -> torch.Tensor:
+        """Boolean mask of the environments for which a valid IK branch was found."""
+        return self._ik_success
+
+    """
+    Operations.
+    """
+
+    def process_actions(self, actions: torch.Tensor):
+        # store the raw actions
+        self._raw_actions[:] = actions
+        self._processed_actions[:] = self.raw_actions * self._scale
+        # compute the target pose of the end-effector in the root frame
+        if self.cfg.use_relative_mode:
+            ee_pos_b, ee_quat_b = self._compute_frame_pose()
+            ee_pos_des, ee_quat_des = math_utils.apply_delta_pose(ee_pos_b, ee_quat_b, self._processed_actions)
+        else:
+            ee_pos_des = self._processed_actions[:, :3]
+            ee_quat_des = math_utils.normalize(self._processed_actions[:, 3:7])
+        # the IK is solved once per environment step
+        self._joint_pos_target = self.compute_joint_targets(ee_pos_des, ee_quat_des)
+
+    def apply_actions(self):
+        self._asset.set_joint_position_target(self._joint_pos_target, self._joint_ids)
+
+    def reset(self, env_ids: Sequence[int] | None = None) -> None:
+        if env_ids is None:
+            env_ids = slice(None)
+        self._raw_actions[env_ids] = 0.0
+        self._joint_pos_target[env_ids] = self._asset.data.joint_pos[env_ids][:, self._joint_ids]
+        self._ik_success[env_ids] = True
+
+    def compute_joint_targets(self, ee_pos_des: torch.Tensor, ee_quat_des: torch.Tensor) -> torch.Tensor:
+        """Compute the joint positions of the nearest IK branch for the desired poses.
+
+        Parameters
+        ----------
+        ee_pos_des : torch.Tensor
+            Desired end-effector positions in the root frame. Shape is (num_envs, 3).
+        ee_quat_des : torch.Tensor
+            Desired end-effector orientations (w, x, y, z) in the root frame. Shape is (num_envs, 4).
+
+        Returns
+        -------
+        torch.Tensor
+            Joint position targets. Shape is (num_envs, 6).
+        """
+        if self._flange_offset_pos is None:
+            self._calibrate_flange_offset()
+        # controlled frame -> body
+        if self._body_offset_pos is not None:
+            body_pos, body_quat = math_utils.combine_frame_transforms(
+                ee_pos_des,
+                ee_quat_des,
+                *math_utils.subtract_frame_transforms(
+                    self._body_offset_pos, self._body_offset_rot
+                ),
+            )
+        else:
+            body_pos, body_quat = ee_pos_des, ee_quat_des
+        # body -> flange
+        flange_pos, flange_quat = math_utils.combine_frame_transforms(
+            body_pos,
+            body_quat,
+            *math_utils.subtract_frame_transforms(self._flange_offset_pos, self._flange_offset_rot),
+        )
+        # root -> DH base
+        flange_pos, flange_quat = math_utils.subtract_frame_transforms(
+            self._base_offset_pos.expand_as(flange_pos),
+            self._base_offset_rot.expand_as(flange_quat),
+            flange_pos,
+            flange_quat,
+        )
+        pose = torch.zeros(self.num_envs, 4, 4, device=self.device)
+        pose[:, :3, :3] = math_utils.matrix_from_quat(flange_quat)
+        pose[:, :3, 3] = flange_pos
+        pose[:, 3, 3] = 1.0
+
+        solutions, valid = ur_inverse_kinematics(pose, self._dh_params)
+        joint_pos = self._asset.data.joint_pos[:, self._joint_ids]
+        joint_pos_limits = (
+            self._asset.data.soft_joint_pos_limits[:, self._joint_ids] if self.cfg.respect_joint_limits else None
+        )
+        joint_pos_des, self._ik_success = select_nearest_branch(
+            solutions, valid, joint_pos, joint_pos_limits, self._joint_weights
+        )
+        return torch.where(self._ik_success.unsqueeze(-1), joint_pos_des, self._joint_pos_target)
+
+    """
+    Helper functions.
+    """
+
+    def _offset_tensors(self, offset: URAnalyticalIKActionCfg.OffsetCfg) -> tuple[torch.Tensor, torch.Tensor]:
+        pos = torch.tensor(offset.pos, device=self.device).repeat(self.num_envs, 1)
+        rot = torch.tensor(offset.rot, device=self.device).repeat(self.num_envs, 1)
+        return pos, rot
+
+    def _compute_frame_pose(self) -> tuple[torch.Tensor, torch.Tensor]:
+        """Pose of the controlled frame in the root frame of the robot."""
+        body_pos_b, body_quat_b = math_utils.subtract_frame_transforms(
+            self._asset.data.root_pos_w,
+            self._asset.data.root_quat_w,
+            self._asset.data.body_pos_w[:, self._body_idx],
+            self._asset.data.body_quat_w[:, self._body_idx],
+        )
+        if self._body_offset_pos is not None:
+            return math_utils.combine_frame_transforms(
+                body_pos_b, body_quat_b, self._body_offset_pos, self._body_offset_rot
+            )
+        return body_pos_b, body_quat_b
+
+    def _calibrate_flange_offset(self):
+        """Compute the pose of the body in the DH flange frame from the current state."""
+        body_pos_b, body_quat_b = math_utils.subtract_frame_transforms(
+            self._asset.data.root_pos_w,
+            self._asset.data.root_quat_w,
+            self._asset.data.body_pos_w[:, self._body_idx],
+            self._asset.data.body_quat_w[:, self._body_idx],
+        )
+        flange = ur_forward_kinematics(self._asset.data.joint_pos[:, self._joint_ids], self._dh_params)
+        flange_pos, flange_quat = math_utils.combine_frame_transforms(
+            self._base_offset_pos,
+            self._base_offset_rot,
+            flange[:, :3, 3],
+            math_utils.quat_from_matrix(flange[:, :3, :3]),
+        )
+        # each environment is calibrated from its own state
+        self._flange_offset_pos, self._flange_offset_rot = math_utils.subtract_frame_transforms(
+            flange_pos, flange_quat, body_pos_b, body_quat_b
+        )
+
+
+@configclass
+class URAnalyticalIKActionCfg(ActionTermCfg):
+    """Configuration for the analytical inverse kinematics action term of UR arms."""
+
+    @configclass
+    class OffsetCfg:
+        """The offset pose of one frame relative to another."""
+
+        pos: tuple[float, float, float] = (0.0, 0.0, 0.0)
+        """Translation w.r.t. the parent frame. Defaults to (0.0, 0.0, 0.0)."""
+        rot: tuple[float, float, float, float] = (1.0, 0.0, 0.0, 0.0)
+        """Quaternion rotation ``(w, x, y, z)`` w.r.t. the parent frame. Defaults to (1.0, 0.0, 0.0, 0.0)."""
+
+    class_type: type[ActionTerm] = URAnalyticalIKAction
+
+    joint_names: list[str] = MISSING
+    """List of the six arm joint names or regex expressions, from the shoulder pan to wrist 3."""
+
+    body_name: str = MISSING
+    """Name of the body whose pose is controlled."""
+
+    robot_type: str = MISSING
+    """Name of the arm in :data:`UR_DH_PARAMS`, e.g. ``"UR5e"``."""
+
+    body_offset: OffsetCfg | None = None
+    """Offset of the controlled frame from the body. Defaults to None, i.e. the body frame."""
+
+    base_offset: OffsetCfg = OffsetCfg(rot=(0.0, 0.0, 0.0, 1.0))
+    """Pose of the DH base frame in the root frame of the robot. Defaults to a 180 degree
+    rotation about the z-axis, as in the Universal Robots descriptions."""
+
+    flange_offset: OffsetCfg | None = None
+    """Pose of the body in the DH flange frame. Defaults to None, in which case it is
+    calibrated from the simulation on the first action."""
+
+    use_relative_mode: bool = False
+    """Whether the actions are deltas of the current pose. Defaults to False."""
+
+    scale: float | tuple[float, ...] = 1.0
+    """Scale factor of the actions. Defaults to 1.0."""
+
+    joint_weights: tuple[float, ...] | None = None
+    """Per-joint weights of the distance used to select the nearest branch. Defaults to None."""
+
+    respect_joint_limits: bool = True
+    """Whether to reject branches outside of the soft joint limits. Defaults to True."""
@@ -0,0 +1,219 @@
+"""Closed-form batched kinematics of the Universal Robots arm family.
+
+The forward and inverse kinematics follow the standard Denavit-Hartenberg parameters
+published by Universal Robots. All functions operate on batches of poses and joint
+configurations and only use element-wise tensor operations, so that the inverse
+kinematics of thousands of environments is solved without any iteration.
+
+Poses are expressed as homogeneous transforms of the flange (``tool0``) in the DH base
+frame of the arm. The DH base frame is rotated by 180 degrees about the z-axis with
+respect to the ``base_link`` frame used in the robot descriptions.
+"""
+
+from __future__ import annotations
+
+import math
+
+import torch
+
+UR_DH_PARAMS = {
+    "UR3e": {"d1": 0.15185, "a2": -0.24355, "a3": -0.2132, "d4": 0.13105, "d5": 0.08535, "d6": 0.0921},
+    "UR5e": {"d1": 0.1625, "a2": -0.425, "a3": -0.3922, "d4": 0.1333, "d5": 0.0997, "d6": 0.0996},
+    "UR10e": {"d1": 0.1807, "a2": -0.6127, "a3": -0.57155, "d4": 0.17415, "d5": 0.11985, "d6": 0.11655},
+    "UR16e": {"d1": 0.1807, "a2": -0.4784, "a3": -0.36, "d4": 0.17415, "d5": 0.11985, "d6": 0.11655},
+}
+"""Denavit-Hartenberg parameters of the Universal Robots e-Series arms (in m)."""
+
+
+def _dh_transform(
+    theta: torch.Tensor, d: float, a: float, alpha: float
+) -> torch.Tensor:
+    """Homogeneous transform of a single DH link. Shape is (..., 4, 4)."""
+    ct, st = torch.cos(theta), torch.sin(theta)
+    ca, sa = math.cos(alpha), math.sin(alpha)
+    zeros, ones = torch.zeros_like(theta), torch.ones_like(theta)
+    return torch.stack(
+        [
+            torch.stack([ct, -st * ca, st * sa, a * ct], dim=-1),
+            torch.stack([st, ct * ca, -ct * sa, a * st], dim=-1),
+            torch.stack([zeros, sa * ones, ca * ones, d * ones], dim=-1),
+            torch.stack([zeros, zeros, zeros, ones], dim=-1),
+        ],
+        dim=-2,
+    )
+
+
+def _invert_transform(transform: torch.Tensor) -> torch.Tensor:
+    """Inverse of rigid homogeneous transforms. Shape is (..., 4, 4)."""
+    rot_t = transform[..., :3, :3].transpose(-1, -2)
+    inverse = torch.zeros_like(transform)
+    inverse[..., :3, :3] = rot_t
+    inverse[..., :3, 3] = -(rot_t @ transform[..., :3, 3:]).squeeze(-1)
+    inverse[..., 3, 3] = 1.0
+    return inverse
+
+
+def _dh_table(params: dict[str, float]) -> list[tuple[float, float, float]]:
+    """List of (d, a, alpha) tuples of the six links."""
+    return [
+        (params["d1"], 0.0, math.pi / 2),
+        (0.0, params["a2"], 0.0),
+        (0.0, params["a3"], 0.0),
+        (params["d4"], 0.0, math.pi / 2),
+        (params["d5"], 0.0, -math.pi / 2),
+        (params["d6"], 0.0, 0.0),
+    ]
+
+
+def ur_forward_kinematics(joint_pos: torch.Tensor, params: dict[str, float]) -> torch.Tensor:
+    """Compute the pose of the flange in the DH base frame.
+
+    Parameters
+    ----------
+    joint_pos : torch.Tensor
+        Joint positions. Shape is (..., 6).
+    params : dict[str, float]
+        DH parameters, e.g. ``UR_DH_PARAMS["UR5e"]``.
+
+    Returns
+    -------
+    torch.Tensor
+        Homogeneous transforms of the flange. Shape is (..., 4, 4).
+    """
+    pose = None
+    for i, (d, a, alpha) in enumerate(_dh_table(params)):
+        link = _dh_transform(joint_pos[..., i], d, a, alpha)
+        pose = link if pose is None else pose @ link
+    return pose
+
+
+def ur_inverse_kinematics(
+    pose: torch.Tensor, params: dict[str, float], eps: float = 1e-6
+) -> tuple[torch.Tensor, torch.Tensor]:
+    """Compute all eight closed-form inverse kinematics solutions.
+
+    The branches are ordered by (shoulder, wrist, elbow), i.e. the branch index is
+    ``4 * shoulder + 2 * wrist + elbow``.
+
+    Parameters
+    ----------
+    pose : torch.Tensor
+        Homogeneous transforms of the flange in the DH base frame. Shape is (N, 4, 4).
+    params : dict[str, float]
+        DH parameters, e.g. ``UR_DH_PARAMS["UR5e"]``.
+    eps : float
+        Tolerance used to detect unreachable poses and wrist singularities.
+
+    Returns
+    -------
+    tuple[torch.Tensor, torch.Tensor]
+        Joint positions of shape (N, 8, 6) in the range [-pi, pi] and a boolean mask of
+        shape (N, 8) that is False for branches without an exact solution.
+    """
+    d1, a2, a3 = params["d1"], params["a2"], params["a3"]
+    d4, d5, d6 = params["d4"], params["d5"], params["d6"]
+    num = pose.shape[0]
+    pose = pose.unsqueeze(1).expand(num, 8, 4, 4)
+    signs = torch.tensor(
+        [[s, w, e] for s in (1.0, -1.0) for w in (1.0, -1.0) for e in (1.0, -1.0)],
+        dtype=pose.dtype,
+        device=pose.device,
+    )
+    shoulder, wrist, elbow = signs[:, 0], signs[:, 1], signs[:, 2]
+
+    rot = pose[..., :3, :3]
+    pos = pose[..., :3, 3]
+
+    # shoulder pan: the wrist center lies in a plane at distance d4 from the base axis
+    p05 = pos - d6 * rot[..., :, 2]
+    r05 = torch.sqrt(p05[..., 0] ** 2 + p05[..., 1] ** 2)
+    cos_1 = d4 / r05.clamp(min=eps)
+    valid = cos_1.abs() <= 1.0
+    theta1 = torch.atan2(p05[..., 1], p05[..., 0]) + shoulder * torch.acos(cos_1.clamp(-1.0, 1.0)) + math.pi / 2
+    s1, c1 = torch.sin(theta1), torch.cos(theta1)
+
+    # wrist 2
+    cos_5 = (pos[..., 0] * s1 - pos[..., 1] * c1 - d4) / d6
+    valid &= cos_5.abs() <= 1.0 + eps
+    theta5 = wrist * torch.acos(cos_5.clamp(-1.0, 1.0))
+    s5 = torch.sin(theta5)
+
+    # wrist 3: undefined at the wrist singularity, where the current value is arbitrary
+    singular = s5.abs() < eps
+    s5 = torch.where(singular, torch.ones_like(s5), s5)
+    # rows of the rotation are the axes of the base expressed in the flange frame
+    x_axis, y_axis = rot[..., 0, :], rot[..., 1, :]
+    theta6 = torch.atan2(
+        (-x_axis[..., 1] * s1 + y_axis[..., 1] * c1) / s5,
+        (x_axis[..., 0] * s1 - y_axis[..., 0] * c1) / s5,
+    )
+    theta6 = torch.where(singular, torch.zeros_like(theta6), theta6)
+
+    # planar 3R chain of shoulder lift, elbow and wrist 1
+    t01 = _dh_transform(theta1, d1, 0.0, math.pi / 2)
+    t45 = _dh_transform(theta5, d5, 0.0, -math.pi / 2)
+    t56 = _dh_transform(theta6, d6, 0.0, 0.0)
+    t14 = _invert_transform(t01) @ pose @ _invert_transform(t45 @ t56)
+    p13 = t14[..., :3, 3] - d4 * t14[..., :3, 1]
+    r13_sq = p13[..., 0] ** 2 + p13[..., 1] ** 2
+    cos_3 = (r13_sq - a2**2 - a3**2) / (2.0 * a2 * a3)
+    valid &= cos_3.abs() <= 1.0 + eps
+    theta3 = elbow * torch.acos(cos_3.clamp(-1.0, 1.0))
+    theta2 = torch.atan2(p13[..., 1], p13[..., 0]) - torch.atan2(
+        a3 * torch.sin(theta3), a2 + a3 * torch.cos(theta3)
+    )
+    theta4 = torch.atan2(t14[..., 1, 0], t14[..., 0, 0]) - theta2 - theta3
+
+    joint_pos = torch.stack([theta1, theta2, theta3, theta4, theta5, theta6], dim=-1)
+    joint_pos = torch.atan2(torch.sin(joint_pos), torch.cos(joint_pos))
+    return joint_pos, valid
+
+
+def select_nearest_branch(
+    solutions: torch.Tensor,
+    valid: torch.Tensor,
+    joint_pos: torch.Tensor,
+    joint_pos_limits: torch.Tensor | None = None,
+    weights: torch.Tensor | None = None,
+) -> tuple[torch.Tensor, torch.Tensor]:
+    """Select the inverse kinematics branch closest to the current joint positions.
+
+    Each solution is first unwrapped to the multiple of 2*pi closest to the current
+    joint positions, so that continuous joints do not jump by a full revolution.
+
+    Parameters
+    ----------
+    solutions : torch.Tensor
+        Joint positions of all branches. Shape is (N, B, 6).
+    valid : torch.Tensor
+        Mask of the valid branches. Shape is (N, B).
+    joint_pos : torch.Tensor
+        Current joint positions. Shape is (N, 6).
+    joint_pos_limits : torch.Tensor | None
+        Joint position limits. Shape is (N, 6, 2). Branches outside of them are rejected.
+    weights : torch.Tensor | None
+        Per-joint weights of the distance. Shape is (6,). Defaults to ones.
+
+    Returns
+    -------
+    tuple[torch.Tensor, torch.Tensor]
+        Selected joint positions of shape (N, 6) and a boolean mask of shape (N,) that
+        is False where no branch is valid. In that case the current joint positions
+        are returned.
+    """
+    current = joint_pos.unsqueeze(1)
+    delta = solutions - current
+    delta = torch.atan2(torch.sin(delta), torch.cos(delta))
+    candidates = current + delta
+    if joint_pos_limits is not None:
+        lower = joint_pos_limits[..., 0].unsqueeze(1)
+        upper = joint_pos_limits[..., 1].unsqueeze(1)
+        valid = valid & ((candidates >= lower) & (candidates <= upper)).all(dim=-1)
+    if weights is not None:
+        delta = delta * weights
+    distance = torch.where(valid, torch.sum(delta**2, dim=-1), torch.full_like(delta[..., 0], float("inf")))
+    best = torch.argmin(distance, dim=-1)
+    selected = candidates[torch.arange(candidates.shape[0], device=candidates.device), best]
+    success = valid.any(dim=-1)
+    selected = torch.where(success.unsqueeze(-1), selected, joint_pos)
+    return selected, success
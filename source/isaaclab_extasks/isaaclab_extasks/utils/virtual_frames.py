@@ -0,0 +1,78 @@
+"""Virtual frames attached to scene assets.
+
+A virtual frame is a pose defined relative to the root of a parent asset. It is not
+spawned in the stage and adds no body to the physics solver; its world pose is
+computed on demand from the parent pose. Virtual frames are declared in the
+``virtual_frames`` attribute of the environment configuration and can be used
+wherever terms need goal or reference frames.
+"""
+
+from __future__ import annotations
+
+from dataclasses import MISSING
+from typing import TYPE_CHECKING
+
+import torch
+from isaaclab.utils import configclass
+from isaaclab.utils.math import combine_frame_transforms
+
+from .static_colliders import asset_root_pose
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedEnv
+
+
+@configclass
+class VirtualFrameCfg:
+    """Configuration of a frame attached to a scene asset."""
+
+    parent_name: str = MISSING
+    """Name of the asset in the scene the frame is attached to."""
+
+    pos: tuple[float, float, float] = (0.0, 0.0, 0.0)
+    """Translation w.r.t. the root frame of the parent asset. Defaults to (0.0, 0.0, 0.0)."""
+
+    rot: tuple[float, float, float, float] = (1.0, 0.0, 0.0, 0.0)
+    """Quaternion rotation ``(w, x, y, z)`` w.r.t. the root frame of the parent asset. Defaults to (1.0, 0.0, 0.0, 0.0)."""
+
+
+def virtual_frame_pose(env: ManagerBasedEnv, frame_name: str) -> tuple[torch.Tensor, torch.Tensor]:
+    """Compute the world pose of a virtual frame.
+
+    Parameters
+    ----------
+    env : ManagerBasedEnv
+        The environment. Its configuration must declare the frame in ``virtual_frames``.
+    frame_name : str
+        Name of the virtual frame.
+
+    Returns
+    -------
+    tuple[torch.Tensor, torch.Tensor]
+        Positions of shape (num_envs, 3) and quaternions (w, x, y, z) of shape (num_envs, 4) in the world frame.
+    """
+    frame_cfg: VirtualFrameCfg = env.cfg.virtual_frames[frame_name]
+    parent_pos_w, parent_quat_w = asset_root_pose(env, frame_cfg.parent_name)
+    offset_pos = torch.tensor(frame_cfg.pos, device=env.device).expand(env.num_envs, 3)
+    offset_rot = torch.tensor(frame_cfg.rot, device=env.device).expand(env.num_envs, 4)
+    return combine_frame_transforms(parent_pos_w, parent_quat_w, offset_pos, offset_rot)
+
+
+def frame_pose(env: ManagerBasedEnv, name: str) -> tuple[torch.Tensor, torch.Tensor]:
+    """Compute the world pose of a virtual frame or of the root of a scene asset.
+
+    Parameters
+    ----------
+    env : ManagerBasedEnv
+        The environment.
+    name : str
+        Name of a virtual frame or of an entity in the scene.
+
+    Returns
+    -------
+    tuple[torch.Tensor, torch.Tensor]
+        Positions of shape (num_envs, 3) and quaternions (w, x, y, z) of shape (num_envs, 4) in the world frame.
+    """
+    if name in getattr(env.cfg, "virtual_frames", {}):
+        return virtual_frame_pose(env, name)
+    return asset_root_pose(env, name)
@@ -0,0 +1,80 @@
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import dataclasses
+import os
+
+import pytest
+
+from isaaclab_exassets.mirror import dependency_url, mirror_path, resolve_cfg_assets
+
+NUCLEUS = "omniverse://localhost/NVIDIA/Assets"
+
+
+@dataclasses.dataclass
+class _SpawnCfg:
+    usd_path: str
+    textures: list
+
+
+@dataclasses.dataclass
+class _SceneCfg:
+    table: _SpawnCfg
+    objects: dict
+    local_path: str = "/data/Props/table.usd"
+
+
+def _mirror(mirror_dir: str, url: str):
+    path = mirror_path(url, mirror_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    open(path, "w").close()
+
+
+def test_mirror_path_keeps_the_host_and_path():
+    """Remote files are mirrored under their host and unquoted path."""
+    assert mirror_path(f"{NUCLEUS}/Props/Mug%20Blue.usd", "/mirror") == (
+        "/mirror/localhost/NVIDIA/Assets/Props/Mug Blue.usd"
+    )
+    assert mirror_path("s3://bucket/Props/mug.usd", "/mirror") == "/mirror/bucket/Props/mug.usd"
+
+
+def test_dependency_url_resolves_against_the_layer():
+    """Relative and server-absolute paths authored in a remote layer resolve on the server of the layer."""
+    layer_url = f"{NUCLEUS}/Props/Mug/mug.usd?checkpoint=1"
+    assert dependency_url(layer_url, "./textures/albedo.png") == f"{NUCLEUS}/Props/Mug/textures/albedo.png"
+    assert dependency_url(layer_url, "../Materials/mug.mdl") == f"{NUCLEUS}/Props/Materials/mug.mdl"
+    assert dependency_url(layer_url, "/NVIDIA/Materials/base.mdl") == "omniverse://localhost/NVIDIA/Materials/base.mdl"
+    # remote paths are kept as they are
+    assert dependency_url(layer_url, "https://example.com/a.usd") == "https://example.com/a.usd"
+
+
+def test_resolve_cfg_assets_replaces_the_mirrored_paths(tmp_path, monkeypatch):
+    """Mirrored paths are replaced in nested configurations and the other remote paths are reported."""
+    monkeypatch.delenv("ISAACLAB_ASSET_OFFLINE", raising=False)
+    mirror_dir = str(tmp_path)
+    _mirror(mirror_dir, f"{NUCLEUS}/Props/table.usd")
+    _mirror(mirror_dir, f"{NUCLEUS}/Props/wood.png")
+    cfg = _SceneCfg(
+        table=_SpawnCfg(usd_path=f"{NUCLEUS}/Props/table.usd", textures=[f"{NUCLEUS}/Props/wood.png"]),
+        objects={"mug": _SpawnCfg(usd_path=f"{NUCLEUS}/Props/mug.usd", textures=[])},
+    )
+    missing = resolve_cfg_assets(cfg, mirror_dir)
+    assert missing == [f"{NUCLEUS}/Props/mug.usd"]
+    assert cfg.table.usd_path == mirror_path(f"{NUCLEUS}/Props/table.usd", mirror_dir)
+    assert cfg.table.textures == [mirror_path(f"{NUCLEUS}/Props/wood.png", mirror_dir)]
+    assert cfg.objects["mug"].usd_path == f"{NUCLEUS}/Props/mug.usd"
+    assert cfg.local_path == "/data/Props/table.usd"
+
+
+def test_resolve_cfg_assets_raises_offline(tmp_path, monkeypatch):
+    """Offline runs fail on remote paths that are not mirrored instead of reaching the network."""
+    monkeypatch.setenv("ISAACLAB_ASSET_OFFLINE", "1")
+    cfg = _SceneCfg(table=_SpawnCfg(usd_path=f"{NUCLEUS}/Props/table.usd", textures=[]), objects={})
+    with pytest.raises(FileNotFoundError, match="not mirrored"):
+        resolve_cfg_assets(cfg, str(tmp_path))
@@ -0,0 +1,146 @@
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import json
+import os
+import sys
+import urllib.request
+
+import pytest
+import yaml
+
+# the completion backends are part of the scene construction scripts
+SCRIPTS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "scripts"))
+sys.path.insert(0, SCRIPTS_DIR)
+
+from completion_backend import (  # noqa: E402
+    CachedBackend,
+    CompletionBackend,
+    LocalBackend,
+    export_rules,
+    json_example,
+    serve_completions,
+)
+
+PROMPT = """Place the objects of a kitchen scene.
+Answer in the format:
+```json
+{"objects": [{"name": "mug", "support": "table"}]}
+```"""
+
+
+class _CountingBackend(CompletionBackend):
+    """Backend that answers with the number of its calls."""
+
+    def __init__(self):
+        self.calls = 0
+        self.kwargs = None
+
+    def complete(self, messages: list[dict], model: str, **kwargs) -> str:
+        self.calls += 1
+        self.kwargs = kwargs
+        return f"response {self.calls}"
+
+
+def _messages(prompt: str) -> list[dict]:
+    return [{"role": "system", "content": "You design scenes."}, {"role": "user", "content": prompt}]
+
+
+def _write_rules(tmp_path, rules_cfg: dict) -> str:
+    path = os.path.join(tmp_path, "rules.yaml")
+    with open(path, "w") as f:
+        yaml.safe_dump(rules_cfg, f)
+    return path
+
+
+def test_json_example_prefers_fenced_blocks():
+    """The output format is read from the last fenced JSON block, else from the last JSON value of the text."""
+    assert json.loads(json_example(PROMPT)) == {"objects": [{"name": "mug", "support": "table"}]}
+    text = 'Use {name} placeholders. Answer as [{"name": "cup"}, {"name": "plate"}] or {"name": "bowl"}.'
+    assert json_example(text) == '{"name": "bowl"}'
+    assert json_example("Name three objects of a kitchen.") is None
+
+
+def test_local_rules_are_matched_in_order(tmp_path):
+    """The first matching rule answers and the groups of its match fill the response."""
+    with open(os.path.join(tmp_path, "table.json"), "w") as f:
+        f.write('{"objects": ["table"]}')
+    rules_path = _write_rules(
+        tmp_path,
+        {
+            "rules": [
+                {"match": r"(?i)place (?:a|an) (\w+) on the (\w+)", "response": '{{"{0}": "{1}"}}'},
+                {"match": r"(?i)place", "response": '{"objects": []}'},
+                {"match": r"(?i)table", "file": "table.json"},
+            ]
+        },
+    )
+    backend = LocalBackend(rules_path)
+    assert backend.complete(_messages("Place a mug on the table."), "gpt-4") == '{{"mug": "table"}}'
+    # responses of patterns without groups are returned as written
+    assert backend.complete(_messages("Place the cups."), "gpt-4") == '{"objects": []}'
+    assert backend.complete(_messages("Describe the table."), "gpt-4") == '{"objects": ["table"]}'
+    with pytest.raises(ValueError, match="no default"):
+        backend.complete(_messages("Describe the kitchen."), "gpt-4")
+
+
+def test_shipped_rules_answer_with_the_output_format():
+    """The shipped rules answer every prompt with a JSON example in the format of the prompt."""
+    backend = LocalBackend(os.path.join(SCRIPTS_DIR, "configs", "local_completion_rules.yaml"))
+    response = backend.complete(_messages(PROMPT), "gpt-4")
+    assert json.loads(response) == {"objects": [{"name": "mug", "support": "table"}]}
+    # deterministic
+    assert backend.complete(_messages(PROMPT), "gpt-4", temperature=1.0) == response
+    with pytest.raises(ValueError, match="JSON example"):
+        backend.complete(_messages("Name three objects of a kitchen."), "gpt-4")
+
+
+def test_cache_answers_identical_requests(tmp_path):
+    """Identical requests are answered from the cache, requests of other seeds are not."""
+    counting = _CountingBackend()
+    backend = CachedBackend(counting, str(tmp_path))
+    first = backend.complete(_messages(PROMPT), "gpt-4", temperature=0.0)
+    assert backend.complete(_messages(PROMPT), "gpt-4", temperature=0.0) == first
+    assert (backend.hits, backend.misses, counting.calls) == (1, 1, 1)
+    assert backend.complete(_messages(PROMPT), "gpt-4", temperature=0.0, seed=1) != first
+    assert backend.complete(_messages(PROMPT), "gpt-4-turbo", temperature=0.0) != first
+    assert counting.calls == 3
+    # the entries persist across backends
+    backend = CachedBackend(_CountingBackend(), str(tmp_path))
+    assert backend.complete(_messages(PROMPT), "gpt-4", temperature=0.0) == first
+
+
+def test_recorded_responses_are_replayed(tmp_path):
+    """Responses recorded in a cache are exported as exact-match rules of the local backend."""
+    cache_dir = os.path.join(tmp_path, "cache")
+    CachedBackend(_CountingBackend(), cache_dir).complete(_messages("Place a mug (and a cup)."), "gpt-4")
+    rules_path = os.path.join(tmp_path, "recorded.yaml")
+    assert export_rules(cache_dir, rules_path) == 1
+    backend = LocalBackend(rules_path)
+    assert backend.complete(_messages("Place a mug (and a cup)."), "gpt-4") == "response 1"
+    assert json.loads(backend.complete(_messages(PROMPT), "gpt-4"))["objects"][0]["name"] == "mug"
+
+
+def test_served_backend_answers_chat_completions():
+    """The local endpoint answers chat completion requests and is set as the endpoint of the OpenAI clients."""
+    previous = os.environ.get("OPENAI_BASE_URL")
+    counting = _CountingBackend()
+    with serve_completions(counting, seed=3) as base_url:
+        assert os.environ["OPENAI_BASE_URL"] == base_url
+        request = urllib.request.Request(
+            f"{base_url}/chat/completions",
+            data=json.dumps({"model": "gpt-4", "messages": _messages(PROMPT)}).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+        )
+        with urllib.request.urlopen(request, timeout=10) as response:
+            completion = json.load(response)
+    assert completion["object"] == "chat.completion"
+    assert completion["choices"][0]["message"] == {"role": "assistant", "content": "response 1"}
+    assert counting.kwargs == {"seed": 3}
+    assert os.environ.get("OPENAI_BASE_URL") == previous
@@ -0,0 +1,144 @@
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+from types import SimpleNamespace
+
+import pytest
+import torch
+
+from isaaclab_extasks.utils.mixed_robots import (
+    EmbodimentArticulation,
+    MixedJointPositionAction,
+    assign_env_groups,
+    embodiment_id,
+    mixed_joint_pos,
+    mixed_joint_vel_l2,
+)
+
+WEIGHTS = {"Franka": 3.0, "UR5e": 2.0}
+NUM_ENVS = 5
+
+
+class _Embodiment(EmbodimentArticulation):
+    """Robot of an env group whose joint data are given as tensors."""
+
+    data = None
+    device = "cpu"
+
+    def __init__(self, name: str, num_joints: int, arm_joint_ids: list[int], gripper_joint_ids: list[int]):
+        self.cfg = SimpleNamespace(embodiment_name=name, embodiment_weights=WEIGHTS)
+        env_ids = assign_env_groups(NUM_ENVS, WEIGHTS)[name]
+        # the mapping of the env ids to the instances, as built when the robot is initialized
+        self._env_ids = torch.tensor(env_ids)
+        self._instance_ids = torch.full((env_ids[-1] + 1,), -1, dtype=torch.long)
+        self._instance_ids[self._env_ids] = torch.arange(len(env_ids))
+        self._ALL_INDICES = torch.arange(len(env_ids))
+        self._arm_joint_ids, self._gripper_joint_ids = arm_joint_ids, gripper_joint_ids
+        # joint i of instance k is at 10 * (env id + 1) + i
+        joint_pos = 10.0 * (self._env_ids.unsqueeze(-1) + 1) + torch.arange(num_joints, dtype=torch.float)
+        self.data = SimpleNamespace(
+            joint_pos=joint_pos, joint_vel=torch.ones(len(env_ids), num_joints), default_joint_pos=joint_pos.clone()
+        )
+        self.targets = None
+
+    def set_joint_position_target(self, target: torch.Tensor, joint_ids: list[int] | None = None):
+        self.targets = (target.clone(), joint_ids)
+
+
+def _env() -> SimpleNamespace:
+    franka = _Embodiment("Franka", 9, list(range(7)), [7, 8])
+    ur5e = _Embodiment("UR5e", 7, list(range(6)), [6])
+    # the articulations of the scene are not ordered by embodiment
+    articulations = {"robot_ur5e": ur5e, "robot_franka": franka}
+    return SimpleNamespace(num_envs=NUM_ENVS, device="cpu", scene=SimpleNamespace(articulations=articulations))
+
+
+def test_env_groups_follow_the_weights():
+    """The envs are split into contiguous groups, in the order of the weights, with proportional sizes."""
+    assert assign_env_groups(10, {"A": 1.0, "B": 1.0}) == {"A": [0, 1, 2, 3, 4], "B": [5, 6, 7, 8, 9]}
+    groups = assign_env_groups(100, {"A": 3.0, "B": 1.0})
+    assert groups == {"A": list(range(75)), "B": list(range(75, 100))}
+    # weights need not sum to one
+    assert assign_env_groups(4, {"A": 0.25, "B": 0.75}) == assign_env_groups(4, {"A": 1.0, "B": 3.0})
+
+
+def test_env_groups_round_by_the_largest_remainders():
+    """The envs left by rounding down go to the groups with the largest remainders."""
+    groups = assign_env_groups(7, {"A": 0.5, "B": 0.3, "C": 0.2})
+    assert {name: len(env_ids) for name, env_ids in groups.items()} == {"A": 4, "B": 2, "C": 1}
+    groups = assign_env_groups(10, {"A": 1.0, "B": 1.0, "C": 1.0})
+    assert sorted(len(env_ids) for env_ids in groups.values()) == [3, 3, 4]
+    # every env belongs to exactly one group
+    generator = torch.Generator().manual_seed(0)
+    for num_envs in [17, 64, 1001]:
+        weights = {str(i): weight for i, weight in enumerate((torch.rand(3, generator=generator) + 0.5).tolist())}
+        groups = assign_env_groups(num_envs, weights)
+        assert sum(groups.values(), []) == list(range(num_envs))
+        for name, env_ids in groups.items():
+            assert abs(len(env_ids) - num_envs * weights[name] / sum(weights.values())) < 1.0
+
+
+def test_env_groups_without_envs_raise():
+    """A group that gets no env fails early."""
+    with pytest.raises(ValueError, match="No envs are left"):
+        assign_env_groups(2, {"A": 1.0, "B": 1.0, "C": 1.0})
+
+
+def test_local_env_ids_mask_the_other_groups():
+    """Env ids are mapped to the instances of the group and the envs of the other groups are dropped."""
+    env = _env()
+    franka, ur5e = env.scene.articulations["robot_franka"], env.scene.articulations["robot_ur5e"]
+    instance_ids, env_ids = ur5e.local_env_ids([0, 3, 4])
+    assert instance_ids.tolist() == [0, 1] and env_ids.tolist() == [3, 4]
+    # env ids past the last env of the group
+    instance_ids, env_ids = franka.local_env_ids(torch.tensor([1, 4]))
+    assert instance_ids.tolist() == [1] and env_ids.tolist() == [1]
+    instance_ids, env_ids = franka.local_env_ids(None)
+    assert instance_ids.tolist() == [0, 1, 2] and env_ids.tolist() == [0, 1, 2]
+
+
+def test_observations_are_padded():
+    """The per-robot joint data are gathered into zero-padded columns of all envs."""
+    env = _env()
+    arm_pos = mixed_joint_pos(env, "arm")
+    assert arm_pos.shape == (NUM_ENVS, 7)
+    expected = 10.0 * (torch.arange(NUM_ENVS, dtype=torch.float).unsqueeze(-1) + 1) + torch.arange(7.0)
+    expected[3:, 6] = 0.0
+    torch.testing.assert_close(arm_pos, expected)
+    gripper_pos = mixed_joint_pos(env, "gripper")
+    torch.testing.assert_close(gripper_pos[:3], expected[:3, :2] + 7.0)
+    torch.testing.assert_close(gripper_pos[3:], torch.tensor([[46.0, 0.0], [56.0, 0.0]]))
+    # one-hot embodiment in the order of the weights
+    torch.testing.assert_close(embodiment_id(env), torch.tensor([[1.0, 0.0]] * 3 + [[0.0, 1.0]] * 2))
+    # the padded joints do not add to the penalty
+    torch.testing.assert_close(mixed_joint_vel_l2(env), torch.tensor([9.0, 9.0, 9.0, 7.0, 7.0]))
+
+
+@pytest.mark.parametrize("use_default_offset", [False, True])
+def test_actions_use_the_leading_columns(use_default_offset):
+    """Each robot is driven by the leading action columns of its joints in the envs of its group."""
+    env = _env()
+    action = MixedJointPositionAction.__new__(MixedJointPositionAction)
+    action.cfg = SimpleNamespace(scale=0.5, use_default_offset=use_default_offset)
+    action._assets = [env.scene.articulations["robot_franka"], env.scene.articulations["robot_ur5e"]]
+    action._joint_ids = [asset.joint_ids("arm") for asset in action._assets]
+    action._raw_actions = torch.zeros(NUM_ENVS, 7)
+    action._processed_actions = torch.zeros(NUM_ENVS, 7)
+    actions = torch.arange(NUM_ENVS * 7, dtype=torch.float).reshape(NUM_ENVS, 7)
+    action.process_actions(actions)
+    action.apply_actions()
+    for asset, env_ids, num_joints in zip(action._assets, [slice(0, 3), slice(3, 5)], [7, 6]):
+        targets, joint_ids = asset.targets
+        expected = 0.5 * actions[env_ids, :num_joints]
+        if use_default_offset:
+            expected += asset.data.default_joint_pos[:, :num_joints]
+        torch.testing.assert_close(targets, expected)
+        assert joint_ids == list(range(num_joints))
+    action.reset(torch.tensor([1, 4]))
+    assert action.raw_actions[[1, 4]].abs().sum() == 0.0
@@ -0,0 +1,184 @@
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+from types import SimpleNamespace
+
+import isaaclab.sim as sim_utils
+import pytest
+import torch
+from isaaclab.assets import AssetBaseCfg, RigidObjectCfg
+from isaaclab.managers import EventTermCfg as EventTerm
+from isaaclab.managers import ObservationGroupCfg as ObsGroup
+from isaaclab.managers import ObservationTermCfg as ObsTerm
+from isaaclab.managers import RewardTermCfg as RewTerm
+from isaaclab.scene import InteractiveSceneCfg
+from isaaclab.utils import configclass
+
+from isaaclab_extasks.utils.multi_task import EnvGroupSpawnerCfg, apply_multi_task
+
+RED_POS_STACK = (0.5, 0.0, 0.05)
+RED_POS_SORT = (0.4, -0.2, 0.05)
+
+
+def _block(color: str, pos: tuple) -> RigidObjectCfg:
+    return RigidObjectCfg(
+        prim_path=f"{{ENV_REGEX_NS}}/{color}Block",
+        spawn=sim_utils.CuboidCfg(size=(0.05, 0.05, 0.05)),
+        init_state=RigidObjectCfg.InitialStateCfg(pos=pos),
+    )
+
+
+def _ones(env) -> torch.Tensor:
+    return torch.ones(env.num_envs, 2)
+
+
+def _progress(env, offset: float) -> torch.Tensor:
+    return torch.full((env.num_envs,), offset)
+
+
+def _record(env, env_ids: torch.Tensor):
+    env.calls.append(env_ids.tolist())
+
+
+@configclass
+class _SceneCfg(InteractiveSceneCfg):
+    table = AssetBaseCfg(prim_path="{ENV_REGEX_NS}/Table", spawn=sim_utils.CuboidCfg(size=(1.0, 1.0, 0.1)))
+    red_block = _block("Red", RED_POS_STACK)
+
+
+@configclass
+class _ObservationsCfg:
+    @configclass
+    class PolicyCfg(ObsGroup):
+        ones = ObsTerm(func=_ones)
+
+    policy: PolicyCfg = PolicyCfg()
+
+
+@configclass
+class _RewardsCfg:
+    progress = RewTerm(func=_progress, weight=1.0, params={"offset": 1.0})
+
+
+@configclass
+class _TerminationsCfg:
+    pass
+
+
+@configclass
+class _EventsCfg:
+    reset = EventTerm(func=_record, mode="reset")
+
+
+@configclass
+class _TaskCfg:
+    scene: _SceneCfg = _SceneCfg(num_envs=4, env_spacing=2.0)
+    observations: _ObservationsCfg = _ObservationsCfg()
+    rewards: _RewardsCfg = _RewardsCfg()
+    terminations: _TerminationsCfg = _TerminationsCfg()
+    events: _EventsCfg = _EventsCfg()
+
+
+def _stack_cfg() -> _TaskCfg:
+    cfg = _TaskCfg()
+    cfg.scene.blue_block = _block("Blue", (0.5, 0.1, 0.05))
+    # the target block is an alias of one of the blocks
+    cfg.scene.target_object = cfg.scene.red_block
+    return cfg
+
+
+def _sort_cfg() -> _TaskCfg:
+    cfg = _TaskCfg()
+    cfg.scene.red_block = _block("Red", RED_POS_SORT)
+    cfg.scene.green_block = _block("Green", (0.4, 0.2, 0.05))
+    cfg.scene.bin = AssetBaseCfg(prim_path="{ENV_REGEX_NS}/Bin", spawn=sim_utils.CuboidCfg(size=(0.2, 0.2, 0.05)))
+    cfg.rewards.progress.params = {"offset": 2.0}
+    cfg.events.shuffle = EventTerm(func=_record, mode="reset")
+    return cfg
+
+
+def _pose(pos: tuple) -> tuple:
+    return tuple(pos) + (1.0, 0.0, 0.0, 0.0)
+
+
+def test_scenes_are_merged():
+    """The scene is the union of the task scenes and the props of some tasks are spawned in their envs only."""
+    env_cfg = _stack_cfg()
+    apply_multi_task(env_cfg, {"stack": env_cfg, "sort": _sort_cfg()})
+    scene = env_cfg.scene
+    for name in ["table", "red_block", "blue_block", "target_object", "green_block", "bin", "parking_shelf"]:
+        assert getattr(scene, name) is not None
+    assert not scene.replicate_physics
+    assert isinstance(scene.table.spawn, sim_utils.CuboidCfg)
+    assert isinstance(scene.bin.spawn, EnvGroupSpawnerCfg)
+    assert scene.bin.spawn.group_names == ["sort"]
+    assert scene.bin.spawn.group_weights == {"stack": 1.0, "sort": 1.0}
+    # the merged scene keeps the poses of the first task
+    assert scene.red_block.init_state.pos == RED_POS_STACK
+
+
+def test_entities_must_be_shared_consistently():
+    """Entities of the same name must be configured the same way by all tasks, up to the pose of objects."""
+    stack_cfg, sort_cfg = _stack_cfg(), _sort_cfg()
+    sort_cfg.scene.table = sort_cfg.scene.table.replace(spawn=sim_utils.CuboidCfg(size=(2.0, 1.0, 0.1)))
+    with pytest.raises(ValueError, match="'table' differently"):
+        apply_multi_task(stack_cfg, {"stack": stack_cfg, "sort": sort_cfg})
+    stack_cfg = _stack_cfg()
+    with pytest.raises(ValueError, match="Expected weights"):
+        apply_multi_task(stack_cfg, {"stack": stack_cfg, "sort": _sort_cfg()}, {"sort": 1.0, "stack": 1.0})
+
+
+@pytest.mark.parametrize("stack_first", [True, False])
+def test_unused_objects_are_parked(stack_first):
+    """Objects are parked in the envs of the tasks that do not use their prim, one place per prim."""
+    stack_cfg, sort_cfg = _stack_cfg(), _sort_cfg()
+    task_cfgs = {"stack": stack_cfg, "sort": sort_cfg} if stack_first else {"sort": sort_cfg, "stack": stack_cfg}
+    env_cfg = next(iter(task_cfgs.values()))
+    apply_multi_task(env_cfg, task_cfgs)
+    default_poses = env_cfg.events.task_default_states.params["default_poses"]
+    stack_poses = {**default_poses["stack"]}
+    sort_poses = {**default_poses["sort"]}
+    # the target block is the red block, which the sort task places elsewhere and does not park
+    assert sort_poses.pop("target_object") == pytest.approx(_pose(RED_POS_SORT))
+    if stack_first:
+        assert sort_poses.pop("red_block") == pytest.approx(_pose(RED_POS_SORT))
+    else:
+        assert stack_poses.pop("red_block") == pytest.approx(_pose(RED_POS_STACK))
+    # one place on the shelf per parked prim
+    parked = {name: pose for poses in (stack_poses, sort_poses) for name, pose in poses.items()}
+    assert set(parked) == {"blue_block", "green_block"}
+    assert set(sort_poses) == {"blue_block"}
+    assert sorted(pose[1] for pose in parked.values()) == pytest.approx([0.0, 0.3])
+    assert all(pose[0] == pytest.approx(-1.2) and pose[2] == pytest.approx(-0.2) for pose in parked.values())
+    assert env_cfg.scene.parking_shelf.spawn.size == pytest.approx((0.3, 0.6, 0.02))
+
+
+def test_terms_are_merged_by_name():
+    """Shared terms are kept and the others apply only to the envs of their tasks."""
+    env_cfg = _stack_cfg()
+    apply_multi_task(env_cfg, {"stack": env_cfg, "sort": _sort_cfg()})
+    env = SimpleNamespace(num_envs=4, device="cpu", calls=[])
+    # the terms that all tasks configure the same way are not wrapped
+    assert env_cfg.observations.policy.ones.func is _ones
+    assert env_cfg.events.reset.func is _record
+    assert env_cfg.observations.policy.task_id.func(env, **env_cfg.observations.policy.task_id.params).tolist() == [
+        [1.0, 0.0],
+        [1.0, 0.0],
+        [0.0, 1.0],
+        [0.0, 1.0],
+    ]
+    # conflicting terms are suffixed with the task and masked
+    assert env_cfg.rewards.progress is None
+    progress_stack, progress_sort = env_cfg.rewards.progress_stack, env_cfg.rewards.progress_sort
+    assert progress_stack.func(env, **progress_stack.params).tolist() == [1.0, 1.0, 0.0, 0.0]
+    assert progress_sort.func(env, **progress_sort.params).tolist() == [0.0, 0.0, 2.0, 2.0]
+    # events of some tasks receive the env ids of their groups only
+    env_cfg.events.shuffle.func(env, torch.tensor([0, 1, 3]))
+    env_cfg.events.shuffle.func(env, torch.tensor([0, 1]))
+    assert env.calls == [[3]]
@@ -0,0 +1,57 @@
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import pytest
+import torch
+
+from isaaclab_extasks.utils.reset_rng import ResetRNG, philox, seeded_index
+
+MASK_32 = 0xFFFFFFFF
+
+
+@pytest.mark.parametrize(
+    "counter, key, expected",
+    [
+        ((0, 0, 0, 0), (0, 0), (0x6627E8D5, 0xE169C58D, 0xBC57AC4C, 0x9B00DBD8)),
+        ((MASK_32,) * 4, (MASK_32, MASK_32), (0x408F276D, 0x41C83B0E, 0xA20BC7C6, 0x6D5451FD)),
+        (
+            (0x243F6A88, 0x85A308D3, 0x13198A2E, 0x03707344),
+            (0xA4093822, 0x299F31D0),
+            (0xD16CFE09, 0x94FDCCEB, 0x5001E420, 0x24126EA1),
+        ),
+    ],
+)
+def test_philox_matches_the_known_answers(counter, key, expected):
+    """The bijection is Philox-4x32-10 as published with Random123."""
+    assert philox(torch.tensor([counter]), key)[0].tolist() == list(expected)
+    # batched counters are mapped independently
+    counters = torch.tensor([[0, 1, 2, 3], counter, [4, 5, 6, 7]])
+    assert philox(counters, key)[1].tolist() == list(expected)
+
+
+def test_draws_do_not_depend_on_the_other_envs():
+    """The draws of an env depend on the seed, its id and its episode, not on the envs reset with it."""
+    lower, upper = torch.zeros(3), torch.ones(3)
+    rng = ResetRNG(seed=7, num_envs=4, device="cpu")
+    rng.advance(torch.arange(4), 0, "pose")
+    together = rng.uniform(torch.tensor([0, 2, 3]), lower, upper, "pose")
+    rng = ResetRNG(seed=7, num_envs=4, device="cpu")
+    rng.advance(torch.tensor([2]), 0, "pose")
+    torch.testing.assert_close(rng.uniform(torch.tensor([2]), lower, upper, "pose"), together[1:2])
+    assert ((together >= 0.0) & (together < 1.0)).all()
+    # the next episode and other streams draw other values
+    rng.advance(torch.tensor([2]), 1, "pose")
+    assert not torch.equal(rng.uniform(torch.tensor([2]), lower, upper, "pose"), together[1:2])
+    assert not torch.equal(rng.uniform(torch.tensor([2]), lower, upper, "velocity"), together[1:2])
+
+
+def test_seeded_index_is_reproducible():
+    """Choices of the configurations are fixed by the seed."""
+    assert seeded_index(3, "target", 5) == seeded_index(3, "target", 5)
+    assert {seeded_index(seed, "target", 5) for seed in range(32)} == set(range(5))
@@ -0,0 +1,63 @@
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+from types import SimpleNamespace
+
+import torch
+from isaaclab.managers import TerminationTermCfg
+
+from isaaclab_extasks.utils.reset_scheduler import StaggeredTimeOut
+
+
+def _time_out(num_envs: int = 8, **params) -> tuple[StaggeredTimeOut, SimpleNamespace]:
+    env = SimpleNamespace(
+        num_envs=num_envs,
+        device="cpu",
+        max_episode_length=100,
+        episode_length_buf=torch.zeros(num_envs, dtype=torch.long),
+        common_step_counter=0,
+        extras={},
+    )
+    return StaggeredTimeOut(TerminationTermCfg(func=StaggeredTimeOut, params=params), env), env
+
+
+def test_time_outs_above_the_cap_are_deferred():
+    """Only the longest overdue envs time out when more envs than the cap are due."""
+    term, env = _time_out(max_resets_per_step=2, initial_length_range=(1.0, 1.0))
+    env.episode_length_buf[:] = torch.tensor([100, 103, 101, 99, 103, 100, 0, 0])
+    assert term(env).nonzero().flatten().tolist() == [1, 4]
+    # the deferred envs are due in the next step
+    env.episode_length_buf[[1, 4]] = 0
+    env.episode_length_buf[[0, 2, 5]] += 1
+    assert term(env).nonzero().flatten().tolist() == [0, 2]
+
+
+def test_deferral_is_bounded():
+    """Envs overdue by the maximum deferral time out even above the cap."""
+    term, env = _time_out(max_resets_per_step=1, initial_length_range=(1.0, 1.0), max_deferral=5)
+    assert term.max_deferral == 5
+    env.episode_length_buf[:3] = torch.tensor([105, 107, 100])
+    assert term(env).nonzero().flatten().tolist() == [0, 1]
+    # without overdue envs, the cap applies again
+    env.episode_length_buf[:3] = torch.tensor([0, 0, 101])
+    env.episode_length_buf[3] = 100
+    assert term(env).nonzero().flatten().tolist() == [2]
+
+
+def test_only_the_first_episodes_are_shortened():
+    """The first episode ends within the initial length range and later ones after the episode length."""
+    term, env = _time_out(max_resets_per_step=8, initial_length_range=(0.2, 0.4))
+    env.episode_length_buf[:] = 19
+    assert not term(env).any()
+    env.episode_length_buf[:] = 40
+    assert term(env).all()
+    env.common_step_counter = 1
+    term.reset([0, 1])
+    env.episode_length_buf[:] = 50
+    assert term(env).nonzero().flatten().tolist() == [2, 3, 4, 5, 6, 7]
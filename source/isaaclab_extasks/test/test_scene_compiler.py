@@ -0,0 +1,127 @@
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import json
+import math
+
+import pytest
+from isaaclab.assets import AssetBaseCfg, RigidObjectCfg
+from isaaclab_exassets import ISAACLAB_EXTENDED_ASSETS_DATA_DIR, fixture_usd_path
+
+from isaaclab_extasks.utils import scene_compiler
+from isaaclab_extasks.utils.scene_compiler import compile_scene, placement_events
+
+
+def _write(path, data) -> str:
+    with open(path, "w") as f:
+        json.dump(data, f)
+    return str(path)
+
+
+def _object(name: str, position: list[float], size: list[float] | None = None, type: str = "static") -> dict:
+    return {"name": name, "usd_path": f"/nonexistent/{name}.usd", "position": position, "size": size, "type": type}
+
+
+@pytest.fixture(autouse=True)
+def clear_compiled_scenes():
+    """Compile every scene of a test from its files."""
+    scene_compiler._COMPILED_SCENES.clear()
+    yield
+    scene_compiler._COMPILED_SCENES.clear()
+
+
+def test_colliding_names_get_a_suffix(tmp_path):
+    """Objects whose names collide with each other or with the compiler entities are all kept."""
+    config = {
+        "objects": [
+            _object("table", [0.5, 0.0, 0.0], size=[1.0, 0.8, 0.7]),
+            _object("cup_a", [0.4, 0.1, 0.75], type="rigid"),
+            _object("cup.a", [0.6, -0.1, 0.75], type="rigid"),
+            _object("plane", [0.0, 1.0, 0.0]),
+            _object("num_envs", [0.0, -1.0, 0.0]),
+        ]
+    }
+    graph = {"edges": [{"source": "cup.a", "target": "table", "relation": "on"}]}
+    compiled = compile_scene(
+        _write(tmp_path / "scene.json", config), _write(tmp_path / "graph.json", graph), cache_dir=None
+    )
+    scene_cfg = compiled.scene_cfg_class(num_envs=1, env_spacing=2.0)
+
+    assert isinstance(scene_cfg.cup_a, RigidObjectCfg)
+    assert isinstance(scene_cfg.cup_a_1, RigidObjectCfg)
+    assert scene_cfg.cup_a_1.init_state.pos == (0.6, -0.1, 0.75)
+    assert scene_cfg.plane.prim_path == "/World/GroundPlane"
+    assert isinstance(scene_cfg.plane_1, AssetBaseCfg)
+    assert scene_cfg.plane_1.prim_path == "{ENV_REGEX_NS}/Scene/plane_1"
+    assert scene_cfg.num_envs == 1
+    assert scene_cfg.num_envs_1.init_state.pos == (0.0, -1.0, 0.0)
+    # the relation of the renamed object bounds it to the top of the table
+    assert compiled.placement_ranges["cup_a_1"]["x"] == pytest.approx((-0.55, 0.35))
+    assert compiled.placement_ranges["cup_a_1"]["y"] == pytest.approx((-0.25, 0.45))
+    assert compiled.placement_ranges["cup_a"]["yaw"] == pytest.approx((-math.pi, math.pi))
+    assert set(placement_events(compiled)) == {"reset_cup_a", "reset_cup_a_1"}
+
+
+def test_duplicate_names_raise(tmp_path):
+    """Two objects of the same name cannot be told apart by the scene graph."""
+    config = {"objects": [_object("cup", [0.4, 0.1, 0.75]), _object("cup", [0.6, -0.1, 0.75])]}
+    with pytest.raises(ValueError, match="cup"):
+        compile_scene(_write(tmp_path / "scene.json", config), cache_dir=None)
+
+
+def test_robocasa_fixtures_use_the_converted_models(tmp_path):
+    """Fixtures are spawned from the converted models and the room boxes from their half extents."""
+    config = {
+        "fixture": [
+            {
+                "name": "light",
+                "path": "fixtures/lights/light_1/model.xml",
+                "type": "fixed",
+                "position": [1.0, 2.0, 3.0],
+                "rotation": [0.0, 0.0, 0.0, 0.0],
+                "size": [0.1, 0.1, 0.1],
+            }
+        ],
+        "others": [{"name": "floor", "position": [0.0, 0.0, -0.05], "size": [2.0, 2.0, 0.05]}],
+    }
+    compiled = compile_scene(_write(tmp_path / "env_config.json", config), cache_dir=None)
+    scene_cfg = compiled.scene_cfg_class(num_envs=1, env_spacing=2.0)
+
+    usd_path = fixture_usd_path("fixtures/lights/light_1/model.xml", ISAACLAB_EXTENDED_ASSETS_DATA_DIR)
+    assert scene_cfg.light_1.spawn.usd_path == usd_path
+    assert scene_cfg.light_1.init_state.rot == (1.0, 0.0, 0.0, 0.0)
+    assert scene_cfg.floor.spawn.size == (4.0, 4.0, 0.1)
+    assert compiled.placement_ranges == {}
+
+
+def test_descriptions_are_cached_across_processes(tmp_path, monkeypatch):
+    """A scene compiled before is built from its cached description without describing it again."""
+    config = {
+        "objects": [
+            _object("table", [0.5, 0.0, 0.0], size=[1.0, 0.8, 0.7]),
+            _object("cup", [0.4, 0.1, 0.75], type="rigid"),
+        ]
+    }
+    scene_path = _write(tmp_path / "scene.json", config)
+    cache_dir = tmp_path / "cache"
+    first = compile_scene(scene_path, cache_dir=str(cache_dir))
+    assert len(list(cache_dir.glob("scene_*.json"))) == 1
+
+    # a new process starts without the memoized scenes
+    scene_compiler._COMPILED_SCENES.clear()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("The scene was described again.")
+
+    monkeypatch.setattr(scene_compiler, "_describe_synthesized", fail)
+    second = compile_scene(scene_path, cache_dir=str(cache_dir))
+
+    assert second.source_hash == first.source_hash
+    assert second.placement_ranges == first.placement_ranges
+    assert second.scene_cfg_class(num_envs=1, env_spacing=2.0).cup.init_state.pos == (0.4, 0.1, 0.75)
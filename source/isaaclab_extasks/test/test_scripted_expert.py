@@ -0,0 +1,168 @@
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+from types import SimpleNamespace
+
+import gymnasium as gym
+import pytest
+import torch
+from isaaclab_exassets.grippers import FRANKA_HAND_CLOSE, KINOVA_3F_OPEN, ROBOTIQ_2F_140_CLOSE
+from isaaclab_tasks.utils import parse_env_cfg
+
+from isaaclab_extasks.utils.scripted_expert import (
+    BLOCK_HEIGHT,
+    EXPERT_CFGS,
+    PickPlaceExpert,
+    collect_demonstrations,
+    gripper_joint_positions,
+    sort_sequence,
+    stack_sequence,
+    task_sequence,
+)
+from isaaclab_extasks.utils.trajectory_dataset import TrajectoryDataset, TrajectoryWriter
+
+
+def test_stack_sequence_follows_the_given_order():
+    """Each block is placed on top of the previous one."""
+    sequence = stack_sequence(["red_block", "blue_block", "green_block"])
+    assert sequence == [
+        ("blue_block", "red_block", (0.0, 0.0, BLOCK_HEIGHT)),
+        ("green_block", "blue_block", (0.0, 0.0, BLOCK_HEIGHT)),
+    ]
+
+
+def test_sort_sequence_pairs_blocks_and_regions():
+    """The i-th block is placed onto the i-th region, whatever the names."""
+    sequence = sort_sequence(["green_block", "blue_block"], ["base3", "base1"])
+    assert [(name, region) for name, region, _ in sequence] == [("green_block", "base3"), ("blue_block", "base1")]
+    with pytest.raises(ValueError):
+        sort_sequence(["green_block"], ["base1", "base2"])
+
+
+def test_task_sequence_reads_the_success_term():
+    """The sequence is derived from the parameters of the success term."""
+    env_cfg = SimpleNamespace(terminations=SimpleNamespace(success=SimpleNamespace(params={})))
+    env_cfg.terminations.success.params = {"asset_names": ["yellow_block", "red_block"], "region_names": ["b", "a"]}
+    assert [(name, ref) for name, ref, _ in task_sequence(env_cfg)] == [("yellow_block", "b"), ("red_block", "a")]
+    env_cfg.terminations.success.params = {"asset_names": ["yellow_block", "red_block"]}
+    assert [(name, ref) for name, ref, _ in task_sequence(env_cfg)] == [("red_block", "yellow_block")]
+    env_cfg.terminations.success = None
+    with pytest.raises(ValueError):
+        task_sequence(env_cfg)
+
+
+def test_gripper_joint_positions_follow_the_action_order():
+    """Positions are resolved per joint in the order of the gripper action."""
+    joint_names = ["j2n7s300_joint_finger_tip_1", "j2n7s300_joint_finger_1", "j2n7s300_joint_finger_2"]
+    joint_pos = gripper_joint_positions({".*_finger_[1-3]": 1.2, ".*_finger_tip_[1-3]": 0.4}, joint_names, "cpu")
+    torch.testing.assert_close(joint_pos, torch.tensor([0.4, 1.2, 1.2]))
+    torch.testing.assert_close(gripper_joint_positions(KINOVA_3F_OPEN, joint_names, "cpu"), torch.full((3,), 0.2))
+
+
+def test_gripper_joint_positions_require_all_joints():
+    """A gripper joint without a position is an error."""
+    with pytest.raises(ValueError):
+        gripper_joint_positions(FRANKA_HAND_CLOSE, ["panda_finger_joint1", "finger_joint"], "cpu")
+
+
+def test_expert_cfgs_use_the_mounted_grippers():
+    """The expert configurations take the gripper positions from the asset package."""
+    assert EXPERT_CFGS["Franka"].gripper_close == FRANKA_HAND_CLOSE
+    assert EXPERT_CFGS["UR10e"].gripper_close == ROBOTIQ_2F_140_CLOSE
+    for cfg in EXPERT_CFGS.values():
+        assert cfg.gripper_open.keys() == cfg.gripper_close.keys()
+
+
+class _SuccessTerminations:
+    """Termination manager with a success term that fires in the 4th step of env 0."""
+
+    active_terms = ["success"]
+
+    def __init__(self):
+        self.success = torch.zeros(2, dtype=torch.bool)
+
+    def get_term(self, name: str) -> torch.Tensor:
+        return self.success
+
+
+class _CountingEnv:
+    """Two envs whose observation is the number of steps of the running episode."""
+
+    num_envs = 2
+    device = "cpu"
+
+    def __init__(self):
+        self.termination_manager = _SuccessTerminations()
+        self.episode_length = torch.zeros(2, dtype=torch.long)
+
+    def reset(self, env_ids=None):
+        self.episode_length[slice(None) if env_ids is None else env_ids] = 0
+        return {"policy": self.episode_length.float().unsqueeze(-1)}, {}
+
+    def step(self, actions):
+        self.episode_length += 1
+        terminated = self.termination_manager.success
+        terminated[:] = torch.tensor([self.episode_length[0] == 4, False])
+        # terminated envs are reset inside of step()
+        self.episode_length[terminated] = 0
+        obs = {"policy": self.episode_length.float().unsqueeze(-1)}
+        return obs, None, terminated.clone(), torch.zeros_like(terminated), {}
+
+
+class _CountingExpert:
+    """Expert whose action is its step count and that finishes env 1 after 3 steps."""
+
+    def __init__(self):
+        self.steps = torch.zeros(2, dtype=torch.long)
+
+    @property
+    def done(self) -> torch.Tensor:
+        return (self.steps >= 3) & torch.tensor([False, True])
+
+    def reset(self, env_ids=None):
+        self.steps[slice(None) if env_ids is None else env_ids] = 0
+
+    def compute(self) -> torch.Tensor:
+        self.steps += 1
+        return self.steps.float().unsqueeze(-1)
+
+
+def test_episodes_ended_by_the_expert_or_the_success_term_are_recorded(tmp_path):
+    """Both the episodes the expert finishes and those the success term resets are written."""
+    with TrajectoryWriter(str(tmp_path)) as writer:
+        demos, steps = collect_demonstrations(_CountingEnv(), _CountingExpert(), writer, num_demos=2)
+    assert (demos, steps) == (2, 8)
+
+    dataset = TrajectoryDataset(str(tmp_path))
+    assert dataset.episode_index[:, 2].tolist() == [3, 4]
+    first, second = dataset.get_episode(0), dataset.get_episode(1)
+    assert first["actions"].flatten().tolist() == [1.0, 2.0, 3.0]
+    assert first["obs.policy"].flatten().tolist() == [0.0, 1.0, 2.0]
+    assert second["actions"].flatten().tolist() == [1.0, 2.0, 3.0, 4.0]
+    assert second["obs.policy"].flatten().tolist() == [0.0, 1.0, 2.0, 3.0]
+
+
+def test_expert_records_a_stack_demo(tmp_path):
+    """The expert stacks the blocks of the Franka stack task and the episode is written as a demonstration."""
+    task = "Isaac-Block-Stack-Franka-v0"
+    env_cfg = parse_env_cfg(task, device="cuda:0", num_envs=1)
+    env_cfg.terminations.time_out = None
+    env = gym.make(task, cfg=env_cfg)
+    try:
+        expert = PickPlaceExpert(env.unwrapped, EXPERT_CFGS["Franka"], task_sequence(env.unwrapped.cfg))
+        with TrajectoryWriter(str(tmp_path)) as writer:
+            demos, _ = collect_demonstrations(env.unwrapped, expert, writer, num_demos=1, max_episode_steps=1500)
+    finally:
+        env.close()
+
+    assert demos == 1
+    dataset = TrajectoryDataset(str(tmp_path))
+    assert dataset.num_episodes == 1
+    assert dataset.num_steps < 1500
+    assert "actions" in dataset.keys
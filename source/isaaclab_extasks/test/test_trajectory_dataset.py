@@ -0,0 +1,90 @@
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import numpy as np
+import pytest
+
+from isaaclab_extasks.utils.trajectory_dataset import TrajectoryDataset, TrajectoryLoader, TrajectoryWriter
+
+EPISODE_LENGTHS = [5, 3, 8, 2, 6]
+
+
+def _episode(index: int, length: int) -> dict:
+    # every step encodes (episode, step) so that windows can be traced back to their source
+    steps = np.arange(length)
+    return {
+        "actions": np.stack([np.full(length, index), steps], axis=-1).astype(np.float32),
+        "obs": {"step": steps.astype(np.int64)},
+    }
+
+
+@pytest.fixture
+def dataset(tmp_path) -> TrajectoryDataset:
+    with TrajectoryWriter(str(tmp_path), chunk_size=10) as writer:
+        for index, length in enumerate(EPISODE_LENGTHS):
+            writer.add_episode(_episode(index, length))
+    return TrajectoryDataset(str(tmp_path))
+
+
+def test_episodes_are_indexed_across_chunks(dataset):
+    """Episodes are never split and keep their data across chunk boundaries."""
+    assert dataset.num_episodes == len(EPISODE_LENGTHS)
+    assert dataset.num_steps == sum(EPISODE_LENGTHS)
+    assert dataset.episode_index[:, 0].tolist() == [0, 0, 0, 1, 1]
+    assert dataset.episode_index[:, 2].tolist() == EPISODE_LENGTHS
+    for index, length in enumerate(EPISODE_LENGTHS):
+        episode = dataset.get_episode(index)
+        assert np.array_equal(episode["actions"], _episode(index, length)["actions"])
+        assert np.array_equal(episode["obs.step"], np.arange(length))
+
+
+def test_windows_stay_inside_their_episode(dataset):
+    """Sampled windows are consecutive steps of one episode long enough to hold them."""
+    batch = dataset.sample(256, 4, rng=np.random.default_rng(0), pin_memory=False)
+    assert batch["actions"].shape == (256, 4, 2)
+    assert batch["obs.step"].shape == (256, 4)
+    actions = batch["actions"].numpy()
+    # a single episode per window
+    assert (actions[:, :, 0] == actions[:, :1, 0]).all()
+    assert set(actions[:, 0, 0].astype(int).tolist()) == {0, 2, 4}
+    # consecutive steps that end inside the episode
+    assert (np.diff(actions[:, :, 1], axis=1) == 1).all()
+    lengths = np.array(EPISODE_LENGTHS)[actions[:, 0, 0].astype(int)]
+    assert (actions[:, -1, 1] < lengths).all()
+    assert np.array_equal(batch["obs.step"].numpy(), actions[:, :, 1])
+
+
+def test_windows_longer_than_every_episode_raise(dataset):
+    """A window length that no episode can hold fails early."""
+    with pytest.raises(ValueError, match="long enough"):
+        dataset.window_starts(max(EPISODE_LENGTHS) + 1)
+    with pytest.raises(ValueError, match="long enough"):
+        TrajectoryLoader(dataset, batch_size=2, seq_len=max(EPISODE_LENGTHS) + 1)
+
+
+def test_sample_reads_into_the_given_batch(dataset):
+    """A preallocated batch is filled in place."""
+    out = dataset.allocate_batch(16, 2, pin_memory=False)
+    batch = dataset.sample(16, 2, rng=np.random.default_rng(0), out=out)
+    assert all(batch[name] is out[name] for name in out)
+
+
+def test_loader_reuses_its_staging_batches(dataset):
+    """The loader cycles through a fixed pool of host batches."""
+    loader = TrajectoryLoader(dataset, batch_size=8, seq_len=2, num_workers=2, prefetch=2, pin_memory=False, seed=0)
+    try:
+        pointers = set()
+        for _ in range(50):
+            batch = next(loader)
+            assert batch["actions"].shape == (8, 2, 2)
+            assert (np.diff(batch["actions"].numpy()[:, :, 1], axis=1) == 1).all()
+            pointers.add(batch["actions"].data_ptr())
+        assert len(pointers) <= 2 + 2 + 1
+    finally:
+        loader.close()
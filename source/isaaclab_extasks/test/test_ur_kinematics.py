@@ -0,0 +1,69 @@
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import math
+
+import pytest
+import torch
+
+from isaaclab_extasks.utils.ur_kinematics import (
+    UR_DH_PARAMS,
+    select_nearest_branch,
+    ur_forward_kinematics,
+    ur_inverse_kinematics,
+)
+
+
+@pytest.mark.parametrize("robot_type", list(UR_DH_PARAMS.keys()))
+def test_fk_ik_round_trip(robot_type: str):
+    """Every valid IK branch reproduces the pose and the nearest branch recovers the joint positions."""
+    params = UR_DH_PARAMS[robot_type]
+    generator = torch.Generator().manual_seed(0)
+    joint_pos = (torch.rand(1024, 6, generator=generator, dtype=torch.float64) * 2.0 - 1.0) * math.pi
+
+    pose = ur_forward_kinematics(joint_pos, params)
+    solutions, valid = ur_inverse_kinematics(pose, params)
+
+    # a generic pose has at least the branch it was computed from
+    assert valid.any(dim=-1).all()
+    solution_pose = ur_forward_kinematics(solutions, params)
+    error = (solution_pose - pose.unsqueeze(1)).abs().amax(dim=(-2, -1))
+    assert error[valid].max() < 1e-9
+
+    selected, success = select_nearest_branch(solutions, valid, joint_pos)
+    assert success.all()
+    torch.testing.assert_close(selected, joint_pos, atol=1e-9, rtol=0.0)
+
+
+def test_nearest_branch_unwraps_continuous_joints():
+    """The selected branch is unwrapped to the revolution of the current joint positions."""
+    params = UR_DH_PARAMS["UR5e"]
+    joint_pos = torch.tensor([[0.3, -1.2, 1.4, -1.7, -1.5, 0.2]], dtype=torch.float64)
+    current = joint_pos + torch.tensor([[0.0, 0.0, 0.0, 0.0, 0.0, 2.0 * math.pi]], dtype=torch.float64)
+
+    solutions, valid = ur_inverse_kinematics(ur_forward_kinematics(joint_pos, params), params)
+    selected, success = select_nearest_branch(solutions, valid, current)
+
+    assert success.all()
+    torch.testing.assert_close(selected, current, atol=1e-9, rtol=0.0)
+
+
+def test_unreachable_pose_has_no_valid_branch():
+    """A pose beyond the reach of the arm keeps the current joint positions."""
+    params = UR_DH_PARAMS["UR5e"]
+    pose = torch.eye(4, dtype=torch.float64).unsqueeze(0)
+    pose[0, :3, 3] = torch.tensor([3.0, 0.0, 0.5], dtype=torch.float64)
+    joint_pos = torch.zeros(1, 6, dtype=torch.float64)
+
+    solutions, valid = ur_inverse_kinematics(pose, params)
+    selected, success = select_nearest_branch(solutions, valid, joint_pos)
+
+    assert not valid.any()
+    assert not success.any()
+    torch.testing.assert_close(selected, joint_pos)
@@ -0,0 +1,76 @@
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import math
+from types import SimpleNamespace
+
+import torch
+
+from isaaclab_extasks.mdp import frame_position_in_robot_root_frame
+from isaaclab_extasks.utils.virtual_frames import VirtualFrameCfg, frame_pose
+
+# rotation by a quarter turn about the z-axis
+YAW_90 = (math.cos(math.pi / 4), 0.0, 0.0, math.sin(math.pi / 4))
+
+
+class _Scene(dict):
+    """Scene with rigid objects read from their data and static assets read from their configuration."""
+
+    def __init__(self, num_envs: int, rigid_objects: dict, static_assets: dict):
+        super().__init__(rigid_objects)
+        self.rigid_objects = rigid_objects
+        self.articulations = {}
+        self.cfg = SimpleNamespace(**static_assets)
+        self.env_origins = torch.arange(num_envs, dtype=torch.float).unsqueeze(-1) * torch.tensor([0.0, 2.0, 0.0])
+
+
+def _rigid_object(num_envs: int, pos: tuple, rot: tuple = (1.0, 0.0, 0.0, 0.0)) -> SimpleNamespace:
+    root_state_w = torch.tensor([*pos, *rot]).repeat(num_envs, 1)
+    data = SimpleNamespace(root_pos_w=root_state_w[:, :3], root_quat_w=root_state_w[:, 3:7], root_state_w=root_state_w)
+    return SimpleNamespace(data=data)
+
+
+def _env(num_envs: int = 2) -> SimpleNamespace:
+    rigid_objects = {
+        "robot": _rigid_object(num_envs, (1.0, 0.0, 0.0), YAW_90),
+        "gear_base": _rigid_object(num_envs, (2.0, 1.0, 0.0), YAW_90),
+    }
+    table = SimpleNamespace(init_state=SimpleNamespace(pos=(0.5, 0.0, 0.0), rot=(1.0, 0.0, 0.0, 0.0)))
+    virtual_frames = {
+        "target_small": VirtualFrameCfg(parent_name="gear_base", pos=(0.1, 0.0, 0.05)),
+        "table_corner": VirtualFrameCfg(parent_name="table", pos=(0.0, 0.2, 0.0)),
+    }
+    return SimpleNamespace(
+        num_envs=num_envs,
+        device="cpu",
+        scene=_Scene(num_envs, rigid_objects, {"table": table}),
+        cfg=SimpleNamespace(virtual_frames=virtual_frames),
+    )
+
+
+def test_frames_follow_their_parents():
+    """The offset of a frame is applied in the frame of its parent, rigid or static."""
+    env = _env()
+    pos, quat = frame_pose(env, "target_small")
+    torch.testing.assert_close(pos, torch.tensor([[2.0, 1.1, 0.05], [2.0, 1.1, 0.05]]))
+    torch.testing.assert_close(quat, torch.tensor([YAW_90, YAW_90]))
+    pos, _ = frame_pose(env, "table_corner")
+    torch.testing.assert_close(pos, torch.tensor([[0.5, 0.2, 0.0], [0.5, 2.2, 0.0]]))
+    # names that are not virtual frames resolve to the root of the asset
+    pos, _ = frame_pose(env, "gear_base")
+    torch.testing.assert_close(pos, torch.tensor([[2.0, 1.0, 0.0], [2.0, 1.0, 0.0]]))
+
+
+def test_frame_position_is_observed_in_the_robot_root_frame():
+    """The observation term expresses the frame position in the root frame of the robot."""
+    env = _env()
+    obs = frame_position_in_robot_root_frame(env, "target_small")
+    assert obs.shape == (2, 3)
+    # the robot x-axis points along the world y-axis
+    torch.testing.assert_close(obs, torch.tensor([[1.1, -1.0, 0.05], [1.1, -1.0, 0.05]]))